@@ -2,7 +2,7 @@
 
 import React, { useState } from "react";
 import { FolderOpen, Upload, Loader2, X, FileText, AlertCircle, CheckCircle } from "lucide-react";
-import { getBackendHttpUrl } from "@/lib/api";
+import { getBackendHttpUrl, getBackendWsUrl } from "@/lib/api";
 
 interface Step1Props {
   onNext: (projectPath: string, pdfDocsPath?: string) => void;
@@ -47,6 +47,18 @@ export function Step1_ProjectSelection({ onNext }: Step1Props) {
       const projectFormData = new FormData();
       projectFormData.append("file", projectFile);
 
+      // Progresso de gravação/extração do zip no backend
+      const uploadId = crypto.randomUUID();
+      projectFormData.append("upload_id", uploadId);
+      const progressWs = new WebSocket(`${getBackendWsUrl()}/api/import-wizard/ws/upload/${uploadId}`);
+      progressWs.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        if (data.type === "upload_progress") {
+          const label = data.phase === "extracting" ? "Extraindo projeto" : "Gravando arquivo";
+          setUploadProgress(`${label}... ${data.percent}%`);
+        }
+      };
+
       console.log("Uploading project file:", projectFile.name, projectFile.size, "bytes");
 
       // Upload direto para o backend (não passa pelo proxy Next.js para evitar problemas com arquivos grandes)
@@ -62,6 +74,8 @@ export function Step1_ProjectSelection({ onNext }: Step1Props) {
       } catch (fetchError) {
         console.error("Fetch error:", fetchError);
         throw new Error(`Erro de rede ao fazer upload: ${fetchError instanceof Error ? fetchError.message : "Desconhecido"}`);
+      } finally {
+        progressWs.close();
       }
 
       if (!projectResponse.ok) {
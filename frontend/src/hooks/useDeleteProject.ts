@@ -2,11 +2,34 @@
 
 /**
  * Hook para deletar um projeto.
- * Invalida a lista de projetos apos exclusao bem-sucedida.
+ * O backend executa o purge em background (202 + job); o hook acompanha o
+ * job ate o fim e invalida a lista de projetos apos exclusao bem-sucedida.
  */
 
 import { useMutation, useQueryClient } from "@tanstack/react-query";
-import type { DeleteProjectResponse } from "@/types/project";
+import type { DeleteProjectResponse, PurgeJob } from "@/types/project";
+
+const PURGE_POLL_INTERVAL_MS = 500;
+
+async function waitForPurgeJob(job: PurgeJob): Promise<DeleteProjectResponse> {
+  while (job.status === "pending" || job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, PURGE_POLL_INTERVAL_MS));
+    const response = await fetch(`/api/projects/purge-jobs/${job.job_id}`);
+    if (!response.ok) {
+      throw new Error("Falha ao acompanhar exclusao do projeto");
+    }
+    job = await response.json();
+  }
+
+  if (job.status === "failed" || !job.stats) {
+    throw new Error(job.error || "Falha ao excluir projeto");
+  }
+
+  return {
+    message: `Projeto '${job.project_name}' removido com sucesso`,
+    stats: job.stats,
+  };
+}
 
 async function deleteProject(projectId: string): Promise<DeleteProjectResponse> {
   const response = await fetch(`/api/projects/${projectId}`, {
@@ -18,6 +41,10 @@ async function deleteProject(projectId: string): Promise<DeleteProjectResponse>
     throw new Error(error.detail || "Falha ao excluir projeto");
   }
 
+  if (response.status === 202) {
+    return waitForPurgeJob(await response.json());
+  }
+
   return response.json();
 }
 
@@ -15,6 +15,8 @@ export interface TokenUsageLogEntry {
   session_id: string;
   input_tokens: number;
   output_tokens: number;
+  cache_creation_tokens?: number;
+  cache_read_tokens?: number;
   cost_usd: number;
   model: string | null;
   created_at: string;
@@ -26,6 +28,8 @@ export interface TokenUsageResponse {
   total_sessions: number;
   total_input_tokens: number;
   total_output_tokens: number;
+  total_cache_creation_tokens?: number;
+  total_cache_read_tokens?: number;
   total_cost_usd: number;
   recent_logs: TokenUsageLogEntry[];
 }
@@ -203,3 +203,15 @@ export interface DeleteProjectResponse {
   message: string;
   stats: DeleteProjectStats;
 }
+
+export interface PurgeJob {
+  job_id: string;
+  project_id: string;
+  project_name: string;
+  status: "pending" | "running" | "completed" | "failed";
+  progress: Record<string, number>;
+  stats: DeleteProjectStats | null;
+  error: string | null;
+  started_at: string;
+  finished_at: string | null;
+}
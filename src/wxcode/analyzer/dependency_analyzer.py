@@ -5,18 +5,20 @@ Coordena GraphBuilder, CycleDetector e TopologicalSorter
 para análise completa de dependências do projeto.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
 import networkx as nx
 from beanie import PydanticObjectId
+from pymongo import UpdateOne
 
 from wxcode.analyzer.cycle_detector import CycleDetector
 from wxcode.analyzer.graph_builder import GraphBuilder
 from wxcode.analyzer.models import AnalysisResult
 from wxcode.analyzer.topological_sorter import TopologicalSorter
 from wxcode.models import ClassDefinition, Element, Procedure
-from wxcode.models.schema import DatabaseSchema
+from wxcode.models.schema import DatabaseSchema, SchemaTableDocument
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +66,30 @@ class DependencyAnalyzer:
             f"{self.graph.number_of_edges()} arestas"
         )
 
+        # 2-4. Ciclos e ordenação são CPU puro: rodam fora do event loop
+        self._result = await asyncio.to_thread(self._analyze_graph, builder)
+
+        # 5. Persiste no MongoDB
+        if persist:
+            await self._persist_order(self._result.topological_order, self._result.layers)
+
+        logger.info("Análise de dependências concluída")
+        return self._result
+
+    def _analyze_graph(self, builder: GraphBuilder) -> AnalysisResult:
+        """
+        Detecta ciclos e ordena topologicamente o grafo construído.
+
+        Args:
+            builder: GraphBuilder com o grafo já construído
+
+        Returns:
+            AnalysisResult com estatísticas e ordem
+        """
+        graph = builder.graph
+
         # 2. Detecta ciclos
-        detector = CycleDetector(self.graph)
+        detector = CycleDetector(graph)
         cycles = detector.detect_cycles()
 
         if cycles:
@@ -74,15 +98,15 @@ class DependencyAnalyzer:
                 logger.warning(f"  Ciclo: {' → '.join(cycle.nodes)}")
 
         # 3. Ordena topologicamente
-        sorter = TopologicalSorter(self.graph)
+        sorter = TopologicalSorter(graph)
         order = sorter.sort()
         layers = sorter.get_layers()
         layer_stats = sorter.get_layer_stats()
 
         # 4. Monta resultado
-        self._result = AnalysisResult(
-            total_nodes=self.graph.number_of_nodes(),
-            total_edges=self.graph.number_of_edges(),
+        return AnalysisResult(
+            total_nodes=graph.number_of_nodes(),
+            total_edges=graph.number_of_edges(),
             nodes_by_type=builder.get_node_count_by_type(),
             edges_by_type=builder.get_edge_count_by_type(),
             cycles=cycles,
@@ -91,13 +115,6 @@ class DependencyAnalyzer:
             layers=layers
         )
 
-        # 5. Persiste no MongoDB
-        if persist:
-            await self._persist_order(order, layers)
-
-        logger.info("Análise de dependências concluída")
-        return self._result
-
     async def _persist_order(
         self,
         order: list[str],
@@ -158,12 +175,12 @@ class DependencyAnalyzer:
                 )
                 updated_procedures += result.modified_count
 
-        # Atualiza Tables no DatabaseSchema (embedded documents)
+        # Atualiza Tables (coleção schema_tables; embutidas no formato legado)
         updated_tables = 0
         schema = await DatabaseSchema.find_one(
             DatabaseSchema.project_id == self.project_id
         )
-        if schema:
+        if schema and schema.tables:
             tables_updated = False
             for table in schema.tables:
                 table_node_id = f"table:{table.name}"
@@ -176,6 +193,20 @@ class DependencyAnalyzer:
 
             if tables_updated:
                 await schema.save()
+        elif schema:
+            operations = [
+                UpdateOne(
+                    {"project_id": self.project_id, "name_key": node_id.split(":", 1)[1].upper()},
+                    {"$set": {"topological_order": pos, "layer": layer}},
+                )
+                for node_id, (pos, layer) in node_info.items()
+                if node_id.startswith("table:")
+            ]
+            if operations:
+                result = await SchemaTableDocument.get_pymongo_collection().bulk_write(
+                    operations, ordered=False
+                )
+                updated_tables = result.modified_count
 
         logger.info(
             f"Persistidos: {updated_elements} elements, "
@@ -20,6 +20,7 @@ from wxcode.models import (
     ElementType,
     Procedure,
 )
+from wxcode.models.schema import get_schema_tables
 
 logger = logging.getLogger(__name__)
 
@@ -84,18 +85,19 @@ class GraphBuilder:
             logger.warning("Schema não encontrado para o projeto")
             return
 
-        for table in schema.tables:
+        tables = await get_schema_tables(schema)
+        for table in tables:
             node_id = f"table:{table.name}"
             node = GraphNode(
                 id=node_id,
                 name=table.name,
                 node_type=NodeType.TABLE,
                 layer=ElementLayer.SCHEMA,
-                collection="schemas"
+                collection="schema_tables"
             )
             self._add_node(node)
 
-        logger.info(f"Adicionadas {len(schema.tables)} tabelas")
+        logger.info(f"Adicionadas {len(tables)} tabelas")
 
     async def _add_class_nodes(self) -> None:
         """Adiciona nós e arestas de classes."""
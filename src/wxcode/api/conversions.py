@@ -5,12 +5,19 @@ API de Conversões.
 import asyncio
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
-from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from wxcode.models import Conversion, ConversionPhase, Project
+from wxcode.models.conversion import conversion_duration, conversion_progress
+from wxcode.services.pagination import (
+    InvalidCursorError,
+    iter_projected,
+    paginate_by_cursor,
+)
 
 if TYPE_CHECKING:
     from wxcode.models.product import Product
@@ -223,39 +230,145 @@ class StartConversionRequest(BaseModel):
     element_names: Optional[list[str]] = None
 
 
+# Projeção da listagem: evita trazer erros e progresso por camada
+CONVERSION_LIST_PROJECTION = {
+    "project_id": 1,
+    "target_stack": 1,
+    "target_element_names": 1,
+    "current_phase": 1,
+    "total_elements": 1,
+    "elements_converted": 1,
+    "elements_with_errors": 1,
+    "started_at": 1,
+    "completed_at": 1,
+}
+
+
+def _conversion_response_from_doc(doc: dict, project_name: str) -> ConversionResponse:
+    """Converte um documento projetado (CONVERSION_LIST_PROJECTION) em resposta."""
+    total = doc.get("total_elements", 0)
+    converted = doc.get("elements_converted", 0)
+
+    return ConversionResponse(
+        id=str(doc["_id"]),
+        project_name=project_name,
+        target_stack=doc.get("target_stack", "fastapi-jinja2"),
+        layer=None,  # TODO: adicionar quando tivermos layer no model
+        target_element_names=doc.get("target_element_names"),
+        current_phase=doc.get("current_phase", ConversionPhase.PENDING),
+        total_elements=total,
+        elements_converted=converted,
+        elements_with_errors=doc.get("elements_with_errors", 0),
+        overall_progress=conversion_progress(converted, total),
+        duration_seconds=conversion_duration(doc.get("started_at"), doc.get("completed_at")),
+    )
+
+
+async def _project_names(docs: list[dict]) -> dict:
+    """Busca os nomes dos projetos referenciados com uma única consulta."""
+    ids = {doc["project_id"].id for doc in docs if doc.get("project_id") is not None}
+    if not ids:
+        return {}
+    projects = await Project.aggregate([
+        {"$match": {"_id": {"$in": list(ids)}}},
+        {"$project": {"name": 1}},
+    ]).to_list()
+    return {p["_id"]: p["name"] for p in projects}
+
+
+def _project_name_for(doc: dict, names: dict) -> str:
+    ref = doc.get("project_id")
+    return names.get(ref.id, "unknown") if ref is not None else "unknown"
+
+
+def _conversion_filter(project: Optional[Project]) -> dict:
+    return {"project_id.$id": project.id} if project else {}
+
+
+async def _project_by_name_or_404(project_name: Optional[str]) -> Optional[Project]:
+    if not project_name:
+        return None
+    project = await Project.find_one(Project.name == project_name)
+    if not project:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado")
+    return project
+
+
 @router.get("/", response_model=list[ConversionResponse])
 async def list_conversions(
+    response: Response,
     project_name: Optional[str] = None,
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Tamanho da página (None = todas)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor da página anterior (header X-Next-Cursor)"
+    ),
 ) -> list[ConversionResponse]:
-    """Lista conversões."""
-    if project_name:
-        project = await Project.find_one(Project.name == project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Projeto não encontrado")
-        conversions = await Conversion.find(
-            {"project_id.$id": project.id}
-        ).to_list()
+    """
+    Lista conversões.
+
+    Com `limit`, pagina por _id; quando há mais itens, o header
+    `X-Next-Cursor` traz o valor a passar em `cursor`.
+    """
+    project = await _project_by_name_or_404(project_name)
+    match = _conversion_filter(project)
+
+    if limit:
+        try:
+            docs, next_cursor = await paginate_by_cursor(
+                Conversion, match, ["_id"], CONVERSION_LIST_PROJECTION, limit, cursor
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
     else:
-        conversions = await Conversion.find_all().to_list()
-
-    result = []
-    for conv in conversions:
-        project = await Project.get(conv.project_id.ref.id)
-        result.append(ConversionResponse(
-            id=str(conv.id),
-            project_name=project.name if project else "unknown",
-            target_stack=conv.target_stack,
-            layer=None,  # TODO: adicionar quando tivermos layer no model
-            target_element_names=conv.target_element_names,
-            current_phase=conv.current_phase,
-            total_elements=conv.total_elements,
-            elements_converted=conv.elements_converted,
-            elements_with_errors=conv.elements_with_errors,
-            overall_progress=conv.overall_progress,
-            duration_seconds=conv.duration_seconds,
-        ))
-
-    return result
+        docs = await Conversion.aggregate([
+            {"$match": match},
+            {"$sort": {"_id": 1}},
+            {"$project": CONVERSION_LIST_PROJECTION},
+        ]).to_list()
+
+    names = await _project_names(docs)
+    return [
+        _conversion_response_from_doc(doc, _project_name_for(doc, names))
+        for doc in docs
+    ]
+
+
+async def _ndjson_lines(docs: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Serializa respostas de conversão como NDJSON, resolvendo nomes por lote."""
+    batch: list[dict] = []
+
+    async def flush():
+        names = await _project_names(batch)
+        lines = [
+            _conversion_response_from_doc(doc, _project_name_for(doc, names)).model_dump_json() + "\n"
+            for doc in batch
+        ]
+        batch.clear()
+        return "".join(lines).encode("utf-8")
+
+    async for doc in docs:
+        batch.append(doc)
+        if len(batch) >= 500:
+            yield await flush()
+    if batch:
+        yield await flush()
+
+
+@router.get("/export")
+async def export_conversions(project_name: Optional[str] = None) -> StreamingResponse:
+    """Exporta todas as conversões como NDJSON (uma conversão por linha)."""
+    project = await _project_by_name_or_404(project_name)
+    docs = iter_projected(
+        Conversion, _conversion_filter(project), ["_id"], CONVERSION_LIST_PROJECTION
+    )
+    return StreamingResponse(
+        _ndjson_lines(docs),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.post("/start", response_model=ConversionResponse)
@@ -2,12 +2,18 @@
 API de Elementos.
 """
 
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from wxcode.models import Element, ElementType, ElementLayer, ConversionStatus
+from wxcode.services.pagination import (
+    InvalidCursorError,
+    iter_projected,
+    paginate_by_cursor,
+)
 
 
 router = APIRouter()
@@ -41,30 +47,59 @@ class ElementDetailResponse(ElementResponse):
 class ElementListResponse(BaseModel):
     """Lista de elementos."""
     elements: list[ElementResponse]
-    total: int
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+# Ordenações suportadas pela paginação por cursor (o _id desempata)
+ELEMENT_SORT_FIELDS = {
+    "source_name": ["source_name", "_id"],
+    "topological_order": ["topological_order", "_id"],
+}
+
+# Projeção da listagem: evita trazer raw_content, ast e chunks
+ELEMENT_LIST_PROJECTION = {
+    "source_type": 1,
+    "source_name": 1,
+    "source_file": 1,
+    "layer": 1,
+    "topological_order": 1,
+    "conversion_status": {"$ifNull": ["$conversion.status", ConversionStatus.PENDING.value]},
+    "has_chunks": {"$gt": [{"$size": {"$ifNull": ["$chunks", []]}}, 0]},
+    "dependencies_count": {"$size": {"$ifNull": ["$dependencies.uses", []]}},
+    "dependents_count": {"$size": {"$ifNull": ["$dependencies.used_by", []]}},
+    "dependencies_uses": {"$ifNull": ["$dependencies.uses", []]},
+}
+
+
+def _element_response_from_doc(doc: dict) -> ElementResponse:
+    """Converte um documento projetado (ELEMENT_LIST_PROJECTION) em resposta."""
+    return ElementResponse(
+        id=str(doc["_id"]),
+        source_type=doc["source_type"],
+        source_name=doc["source_name"],
+        source_file=doc["source_file"],
+        layer=doc.get("layer"),
+        topological_order=doc.get("topological_order"),
+        conversion_status=doc["conversion_status"],
+        has_chunks=doc["has_chunks"],
+        dependencies_count=doc["dependencies_count"],
+        dependents_count=doc["dependents_count"],
+        dependencies_uses=doc["dependencies_uses"],
+    )
 
 
-@router.get("/", response_model=ElementListResponse)
-async def list_elements(
-    project_name: Optional[str] = Query(None, description="Nome do projeto"),
-    project_id: Optional[str] = Query(None, description="ID do projeto"),
-    source_type: Optional[ElementType] = None,
-    layer: Optional[ElementLayer] = None,
-    status: Optional[ConversionStatus] = None,
-    skip: int = 0,
-    limit: int = 100,
-) -> ElementListResponse:
-    """Lista elementos de um projeto."""
+async def _resolve_project(project_id: Optional[str], project_name: Optional[str]):
+    """Busca projeto por ID ou nome (HTTPException se inválido/inexistente)."""
     from wxcode.models import Project
     from beanie import PydanticObjectId
 
-    # Busca projeto por ID ou nome
     project = None
     if project_id:
         try:
             project = await Project.get(PydanticObjectId(project_id))
-        except Exception:
-            raise HTTPException(status_code=400, detail="project_id inválido")
+        except Exception as e:
+            raise HTTPException(status_code=400, detail="project_id inválido") from e
     elif project_name:
         project = await Project.find_one(Project.name == project_name)
     else:
@@ -73,38 +108,141 @@ async def list_elements(
     if not project:
         raise HTTPException(status_code=404, detail="Projeto não encontrado")
 
-    # Monta query - Link fields são armazenados como DBRef, precisa usar $id
-    query = Element.find({"project_id.$id": project.id})
+    return project
+
 
+def _element_filter(
+    project,
+    source_type: Optional[ElementType],
+    layer: Optional[ElementLayer],
+    status: Optional[ConversionStatus],
+) -> dict:
+    """Monta o filtro da listagem de elementos."""
+    # Link fields são armazenados como DBRef, precisa usar $id
+    match: dict = {"project_id.$id": project.id}
     if source_type:
-        query = query.find(Element.source_type == source_type)
+        match["source_type"] = source_type.value
     if layer:
-        query = query.find(Element.layer == layer)
+        match["layer"] = layer.value
     if status:
-        query = query.find(Element.conversion.status == status)
+        match["conversion.status"] = status.value
+    return match
 
-    # Executa
-    elements = await query.skip(skip).limit(limit).to_list()
-    total = await query.count()
 
-    return ElementListResponse(
-        elements=[
-            ElementResponse(
-                id=str(e.id),
-                source_type=e.source_type,
-                source_name=e.source_name,
-                source_file=e.source_file,
-                layer=e.layer,
-                topological_order=e.topological_order,
-                conversion_status=e.conversion.status,
-                has_chunks=len(e.chunks) > 0,
-                dependencies_count=len(e.dependencies.uses),
-                dependents_count=len(e.dependencies.used_by),
-                dependencies_uses=e.dependencies.uses,
+@router.get("/", response_model=ElementListResponse)
+async def list_elements(
+    project_name: Optional[str] = Query(None, description="Nome do projeto"),
+    project_id: Optional[str] = Query(None, description="ID do projeto"),
+    source_type: Optional[ElementType] = None,
+    layer: Optional[ElementLayer] = None,
+    status: Optional[ConversionStatus] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor (substitui skip)"
+    ),
+    order_by: Literal["source_name", "topological_order"] = Query(
+        "source_name", description="Ordenação da paginação por cursor"
+    ),
+    count: Literal["exact", "estimated", "none"] = Query(
+        "exact",
+        description="exact: count() da consulta; estimated: estatísticas do projeto; none: sem total",
+    ),
+) -> ElementListResponse:
+    """
+    Lista elementos de um projeto.
+
+    Sem `cursor`, mantém a paginação por skip/limit. Com `cursor`, busca a
+    página seguinte pela chave de ordenação, com custo constante em
+    qualquer profundidade. `next_cursor` é sempre retornado quando há mais
+    itens.
+    """
+    project = await _resolve_project(project_id, project_name)
+    match = _element_filter(project, source_type, layer, status)
+    sort_fields = ELEMENT_SORT_FIELDS[order_by]
+
+    if cursor or not skip:
+        try:
+            docs, next_cursor = await paginate_by_cursor(
+                Element, match, sort_fields, ELEMENT_LIST_PROJECTION, limit, cursor
             )
-            for e in elements
-        ],
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+    else:
+        pipeline = [
+            {"$match": match},
+            {"$sort": {f: 1 for f in sort_fields}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": ELEMENT_LIST_PROJECTION},
+        ]
+        docs = await Element.aggregate(pipeline).to_list()
+        next_cursor = None
+
+    total: Optional[int] = None
+    if count == "exact":
+        total = await Element.find(match).count()
+    elif count == "estimated":
+        total = _estimate_element_total(project, source_type, layer, status)
+        if total is None:
+            total = await Element.find(match).count()
+
+    return ElementListResponse(
+        elements=[_element_response_from_doc(d) for d in docs],
         total=total,
+        next_cursor=next_cursor,
+    )
+
+
+def _estimate_element_total(
+    project,
+    source_type: Optional[ElementType],
+    layer: Optional[ElementLayer],
+    status: Optional[ConversionStatus],
+) -> Optional[int]:
+    """
+    Estima o total a partir das estatísticas gravadas no projeto na importação.
+
+    Returns:
+        Total estimado, ou None quando os filtros não permitem estimar
+    """
+    if layer or status:
+        return None
+    if source_type:
+        return project.elements_by_type.get(source_type.value, 0)
+    return project.total_elements
+
+
+async def _ndjson_lines(docs: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Serializa respostas de elemento como NDJSON."""
+    async for doc in docs:
+        line = _element_response_from_doc(doc).model_dump_json()
+        yield (line + "\n").encode("utf-8")
+
+
+@router.get("/export")
+async def export_elements(
+    project_name: Optional[str] = Query(None, description="Nome do projeto"),
+    project_id: Optional[str] = Query(None, description="ID do projeto"),
+    source_type: Optional[ElementType] = None,
+    layer: Optional[ElementLayer] = None,
+    status: Optional[ConversionStatus] = None,
+    order_by: Literal["source_name", "topological_order"] = "source_name",
+) -> StreamingResponse:
+    """
+    Exporta todos os elementos do filtro como NDJSON (um elemento por linha).
+
+    Os documentos são lidos em páginas por cursor e enviados conforme
+    chegam, sem montar a lista inteira em memória.
+    """
+    project = await _resolve_project(project_id, project_name)
+    match = _element_filter(project, source_type, layer, status)
+    docs = iter_projected(
+        Element, match, ELEMENT_SORT_FIELDS[order_by], ELEMENT_LIST_PROJECTION
+    )
+    return StreamingResponse(
+        _ndjson_lines(docs),
+        media_type="application/x-ndjson",
     )
 
 
@@ -2,7 +2,6 @@
 API REST para o wizard de importação.
 """
 
-import shutil
 import asyncio
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -13,6 +12,13 @@ import aiofiles
 from wxcode.models.import_session import ImportSession
 from wxcode.models.element import Element
 from wxcode.models.project import Project
+from wxcode.services.project_archive import (
+    ProjectArchiveError,
+    extract_plan,
+    plan_extraction,
+    save_stream,
+)
+from wxcode.services.upload_progress import upload_progress
 from wxcode.services.workspace_manager import WorkspaceManager
 
 
@@ -37,6 +43,8 @@ class UploadResponse(BaseModel):
     file_path: str
     file_name: str
     size: int
+    extracted_files: int = 0
+    skipped_files: int = 0
 
 
 class ProjectSummary(BaseModel):
@@ -53,15 +61,24 @@ class ProjectSummary(BaseModel):
 
 
 @router.post("/upload/project", response_model=UploadResponse)
-async def upload_project_file(file: UploadFile = File(...)) -> UploadResponse:
+async def upload_project_file(
+    file: UploadFile = File(...),
+    upload_id: Optional[str] = Form(None),
+) -> UploadResponse:
     """
     Faz upload do arquivo .zip do projeto.
 
+    O diretório central do zip é inspecionado antes da extração: só a árvore
+    do .wwp é extraída (em paralelo), sem imagens, DLLs e artefatos
+    compilados. Com `upload_id`, o progresso é publicado no WebSocket
+    /api/import-wizard/ws/upload/{upload_id}.
+
     Args:
         file: Arquivo .zip do projeto
+        upload_id: Id gerado pelo cliente para acompanhar o progresso
 
     Returns:
-        Caminho do arquivo salvo
+        Caminho do arquivo .wwp extraído
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -76,37 +93,53 @@ async def upload_project_file(file: UploadFile = File(...)) -> UploadResponse:
     session_dir.mkdir(exist_ok=True)
     logger.info(f"[UPLOAD] Diretório criado: {session_dir}")
 
-    # Salvar arquivo de forma assíncrona
+    loop = asyncio.get_running_loop()
     file_path = session_dir / file.filename
-    logger.info(f"[UPLOAD] Iniciando salvamento do arquivo...")
-    async with aiofiles.open(file_path, "wb") as buffer:
-        total_bytes = 0
-        while chunk := await file.read(8192):  # 8KB chunks
-            await buffer.write(chunk)
-            total_bytes += len(chunk)
-    logger.info(f"[UPLOAD] Arquivo salvo: {total_bytes} bytes")
-
-    # Extrair zip em um executor separado para não bloquear
     extract_dir = session_dir / "project"
-    extract_dir.mkdir(exist_ok=True)
-    logger.info(f"[UPLOAD] Extraindo arquivo zip...")
-    await asyncio.to_thread(shutil.unpack_archive, file_path, extract_dir)
-    logger.info(f"[UPLOAD] Arquivo extraído")
-
-    # Encontrar arquivo .wwp
-    logger.info(f"[UPLOAD] Procurando arquivo .wwp...")
-    wwp_files = list(extract_dir.rglob("*.wwp"))
-    if not wwp_files:
-        raise HTTPException(status_code=400, detail="No .wwp file found in zip")
 
-    project_path = str(wwp_files[0])
-    logger.info(f"[UPLOAD] Arquivo .wwp encontrado: {project_path}")
-
-    return UploadResponse(
-        file_path=project_path,
+    try:
+        # Salvar em blocos grandes, fora do event loop
+        logger.info(f"[UPLOAD] Iniciando salvamento do arquivo...")
+        total_bytes = await asyncio.to_thread(
+            save_stream,
+            file.file,
+            file_path,
+            upload_progress.progress_callback(upload_id, "saving", loop),
+            file.size,
+        )
+        logger.info(f"[UPLOAD] Arquivo salvo: {total_bytes} bytes")
+
+        # Diretório central: localizar o .wwp antes de extrair
+        plan = await asyncio.to_thread(plan_extraction, file_path)
+        logger.info(
+            f"[UPLOAD] Projeto {plan.project_member}: {len(plan.members)} arquivos "
+            f"a extrair, {plan.skipped} ignorados"
+        )
+
+        project_path = await asyncio.to_thread(
+            extract_plan,
+            file_path,
+            plan,
+            extract_dir,
+            upload_progress.progress_callback(upload_id, "extracting", loop),
+        )
+        logger.info(f"[UPLOAD] Arquivo .wwp extraído: {project_path}")
+    except ProjectArchiveError as e:
+        upload_progress.publish(upload_id, {"type": "upload_error", "error": {"message": str(e)}})
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        upload_progress.publish(upload_id, {"type": "upload_error", "error": {"message": str(e)}})
+        raise
+
+    response = UploadResponse(
+        file_path=str(project_path),
         file_name=file.filename,
-        size=file_path.stat().st_size,
+        size=total_bytes,
+        extracted_files=len(plan.members),
+        skipped_files=plan.skipped,
     )
+    upload_progress.publish(upload_id, {"type": "upload_complete", **response.model_dump()})
+    return response
 
 
 @router.post("/upload/pdfs", response_model=UploadResponse)
@@ -11,6 +11,7 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
 
 from wxcode.models.import_session import ImportSession
 from wxcode.services.step_executor import StepExecutor
+from wxcode.services.upload_progress import TERMINAL_EVENTS, upload_progress
 
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,35 @@ router = APIRouter()
 executor = StepExecutor()
 
 
+@router.websocket("/api/import-wizard/ws/upload/{upload_id}")
+async def upload_progress_endpoint(websocket: WebSocket, upload_id: str):
+    """
+    WebSocket de progresso do upload do projeto.
+
+    Repassa eventos upload_progress até upload_complete ou upload_error.
+
+    Args:
+        websocket: Conexão WebSocket
+        upload_id: Id enviado junto com o upload
+    """
+    await websocket.accept()
+    queue = upload_progress.subscribe(upload_id)
+    try:
+        while True:
+            event = await queue.get()
+            await websocket.send_text(json.dumps(event))
+            if event.get("type") in TERMINAL_EVENTS:
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        upload_progress.unsubscribe(upload_id, queue)
+    try:
+        await websocket.close()
+    except RuntimeError:
+        pass
+
+
 @router.websocket("/api/import-wizard/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """
@@ -195,6 +225,9 @@ async def handle_start(session: ImportSession, websocket: WebSocket) -> None:
             await websocket.send_text(json.dumps(error_event))
             break
 
+    # Etapas encerradas: liberar estado do pipeline da sessão
+    executor.release_session(session.session_id)
+
     # Se chegou ao final sem erros, marcar como completed (recarregar do banco)
     fresh_session = await ImportSession.find_one(ImportSession.session_id == session.session_id)
     if fresh_session and fresh_session.status == "running":
@@ -256,7 +289,7 @@ async def handle_cancel(session: ImportSession, websocket: WebSocket) -> None:
         session: Sessão de importação
         websocket: Conexão WebSocket
     """
-    # Cancelar processos ativos
+    # Cancelar etapa em execução
     await executor.cancel_session(session.session_id)
 
     # Atualizar status
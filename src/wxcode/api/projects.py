@@ -4,10 +4,11 @@ API de Projetos.
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 
 from beanie import PydanticObjectId
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from wxcode.models import Project, ProjectStatus, ProjectConfiguration
@@ -29,11 +30,16 @@ from wxcode.models.terminal_messages import (
     TerminalBannerMessage,
     TerminalAssistantTextMessage,
 )
-from wxcode.services import purge_project, PurgeStats
+from wxcode.services import get_purge_job, purge_project, start_purge_job, PurgeStats
 from wxcode.services.bidirectional_pty import BidirectionalPTY
 from wxcode.services.pty_session_manager import get_session_manager
 from wxcode.services.terminal_handler import TerminalHandler
 from wxcode.services.session_file_watcher import session_watcher_manager
+from wxcode.services.pagination import (
+    InvalidCursorError,
+    iter_projected,
+    paginate_by_cursor,
+)
 
 
 router = APIRouter()
@@ -61,7 +67,38 @@ class ProjectListResponse(BaseModel):
     """Lista de projetos."""
 
     projects: list[ProjectResponse]
-    total: int
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+# Projeção da listagem (apenas campos de ProjectResponse)
+PROJECT_LIST_PROJECTION = {
+    "name": 1,
+    "display_name": 1,
+    "major_version": 1,
+    "minor_version": 1,
+    "status": 1,
+    "total_elements": 1,
+    "elements_by_type": 1,
+    "configurations": 1,
+    "workspace_path": 1,
+}
+
+
+def _project_response_from_doc(doc: dict) -> ProjectResponse:
+    """Converte um documento projetado (PROJECT_LIST_PROJECTION) em resposta."""
+    return ProjectResponse(
+        id=str(doc["_id"]),
+        name=doc["name"],
+        display_name=doc.get("display_name"),
+        major_version=doc.get("major_version", 26),
+        minor_version=doc.get("minor_version", 0),
+        status=doc.get("status", ProjectStatus.IMPORTED),
+        total_elements=doc.get("total_elements", 0),
+        elements_by_type=doc.get("elements_by_type") or {},
+        configurations=doc.get("configurations") or [],
+        workspace_path=doc.get("workspace_path"),
+    )
 
 
 class DeleteProjectResponse(BaseModel):
@@ -71,33 +108,83 @@ class DeleteProjectResponse(BaseModel):
     stats: dict[str, int]
 
 
+class PurgeJobResponse(BaseModel):
+    """Estado de um purge de projeto executando em background."""
+
+    job_id: str
+    project_id: str
+    project_name: str
+    status: str
+    progress: dict[str, int]
+    stats: Optional[dict] = None
+    error: Optional[str] = None
+    started_at: str
+    finished_at: Optional[str] = None
+
+
 @router.get("", response_model=ProjectListResponse, include_in_schema=False)
 @router.get("/", response_model=ProjectListResponse)
 async def list_projects(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor (substitui skip)"
+    ),
+    count: Literal["exact", "estimated", "none"] = Query(
+        "exact",
+        description="exact: count(); estimated: metadados da collection; none: sem total",
+    ),
 ) -> ProjectListResponse:
-    """Lista todos os projetos."""
-    projects = await Project.find_all().skip(skip).limit(limit).to_list()
-    total = await Project.count()
+    """
+    Lista todos os projetos.
 
-    return ProjectListResponse(
-        projects=[
-            ProjectResponse(
-                id=str(p.id),
-                name=p.name,
-                display_name=p.display_name,
-                major_version=p.major_version,
-                minor_version=p.minor_version,
-                status=p.status,
-                total_elements=p.total_elements,
-                elements_by_type=p.elements_by_type,
-                configurations=p.configurations,
-                workspace_path=p.workspace_path,
+    Sem `cursor`, mantém a paginação por skip/limit. Com `cursor`, busca a
+    página seguinte por _id. `next_cursor` é retornado quando há mais itens.
+    """
+    if cursor or not skip:
+        try:
+            docs, next_cursor = await paginate_by_cursor(
+                Project, {}, ["_id"], PROJECT_LIST_PROJECTION, limit, cursor
             )
-            for p in projects
-        ],
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+    else:
+        pipeline = [
+            {"$sort": {"_id": 1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": PROJECT_LIST_PROJECTION},
+        ]
+        docs = await Project.aggregate(pipeline).to_list()
+        next_cursor = None
+
+    total: Optional[int] = None
+    if count == "exact":
+        total = await Project.count()
+    elif count == "estimated":
+        total = await Project.get_pymongo_collection().estimated_document_count()
+
+    return ProjectListResponse(
+        projects=[_project_response_from_doc(d) for d in docs],
         total=total,
+        next_cursor=next_cursor,
+    )
+
+
+async def _ndjson_lines(docs: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Serializa respostas de projeto como NDJSON."""
+    async for doc in docs:
+        line = _project_response_from_doc(doc).model_dump_json()
+        yield (line + "\n").encode("utf-8")
+
+
+@router.get("/export")
+async def export_projects() -> StreamingResponse:
+    """Exporta todos os projetos como NDJSON (um projeto por linha)."""
+    docs = iter_projected(Project, {}, ["_id"], PROJECT_LIST_PROJECTION)
+    return StreamingResponse(
+        _ndjson_lines(docs),
+        media_type="application/x-ndjson",
     )
 
 
@@ -143,8 +230,18 @@ async def get_project_by_name(name: str) -> ProjectResponse:
     )
 
 
-@router.delete("/{project_id}", response_model=DeleteProjectResponse)
-async def delete_project(project_id: str) -> DeleteProjectResponse:
+@router.delete(
+    "/{project_id}",
+    response_model=DeleteProjectResponse | PurgeJobResponse,
+)
+async def delete_project(
+    project_id: str,
+    response: Response,
+    background: bool = Query(
+        True,
+        description="Executa o purge em background e retorna o job (202)",
+    ),
+) -> DeleteProjectResponse | PurgeJobResponse:
     """
     Remove um projeto e todos os seus dados do banco.
 
@@ -156,18 +253,31 @@ async def delete_project(project_id: str) -> DeleteProjectResponse:
     - schemas (schema do banco)
     - conversions (conversões realizadas)
 
+    Por padrão o purge roda em background: a resposta (202) traz o job, cujo
+    progresso pode ser consultado em /purge-jobs/{job_id} ou acompanhado
+    pelo WebSocket /purge-jobs/{job_id}/ws. Com `background=false`, aguarda
+    o término e retorna as estatísticas.
+
     Returns:
-        Mensagem de sucesso com estatísticas de remoção
+        Job de purge ou mensagem de sucesso com estatísticas de remoção
     """
     try:
         object_id = PydanticObjectId(project_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="ID de projeto inválido")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail="ID de projeto inválido") from e
+
+    if background:
+        try:
+            job = await start_purge_job(object_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        response.status_code = 202
+        return PurgeJobResponse(**job.to_dict())
 
     try:
         stats = await purge_project(object_id)
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
 
     return DeleteProjectResponse(
         message=f"Projeto '{stats.project_name}' removido com sucesso",
@@ -175,6 +285,45 @@ async def delete_project(project_id: str) -> DeleteProjectResponse:
     )
 
 
+@router.get("/purge-jobs/{job_id}", response_model=PurgeJobResponse)
+async def get_purge_job_status(job_id: str) -> PurgeJobResponse:
+    """Retorna o estado e o progresso de um purge em background."""
+    job = get_purge_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job de purge não encontrado")
+    return PurgeJobResponse(**job.to_dict())
+
+
+@router.websocket("/purge-jobs/{job_id}/ws")
+async def purge_job_websocket(websocket: WebSocket, job_id: str):
+    """
+    Acompanha o progresso de um purge via WebSocket.
+
+    Envia o estado atual ao conectar e uma mensagem a cada lote removido.
+    Fecha a conexão quando o job termina (completed/failed).
+    """
+    await websocket.accept()
+
+    job = get_purge_job(job_id)
+    if not job:
+        await websocket.send_json({"error": "Job de purge não encontrado"})
+        await websocket.close(code=4004)
+        return
+
+    queue = job.subscribe()
+    try:
+        while True:
+            snapshot = await queue.get()
+            await websocket.send_json(snapshot)
+            if snapshot["status"] in ("completed", "failed"):
+                break
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        job.unsubscribe(queue)
+
+
 # === Terminal WebSocket for Knowledge Bases ===
 
 
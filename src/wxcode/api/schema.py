@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from wxcode.models import Project, DatabaseSchema
+from wxcode.models.schema import get_schema_tables
 
 
 router = APIRouter()
@@ -56,11 +57,12 @@ async def get_schema(project_name: str) -> SchemaResponse:
     if not schema:
         raise HTTPException(status_code=404, detail="Schema não encontrado")
 
+    tables = await get_schema_tables(schema)
     return SchemaResponse(
         project=project.name,
         source_file=schema.source_file,
         version=schema.version,
-        total_tables=len(schema.tables),
+        total_tables=len(tables),
         tables=[
             SchemaTableResponse(
                 name=t.name,
@@ -70,7 +72,7 @@ async def get_schema(project_name: str) -> SchemaResponse:
                 index_count=len(t.indexes),
                 primary_key=t.primary_key_columns,
             )
-            for t in schema.tables
+            for t in tables
         ],
         total_connections=len(schema.connections),
         connections=[
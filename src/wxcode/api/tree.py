@@ -11,9 +11,10 @@ from enum import Enum
 from typing import Optional
 
 from beanie import PydanticObjectId
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
+from wxcode.services.pagination import InvalidCursorError
 from wxcode.services.tree_builder import TreeBuilder
 
 
@@ -104,8 +105,8 @@ async def get_project_tree(
     """
     try:
         oid = PydanticObjectId(project_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="ID de projeto inválido")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail="ID de projeto inválido") from e
 
     builder = TreeBuilder()
     tree = await builder.build_project_tree(oid, depth=depth)
@@ -120,7 +121,16 @@ async def get_project_tree(
 async def get_node_children(
     project_id: str,
     node_id: str,
-    node_type: TreeNodeType = Query(..., description="Tipo do nó pai")
+    response: Response,
+    node_type: TreeNodeType = Query(..., description="Tipo do nó pai"),
+    limit: Optional[int] = Query(
+        default=None, ge=1, le=1000,
+        description="Máximo de elementos por página (apenas categorias de configuração)"
+    ),
+    after: Optional[str] = Query(
+        default=None,
+        description="Cursor da página anterior (header X-Next-Cursor)"
+    ),
 ) -> list[TreeNodeResponse]:
     """
     Carrega filhos de um nó (lazy loading).
@@ -130,18 +140,23 @@ async def get_node_children(
     - Nome de categoria (para node_type=category, ex: "pages", "procedures")
     - ID de elemento (para node_type=element)
 
+    Categorias grandes podem ser paginadas com `limit`; quando houver mais
+    itens, o header `X-Next-Cursor` traz o valor a passar em `after`.
+
     Args:
         project_id: ID do projeto
         node_id: ID ou identificador do nó pai
         node_type: Tipo do nó pai
+        limit: Tamanho da página
+        after: Cursor da página anterior
 
     Returns:
         Lista de nós filhos.
     """
     try:
         project_oid = PydanticObjectId(project_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="ID de projeto inválido")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail="ID de projeto inválido") from e
 
     builder = TreeBuilder()
 
@@ -158,13 +173,22 @@ async def get_node_children(
         else:
             config_id = None
             category = node_id
-        return await builder.expand_category(project_oid, config_id, category)
+        try:
+            children = await builder.expand_category(
+                project_oid, config_id, category, limit=limit, after=after
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        next_cursor = builder.category_page_cursor(children, limit)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return children
 
     elif node_type == TreeNodeType.ELEMENT:
         try:
             element_oid = PydanticObjectId(node_id)
-        except Exception:
-            raise HTTPException(status_code=400, detail="ID de elemento inválido")
+        except Exception as e:
+            raise HTTPException(status_code=400, detail="ID de elemento inválido") from e
         return await builder.expand_element(element_oid)
 
     else:
@@ -188,6 +188,8 @@ async def get_token_usage(project_id: str, tenant_id: str = "default"):
     # Calcula totais
     total_input = sum(log.input_tokens for log in logs)
     total_output = sum(log.output_tokens for log in logs)
+    total_cache_creation = sum(log.cache_creation_tokens for log in logs)
+    total_cache_read = sum(log.cache_read_tokens for log in logs)
     total_cost = sum(log.total_cost_usd for log in logs)
 
     return {
@@ -195,12 +197,16 @@ async def get_token_usage(project_id: str, tenant_id: str = "default"):
         "total_sessions": len(logs),
         "total_input_tokens": total_input,
         "total_output_tokens": total_output,
+        "total_cache_creation_tokens": total_cache_creation,
+        "total_cache_read_tokens": total_cache_read,
         "total_cost_usd": total_cost,
         "recent_logs": [
             {
                 "session_id": log.session_id,
                 "input_tokens": log.input_tokens,
                 "output_tokens": log.output_tokens,
+                "cache_creation_tokens": log.cache_creation_tokens,
+                "cache_read_tokens": log.cache_read_tokens,
                 "cost_usd": log.total_cost_usd,
                 "model": log.model,
                 "created_at": log.created_at.isoformat(),
@@ -21,7 +21,6 @@ from rich.table import Table
 from rich import box
 
 from wxcode import __version__
-from wxcode.config import get_settings
 
 # Cria aplicação Typer
 app = typer.Typer(
@@ -581,6 +580,16 @@ def convert(
         "-l",
         help="Camada: schema, domain, service, route, api, template, ou all",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Não usa o cache de respostas do LLM",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignora respostas em cache e regrava o cache com as novas",
+    ),
 ) -> None:
     """
     Converte um projeto para FastAPI + Jinja2 usando LLM.
@@ -596,6 +605,7 @@ def convert(
       wxcode convert Linkpay_ADM --dry-run                 # Preview
       wxcode convert Linkpay_ADM --layer service           # Só services
       wxcode convert Linkpay_ADM --layer all               # Tudo
+      wxcode convert Linkpay_ADM --refresh                 # Ignora cache do LLM
     """
     # Validar que --deploy-assets requer --theme
     if deploy_assets and not theme:
@@ -614,7 +624,12 @@ def convert(
         from wxcode.config import get_settings
         from wxcode.database import init_db, close_db
         from wxcode.models import Project
-        from wxcode.llm_converter import PageConverter, ProcedureConverter, ConversionError
+        from wxcode.llm_converter import (
+            ConversionError,
+            PageConverter,
+            ProcedureConverter,
+            get_response_cache,
+        )
         from wxcode.llm_converter.providers import create_provider
         from wxcode.generator import StarterKitGenerator
 
@@ -730,6 +745,8 @@ def convert(
         total_tokens_input = 0
         total_tokens_output = 0
         total_cost = 0.0
+        cache_hits = 0
+        response_cache = None if no_cache else get_response_cache()
         step = 2
 
         # 2. Converter camadas não-LLM via orchestrator (schema, domain, api, template)
@@ -795,6 +812,8 @@ def convert(
                     llm_provider=llm_provider,
                     theme=theme,
                     project_root=Path.cwd(),
+                    response_cache=response_cache,
+                    refresh_cache=refresh,
                 )
 
                 for i, page in enumerate(pages, 1):
@@ -807,7 +826,9 @@ def convert(
                         total_tokens_input += result.tokens_used.get("input", 0)
                         total_tokens_output += result.tokens_used.get("output", 0)
                         total_cost += result.cost_usd
-                        console.print(f"[green]✓[/] ({result.duration_seconds:.1f}s, ${result.cost_usd:.4f})")
+                        cache_hits += result.cache_hit
+                        cached = " [dim]cache[/]" if result.cache_hit else ""
+                        console.print(f"[green]✓[/] ({result.duration_seconds:.1f}s, ${result.cost_usd:.4f}){cached}")
                     except ConversionError as e:
                         results.append((page_name, None, str(e)))
                         console.print(f"[red]✗ {e}[/]")
@@ -849,6 +870,8 @@ def convert(
                     db,
                     config_output,
                     llm_provider=llm_provider,
+                    response_cache=response_cache,
+                    refresh_cache=refresh,
                 )
 
                 for i, group in enumerate(groups, 1):
@@ -861,7 +884,9 @@ def convert(
                         total_tokens_input += result.tokens_used.get("input", 0)
                         total_tokens_output += result.tokens_used.get("output", 0)
                         total_cost += result.cost_usd
-                        console.print(f"[green]✓[/] ({result.duration_seconds:.1f}s, ${result.cost_usd:.4f})")
+                        cache_hits += result.cache_hit
+                        cached = " [dim]cache[/]" if result.cache_hit else ""
+                        console.print(f"[green]✓[/] ({result.duration_seconds:.1f}s, ${result.cost_usd:.4f}){cached}")
                     except ConversionError as e:
                         service_results.append((group_name, None, str(e)))
                         console.print(f"[red]✗ {e}[/]")
@@ -892,6 +917,8 @@ def convert(
         table.add_row("Tokens (input)", f"{total_tokens_input:,}")
         table.add_row("Tokens (output)", f"{total_tokens_output:,}")
         table.add_row("Custo total", f"${total_cost:.4f}")
+        if response_cache is not None:
+            table.add_row("Cache hits (LLM)", str(cache_hits))
         table.add_row("Saída", str(config_output))
 
         console.print(table)
@@ -950,6 +977,16 @@ def export(
         "--docker/--no-docker",
         help="Incluir arquivos Docker (Dockerfile, docker-compose.yml)",
     ),
+    parallel: bool = typer.Option(
+        False,
+        "--parallel",
+        help="Carrega os dados uma vez e gera as camadas em paralelo",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        help="Processos para conversão WLanguage no modo paralelo (padrão: nº de CPUs)",
+    ),
 ) -> None:
     """
     Exporta o projeto convertido para o sistema de arquivos.
@@ -988,7 +1025,10 @@ def export(
         ) as progress:
             task = progress.add_task("Gerando projeto...", total=None)
 
-            orchestrator = GeneratorOrchestrator(str(proj.id), output, None, "python")
+            orchestrator = GeneratorOrchestrator(
+                str(proj.id), output, None, "python",
+                parallel=parallel, max_workers=workers,
+            )
             result = await orchestrator.generate_all()
 
             progress.update(task, description="Concluído!")
@@ -1486,8 +1526,8 @@ def parse_procedures(
     async def _parse_procedures() -> None:
         from wxcode.database import init_db, close_db
         from wxcode.models import Project, Element, ElementType
-        from wxcode.models.procedure import Procedure, ProcedureParameter, ProcedureDependencies
         from wxcode.parser.wdg_parser import parse_wdg_file
+        from wxcode.services.import_pipeline import save_wdg_procedures
 
         # Encontra arquivo de projeto
         project_file = _find_project_file(project_dir)
@@ -1575,62 +1615,8 @@ def parse_procedures(
                 # Parseia o arquivo
                 result = parse_wdg_file(wdg_path)
 
-                # Remove procedures antigas do elemento
-                await Procedure.find(
-                    Procedure.element_id == element.id
-                ).delete()
-
-                # Salva novas procedures
-                for proc in result.procedures:
-                    procedure = Procedure(
-                        element_id=element.id,
-                        project_id=proj.id,
-                        name=proc.name,
-                        procedure_id=proc.procedure_id,
-                        type_code=proc.type_code,
-                        windev_type=proc.windev_type,
-                        internal_properties=proc.internal_properties,
-                        parameters=[
-                            ProcedureParameter(
-                                name=p.name,
-                                type=p.type,
-                                is_local=p.is_local,
-                                default_value=p.default_value
-                            )
-                            for p in proc.parameters
-                        ],
-                        return_type=proc.return_type,
-                        code=proc.code,
-                        code_lines=proc.code_lines,
-                        dependencies=ProcedureDependencies(
-                            calls_procedures=proc.dependencies.calls_procedures,
-                            uses_files=proc.dependencies.uses_files,
-                            uses_apis=proc.dependencies.uses_apis,
-                            uses_queries=proc.dependencies.uses_queries
-                        ),
-                        has_documentation=proc.has_documentation,
-                        is_public=proc.is_public,
-                        is_internal=proc.is_internal,
-                        has_error_handling=proc.has_error_handling
-                    )
-                    await procedure.insert()
-
-                # Atualiza o campo ast do Element com resumo das procedures
-                from wxcode.models.element import ElementAST
-                if element.ast is None:
-                    element.ast = ElementAST()
-
-                element.ast.procedures = [
-                    {
-                        "name": proc.name,
-                        "parameters": [{"name": p.name, "type": p.type} for p in proc.parameters],
-                        "return_type": proc.return_type,
-                        "code_lines": proc.code_lines,
-                        "has_error_handling": proc.has_error_handling,
-                    }
-                    for proc in result.procedures
-                ]
-                await element.save()
+                # Regrava procedures e resumo no AST do elemento
+                await save_wdg_procedures(element, proj.id, result)
 
                 total_files += 1
                 total_procedures += result.total_procedures
@@ -1691,8 +1677,9 @@ def parse_classes(
     """
     async def _parse_classes() -> None:
         from wxcode.database import init_db, close_db
-        from wxcode.models import Project, Element, ClassDefinition
+        from wxcode.models import Project
         from wxcode.parser.wdc_parser import WdcParser
+        from wxcode.services.import_pipeline import save_class_definitions
 
         # Encontra arquivo do projeto
         project_file = _find_project_file(project_dir)
@@ -1764,89 +1751,7 @@ def parse_classes(
 
                 progress.update(task, description="Salvando no MongoDB...")
 
-                # Remove classes antigas (idempotente)
-                await ClassDefinition.find(
-                    ClassDefinition.project_id == proj.id
-                ).delete()
-
-                # Salva classes
-                total_members = 0
-                total_methods = 0
-                total_code_lines = 0
-
-                for wdc_file, parsed_class in parsed_classes:
-                    # Busca Element correspondente
-                    element = await Element.find_one(
-                        Element.project_id == proj.id,
-                        Element.source_file == wdc_file.name
-                    )
-
-                    if not element:
-                        # Cria element se não existir
-                        from wxcode.models import ElementType
-                        element = Element(
-                            project_id=proj.id,
-                            source_type=ElementType.CLASS,
-                            source_name=parsed_class.name,
-                            source_file=wdc_file.name,
-                            windev_type=4,
-                        )
-                        await element.insert()
-
-                    # Converte para ClassDefinition
-                    class_def = ClassDefinition(
-                        project_id=proj.id,
-                        element_id=element.id,
-                        name=parsed_class.name,
-                        identifier=parsed_class.identifier,
-                        inherits_from=parsed_class.inherits_from,
-                        is_abstract=parsed_class.is_abstract,
-                        members=[
-                            {
-                                "name": m.name,
-                                "type": m.type,
-                                "visibility": m.visibility,
-                                "default_value": m.default_value,
-                                "serialize": m.serialize,
-                            }
-                            for m in parsed_class.members
-                        ],
-                        methods=[
-                            {
-                                "name": m.name,
-                                "method_type": m.method_type,
-                                "visibility": m.visibility,
-                                "parameters": m.parameters,
-                                "return_type": m.return_type,
-                                "code": m.code,
-                                "code_lines": m.code_lines,
-                                "is_static": m.is_static,
-                                "procedure_id": m.procedure_id,
-                                "type_code": m.type_code,
-                                "windev_type": m.windev_type,
-                                "internal_properties": m.internal_properties,
-                            }
-                            for m in parsed_class.methods
-                        ],
-                        constants=[
-                            {
-                                "name": c.name,
-                                "value": c.value,
-                                "type": c.type,
-                            }
-                            for c in parsed_class.constants
-                        ],
-                        dependencies={
-                            "uses_classes": parsed_class.dependencies.uses_classes,
-                            "uses_files": parsed_class.dependencies.uses_files,
-                            "calls_procedures": parsed_class.dependencies.calls_procedures,
-                        },
-                    )
-                    await class_def.insert()
-
-                    total_members += parsed_class.total_members
-                    total_methods += parsed_class.total_methods
-                    total_code_lines += parsed_class.total_code_lines
+                await save_class_definitions(proj.id, parsed_classes)
 
                 progress.update(task, description="Concluído!")
         else:
@@ -1863,92 +1768,14 @@ def parse_classes(
 
             print("[INFO] Salvando no MongoDB...", flush=True)
 
-            # Remove classes antigas (idempotente)
-            await ClassDefinition.find(
-                ClassDefinition.project_id == proj.id
-            ).delete()
-
-            # Salva classes
-            total_members = 0
-            total_methods = 0
-            total_code_lines = 0
-
-            for wdc_file, parsed_class in parsed_classes:
-                # Busca Element correspondente
-                element = await Element.find_one(
-                    Element.project_id == proj.id,
-                    Element.source_file == wdc_file.name
-                )
-
-                if not element:
-                    # Cria element se não existir
-                    from wxcode.models import ElementType
-                    element = Element(
-                        project_id=proj.id,
-                        source_type=ElementType.CLASS,
-                        source_name=parsed_class.name,
-                        source_file=wdc_file.name,
-                        windev_type=4,
-                    )
-                    await element.insert()
-
-                # Converte para ClassDefinition
-                class_def = ClassDefinition(
-                    project_id=proj.id,
-                    element_id=element.id,
-                    name=parsed_class.name,
-                    identifier=parsed_class.identifier,
-                    inherits_from=parsed_class.inherits_from,
-                    is_abstract=parsed_class.is_abstract,
-                    members=[
-                        {
-                            "name": m.name,
-                            "type": m.type,
-                            "visibility": m.visibility,
-                            "default_value": m.default_value,
-                            "serialize": m.serialize,
-                        }
-                        for m in parsed_class.members
-                    ],
-                    methods=[
-                        {
-                            "name": m.name,
-                            "method_type": m.method_type,
-                            "visibility": m.visibility,
-                            "parameters": m.parameters,
-                            "return_type": m.return_type,
-                            "code": m.code,
-                            "code_lines": m.code_lines,
-                            "is_static": m.is_static,
-                            "procedure_id": m.procedure_id,
-                            "type_code": m.type_code,
-                            "windev_type": m.windev_type,
-                            "internal_properties": m.internal_properties,
-                        }
-                        for m in parsed_class.methods
-                    ],
-                    constants=[
-                        {
-                            "name": c.name,
-                            "value": c.value,
-                            "type": c.type,
-                        }
-                        for c in parsed_class.constants
-                    ],
-                    dependencies={
-                        "uses_classes": parsed_class.dependencies.uses_classes,
-                        "uses_files": parsed_class.dependencies.uses_files,
-                        "calls_procedures": parsed_class.dependencies.calls_procedures,
-                    },
-                )
-                await class_def.insert()
-
-                total_members += parsed_class.total_members
-                total_methods += parsed_class.total_methods
-                total_code_lines += parsed_class.total_code_lines
+            await save_class_definitions(proj.id, parsed_classes)
 
             print("[INFO] Concluído!", flush=True)
 
+        total_members = sum(c.total_members for _, c in parsed_classes)
+        total_methods = sum(c.total_methods for _, c in parsed_classes)
+        total_code_lines = sum(c.total_code_lines for _, c in parsed_classes)
+
         # Exibe resultado
         table = Table(title="Resultado do Parsing de Classes")
         table.add_column("Métrica", style="cyan")
@@ -2308,8 +2135,9 @@ def parse_schema(
     """
     async def _parse_schema() -> None:
         from wxcode.database import init_db, close_db
-        from wxcode.models import Project, DatabaseSchema
+        from wxcode.models import Project
         from wxcode.parser.xdd_parser import XddParser, find_analysis_file
+        from wxcode.services.import_pipeline import save_database_schema
 
         # Encontra arquivo do projeto
         project_file = _find_project_file(project_dir)
@@ -2376,20 +2204,9 @@ def parse_schema(
 
                 progress.update(task, description="Salvando no MongoDB...")
 
-                # Remove schema anterior (idempotente)
-                await DatabaseSchema.find(
-                    DatabaseSchema.project_id == proj.id
-                ).delete()
-
-                # Cria e salva novo schema
-                schema = DatabaseSchema(
-                    project_id=proj.id,
-                    source_file=str(xdd_path.relative_to(project_dir)),
-                    version=result.version,
-                    connections=result.connections,
-                    tables=result.tables,
+                await save_database_schema(
+                    proj.id, str(xdd_path.relative_to(project_dir)), result
                 )
-                await schema.insert()
 
                 progress.update(task, description="Concluído!")
         else:
@@ -2405,20 +2222,9 @@ def parse_schema(
 
             print("[INFO] Salvando no MongoDB...", flush=True)
 
-            # Remove schema anterior (idempotente)
-            await DatabaseSchema.find(
-                DatabaseSchema.project_id == proj.id
-            ).delete()
-
-            # Cria e salva novo schema
-            schema = DatabaseSchema(
-                project_id=proj.id,
-                source_file=str(xdd_path.relative_to(project_dir)),
-                version=result.version,
-                connections=result.connections,
-                tables=result.tables,
+            await save_database_schema(
+                proj.id, str(xdd_path.relative_to(project_dir)), result
             )
-            await schema.insert()
 
             print("[INFO] Schema salvo no MongoDB!", flush=True)
 
@@ -2516,6 +2322,16 @@ def convert_page(
         "--deploy-assets",
         help="Copia assets do tema (CSS, JS, fonts, images) antes da conversão. Requer --theme.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Não usa o cache de respostas do LLM",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignora respostas em cache e regrava o cache com as novas",
+    ),
 ) -> None:
     """
     Converte uma página WinDev para FastAPI + Jinja2 usando LLM.
@@ -2550,7 +2366,7 @@ def convert_page(
     async def _convert() -> None:
         from wxcode.config import get_settings
         from wxcode.database import init_db, close_db
-        from wxcode.llm_converter import PageConverter, ConversionError
+        from wxcode.llm_converter import PageConverter, ConversionError, get_response_cache
         from wxcode.llm_converter.providers import create_provider
 
         # Resolve modelo (usa default do provider se não especificado)
@@ -2626,6 +2442,8 @@ def convert_page(
                     llm_provider=llm_provider,
                     theme=theme,
                     project_root=Path.cwd(),
+                    response_cache=None if no_cache else get_response_cache(),
+                    refresh_cache=refresh,
                 )
 
                 progress.update(task, description=f"Chamando {provider} (pode demorar)...")
@@ -2655,6 +2473,7 @@ def convert_page(
         table.add_row("Tokens (output)", str(result.tokens_used.get("output", 0)))
         table.add_row("Duração", f"{result.duration_seconds:.2f}s")
         table.add_row("Custo estimado", f"${result.cost_usd:.4f}")
+        table.add_row("Cache do LLM", "hit" if result.cache_hit else "miss")
         table.add_row("Arquivos criados", str(len(result.files_created)))
 
         console.print(table)
@@ -3582,7 +3401,11 @@ def purge_project_cmd(
             console=console,
         ) as progress:
             task = progress.add_task("Removendo projeto...", total=None)
-            stats = await purge_project(project.id)
+
+            def on_purge_progress(step: str, count: int) -> None:
+                progress.update(task, description=f"Removendo {step}... ({count})")
+
+            stats = await purge_project(project.id, on_purge_progress)
             progress.update(task, description="Projeto removido")
 
         # Fecha conexão
@@ -3599,6 +3422,7 @@ def purge_project_cmd(
         table.add_row("procedures", str(stats.procedures))
         table.add_row("class_definitions", str(stats.class_definitions))
         table.add_row("schemas", str(stats.schemas))
+        table.add_row("schema_tables", str(stats.schema_tables))
         table.add_row("conversions", str(stats.conversions))
         table.add_row("[bold]Total MongoDB[/]", f"[bold]{stats.total}[/]")
 
@@ -3984,6 +3808,95 @@ def spec_proposal(
     asyncio.run(_spec_proposal())
 
 
+@app.command("spec-proposal-all")
+def spec_proposal_all(
+    project_name: str = typer.Argument(
+        ...,
+        help="Nome do projeto no MongoDB (ex: Linkpay_ADM)",
+    ),
+    output: Path = typer.Option(
+        Path("output/openspec"),
+        "--output",
+        "-o",
+        help="Diretório base do openspec (default: output/openspec)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Conversões simultâneas (default: CONVERSION_MAX_WORKERS)",
+    ),
+    limit: Optional[int] = typer.Option(
+        None,
+        "--limit",
+        "-n",
+        help="Máximo de elementos a converter nesta execução",
+    ),
+    provider: str = typer.Option(
+        "anthropic",
+        "--provider",
+        "-P",
+        help="LLM provider (anthropic, openai, ollama)",
+    ),
+    model: Optional[str] = typer.Option(
+        None,
+        "--model",
+        "-m",
+        help="Modelo específico (usa default do provider se não fornecido)",
+    ),
+) -> None:
+    """
+    Gera proposals para todos os elementos pendentes em paralelo.
+
+    Carrega a fronteira pendente uma vez, pula classes/procedures em lote e
+    converte cada elemento assim que suas dependências pendentes tiverem
+    proposal gerada. A concorrência por provider e o limite de tokens por
+    minuto vêm de CONVERSION_PROVIDER_CONCURRENCY e
+    CONVERSION_TOKENS_PER_MINUTE.
+
+    Exemplos:
+        wxcode spec-proposal-all Linkpay_ADM
+        wxcode spec-proposal-all Linkpay_ADM -w 8 -n 100
+    """
+    async def _spec_proposal_all() -> None:
+        from wxcode.config import get_settings
+        from wxcode.database import init_db, close_db
+        from wxcode.services.conversion_executor import ConversionExecutor
+
+        settings = get_settings()
+        client = await init_db()
+        db = client[settings.mongodb_database]
+
+        try:
+            executor = ConversionExecutor(db, output, provider=provider, model=model)
+
+            with console.status("[bold cyan]Gerando proposals..."):
+                report = await executor.execute_pending(
+                    project_name, max_items=limit, max_workers=workers
+                )
+
+            rate = report.dispatched / report.elapsed_seconds if report.elapsed_seconds else 0
+            console.print(f"[green]✓ {len(report.converted)} proposals geradas[/]")
+            if report.skipped:
+                console.print(f"[dim]{report.skipped} classes/procedures puladas[/]")
+            for name, error in report.failed.items():
+                console.print(f"[red]✗ {name}: {error}[/]")
+            if report.blocked:
+                console.print(
+                    f"[yellow]⚠ {len(report.blocked)} elementos aguardando dependências "
+                    f"com falha: {', '.join(report.blocked[:5])}...[/]"
+                )
+            console.print(
+                f"[dim]{report.dispatched} elementos em {report.elapsed_seconds:.1f}s "
+                f"({rate:.2f}/s)[/]"
+            )
+
+        finally:
+            await close_db(client)
+
+    asyncio.run(_spec_proposal_all())
+
+
 @app.command("conversion-skip")
 def conversion_skip(
     project_name: str = typer.Argument(
@@ -4232,11 +4145,17 @@ def list_elements(
                         "source_file": doc.get("source_file"),
                     })
 
-            # 4. Tables (embedded no DatabaseSchema)
+            # 4. Tables (coleção schema_tables; embutidas no schema legado)
             if item_type is None or item_type == "table":
-                schema_doc = await db.schemas.find_one({"project_id": project_id})
-                if schema_doc and "tables" in schema_doc:
-                    for table in schema_doc["tables"]:
+                schema_doc = await db.schemas.find_one(
+                    {"project_id": project_id}, {"tables": 1}
+                )
+                tables = (schema_doc or {}).get("tables") or await db.schema_tables.find(
+                    {"project_id": project_id},
+                    {"name": 1, "layer": 1, "topological_order": 1, "conversion_status": 1},
+                ).sort("_id", 1).to_list(None)
+                if tables:
+                    for table in tables:
                         table_layer = table.get("layer")
                         table_order = table.get("topological_order")
                         table_status = table.get("conversion_status", "pending")
@@ -44,6 +44,22 @@ class Settings(BaseSettings):
     conversion_output_base: str = "./output/openspec"
     conversion_provider: str = "anthropic"
     conversion_model: Optional[str] = None
+    conversion_max_workers: int = 4
+    conversion_provider_concurrency: int = 4
+    conversion_tokens_per_minute: Optional[int] = None  # None = sem limite
+
+    # Cache de respostas do LLM (reconversões com contexto idêntico)
+    llm_cache_dir: str = str(PROJECT_ROOT / ".cache" / "llm-responses")
+    llm_cache_max_mb: int = 512
+
+    # Conteúdo dos arquivos gerados (endereçado por hash, referenciado nos Elements)
+    artifact_store_dir: str = str(PROJECT_ROOT / ".artifacts")
+
+    # Referência WLanguage compilada (JSON indexado, gerado a partir do YAML)
+    wlanguage_index_dir: str = str(PROJECT_ROOT / ".cache" / "wlanguage")
+
+    # Bytecode dos templates Jinja2 dos generators (reuso entre execuções)
+    jinja_bytecode_cache_dir: str = str(PROJECT_ROOT / ".cache" / "jinja")
 
     # Neo4j
     neo4j_uri: str = "bolt://localhost:7687"
@@ -14,6 +14,8 @@ from wxcode.models import (
     ControlTypeDefinition,
     Procedure,
     DatabaseSchema,
+    SchemaTableDocument,
+    SchemaSummary,
     ClassDefinition,
     Product,
     ConversionHistoryEntry,
@@ -48,6 +50,8 @@ async def init_db() -> AsyncIOMotorClient:
             ControlTypeDefinition,
             Procedure,
             DatabaseSchema,
+            SchemaTableDocument,
+            SchemaSummary,
             ClassDefinition,
             TokenUsageLog,
             ImportSession,
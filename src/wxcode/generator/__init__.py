@@ -30,8 +30,10 @@ Usage:
 """
 
 from .api_generator import APIGenerator
+from .artifact_store import ArtifactStore, get_artifact_store
 from .base import BaseGenerator, ElementFilter
 from .domain_generator import DomainGenerator
+from .jinja_environments import JinjaEnvironmentRegistry, get_jinja_environment
 from .orchestrator import GeneratorOrchestrator, OrchestratorResult
 from .result import GenerationResult
 from .route_generator import RouteGenerator
@@ -43,12 +45,14 @@ from .wlanguage_converter import ConversionResult, WLanguageConverter, convert_w
 
 __all__ = [
     "APIGenerator",
+    "ArtifactStore",
     "BaseGenerator",
     "ConversionResult",
     "DomainGenerator",
     "ElementFilter",
     "GenerationResult",
     "GeneratorOrchestrator",
+    "JinjaEnvironmentRegistry",
     "OrchestratorResult",
     "RouteGenerator",
     "SchemaGenerator",
@@ -57,4 +61,6 @@ __all__ = [
     "TemplateGenerator",
     "WLanguageConverter",
     "convert_wlanguage",
+    "get_artifact_store",
+    "get_jinja_environment",
 ]
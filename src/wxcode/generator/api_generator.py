@@ -60,8 +60,7 @@ class APIGenerator(BaseGenerator):
             List of generated file paths
         """
         # Find REST API elements with filter applied
-        query = self.get_element_query("rest_api")
-        elements = await Element.find(query).to_list()
+        elements = await self.find_elements("rest_api")
 
         if not elements:
             return []
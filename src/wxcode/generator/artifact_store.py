@@ -0,0 +1,99 @@
+"""Content-addressed store for generated files.
+
+Generated file contents are stored once per SHA-256 digest under
+``<root>/<digest[:2]>/<digest>``; ``Element.conversion.target_files``
+keeps only the path, type, digest and size of each file.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+
+class ArtifactStore:
+    """Blob store keyed by the SHA-256 of the content.
+
+    Blobs are immutable: writing the same content twice is a no-op, so
+    regenerating unchanged files costs one hash and one ``stat``.
+    """
+
+    def __init__(self, root: Path | str):
+        """Initialize the store.
+
+        Args:
+            root: Directory where blobs are kept
+        """
+        self.root = Path(root)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """SHA-256 hex digest used as the blob key."""
+        return hashlib.sha256(data).hexdigest()
+
+    def path_for(self, digest: str) -> Path:
+        """Path of the blob for a digest."""
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes, digest: str | None = None) -> str:
+        """Store content and return its digest.
+
+        Args:
+            data: Content bytes
+            digest: Precomputed digest of ``data``, if available
+
+        Returns:
+            SHA-256 hex digest of the content
+        """
+        digest = digest or self.digest(data)
+        path = self.path_for(digest)
+        if path.exists():
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic write: concurrent runs may store the same blob
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes | None:
+        """Read a blob.
+
+        Args:
+            digest: Digest returned by put()
+
+        Returns:
+            Content bytes, or None if the blob is missing
+        """
+        try:
+            return self.path_for(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def get_text(self, digest: str) -> str | None:
+        """Read a blob as UTF-8 text."""
+        data = self.get(digest)
+        return data.decode("utf-8") if data is not None else None
+
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return self.path_for(digest).exists()
+
+
+_default_store: ArtifactStore | None = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Return the shared artifact store (configured by settings)."""
+    global _default_store
+    if _default_store is None:
+        from wxcode.config import get_settings
+
+        _default_store = ArtifactStore(get_settings().artifact_store_dir)
+    return _default_store
@@ -3,10 +3,11 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from bson import ObjectId
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment
+from pymongo import UpdateOne
 
 from wxcode.models.element import (
     ConversionStatus,
@@ -15,8 +16,14 @@ from wxcode.models.element import (
     ElementConversion,
 )
 
+from .artifact_store import ArtifactStore, get_artifact_store
+from .jinja_environments import get_jinja_environment
 from .result import GenerationResult
 
+if TYPE_CHECKING:
+    from .snapshot import GenerationSnapshot
+    from .wlanguage_converter import ConversionResult
+
 # Type variable for elements that can be tracked
 T = TypeVar("T")
 
@@ -117,7 +124,10 @@ class BaseGenerator(ABC):
         project_id: MongoDB ObjectId string for the project
         output_dir: Root directory for generated files
         generated_files: List of files generated by this generator
+        skipped_files: Generated files whose content was unchanged on disk
         element_filter: Optional filter for selecting elements
+        snapshot: Preloaded shared data; when set, generate() reads from it
+            instead of querying MongoDB (see GenerationSnapshot)
     """
 
     # Template subdirectory for this generator type
@@ -140,35 +150,40 @@ class BaseGenerator(ABC):
         self.project_id = project_id
         self.output_dir = Path(output_dir)
         self.generated_files: list[Path] = []
+        self.skipped_files: list[Path] = []
         self.element_filter = element_filter
         self._jinja_env: Environment | None = None
+        self._artifact_store: ArtifactStore | None = None
         self._converted_elements: list[Element] = []  # Track converted elements
         self._element_files: dict[str, list[str]] = {}  # element_id -> [file_paths]
+        # path -> (sha256, size, mtime_ns) of the files written by this run
+        self._file_hashes: dict[str, tuple[str, int, int]] = {}
+        # path -> (sha256, mtime_ns) recorded on the element by the last run
+        self._previous_hashes: dict[str, tuple[str, int | None]] = {}
+        self._stale_files: set[str] = set()  # previous files not yet rewritten
+        self.snapshot: "GenerationSnapshot | None" = None
+
+    @property
+    def artifact_store(self) -> ArtifactStore:
+        """Store holding the content of element files (shared by default)."""
+        if self._artifact_store is None:
+            self._artifact_store = get_artifact_store()
+        return self._artifact_store
+
+    @artifact_store.setter
+    def artifact_store(self, store: ArtifactStore) -> None:
+        self._artifact_store = store
 
     @property
     def jinja_env(self) -> Environment:
-        """Get or create Jinja2 environment for template rendering.
+        """Get the Jinja2 environment for template rendering.
 
-        Uses templates from src/wxcode/generator/templates/<subdir>/
+        Uses templates from src/wxcode/generator/templates/<subdir>/. The
+        environment is shared by all generators of the process (see
+        jinja_environments), so templates are compiled once.
         """
         if self._jinja_env is None:
-            self._jinja_env = Environment(
-                loader=PackageLoader(
-                    "wxcode.generator",
-                    f"templates/{self.template_subdir}"
-                ),
-                autoescape=select_autoescape(
-                    enabled_extensions=("html", "xml"),
-                    default_for_string=False,
-                ),
-                trim_blocks=True,
-                lstrip_blocks=True,
-                keep_trailing_newline=True,
-            )
-            # Add custom filters
-            self._jinja_env.filters["snake_case"] = self._to_snake_case
-            self._jinja_env.filters["pascal_case"] = self._to_pascal_case
-            self._jinja_env.filters["camel_case"] = self._to_camel_case
+            self._jinja_env = get_jinja_environment(self.template_subdir)
 
         return self._jinja_env
 
@@ -190,6 +205,9 @@ class BaseGenerator(ABC):
     def write_file(self, relative_path: str, content: str) -> Path:
         """Write content to a file, creating directories as needed.
 
+        Files whose content is unchanged on disk are not rewritten (their
+        mtime is preserved) and are listed in ``skipped_files``.
+
         Args:
             relative_path: Path relative to output_dir (e.g., 'app/models/cliente.py')
             content: String content to write to the file
@@ -198,11 +216,40 @@ class BaseGenerator(ABC):
             Full Path to the created file
         """
         full_path = self.output_dir / relative_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
+        data = content.encode("utf-8")
+        digest = ArtifactStore.digest(data)
+        self._stale_files.discard(relative_path)
+
+        if self._is_unchanged(full_path, relative_path, data, digest):
+            self.skipped_files.append(full_path)
+        else:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.write_bytes(data)
+        self._file_hashes[relative_path] = (digest, len(data), full_path.stat().st_mtime_ns)
         self.generated_files.append(full_path)
         return full_path
 
+    def _is_unchanged(
+        self, full_path: Path, relative_path: str, data: bytes, digest: str
+    ) -> bool:
+        """Check whether the file on disk already holds this content.
+
+        Uses the hash recorded on the element by the previous run only if
+        the file still has the mtime recorded when it was written; files
+        touched since then (or without a recorded mtime) are compared byte
+        by byte. Sizes must match in every case.
+        """
+        try:
+            stat = full_path.stat()
+        except FileNotFoundError:
+            return False
+        if stat.st_size != len(data):
+            return False
+        previous = self._previous_hashes.get(relative_path)
+        if previous is not None and previous[1] == stat.st_mtime_ns:
+            return previous[0] == digest
+        return full_path.read_bytes() == data
+
     def render_template(self, template_name: str, context: dict[str, Any]) -> str:
         """Render a Jinja2 template with the given context.
 
@@ -219,6 +266,8 @@ class BaseGenerator(ABC):
     def render_template_string(self, template_str: str, context: dict[str, Any]) -> str:
         """Render a template from string (for dynamic templates).
 
+        The compiled template is memoized by the shared environment.
+
         Args:
             template_str: Jinja2 template as string
             context: Dictionary of variables to pass to template
@@ -268,8 +317,11 @@ class BaseGenerator(ABC):
         if element_id in self._element_files:
             self._element_files[element_id].append(relative_path)
 
-        # Write the file
-        return self.write_file(relative_path, content)
+        # Write the file and keep its content in the artifact store
+        full_path = self.write_file(relative_path, content)
+        digest, _, _ = self._file_hashes[relative_path]
+        self.artifact_store.put(content.encode("utf-8"), digest)
+        return full_path
 
     async def update_element_status(
         self,
@@ -288,21 +340,40 @@ class BaseGenerator(ABC):
             issues: List of issues found during conversion
             human_review_required: Whether human review is needed
         """
+        self._apply_conversion_status(element, status, issues, human_review_required)
+        await element.save()
+
+    def _apply_conversion_status(
+        self,
+        element: Element,
+        status: ConversionStatus,
+        issues: list[str] | None = None,
+        human_review_required: bool = False,
+    ) -> None:
+        """Update element conversion metadata in memory.
+
+        target_files reference the artifact store by hash; file contents
+        are not read back from disk nor embedded in the element.
+        """
         element_id = str(element.id)
 
         # Build list of new converted files from this generator
         new_files = []
         new_file_types = set()
         for relative_path in self._element_files.get(element_id, []):
-            full_path = self.output_dir / relative_path
-            if full_path.exists():
-                file_type = self._detect_file_type(relative_path)
-                new_files.append(ConvertedFile(
-                    path=relative_path,
-                    file_type=file_type,
-                    content=full_path.read_text(encoding="utf-8"),
-                ))
-                new_file_types.add(file_type)
+            entry = self._file_hashes.get(relative_path)
+            if entry is None:
+                continue
+            digest, size, mtime_ns = entry
+            file_type = self._detect_file_type(relative_path)
+            new_files.append(ConvertedFile(
+                path=relative_path,
+                file_type=file_type,
+                content_hash=digest,
+                size=size,
+                mtime_ns=mtime_ns,
+            ))
+            new_file_types.add(file_type)
 
         # Keep existing files from other generators (different file types)
         existing_files = []
@@ -324,25 +395,56 @@ class BaseGenerator(ABC):
         element.conversion.converted_at = datetime.utcnow()
         element.updated_at = datetime.utcnow()
 
-        await element.save()
-
     async def update_all_converted_elements(
         self,
         status: ConversionStatus = ConversionStatus.CONVERTED,
     ) -> int:
         """Update status for all tracked converted elements.
 
+        Also removes previous files that were not regenerated in this run.
+        All elements are persisted with a single bulk_write.
+
         Args:
             status: Status to set for all elements
 
         Returns:
             Number of elements updated
         """
-        count = 0
+        if self.snapshot is not None:
+            # Generators sharing the snapshot update the same Element objects:
+            # apply + write under a lock so the last write has every file type
+            async with self.snapshot.status_lock:
+                return await self._write_converted_elements(status)
+        return await self._write_converted_elements(status)
+
+    async def _write_converted_elements(self, status: ConversionStatus) -> int:
+        self._remove_stale_files()
+
+        operations = []
         for element in self._converted_elements:
-            await self.update_element_status(element, status)
-            count += 1
-        return count
+            self._apply_conversion_status(element, status)
+            operations.append(UpdateOne(
+                {"_id": element.id},
+                {"$set": {
+                    "conversion": element.conversion.model_dump(),
+                    "updated_at": element.updated_at,
+                }},
+            ))
+
+        if operations:
+            await Element.get_pymongo_collection().bulk_write(operations, ordered=False)
+        return len(operations)
+
+    def _remove_stale_files(self) -> int:
+        """Delete previous files of cleaned elements that were not rewritten."""
+        removed = 0
+        for relative_path in self._stale_files:
+            file_path = self.output_dir / relative_path
+            if file_path.exists():
+                file_path.unlink()
+                removed += 1
+        self._stale_files.clear()
+        return removed
 
     def _detect_file_type(self, path: str) -> str:
         """Detect file type from path.
@@ -396,6 +498,32 @@ class BaseGenerator(ABC):
 
         return query
 
+    async def find_elements(self, source_types: list[str] | str) -> list[Element]:
+        """Get the elements to generate, from the snapshot or MongoDB.
+
+        Args:
+            source_types: Single source type or list of source types
+
+        Returns:
+            Elements matching the type and the element filter
+        """
+        if self.snapshot is not None:
+            return self.snapshot.elements_of_type(source_types)
+        return await Element.find(self.get_element_query(source_types)).to_list()
+
+    def precomputed_conversion(self, code: str) -> "ConversionResult | None":
+        """Conversion of a WLanguage body done ahead of time, if any.
+
+        Args:
+            code: WLanguage source code
+
+        Returns:
+            ConversionResult from the snapshot, or None
+        """
+        if self.snapshot is None:
+            return None
+        return self.snapshot.converted_code.get(code)
+
     async def clean_previous_files(
         self, element: Element, file_types: list[str] | None = None
     ) -> int:
@@ -405,13 +533,16 @@ class BaseGenerator(ABC):
         before regenerating. Only removes files matching the specified
         file types to avoid deleting files from other generators.
 
+        Removal is deferred to update_all_converted_elements(): files that
+        are regenerated with the same content are kept untouched.
+
         Args:
             element: Element whose files should be cleaned
             file_types: List of file types to clean (e.g., ["route", "template"]).
                        If None, cleans all files (use with caution).
 
         Returns:
-            Number of files removed
+            Number of files scheduled for removal
         """
         removed = 0
 
@@ -421,9 +552,14 @@ class BaseGenerator(ABC):
             for converted_file in element.conversion.target_files:
                 # Only clean files of specified types
                 if file_types is None or converted_file.file_type in file_types:
-                    file_path = self.output_dir / converted_file.path
-                    if file_path.exists():
-                        file_path.unlink()
+                    if converted_file.content_hash:
+                        self._previous_hashes[converted_file.path] = (
+                            converted_file.content_hash,
+                            converted_file.mtime_ns,
+                        )
+                    written = converted_file.path in self._file_hashes
+                    if not written and (self.output_dir / converted_file.path).exists():
+                        self._stale_files.add(converted_file.path)
                         removed += 1
                 else:
                     # Keep files from other generators
@@ -106,6 +106,7 @@ class DomainGenerator(BaseGenerator):
         """
         super().__init__(project_id, output_dir, element_filter)
         self._class_names: dict[str, str] = {}  # original_name -> python_class_name
+        self._converter = WLanguageConverter(db_var="self.db")
 
     def _get_class_query(self) -> dict[str, Any]:
         """Get MongoDB query for classes with filter applied.
@@ -148,8 +149,11 @@ class DomainGenerator(BaseGenerator):
             List of generated file paths
         """
         # Fetch class definitions with filter applied
-        query = self._get_class_query()
-        class_defs = await ClassDefinition.find(query).to_list()
+        if self.snapshot is not None:
+            class_defs = list(self.snapshot.class_definitions)
+        else:
+            query = self._get_class_query()
+            class_defs = await ClassDefinition.find(query).to_list()
 
         if not class_defs:
             return []
@@ -367,9 +371,8 @@ class DomainGenerator(BaseGenerator):
         if not code or not code.strip():
             return None
 
-        # Use WLanguageConverter for conversion
-        converter = WLanguageConverter(db_var="self.db")
-        result = converter.convert(code)
+        # Use WLanguageConverter for conversion (state is reset per call)
+        result = self.precomputed_conversion(code) or self._converter.convert(code)
 
         # Build output
         output_lines = []
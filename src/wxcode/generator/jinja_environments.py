@@ -0,0 +1,220 @@
+"""Process-wide Jinja2 environments shared by the generators.
+
+Each generator used to build its own Environment, so every run (and every
+generator instance) re-parsed and re-compiled the same templates. The
+registry keeps one Environment per (stack, template subdir, options):
+- compiled templates are cached in memory by the Environment itself;
+- their bytecode is cached on disk (FileSystemBytecodeCache), so a new
+  process (``wxcode convert``, ``wxcode test-app``) skips compilation of
+  unchanged templates;
+- ``from_string`` is memoized per source string.
+
+If the cache directory is not writable, environments work without the
+bytecode cache.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    select_autoescape,
+)
+from jinja2.bccache import Bucket
+
+logger = logging.getLogger(__name__)
+
+# Compiled from_string templates kept per environment
+MAX_STRING_TEMPLATES = 256
+
+
+class EnvironmentOptions(NamedTuple):
+    """Whitespace options of an environment (part of the registry key)."""
+
+    trim_blocks: bool = True
+    lstrip_blocks: bool = True
+    keep_trailing_newline: bool = True
+
+
+DEFAULT_OPTIONS = EnvironmentOptions()
+
+
+class _BytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache namespaced per environment.
+
+    Jinja keys bytecode by template name and file only, but the compiled
+    code depends on the environment options, so each environment gets its
+    own namespace. I/O errors never fail a render.
+    """
+
+    def __init__(self, directory: str, namespace: str):
+        super().__init__(directory)
+        self.namespace = namespace
+
+    def get_cache_key(self, name: str, filename: str | None = None) -> str:
+        key = f"{self.namespace}|{name}|{filename or ''}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Jinja bytecode cache read failed: {e}")
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Jinja bytecode cache write failed: {e}")
+
+
+class CachedEnvironment(Environment):
+    """Environment that memoizes from_string compilation."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._string_templates: OrderedDict[str, Template] = OrderedDict()
+        self._string_lock = threading.Lock()
+
+    def from_string(self, source, globals=None, template_class=None) -> Template:
+        """Compile a template from a string, reusing earlier compilations."""
+        if globals or template_class is not None or not isinstance(source, str):
+            return super().from_string(source, globals, template_class)
+
+        with self._string_lock:
+            template = self._string_templates.get(source)
+            if template is not None:
+                self._string_templates.move_to_end(source)
+                return template
+
+        template = super().from_string(source)
+        with self._string_lock:
+            self._string_templates[source] = template
+            if len(self._string_templates) > MAX_STRING_TEMPLATES:
+                self._string_templates.popitem(last=False)
+        return template
+
+
+def _cache_directory(directory: Path | None) -> Path | None:
+    if directory is None:
+        from wxcode.config import get_settings
+
+        directory = Path(get_settings().jinja_bytecode_cache_dir)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Jinja bytecode cache disabled ({directory}): {e}")
+        return None
+    return directory
+
+
+def _register_filters(env: Environment) -> None:
+    from .base import BaseGenerator
+
+    env.filters["snake_case"] = BaseGenerator._to_snake_case
+    env.filters["pascal_case"] = BaseGenerator._to_pascal_case
+    env.filters["camel_case"] = BaseGenerator._to_camel_case
+
+
+class JinjaEnvironmentRegistry:
+    """Environments keyed by (stack, template subdir, options)."""
+
+    def __init__(self, cache_dir: Path | None = None, use_bytecode_cache: bool = True):
+        """Initialize the registry.
+
+        Args:
+            cache_dir: Bytecode cache directory (default: settings.jinja_bytecode_cache_dir)
+            use_bytecode_cache: Disable to keep compiled templates in memory only
+        """
+        self.cache_dir = cache_dir
+        self.use_bytecode_cache = use_bytecode_cache
+        self._environments: dict[tuple[str, str, EnvironmentOptions], CachedEnvironment] = {}
+        self._bytecode_dir: Path | None = None
+        self._bytecode_dir_resolved = False
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        template_subdir: str,
+        stack: str = "python",
+        options: EnvironmentOptions = DEFAULT_OPTIONS,
+    ) -> CachedEnvironment:
+        """Return the environment for templates/<template_subdir>, creating it once.
+
+        Args:
+            template_subdir: Subdirectory of wxcode/generator/templates
+            stack: Target stack the templates belong to
+            options: Whitespace options
+
+        Returns:
+            Shared CachedEnvironment (do not mutate its configuration)
+        """
+        key = (stack, template_subdir, options)
+        env = self._environments.get(key)
+        if env is not None:
+            return env
+
+        with self._lock:
+            env = self._environments.get(key)
+            if env is None:
+                env = self._create(key)
+                self._environments[key] = env
+        return env
+
+    def clear(self) -> None:
+        """Drop all environments (the on-disk bytecode cache is kept)."""
+        with self._lock:
+            self._environments.clear()
+
+    def _create(self, key: tuple[str, str, EnvironmentOptions]) -> CachedEnvironment:
+        _, template_subdir, options = key
+        if self.use_bytecode_cache and not self._bytecode_dir_resolved:
+            self._bytecode_dir = _cache_directory(self.cache_dir)
+            self._bytecode_dir_resolved = True
+
+        bytecode_cache: BytecodeCache | None = None
+        if self._bytecode_dir is not None:
+            bytecode_cache = _BytecodeCache(str(self._bytecode_dir), repr(key))
+
+        env = CachedEnvironment(
+            loader=PackageLoader("wxcode.generator", f"templates/{template_subdir}"),
+            autoescape=select_autoescape(
+                enabled_extensions=("html", "xml"),
+                default_for_string=False,
+            ),
+            trim_blocks=options.trim_blocks,
+            lstrip_blocks=options.lstrip_blocks,
+            keep_trailing_newline=options.keep_trailing_newline,
+            bytecode_cache=bytecode_cache,
+            auto_reload=True,
+        )
+        _register_filters(env)
+        return env
+
+
+_default_registry: JinjaEnvironmentRegistry | None = None
+
+
+def get_jinja_registry() -> JinjaEnvironmentRegistry:
+    """Return the process-wide environment registry."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = JinjaEnvironmentRegistry()
+    return _default_registry
+
+
+def get_jinja_environment(
+    template_subdir: str,
+    stack: str = "python",
+    options: EnvironmentOptions = DEFAULT_OPTIONS,
+) -> CachedEnvironment:
+    """Shortcut for get_jinja_registry().get(...)."""
+    return get_jinja_registry().get(template_subdir, stack, options)
@@ -5,8 +5,17 @@ FastAPI + Jinja2 application.
 
 Supports selective element conversion via ElementFilter and
 configuration-aware conversion via ConversionConfig.
+
+With parallel=True the data is preloaded once into a GenerationSnapshot,
+WLanguage bodies are converted in a process pool and the layer generators
+run concurrently; results are still reported in GENERATOR_ORDER.
 """
 
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -27,9 +36,17 @@ from .result import GenerationResult
 from .route_generator import RouteGenerator
 from .schema_generator import SchemaGenerator
 from .service_generator import ServiceGenerator
+from .snapshot import (
+    MIN_CODES_FOR_POOL,
+    SNAPSHOT_SOURCE_TYPES,
+    GenerationSnapshot,
+    load_generation_snapshot,
+)
 from .state_generator import BaseStateGenerator
 from .template_generator import TemplateGenerator
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GeneratorProgress:
@@ -95,6 +112,9 @@ class GeneratorOrchestrator:
     Also generates project structure files (main.py, config, docker, etc.)
 
     Supports selective element conversion via ElementFilter.
+
+    The layers write disjoint directories, so with parallel=True they run
+    concurrently over a shared GenerationSnapshot.
     """
 
     # Generator order based on dependencies
@@ -120,6 +140,8 @@ class GeneratorOrchestrator:
         output_dir: Path,
         element_filter: ElementFilter | None = None,
         stack: str = "python",
+        parallel: bool = False,
+        max_workers: int | None = None,
     ):
         """Initialize orchestrator.
 
@@ -128,11 +150,16 @@ class GeneratorOrchestrator:
             output_dir: Root directory where files will be written
             element_filter: Optional filter for selective element conversion
             stack: Target stack for generation (default: "python")
+            parallel: Preload a shared snapshot and run layers concurrently
+            max_workers: Processes for WLanguage conversion in parallel mode
+                (default: CPU count; 1 converts in-process)
         """
         self.project_id = project_id
         self.output_dir = Path(output_dir)
         self.element_filter = element_filter
         self.stack = stack
+        self.parallel = parallel
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.result = OrchestratorResult(
             project_id=project_id,
             output_dir=self.output_dir,
@@ -178,27 +205,20 @@ class GeneratorOrchestrator:
                 include_converted=True,  # Force include converted for selective
             )
 
-        # Run each generator in order
-        for name, generator_class in self.GENERATOR_ORDER:
-            progress = GeneratorProgress(name=name)
-            self.result.generators.append(progress)
-
-            try:
-                progress.status = "running"
+        if self.parallel:
+            await self._run_generators_parallel(filter_for_generators)
+        else:
+            # Run each generator in order
+            for name, generator_class in self.GENERATOR_ORDER:
+                progress = GeneratorProgress(name=name)
+                self.result.generators.append(progress)
                 # Pass element_filter to each generator
-                generator = generator_class(
-                    self.project_id, self.output_dir, filter_for_generators
+                await self._run_generator(
+                    progress,
+                    lambda cls=generator_class: cls(
+                        self.project_id, self.output_dir, filter_for_generators
+                    ),
                 )
-                files = await generator.generate()
-                progress.files_generated = len(files)
-                progress.status = "completed"
-                self.result.total_files += len(files)
-
-            except Exception as e:
-                progress.status = "failed"
-                progress.error = str(e)
-                self.result.success = False
-                self.result.errors.append(f"{name}: {e}")
 
         # Generate project structure files (only if no filter or full generation)
         if self.result.success and not self.element_filter:
@@ -210,6 +230,96 @@ class GeneratorOrchestrator:
 
         return self.result
 
+    async def _run_generator(self, progress: GeneratorProgress, create) -> None:
+        """Create and run one generator, recording its progress.
+
+        Args:
+            progress: Progress entry of the generator
+            create: Callable returning the generator instance
+        """
+        try:
+            progress.status = "running"
+            generator = create()
+            files = await generator.generate()
+            progress.files_generated = len(files)
+            progress.status = "completed"
+            self.result.total_files += len(files)
+
+        except Exception as e:
+            progress.status = "failed"
+            progress.error = str(e)
+            self.result.success = False
+            self.result.errors.append(f"{progress.name}: {e}")
+
+    async def _run_generators_parallel(self, element_filter: ElementFilter | None) -> None:
+        """Run all layer generators concurrently over a shared snapshot.
+
+        Progress entries and errors are recorded in GENERATOR_ORDER, whatever
+        order the generators finish in.
+
+        Args:
+            element_filter: Filter passed to every generator
+        """
+        generators = [
+            (name, generator_class(self.project_id, self.output_dir, element_filter))
+            for name, generator_class in self.GENERATOR_ORDER
+        ]
+
+        snapshot = None
+        try:
+            snapshot = await self._load_snapshot(generators)
+        except Exception as e:
+            # Not a generation failure: generators fall back to their own queries
+            logger.warning(f"Generation snapshot unavailable, using per-generator queries: {e}")
+
+        progresses = []
+        for name, generator in generators:
+            generator.snapshot = snapshot
+            progresses.append(GeneratorProgress(name=name))
+        self.result.generators.extend(progresses)
+
+        await asyncio.gather(*(
+            self._run_generator(progress, lambda g=generator: g)
+            for progress, (_, generator) in zip(progresses, generators, strict=True)
+        ))
+        # Errors appended in completion order; report them in layer order
+        order = {name: i for i, (name, _) in enumerate(generators)}
+        layer_errors = sorted(
+            (e for e in self.result.errors if e.split(":", 1)[0] in order),
+            key=lambda e: order[e.split(":", 1)[0]],
+        )
+        other_errors = [e for e in self.result.errors if e.split(":", 1)[0] not in order]
+        self.result.errors = other_errors + layer_errors
+
+    async def _load_snapshot(self, generators: list[tuple[str, Any]]) -> GenerationSnapshot:
+        """Preload shared data and pre-convert WLanguage bodies.
+
+        Args:
+            generators: (name, generator) pairs, used to build the filtered queries
+
+        Returns:
+            Loaded GenerationSnapshot
+        """
+        by_name = dict(generators)
+        snapshot = await load_generation_snapshot(
+            self.project_id,
+            element_query=by_name["route"].get_element_query(SNAPSHOT_SOURCE_TYPES),
+            class_query=by_name["domain"]._get_class_query(),
+        )
+
+        if self.max_workers > 1 and len(snapshot.method_bodies()) >= MIN_CODES_FOR_POOL:
+            # spawn: forking would copy the event loop and the Motor client threads
+            context = multiprocessing.get_context("spawn")
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=context
+                ) as executor:
+                    await snapshot.precompute_conversions(executor, self.max_workers)
+            except Exception as e:
+                # Bodies not precomputed are converted by the generators
+                logger.warning(f"WLanguage precomputation skipped: {e}")
+        return snapshot
+
     async def generate_layer(
         self, layer: str, element_filter: ElementFilter | None = None
     ) -> list[Path]:
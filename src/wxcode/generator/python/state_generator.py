@@ -7,8 +7,7 @@ para stack Python/FastAPI usando Dependency Injection.
 
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
-
+from wxcode.generator.jinja_environments import EnvironmentOptions, get_jinja_environment
 from wxcode.generator.python.type_mapper import PythonTypeMapper
 from wxcode.generator.state_generator import BaseStateGenerator
 from wxcode.models.global_state_context import GlobalStateContext
@@ -29,9 +28,13 @@ class PythonStateGenerator(BaseStateGenerator):
         """Inicializa generator com PythonTypeMapper."""
         super().__init__(PythonTypeMapper())
 
-        # Configura Jinja2
-        templates_dir = Path(__file__).parent.parent / "templates" / "python"
-        self.jinja_env = Environment(loader=FileSystemLoader(str(templates_dir)))
+        # Ambiente Jinja2 compartilhado (templates compilados uma vez por processo)
+        self.jinja_env = get_jinja_environment(
+            "python",
+            options=EnvironmentOptions(
+                trim_blocks=False, lstrip_blocks=False, keep_trailing_newline=False
+            ),
+        )
 
     def generate(
         self, context: GlobalStateContext, output_dir: Path
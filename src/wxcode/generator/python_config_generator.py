@@ -7,9 +7,8 @@ stacks Python/FastAPI, incluindo settings.py, .env e __init__.py.
 
 from pathlib import Path
 
-from jinja2 import Environment, PackageLoader, select_autoescape
-
 from wxcode.generator.config_generator import BaseConfigGenerator
+from wxcode.generator.jinja_environments import EnvironmentOptions, get_jinja_environment
 from wxcode.models.configuration_context import ConfigurationContext
 
 
@@ -18,11 +17,8 @@ class PythonConfigGenerator(BaseConfigGenerator):
 
     def __init__(self):
         """Inicializa o generator com templates Jinja2."""
-        self.env = Environment(
-            loader=PackageLoader("wxcode.generator", "templates/python"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True
+        self.env = get_jinja_environment(
+            "python", options=EnvironmentOptions(keep_trailing_newline=False)
         )
 
     def generate(
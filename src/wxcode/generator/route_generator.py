@@ -55,8 +55,7 @@ class RouteGenerator(BaseGenerator):
             List of generated file paths
         """
         # Find page elements with filter applied
-        query = self.get_element_query(["page", "window"])
-        elements = await Element.find(query).to_list()
+        elements = await self.find_elements(["page", "window"])
 
         if not elements:
             return []
@@ -69,9 +68,12 @@ class RouteGenerator(BaseGenerator):
             await self.clean_previous_files(element, file_types=["route"])
 
             # Get controls for this page
-            controls = await Control.find(
-                {"element_id": element.id}
-            ).to_list()
+            if self.snapshot is not None:
+                controls = self.snapshot.controls_for(element.id)
+            else:
+                controls = await Control.find(
+                    {"element_id": element.id}
+                ).to_list()
 
             content = self._generate_route(element, controls)
             filename = self._element_to_filename(element.source_name)
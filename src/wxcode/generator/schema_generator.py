@@ -11,7 +11,12 @@ from typing import Any
 
 from bson import ObjectId
 
-from wxcode.models.schema import DatabaseSchema, SchemaColumn, SchemaTable
+from wxcode.models.schema import (
+    DatabaseSchema,
+    SchemaColumn,
+    SchemaTable,
+    get_schema_tables,
+)
 
 from .base import BaseGenerator, ElementFilter
 
@@ -106,24 +111,28 @@ class SchemaGenerator(BaseGenerator):
         Returns:
             List of generated file paths
         """
-        # Fetch schema from MongoDB
-        schema = await DatabaseSchema.find_one(
-            {"project_id": ObjectId(self.project_id)}
-        )
+        # Fetch schema from the snapshot or MongoDB
+        if self.snapshot is not None:
+            schema, tables = self.snapshot.schema, self.snapshot.schema_tables
+        else:
+            schema = await DatabaseSchema.find_one(
+                {"project_id": ObjectId(self.project_id)}
+            )
+            tables = await get_schema_tables(schema) if schema else []
 
         if not schema:
             return []
 
         # Collect table names for relationship detection
-        self._table_names = {table.name.lower() for table in schema.tables}
+        self._table_names = {table.name.lower() for table in tables}
 
         # Detect relationships across all tables
-        self._detect_relationships(schema.tables)
+        self._detect_relationships(tables)
 
         generated_models: list[dict[str, str]] = []
 
         # Generate model for each table
-        for table in schema.tables:
+        for table in tables:
             content = self._generate_model(table)
             filename = self._table_to_filename(table.name)
             self.write_file(f"app/models/{filename}.py", content)
@@ -83,8 +83,7 @@ class ServiceGenerator(BaseGenerator):
             List of generated file paths
         """
         # Find procedure group elements with filter applied
-        query = self.get_element_query("procedure_group")
-        elements = await Element.find(query).to_list()
+        elements = await self.find_elements("procedure_group")
 
         if not elements:
             return []
@@ -96,12 +95,15 @@ class ServiceGenerator(BaseGenerator):
             # Clean previous generated files for idempotency
             await self.clean_previous_files(element, file_types=["service"])
 
-            procedures = await Procedure.find(
-                {
-                    "element_id": element.id,
-                    "is_local": False,  # Only global procedures
-                }
-            ).to_list()
+            if self.snapshot is not None:
+                procedures = self.snapshot.procedures_for(element.id)
+            else:
+                procedures = await Procedure.find(
+                    {
+                        "element_id": element.id,
+                        "is_local": False,  # Only global procedures
+                    }
+                ).to_list()
 
             if not procedures:
                 continue
@@ -196,7 +198,7 @@ class ServiceGenerator(BaseGenerator):
         original_code = None
 
         if proc.code and proc.code.strip():
-            result = self._converter.convert(proc.code)
+            result = self.precomputed_conversion(proc.code) or self._converter.convert(proc.code)
             body = result.python_code
 
             if result.requires_manual_review:
@@ -0,0 +1,192 @@
+"""Shared data snapshot for parallel generation.
+
+GeneratorOrchestrator(parallel=True) loads everything the layer generators
+need with one query per collection (elements, controls grouped by element,
+global procedures grouped by element, class definitions, schema tables)
+instead of one query per generator and per page. The snapshot's collections
+are read-only for the generators; the Element documents are shared, so
+conversion metadata updated by one generator (e.g. route files) is merged
+by the next one (e.g. template files), as with the sequential reload.
+
+WLanguage method/procedure bodies are pure string -> string conversions and
+can be pre-converted in a process pool (see precompute_conversions).
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any
+
+from bson import ObjectId
+
+from wxcode.models.class_definition import ClassDefinition
+from wxcode.models.control import Control
+from wxcode.models.element import Element
+from wxcode.models.procedure import Procedure
+from wxcode.models.schema import (
+    DatabaseSchema,
+    SchemaTable,
+    get_schema_tables,
+)
+
+from .wlanguage_converter import ConversionResult, WLanguageConverter
+
+# Source types read by the layer generators
+SNAPSHOT_SOURCE_TYPES = ["page", "window", "procedure_group", "rest_api"]
+
+# Below this many distinct bodies, converting in-process beats pool startup
+MIN_CODES_FOR_POOL = 200
+
+
+def _convert_batch(codes: list[str]) -> list[ConversionResult]:
+    """Convert WLanguage bodies in a worker process (one converter per batch)."""
+    converter = WLanguageConverter(db_var="self.db")
+    return [converter.convert(code) for code in codes]
+
+
+@dataclass
+class GenerationSnapshot:
+    """Data preloaded once and shared by all layer generators.
+
+    Attributes:
+        elements: Elements of SNAPSHOT_SOURCE_TYPES, in query order
+        controls_by_element: element_id -> controls, in query order
+        procedures_by_element: element_id -> global procedures
+        class_definitions: Class definitions (domain layer)
+        schema: Database schema, if imported
+        schema_tables: Tables of the schema
+        converted_code: WLanguage body -> conversion, filled by precompute_conversions
+        status_lock: Serializes element status writes between generators
+    """
+
+    elements: list[Element] = field(default_factory=list)
+    controls_by_element: dict[Any, list[Control]] = field(default_factory=dict)
+    procedures_by_element: dict[Any, list[Procedure]] = field(default_factory=dict)
+    class_definitions: list[ClassDefinition] = field(default_factory=list)
+    schema: DatabaseSchema | None = None
+    schema_tables: list[SchemaTable] = field(default_factory=list)
+    converted_code: dict[str, ConversionResult] = field(default_factory=dict)
+    status_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def elements_of_type(self, source_types: list[str] | str) -> list[Element]:
+        """Elements whose source_type is in source_types, in query order."""
+        types = {source_types} if isinstance(source_types, str) else set(source_types)
+        return [e for e in self.elements if _source_type(e) in types]
+
+    def controls_for(self, element_id: Any, ordered: bool = False) -> list[Control]:
+        """Controls of an element.
+
+        Args:
+            element_id: Element id
+            ordered: Sort by (depth, name), like the template query did
+
+        Returns:
+            New list (the snapshot itself is not modified)
+        """
+        controls = self.controls_by_element.get(element_id, [])
+        if ordered:
+            return sorted(controls, key=lambda c: (c.depth, c.name))
+        return list(controls)
+
+    def procedures_for(self, element_id: Any) -> list[Procedure]:
+        """Global procedures of a procedure group element."""
+        return list(self.procedures_by_element.get(element_id, []))
+
+    def method_bodies(self) -> list[str]:
+        """Distinct non-empty WLanguage bodies converted by domain/service."""
+        bodies: dict[str, None] = {}
+        for procedures in self.procedures_by_element.values():
+            for proc in procedures:
+                if proc.code and proc.code.strip():
+                    bodies[proc.code] = None
+        for class_def in self.class_definitions:
+            for method in class_def.methods:
+                if method.code and method.code.strip():
+                    bodies[method.code] = None
+        return list(bodies)
+
+    async def precompute_conversions(
+        self, executor: Executor, max_workers: int
+    ) -> int:
+        """Convert all method bodies in an executor (process pool).
+
+        Args:
+            executor: Executor running _convert_batch
+            max_workers: Workers in the executor (sizes the batches)
+
+        Returns:
+            Number of bodies converted
+        """
+        codes = [c for c in self.method_bodies() if c not in self.converted_code]
+        if not codes:
+            return 0
+
+        batch_size = max(1, -(-len(codes) // (max_workers * 4)))
+        batches = [codes[i:i + batch_size] for i in range(0, len(codes), batch_size)]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, _convert_batch, batch) for batch in batches)
+        )
+        for batch, converted in zip(batches, results, strict=True):
+            self.converted_code.update(zip(batch, converted, strict=True))
+        return len(codes)
+
+
+def _source_type(element: Element) -> str:
+    source_type = element.source_type
+    return getattr(source_type, "value", source_type)
+
+
+def _group_by_element(items: Iterable[Any]) -> dict[Any, list[Any]]:
+    grouped: dict[Any, list[Any]] = defaultdict(list)
+    for item in items:
+        grouped[item.element_id].append(item)
+    return dict(grouped)
+
+
+async def load_generation_snapshot(
+    project_id: str,
+    element_query: dict[str, Any],
+    class_query: dict[str, Any],
+) -> GenerationSnapshot:
+    """Load the snapshot with one query per collection.
+
+    Args:
+        project_id: Project ObjectId string
+        element_query: Element query for SNAPSHOT_SOURCE_TYPES (filter applied)
+        class_query: ClassDefinition query (filter applied)
+
+    Returns:
+        GenerationSnapshot
+    """
+    elements, class_definitions, schema = await asyncio.gather(
+        Element.find(element_query).to_list(),
+        ClassDefinition.find(class_query).to_list(),
+        DatabaseSchema.find_one({"project_id": ObjectId(project_id)}),
+    )
+
+    page_ids = [e.id for e in elements if _source_type(e) in ("page", "window")]
+    group_ids = [e.id for e in elements if _source_type(e) == "procedure_group"]
+
+    controls, procedures, tables = await asyncio.gather(
+        Control.find({"element_id": {"$in": page_ids}}).to_list() if page_ids else _empty(),
+        Procedure.find(
+            {"element_id": {"$in": group_ids}, "is_local": False}
+        ).to_list() if group_ids else _empty(),
+        get_schema_tables(schema) if schema else _empty(),
+    )
+
+    return GenerationSnapshot(
+        elements=elements,
+        controls_by_element=_group_by_element(controls),
+        procedures_by_element=_group_by_element(procedures),
+        class_definitions=class_definitions,
+        schema=schema,
+        schema_tables=tables,
+    )
+
+
+async def _empty() -> list:
+    return []
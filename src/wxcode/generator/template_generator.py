@@ -143,8 +143,7 @@ class TemplateGenerator(BaseGenerator):
             List of generated file paths
         """
         # Find page elements with filter applied
-        query = self.get_element_query(["page", "window"])
-        elements = await Element.find(query).to_list()
+        elements = await self.find_elements(["page", "window"])
 
         if not elements:
             return []
@@ -157,9 +156,12 @@ class TemplateGenerator(BaseGenerator):
             )
 
             # Get controls for this page
-            controls = await Control.find(
-                {"element_id": element.id}
-            ).sort("+depth", "+name").to_list()
+            if self.snapshot is not None:
+                controls = self.snapshot.controls_for(element.id, ordered=True)
+            else:
+                controls = await Control.find(
+                    {"element_id": element.id}
+                ).sort("+depth", "+name").to_list()
 
             content = self._generate_template(element, controls)
             filename = self._element_to_filename(element.source_name)
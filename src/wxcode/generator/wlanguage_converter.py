@@ -2,9 +2,15 @@
 
 Uses the H* function catalog to convert WLanguage code to Python.
 Handles common patterns and marks complex cases for manual review.
+
+Lines are converted by a small rule engine: every pattern is compiled once
+at import time, control-flow rules are dispatched by the line's first token
+(IF, FOR, RESULT, ...) and the remaining rules are tried in order. Each
+converter instance counts hits and time per rule (see rule_stats).
 """
 
 import re
+import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -26,6 +32,113 @@ class ConversionResult:
     warnings: list[str] | None = None
 
 
+@dataclass(frozen=True)
+class LineRule:
+    """A line conversion rule.
+
+    Attributes:
+        name: Rule name (key in rule_stats)
+        pattern: Compiled pattern, applied with match() or search()
+        handler: Name of the WLanguageConverter method that builds the output
+        template: Output template for control-flow rules (str.format)
+        tokens: First tokens the rule applies to (None = any line)
+        search: Use pattern.search() instead of pattern.match()
+    """
+
+    name: str
+    pattern: re.Pattern[str]
+    handler: str
+    template: str = ""
+    tokens: frozenset[str] | None = None
+    search: bool = False
+
+
+@dataclass
+class RuleStats:
+    """Hit count and accumulated time of a rule."""
+
+    hits: int = 0
+    seconds: float = 0.0
+
+
+def _control_flow(name: str, pattern: str, template: str) -> LineRule:
+    token = pattern.split("\\", 1)[0]  # leading keyword, e.g. "IF" in r"IF\s+..."
+    return LineRule(
+        name=name,
+        pattern=re.compile(pattern, re.IGNORECASE),
+        handler="_convert_control_flow",
+        template=template,
+        tokens=frozenset({token}),
+    )
+
+
+# Control-flow rules, in priority order (ELSE IF before ELSE, FOR before FOR EACH)
+CONTROL_FLOW_RULES: tuple[LineRule, ...] = (
+    _control_flow("if", r"IF\s+(.+?)\s+THEN", "if {0}:"),
+    _control_flow("elif", r"ELSE\s+IF\s+(.+?)\s+THEN", "elif {0}:"),
+    _control_flow("else", r"ELSE", "else:"),
+    _control_flow("end", r"END\s*$", ""),  # Python uses indentation
+    _control_flow("while", r"WHILE\s+(.+?)$", "while {0}:"),
+    _control_flow("for_range", r"FOR\s+(\w+)\s*=\s*(\d+)\s+TO\s+(\d+)", "for {0} in range({1}, {2} + 1):"),
+    _control_flow("for_each", r"FOR\s+EACH\s+(\w+)\s+OF\s+(.+)", "for {0} in {1}:"),
+    _control_flow("loop", r"LOOP", "while True:"),
+    _control_flow("break", r"BREAK", "break"),
+    _control_flow("continue", r"CONTINUE", "continue"),
+    _control_flow("result", r"RESULT\s+(.+)", "return {0}"),
+    _control_flow("return", r"RETURN\s+(.+)", "return {0}"),
+)
+
+# Remaining rules, tried in order after control flow
+STATEMENT_RULES: tuple[LineRule, ...] = (
+    LineRule(
+        name="h_function",
+        pattern=re.compile(r"(H\w+)\s*\(\s*([^)]*)\s*\)", re.IGNORECASE),
+        handler="_convert_h_function_rule",
+        search=True,
+    ),
+    LineRule(
+        name="variable",
+        pattern=re.compile(r"(\w+)\s+is\s+(\w+)(?:\s*=\s*(.+))?", re.IGNORECASE),
+        handler="_convert_variable_declaration_rule",
+    ),
+    LineRule(
+        name="local_variable",
+        pattern=re.compile(r"LOCAL\s+(\w+)\s+is\s+(\w+)(?:\s*=\s*(.+))?", re.IGNORECASE),
+        handler="_convert_variable_declaration_rule",
+        tokens=frozenset({"LOCAL"}),
+    ),
+    LineRule(
+        name="table_assignment",
+        pattern=re.compile(r"(\b[A-Z][A-Z0-9_]+)\s*\.\s*(\w+)\s*=\s*(.+)", re.IGNORECASE),
+        handler="_convert_table_assignment_rule",
+    ),
+    LineRule(
+        name="case_error",
+        pattern=re.compile(r"CASE ERROR", re.IGNORECASE),
+        handler="_convert_exception_handler",
+        tokens=frozenset({"CASE"}),
+    ),
+    LineRule(
+        name="when_exception",
+        pattern=re.compile(r"WHEN EXCEPTION", re.IGNORECASE),
+        handler="_convert_exception_handler",
+        tokens=frozenset({"WHEN"}),
+    ),
+)
+
+_CONTROL_FLOW_BY_TOKEN: dict[str, tuple[LineRule, ...]] = {}
+for _rule in CONTROL_FLOW_RULES:
+    for _token in _rule.tokens or ():
+        _CONTROL_FLOW_BY_TOKEN[_token] = _CONTROL_FLOW_BY_TOKEN.get(_token, ()) + (_rule,)
+
+_FIRST_TOKEN = re.compile(r"\w+")
+_NOT_H_FUNCTION = re.compile(r"NOT\s+(H\w+)\s*\(\s*([^)]*)\s*\)", re.IGNORECASE)
+_CAMEL_CASE_VAR = re.compile(r"\b([a-z][a-zA-Z0-9]*[A-Z][a-zA-Z0-9]*)\b")
+_IDENTIFIER = re.compile(r"^[a-zA-Z_]\w*$")
+_BEFORE_CAPITAL = re.compile(r"(?<!^)(?=[A-Z])")
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+
 class WLanguageConverter:
     """Converts WLanguage code to Python.
 
@@ -62,27 +175,8 @@ class WLanguageConverter:
         "tableau": "list",
     }
 
-    # Control flow patterns
-    CONTROL_FLOW_PATTERNS = {
-        r"IF\s+(.+?)\s+THEN": "if {0}:",
-        r"ELSE\s+IF\s+(.+?)\s+THEN": "elif {0}:",
-        r"ELSE": "else:",
-        r"END\s*$": "",  # Python uses indentation
-        r"WHILE\s+(.+?)$": "while {0}:",
-        r"FOR\s+(\w+)\s*=\s*(\d+)\s+TO\s+(\d+)": "for {0} in range({1}, {2} + 1):",
-        r"FOR\s+EACH\s+(\w+)\s+OF\s+(.+)": "for {0} in {1}:",
-        r"LOOP": "while True:",
-        r"BREAK": "break",
-        r"CONTINUE": "continue",
-        r"RESULT\s+(.+)": "return {0}",
-        r"RETURN\s+(.+)": "return {0}",
-    }
-
     # H* function patterns for regex matching
-    H_FUNCTION_PATTERN = re.compile(
-        r"(H\w+)\s*\(\s*([^)]*)\s*\)",
-        re.IGNORECASE
-    )
+    H_FUNCTION_PATTERN = STATEMENT_RULES[0].pattern
 
     # Table field access pattern: TABLE.field
     TABLE_FIELD_PATTERN = re.compile(
@@ -113,6 +207,19 @@ class WLanguageConverter:
         self._warnings: list[str] = []
         self._buffer_vars: dict[str, str] = {}  # table -> current_doc var
         self._needs_settings_import = False
+        self._config_pattern: re.Pattern[str] | None = None
+        self._config_names: dict[str, str] = {}  # lowercase name -> var name
+        self.rule_stats: dict[str, RuleStats] = {}
+
+        # Handlers bound once per instance
+        self._handlers = {
+            rule.name: getattr(self, rule.handler)
+            for rule in CONTROL_FLOW_RULES + STATEMENT_RULES
+        }
+
+    def reset_rule_stats(self) -> None:
+        """Clear the per-rule hit/time counters."""
+        self.rule_stats = {}
 
     def convert(self, wlang_code: str) -> ConversionResult:
         """Convert WLanguage code to Python.
@@ -169,72 +276,87 @@ class WLanguageConverter:
         Returns:
             Converted Python line or None to skip
         """
-        stripped = line.strip()
+        start = time.perf_counter()
+        rule_name, converted = self._apply_rules(line.strip())
+
+        stats = self.rule_stats.get(rule_name)
+        if stats is None:
+            stats = self.rule_stats[rule_name] = RuleStats()
+        stats.hits += 1
+        stats.seconds += time.perf_counter() - start
+
+        return converted
+
+    def _apply_rules(self, stripped: str) -> tuple[str, str | None]:
+        """Find the first rule matching a stripped line and apply it.
+
+        Args:
+            stripped: Line without surrounding whitespace
 
+        Returns:
+            Tuple of (rule name, converted line)
+        """
         # Skip empty lines and comments
         if not stripped:
-            return ""
+            return "blank", ""
         if stripped.startswith("//"):
-            return f"# {stripped[2:].strip()}"
+            return "comment", f"# {stripped[2:].strip()}"
 
-        # Check for control flow
-        for pattern, replacement in self.CONTROL_FLOW_PATTERNS.items():
-            match = re.match(pattern, stripped, re.IGNORECASE)
-            if match:
-                if match.groups():
-                    # Convert condition that may contain H* functions
-                    condition = match.group(1) if match.lastindex >= 1 else ""
-                    condition = self._convert_inline_h_functions(condition)
-                    # Also convert variable names in condition to snake_case
-                    condition = self._convert_condition_vars(condition)
-                    groups = list(match.groups())
-                    if groups:
-                        groups[0] = condition
-                    return replacement.format(*groups)
-                return replacement
-
-        # Check for H* function calls
-        h_match = self.H_FUNCTION_PATTERN.search(stripped)
-        if h_match:
-            return self._convert_h_function(stripped, h_match)
-
-        # Check for variable declaration
-        var_match = re.match(
-            r"(\w+)\s+is\s+(\w+)(?:\s*=\s*(.+))?",
-            stripped,
-            re.IGNORECASE
-        )
-        if var_match:
-            return self._convert_variable_declaration(var_match)
-
-        # Check for LOCAL variable
-        local_match = re.match(
-            r"LOCAL\s+(\w+)\s+is\s+(\w+)(?:\s*=\s*(.+))?",
-            stripped,
-            re.IGNORECASE
-        )
-        if local_match:
-            return self._convert_variable_declaration(local_match)
-
-        # Check for table field assignment: TABLE.field = value
-        assign_match = re.match(
-            r"(\b[A-Z][A-Z0-9_]+)\s*\.\s*(\w+)\s*=\s*(.+)",
-            stripped,
-            re.IGNORECASE
-        )
-        if assign_match:
-            return self._convert_table_assignment(assign_match)
+        token_match = _FIRST_TOKEN.match(stripped)
+        token = token_match.group(0).upper() if token_match else ""
 
-        # Check for CASE ERROR
-        if stripped.upper().startswith("CASE ERROR"):
-            return "except Exception as e:"
+        # Control flow: only the rules for this first token
+        for rule in _CONTROL_FLOW_BY_TOKEN.get(token, ()):
+            match = rule.pattern.match(stripped)
+            if match:
+                return rule.name, self._handlers[rule.name](stripped, match, rule)
 
-        # Check for WHEN EXCEPTION
-        if stripped.upper().startswith("WHEN EXCEPTION"):
-            return "except Exception as e:"
+        for rule in STATEMENT_RULES:
+            if rule.tokens is not None and token not in rule.tokens:
+                continue
+            match = rule.pattern.search(stripped) if rule.search else rule.pattern.match(stripped)
+            if match:
+                return rule.name, self._handlers[rule.name](stripped, match, rule)
 
         # Default: return as comment
-        return f"# {stripped}"
+        return "fallback", f"# {stripped}"
+
+    def _convert_control_flow(self, line: str, match: re.Match[str], rule: LineRule) -> str:
+        """Fill a control-flow template, converting its condition.
+
+        Args:
+            line: Stripped line
+            match: Match of the rule pattern
+            rule: Control-flow rule
+
+        Returns:
+            Python control-flow line
+        """
+        groups = list(match.groups())
+        if not groups:
+            return rule.template
+
+        # Convert condition that may contain H* functions
+        condition = self._convert_inline_h_functions(groups[0])
+        # Also convert variable names in condition to snake_case
+        groups[0] = self._convert_condition_vars(condition)
+        return rule.template.format(*groups)
+
+    def _convert_h_function_rule(self, line: str, match: re.Match[str], rule: LineRule) -> str:
+        return self._convert_h_function(line, match)
+
+    def _convert_variable_declaration_rule(
+        self, line: str, match: re.Match[str], rule: LineRule
+    ) -> str:
+        return self._convert_variable_declaration(match)
+
+    def _convert_table_assignment_rule(
+        self, line: str, match: re.Match[str], rule: LineRule
+    ) -> str:
+        return self._convert_table_assignment(match)
+
+    def _convert_exception_handler(self, line: str, match: re.Match[str], rule: LineRule) -> str:
+        return "except Exception as e:"
 
     def _convert_h_function(self, line: str, match: re.Match) -> str:
         """Convert H* function call to Python.
@@ -488,7 +610,7 @@ class WLanguageConverter:
             return value
 
         # Variable reference - convert to snake_case
-        if re.match(r"^[a-zA-Z_]\w*$", value):
+        if _IDENTIFIER.match(value):
             return self._to_snake_case(value)
 
         return value
@@ -502,14 +624,8 @@ class WLanguageConverter:
         Returns:
             Condition with variable names converted
         """
-        # Pattern to match variable names (not already snake_case)
-        # Match camelCase or PascalCase variable names
-        var_pattern = re.compile(r'\b([a-z][a-zA-Z0-9]*[A-Z][a-zA-Z0-9]*)\b')
-
-        def replace_var(match):
-            return self._to_snake_case(match.group(1))
-
-        return var_pattern.sub(replace_var, condition)
+        # Match camelCase or PascalCase variable names (not already snake_case)
+        return _CAMEL_CASE_VAR.sub(lambda m: self._to_snake_case(m.group(1)), condition)
 
     def _convert_inline_h_functions(self, expression: str) -> str:
         """Convert H* function calls within an expression.
@@ -525,8 +641,7 @@ class WLanguageConverter:
         result = expression
 
         # First, check for NOT HFunction patterns
-        not_pattern = re.compile(r"NOT\s+(H\w+)\s*\(\s*([^)]*)\s*\)", re.IGNORECASE)
-        for match in not_pattern.finditer(expression):
+        for match in _NOT_H_FUNCTION.finditer(expression):
             func_name = match.group(1)
             args_str = match.group(2).strip()
             args = [a.strip() for a in args_str.split(",") if a.strip()]
@@ -602,28 +717,29 @@ class WLanguageConverter:
         if not self._config_context:
             return python_code
 
-        # Obter lista de variáveis configuráveis
-        var_names = self._config_context.get_all_variable_names()
-
-        if not var_names:
-            return python_code
-
-        # Substituir cada variável por settings.VAR_NAME
-        result = python_code
-        for var_name in var_names:
-            # Padrão: variável como palavra completa (não parte de outra palavra)
-            # Evita substituir dentro de strings
-            pattern = r'\b' + re.escape(var_name.lower()) + r'\b'
-
-            def replace_with_settings(match):
-                self._needs_settings_import = True
-                return f"settings.{var_name}"
+        if self._config_pattern is None:
+            # Obter lista de variáveis configuráveis
+            var_names = self._config_context.get_all_variable_names()
+            if not var_names:
+                return python_code
+
+            # Uma única regex com todas as variáveis (maior nome primeiro),
+            # compilada uma vez por converter
+            for var_name in sorted(var_names):
+                self._config_names.setdefault(var_name.lower(), var_name)
+            alternatives = sorted(self._config_names, key=len, reverse=True)
+            self._config_pattern = re.compile(
+                r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")\b",
+                re.IGNORECASE,
+            )
 
-            # Substituir, mas apenas fora de strings (heurística simples)
-            # TODO: Parser mais robusto para evitar substituir dentro de strings
-            result = re.sub(pattern, replace_with_settings, result, flags=re.IGNORECASE)
+        def replace_with_settings(match):
+            self._needs_settings_import = True
+            return f"settings.{self._config_names[match.group(0).lower()]}"
 
-        return result
+        # Variável como palavra completa, substituída fora de strings (heurística simples)
+        # TODO: Parser mais robusto para evitar substituir dentro de strings
+        return self._config_pattern.sub(replace_with_settings, python_code)
 
     @staticmethod
     def _to_snake_case(name: str) -> str:
@@ -642,8 +758,8 @@ class WLanguageConverter:
             return name.lower()
 
         # Insert underscore before capitals
-        name = re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
-        name = re.sub(r"_+", "_", name)
+        name = _BEFORE_CAPITAL.sub("_", name).lower()
+        name = _REPEATED_UNDERSCORES.sub("_", name)
         return name.strip("_")
 
 
@@ -18,6 +18,7 @@ from wxcode.models import (
     ClassDefinition,
     Procedure,
 )
+from wxcode.models.schema import get_schema_summary, get_schema_tables
 
 logger = logging.getLogger(__name__)
 
@@ -156,7 +157,7 @@ class Neo4jSyncService:
             return 0
 
         nodes = []
-        for table in schema.tables:
+        for table in await get_schema_tables(schema):
             nodes.append(
                 {
                     "name": table.name,
@@ -678,7 +679,7 @@ class Neo4jSyncService:
             DatabaseSchema.project_id == project_id
         )
         if schema:
-            result.tables_count = len(schema.tables)
+            result.tables_count = (await get_schema_summary(schema)).total_tables
 
         # Conta classes
         result.classes_count = await ClassDefinition.find(
@@ -1,11 +1,13 @@
 """LLM-based page converter for WinDev/WebDev to FastAPI + Jinja2."""
 
 from .context_builder import ContextBuilder
+from .context_packer import ContextPacker
 from .llm_client import LLMClient  # DEPRECATED - use create_provider() instead
 from .import_validator import ImportValidator
 from .output_writer import OutputWriter
 from .page_converter import PageConverter
-from .response_parser import ResponseParser
+from .response_cache import LLMResponseCache, get_response_cache
+from .response_parser import ResponseParser, StreamingJSONBuffer
 from .procedure_context_builder import ProcedureContextBuilder
 from .procedure_converter import ProcedureConverter
 from .service_response_parser import ServiceResponseParser
@@ -13,6 +15,7 @@ from .service_output_writer import ServiceOutputWriter
 from .spec_context_loader import SpecContextLoader
 from .proposal_generator import ProposalGenerator
 from .conversion_tracker import ConversionTracker
+from .token_counter import TokenCounter, count_tokens, get_token_counter, stored_token_count
 from .models import (
     ConversionContext,
     ConversionError,
@@ -45,10 +48,14 @@ from .providers import (
 __all__ = [
     # Page conversion components
     "ContextBuilder",
+    "ContextPacker",
     "ImportValidator",
     "OutputWriter",
     "PageConverter",
     "ResponseParser",
+    "StreamingJSONBuffer",
+    "LLMResponseCache",
+    "get_response_cache",
     # Procedure/Service conversion components
     "ProcedureContextBuilder",
     "ProcedureConverter",
@@ -58,6 +65,11 @@ __all__ = [
     "SpecContextLoader",
     "ProposalGenerator",
     "ConversionTracker",
+    # Token accounting
+    "TokenCounter",
+    "count_tokens",
+    "get_token_counter",
+    "stored_token_count",
     # Provider abstraction
     "LLMProvider",
     "AnthropicProvider",
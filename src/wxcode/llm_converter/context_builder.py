@@ -2,15 +2,46 @@
 
 import logging
 import re
+from collections import Counter
 from pathlib import Path
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from .context_packer import ContextPacker, PackResult, ProcedureCandidate
 from .models import ConversionContext, ConversionError
+from .token_counter import count_tokens, procedure_tokens
+from .usage_log import element_project_id
 
 logger = logging.getLogger(__name__)
 
+# Keywords e funções built-in do WLanguage ignoradas na extração de chamadas
+_WLANGUAGE_BUILTINS = {
+    'IF', 'WHILE', 'FOR', 'SWITCH', 'CASE', 'RESULT', 'RETURN',
+    'END', 'THEN', 'ELSE', 'DO', 'LOOP', 'BREAK', 'CONTINUE',
+    'TRUE', 'FALSE', 'NULL', 'WHEN', 'IN', 'NOT', 'AND', 'OR',
+    # Funções comuns que não são procedures do usuário
+    'Length', 'Left', 'Right', 'Middle', 'Val', 'Num', 'DateToString',
+    'StringToDate', 'Upper', 'Lower', 'Trim', 'Replace', 'Position',
+    'ExtractString', 'Complete', 'NoSpace', 'Charact', 'Asc',
+    'ArrayAdd', 'ArrayDelete', 'ArrayDeleteAll', 'ArrayCount',
+    'Info', 'Error', 'Warning', 'Confirm', 'Input', 'ToastDisplay',
+    'Trace', 'dbgAssert',
+    'HReadFirst', 'HReadNext', 'HReadSeek', 'HReadSeekFirst',
+    'HAdd', 'HModify', 'HDelete', 'HSave', 'HReset',
+    'HExecuteQuery', 'HExecuteSQLQuery', 'HOut', 'HFound',
+    'PageDisplay', 'PageRefresh', 'PageParameter', 'PageAddress',
+    'CellDisplayDialog', 'CellCloseDialog',
+    'JSONToVariant', 'VariantToJSON', 'Serialize', 'Deserialize',
+    'HTTPRequest', 'HTTPSend', 'restRequest',
+    'fOpen', 'fClose', 'fRead', 'fWrite', 'fDelete',
+}
+WLANGUAGE_BUILTINS_UPPER = {b.upper() for b in _WLANGUAGE_BUILTINS}
+
+# Chamadas de função/procedure e CALL ProcedureName
+CALL_PATTERN = re.compile(r'\b([A-Z][a-zA-Z0-9_]*)\s*\(')
+CALL_KEYWORD_PATTERN = re.compile(r'\bCALL\s+([A-Z][a-zA-Z0-9_]+)', re.IGNORECASE)
+
 
 class ContextBuilder:
     """Constrói o contexto para o LLM a partir dos dados do MongoDB."""
@@ -21,6 +52,8 @@ class ContextBuilder:
         token_limit: int = 150000,
         theme: str | None = None,
         project_root: Path | None = None,
+        call_depth: int = 2,
+        packer: ContextPacker | None = None,
     ):
         """Inicializa o ContextBuilder.
 
@@ -29,11 +62,15 @@ class ContextBuilder:
             token_limit: Limite de tokens para o contexto
             theme: Nome do tema para carregar skills (ex: 'dashlite')
             project_root: Raiz do projeto para encontrar skills
+            call_depth: Profundidade máxima no grafo de chamadas (1 = só diretas)
+            packer: ContextPacker para selecionar procedures no orçamento
         """
         self.db = db
         self.token_limit = token_limit
         self.theme = theme
         self.project_root = project_root or Path.cwd()
+        self.call_depth = max(1, call_depth)
+        self.packer = packer or ContextPacker()
 
     async def build(self, element_id: str | ObjectId) -> ConversionContext:
         """Constrói contexto completo para conversão de uma página.
@@ -64,8 +101,8 @@ class ContextBuilder:
         # Carregar procedures locais
         local_procedures = await self._load_procedures(element_id)
 
-        # Carregar procedures globais referenciadas nos eventos e procedures locais
-        referenced_procedures = await self._load_referenced_procedures(
+        # Procedures globais alcançáveis a partir dos eventos e procedures locais
+        candidates = await self._load_referenced_procedures(
             control_tree, local_procedures
         )
 
@@ -87,31 +124,28 @@ class ContextBuilder:
         # Calcular tokens disponíveis para procedures referenciadas
         available_for_procs = self.token_limit - base_tokens
 
-        # Priorizar procedures se necessário
+        # Empacotar procedures por relevância no espaço disponível
         if available_for_procs > 0:
-            referenced_procedures = self._prioritize_procedures(
-                referenced_procedures, available_for_procs
+            packed = self._pack_procedures(
+                candidates, available_for_procs, self._page_tables(element)
             )
         else:
             logger.warning(
                 f"Sem espaço para procedures referenciadas "
                 f"(base={base_tokens}, limite={self.token_limit})"
             )
-            referenced_procedures = []
-
-        # Calcular tokens totais
-        estimated_tokens = base_tokens
-        for proc in referenced_procedures:
-            estimated_tokens += self._estimate_tokens(proc.get("code", ""))
+            packed = PackResult()
 
         return ConversionContext(
             page_name=element.get("source_name", ""),
             element_id=str(element_id),
+            project_id=element_project_id(element),
             controls=control_tree,
             local_procedures=local_procedures,
-            referenced_procedures=referenced_procedures,
+            referenced_procedures=packed.full,
+            procedure_summaries=packed.summaries,
             dependencies=element.get("dependencies", {}).get("uses", []),
-            estimated_tokens=estimated_tokens,
+            estimated_tokens=base_tokens + packed.tokens,
             theme=self.theme,
             theme_skills=theme_skills,
         )
@@ -258,6 +292,7 @@ class ContextBuilder:
                 "name": proc.get("name"),
                 "code": proc.get("code"),
                 "signature": proc.get("signature"),
+                "token_count": proc.get("token_count"),
             })
 
         return procedures
@@ -277,51 +312,39 @@ class ContextBuilder:
         Returns:
             Set de nomes de procedures encontradas
         """
-        # Pattern para chamadas de função/procedure
-        pattern = r'\b([A-Z][a-zA-Z0-9_]*)\s*\('
-        matches = re.findall(pattern, code)
-
-        # Pattern para CALL ProcedureName
-        call_pattern = r'\bCALL\s+([A-Z][a-zA-Z0-9_]+)'
-        matches.extend(re.findall(call_pattern, code, re.IGNORECASE))
-
-        # Filtrar funções built-in do WLanguage
-        builtins = {
-            'IF', 'WHILE', 'FOR', 'SWITCH', 'CASE', 'RESULT', 'RETURN',
-            'END', 'THEN', 'ELSE', 'DO', 'LOOP', 'BREAK', 'CONTINUE',
-            'TRUE', 'FALSE', 'NULL', 'WHEN', 'IN', 'NOT', 'AND', 'OR',
-            # Funções comuns que não são procedures do usuário
-            'Length', 'Left', 'Right', 'Middle', 'Val', 'Num', 'DateToString',
-            'StringToDate', 'Upper', 'Lower', 'Trim', 'Replace', 'Position',
-            'ExtractString', 'Complete', 'NoSpace', 'Charact', 'Asc',
-            'ArrayAdd', 'ArrayDelete', 'ArrayDeleteAll', 'ArrayCount',
-            'Info', 'Error', 'Warning', 'Confirm', 'Input', 'ToastDisplay',
-            'Trace', 'dbgAssert',
-            'HReadFirst', 'HReadNext', 'HReadSeek', 'HReadSeekFirst',
-            'HAdd', 'HModify', 'HDelete', 'HSave', 'HReset',
-            'HExecuteQuery', 'HExecuteSQLQuery', 'HOut', 'HFound',
-            'PageDisplay', 'PageRefresh', 'PageParameter', 'PageAddress',
-            'CellDisplayDialog', 'CellCloseDialog',
-            'JSONToVariant', 'VariantToJSON', 'Serialize', 'Deserialize',
-            'HTTPRequest', 'HTTPSend', 'restRequest',
-            'fOpen', 'fClose', 'fRead', 'fWrite', 'fDelete',
-        }
-
-        return {m for m in matches if m.upper() not in {b.upper() for b in builtins}}
+        return set(self._count_procedure_calls(code))
+
+    def _count_procedure_calls(self, code: str) -> Counter[str]:
+        """Conta chamadas de procedures no código WLanguage (sem built-ins).
+
+        Args:
+            code: Código WLanguage
+
+        Returns:
+            Counter nome -> número de chamadas
+        """
+        matches = CALL_PATTERN.findall(code)
+        matches.extend(CALL_KEYWORD_PATTERN.findall(code))
+        return Counter(m for m in matches if m.upper() not in WLANGUAGE_BUILTINS_UPPER)
 
     async def _load_referenced_procedures(
         self,
         controls: list[dict],
         local_procedures: list[dict] | None = None,
-    ) -> list[dict]:
-        """Carrega procedures globais referenciadas nos eventos e procedures locais.
+    ) -> list[ProcedureCandidate]:
+        """Carrega procedures globais alcançáveis a partir da página.
+
+        Parte das chamadas nos eventos e procedures locais e segue o grafo
+        de chamadas (dependencies.calls_procedures) até call_depth níveis,
+        uma consulta por nível. Conta quantas vezes cada procedure é chamada
+        pelo código já alcançado.
 
         Args:
             controls: Lista de controles com eventos
             local_procedures: Lista de procedures locais (opcional)
 
         Returns:
-            Lista de procedures globais encontradas
+            Lista de ProcedureCandidate (depth 1 = chamada direta)
         """
         # Coletar todos os códigos de eventos (incluindo filhos)
         all_code: list[str] = []
@@ -337,42 +360,72 @@ class ContextBuilder:
             collect_event_code(control)
 
         # Também coletar código das procedures locais
+        local_names: set[str] = set()
         if local_procedures:
             for proc in local_procedures:
+                local_names.add(proc.get("name"))
                 if code := proc.get("code"):
                     all_code.append(code)
 
-        # Extrair nomes de procedures chamadas
-        called_procs: set[str] = set()
+        # Extrair nomes de procedures chamadas (com frequência)
+        call_counts: Counter[str] = Counter()
         for code in all_code:
-            called_procs.update(self._extract_procedure_calls(code))
-
-        if not called_procs:
-            return []
-
-        logger.debug(f"Procedures referenciadas encontradas: {called_procs}")
+            call_counts.update(self._count_procedure_calls(code))
 
-        # Buscar procedures globais no MongoDB
-        cursor = self.db.procedures.find({
-            "name": {"$in": list(called_procs)},
-            "is_local": False
-        })
+        candidates: dict[str, ProcedureCandidate] = {}
+        frontier = {name for name in call_counts if name not in local_names}
+        depth = 1
 
-        procedures = []
-        async for proc in cursor:
-            procedures.append({
-                "name": proc.get("name"),
-                "code": proc.get("code"),
-                "signature": proc.get("signature"),
-                "source": "global"
+        while frontier and depth <= self.call_depth:
+            cursor = self.db.procedures.find({
+                "name": {"$in": list(frontier)},
+                "is_local": False
             })
 
+            next_calls: Counter[str] = Counter()
+            async for proc in cursor:
+                name = proc.get("name")
+                if name in candidates:
+                    continue
+                deps = proc.get("dependencies") or {}
+                candidates[name] = ProcedureCandidate(
+                    proc={
+                        "name": name,
+                        "code": proc.get("code"),
+                        "signature": proc.get("signature"),
+                        "parameters": proc.get("parameters", []),
+                        "return_type": proc.get("return_type"),
+                        "token_count": proc.get("token_count"),
+                        "source": "global"
+                    },
+                    depth=depth,
+                    call_count=call_counts.get(name, 1),
+                    tables=set(deps.get("uses_files") or []),
+                )
+                callees = deps.get("calls_procedures")
+                if callees is None:
+                    callees = self._extract_procedure_calls(proc.get("code") or "")
+                next_calls.update(callees)
+
+            # Frequência acumulada: chamadas a partir de procedures já no contexto
+            for name, count in next_calls.items():
+                if name in candidates:
+                    candidates[name].call_count += count
+                else:
+                    call_counts[name] += count
+
+            frontier = {
+                name for name in next_calls
+                if name not in candidates and name not in local_names
+            }
+            depth += 1
+
         logger.info(
-            f"Carregadas {len(procedures)} procedures globais de "
-            f"{len(called_procs)} referenciadas"
+            f"Carregadas {len(candidates)} procedures globais "
+            f"(profundidade até {self.call_depth})"
         )
 
-        return procedures
+        return list(candidates.values())
 
     def _build_control_tree(self, controls: list[dict]) -> list[dict]:
         """Organiza controles em estrutura de árvore.
@@ -482,59 +535,52 @@ class ContextBuilder:
         return "\n".join(lines)
 
     def _estimate_tokens(self, text: str) -> int:
-        """Estima número de tokens do texto.
-
-        Usa aproximação de ~4 caracteres por token.
+        """Conta tokens do texto com tiktoken (cache por hash do conteúdo).
 
         Args:
-            text: Texto para estimar
+            text: Texto para contar
 
         Returns:
-            Número estimado de tokens
+            Número de tokens
         """
-        return len(text) // 4
+        return count_tokens(text)
+
+    def _page_tables(self, element: dict) -> set[str]:
+        """Tabelas usadas pela página (arquivos de dados e bindings)."""
+        deps = element.get("dependencies") or {}
+        return set(deps.get("data_files") or []) | set(deps.get("bound_tables") or [])
 
-    def _prioritize_procedures(
+    def _pack_procedures(
         self,
-        referenced_procedures: list[dict],
+        candidates: list[ProcedureCandidate],
         available_tokens: int,
-    ) -> list[dict]:
-        """Prioriza procedures para caber no limite de tokens.
+        page_tables: set[str] | None = None,
+    ) -> PackResult:
+        """Seleciona procedures para caber no limite de tokens.
 
-        Ordena por tamanho (menores primeiro) e remove as que não cabem.
+        Maximiza a relevância (frequência, distância, tabelas em comum) via
+        knapsack; o que não cabe completo entra como assinatura quando há
+        espaço.
 
         Args:
-            referenced_procedures: Lista de procedures referenciadas
+            candidates: Procedures alcançáveis a partir da página
             available_tokens: Tokens disponíveis para procedures
+            page_tables: Tabelas usadas pela página
 
         Returns:
-            Lista de procedures que cabem no limite
+            PackResult com procedures completas e resumidas
         """
-        if not referenced_procedures:
-            return []
-
-        # Calcular tokens de cada procedure
-        proc_with_tokens = []
-        for proc in referenced_procedures:
-            code = proc.get("code", "")
-            tokens = self._estimate_tokens(code)
-            proc_with_tokens.append((proc, tokens))
-
-        # Ordenar por tamanho (menores primeiro para maximizar quantidade)
-        proc_with_tokens.sort(key=lambda x: x[1])
-
-        # Selecionar procedures que cabem
-        result = []
-        used_tokens = 0
-        for proc, tokens in proc_with_tokens:
-            if used_tokens + tokens <= available_tokens:
-                result.append(proc)
-                used_tokens += tokens
-            else:
-                # Log que procedure foi omitida
+        packed = self.packer.pack(candidates, available_tokens, page_tables)
+
+        included = {p.get("name") for p in packed.full}
+        summarized = {p.get("name") for p in packed.summaries}
+        for candidate in candidates:
+            if candidate.name in summarized:
+                logger.info(f"Procedure '{candidate.name}' incluída apenas como assinatura")
+            elif candidate.name not in included:
                 logger.warning(
-                    f"Procedure '{proc.get('name')}' omitida por limite de tokens "
-                    f"({tokens} tokens, restavam {available_tokens - used_tokens})"
+                    f"Procedure '{candidate.name}' omitida por limite de tokens "
+                    f"({procedure_tokens(candidate.proc)} tokens)"
                 )
 
-        return result
+        return packed
@@ -0,0 +1,216 @@
+"""ContextPacker - Seleciona procedures para o contexto por relevância e orçamento."""
+
+import math
+from dataclasses import dataclass, field
+
+from .token_counter import count_tokens, procedure_tokens
+
+# Pesos do score de relevância
+FREQUENCY_WEIGHT = 1.0
+DISTANCE_WEIGHT = 2.0
+TABLE_OVERLAP_WEIGHT = 1.5
+
+# Fração do score obtida quando a procedure entra apenas como assinatura
+SUMMARY_VALUE_RATIO = 0.25
+
+# Resolução máxima do knapsack (unidades de capacidade)
+KNAPSACK_RESOLUTION = 1024
+
+
+@dataclass
+class ProcedureCandidate:
+    """Procedure alcançável a partir da página no grafo de chamadas."""
+
+    proc: dict
+    depth: int  # 1 = chamada direta pela página
+    call_count: int = 1  # chamadas a partir do código já no contexto
+    tables: set[str] = field(default_factory=set)
+    score: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.proc.get("name", "")
+
+
+@dataclass
+class PackResult:
+    """Resultado do empacotamento."""
+
+    full: list[dict] = field(default_factory=list)
+    summaries: list[dict] = field(default_factory=list)
+    tokens: int = 0
+
+
+def format_signature(proc: dict) -> str:
+    """Monta a assinatura WLanguage de uma procedure a partir dos parâmetros."""
+    if signature := proc.get("signature"):
+        return signature
+
+    params = []
+    for param in proc.get("parameters") or []:
+        text = param.get("name", "")
+        if param.get("type"):
+            text += f" is {param['type']}"
+        if param.get("default_value") is not None:
+            text += f" = {param['default_value']}"
+        params.append(text)
+
+    signature = f"PROCEDURE {proc.get('name', '')}({', '.join(params)})"
+    if proc.get("return_type"):
+        signature += f": {proc['return_type']}"
+    return signature
+
+
+def summarize_procedure(proc: dict) -> dict:
+    """Versão apenas-assinatura de uma procedure (sem código)."""
+    return {
+        "name": proc.get("name"),
+        "signature": format_signature(proc),
+        "return_type": proc.get("return_type"),
+    }
+
+
+def score_candidate(candidate: ProcedureCandidate, page_tables: set[str]) -> float:
+    """Calcula a relevância de uma procedure para a página.
+
+    Combina frequência de chamada (log), proximidade no grafo (1/profundidade)
+    e sobreposição das tabelas acessadas com as tabelas da página.
+    """
+    frequency = math.log2(1 + candidate.call_count)
+    distance = 1.0 / max(1, candidate.depth)
+    overlap = 0.0
+    if page_tables and candidate.tables:
+        overlap = len(candidate.tables & page_tables) / len(page_tables)
+
+    return (
+        FREQUENCY_WEIGHT * frequency
+        + DISTANCE_WEIGHT * distance
+        + TABLE_OVERLAP_WEIGHT * overlap
+    )
+
+
+class ContextPacker:
+    """Empacota procedures no orçamento de tokens maximizando a relevância.
+
+    Cada procedure pode entrar completa (código), apenas como assinatura ou
+    ficar de fora. A escolha é resolvida como um knapsack de múltipla
+    escolha sobre o orçamento, com os custos arredondados para no máximo
+    KNAPSACK_RESOLUTION unidades de capacidade.
+    """
+
+    def __init__(
+        self,
+        summary_value_ratio: float = SUMMARY_VALUE_RATIO,
+        resolution: int = KNAPSACK_RESOLUTION,
+    ):
+        """Inicializa o packer.
+
+        Args:
+            summary_value_ratio: Fração do score de uma procedure resumida
+            resolution: Unidades de capacidade do knapsack
+        """
+        self.summary_value_ratio = summary_value_ratio
+        self.resolution = resolution
+
+    def pack(
+        self,
+        candidates: list[ProcedureCandidate],
+        budget: int,
+        page_tables: set[str] | None = None,
+    ) -> PackResult:
+        """Seleciona procedures completas e resumidas dentro do orçamento.
+
+        Args:
+            candidates: Procedures alcançáveis a partir da página
+            budget: Tokens disponíveis
+            page_tables: Tabelas usadas pela página (para o score)
+
+        Returns:
+            PackResult com procedures completas (ordem de relevância) e resumos
+        """
+        if not candidates or budget <= 0:
+            return PackResult()
+
+        for candidate in candidates:
+            candidate.score = score_candidate(candidate, page_tables or set())
+        candidates = sorted(candidates, key=lambda c: (-c.score, c.depth, c.name))
+
+        summaries = [summarize_procedure(c.proc) for c in candidates]
+        full_costs = [procedure_tokens(c.proc) for c in candidates]
+        summary_costs = [count_tokens(s["signature"]) + 4 for s in summaries]
+
+        # Caminho rápido: tudo cabe completo
+        if sum(full_costs) <= budget:
+            return PackResult(
+                full=[c.proc for c in candidates],
+                tokens=sum(full_costs),
+            )
+
+        choices = self._solve(candidates, full_costs, summary_costs, budget)
+
+        result = PackResult()
+        for candidate, choice, summary, full_cost, summary_cost in zip(
+            candidates, choices, summaries, full_costs, summary_costs, strict=True
+        ):
+            if choice == 2:
+                result.full.append(candidate.proc)
+                result.tokens += full_cost
+            elif choice == 1:
+                result.summaries.append(summary)
+                result.tokens += summary_cost
+        return result
+
+    def _solve(
+        self,
+        candidates: list[ProcedureCandidate],
+        full_costs: list[int],
+        summary_costs: list[int],
+        budget: int,
+    ) -> list[int]:
+        """Knapsack de múltipla escolha (0 = fora, 1 = assinatura, 2 = completa).
+
+        Os custos são arredondados para cima na unidade de capacidade, então
+        a solução nunca excede o orçamento real.
+        """
+        unit = max(1, math.ceil(budget / self.resolution))
+        capacity = budget // unit
+
+        def units(tokens: int) -> int:
+            return math.ceil(tokens / unit)
+
+        options = [
+            (
+                (units(summary_costs[i]), candidate.score * self.summary_value_ratio),
+                (units(full_costs[i]), candidate.score),
+            )
+            for i, candidate in enumerate(candidates)
+        ]
+
+        best = [0.0] * (capacity + 1)
+        picks: list[bytearray] = []
+        for (summary_w, summary_v), (full_w, full_v) in options:
+            new_best = best[:]
+            pick = bytearray(capacity + 1)
+            for c in range(summary_w, capacity + 1):
+                value = best[c - summary_w] + summary_v
+                if value > new_best[c]:
+                    new_best[c] = value
+                    pick[c] = 1
+            for c in range(full_w, capacity + 1):
+                value = best[c - full_w] + full_v
+                if value > new_best[c]:
+                    new_best[c] = value
+                    pick[c] = 2
+            best = new_best
+            picks.append(pick)
+
+        choices = [0] * len(candidates)
+        c = capacity
+        for i in range(len(candidates) - 1, -1, -1):
+            choice = picks[i][c]
+            choices[i] = choice
+            if choice == 1:
+                c -= options[i][0][0]
+            elif choice == 2:
+                c -= options[i][1][0]
+        return choices
@@ -22,6 +22,33 @@ class PendingItem:
     name: str
     item_type: str  # "page", "procedure", "class", "table"
 
+    @property
+    def id(self) -> Any:
+        """ObjectId do documento."""
+        return self.doc.get("_id")
+
+    @property
+    def uses(self) -> list[str]:
+        """Nomes dos elementos dos quais este item depende."""
+        return (self.doc.get("dependencies") or {}).get("uses") or []
+
+
+# Filtro de items pendentes (status ausente conta como pendente)
+PENDING_FILTER = {
+    "$or": [
+        {"conversion.status": "pending"},
+        {"conversion.status": {"$exists": False}},
+        {"conversion": {"$exists": False}},
+    ],
+}
+
+# (collection, campo de projeto, campo de nome, tipo do item)
+FRONTIER_SOURCES = [
+    ("elements", "project_id.$id", "source_name", "page"),
+    ("procedures", "project_id", "name", "procedure"),
+    ("class_definitions", "project_id", "name", "class"),
+]
+
 
 class ConversionTracker:
     """Rastreia status de conversão de elementos no MongoDB."""
@@ -179,6 +206,118 @@ class ConversionTracker:
 
         return None
 
+    async def get_pending_frontier(
+        self,
+        project_name: str,
+        limit: int | None = None,
+        include_content_size: bool = True,
+    ) -> list[PendingItem]:
+        """Carrega os items pendentes do projeto de uma vez.
+
+        Faz uma única consulta por collection (com projeção mínima) em vez de
+        três consultas por item como get_next_pending_item. Os items vêm
+        ordenados por topological_order; os sem ordem ficam no final.
+
+        Cada doc traz _id, nome, topological_order, layer, dependencies.uses
+        e, com include_content_size, raw_content_chars (tamanho do conteúdo,
+        para estimar tokens).
+
+        Args:
+            project_name: Nome do projeto
+            limit: Retorna só os primeiros `limit` items (ordenação e limite
+                feitos no MongoDB, por collection)
+            include_content_size: Calcula raw_content_chars ($strLenCP sobre
+                o conteúdo de cada documento)
+
+        Returns:
+            Lista de PendingItem
+        """
+        project = await self.db.projects.find_one({"name": project_name}, {"_id": 1})
+        if not project:
+            return []
+
+        project_id = project["_id"]
+        items: list[PendingItem] = []
+
+        for collection, project_field, name_field, item_type in FRONTIER_SOURCES:
+            match: dict[str, Any] = {project_field: project_id, **PENDING_FILTER}
+            projection: dict[str, Any] = {
+                name_field: 1,
+                "topological_order": 1,
+                "layer": 1,
+                "dependencies.uses": 1,
+            }
+            if include_content_size:
+                projection["raw_content_chars"] = {
+                    "$strLenCP": {"$ifNull": ["$raw_content", ""]}
+                }
+
+            if limit is None:
+                if collection != "elements":
+                    # Elements sem ordem entram como fallback (igual get_next_pending_item)
+                    match["topological_order"] = {"$ne": None}
+                pipelines = [[{"$match": match}, {"$project": projection}]]
+            else:
+                # O MongoDB ordena null antes dos números: items com e sem
+                # ordem são buscados separadamente, cada um já limitado
+                sort = {"topological_order": 1, name_field: 1}
+                pipelines = [[
+                    {"$match": {**match, "topological_order": {"$ne": None}}},
+                    {"$sort": sort},
+                    {"$limit": limit},
+                    {"$project": projection},
+                ]]
+                if collection == "elements":
+                    pipelines.append([
+                        {"$match": {**match, "topological_order": None}},
+                        {"$sort": sort},
+                        {"$limit": limit},
+                        {"$project": projection},
+                    ])
+
+            for pipeline in pipelines:
+                async for doc in self.db[collection].aggregate(pipeline):
+                    items.append(PendingItem(
+                        collection=collection,
+                        doc=doc,
+                        topological_order=doc.get("topological_order"),
+                        layer=doc.get("layer"),
+                        name=doc.get(name_field, "unknown"),
+                        item_type=item_type,
+                    ))
+
+        items.sort(key=lambda x: (
+            x.topological_order is None,
+            x.topological_order or 0,
+            x.name,
+        ))
+        return items if limit is None else items[:limit]
+
+    async def mark_items_status(
+        self, items: list[PendingItem], status: str
+    ) -> int:
+        """Atualiza o status de vários items com um update_many por collection.
+
+        Args:
+            items: Items a atualizar (de qualquer collection)
+            status: Novo status (ex: "skipped")
+
+        Returns:
+            Número de documentos modificados
+        """
+        ids_by_collection: dict[str, list[Any]] = {}
+        for item in items:
+            ids_by_collection.setdefault(item.collection, []).append(item.id)
+
+        modified = 0
+        for collection, ids in ids_by_collection.items():
+            result = await self.db[collection].update_many(
+                {"_id": {"$in": ids}},
+                {"$set": {"conversion.status": status}},
+            )
+            modified += result.modified_count
+        return modified
+
     async def get_pending_count(self, project_name: str) -> int:
         """Conta items pendentes de conversão (todas as collections).
 
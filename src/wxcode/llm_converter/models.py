@@ -10,9 +10,11 @@ class ConversionContext(BaseModel):
 
     page_name: str
     element_id: str
+    project_id: str | None = None
     controls: list[dict] = Field(default_factory=list)
     local_procedures: list[dict] = Field(default_factory=list)
     referenced_procedures: list[dict] = Field(default_factory=list)  # Procedures globais referenciadas
+    procedure_summaries: list[dict] = Field(default_factory=list)  # Só assinatura (não couberam)
     dependencies: list[Any] = Field(default_factory=list)  # str ou dict
     estimated_tokens: int = 0
     theme: str | None = None  # Nome do tema (ex: 'dashlite')
@@ -65,8 +67,10 @@ class LLMResponse(BaseModel):
     """Resposta do LLM."""
 
     content: str
-    input_tokens: int
+    input_tokens: int  # Tokens de entrada fora do cache
     output_tokens: int
+    cache_creation_tokens: int = 0  # Tokens gravados no cache de prompt
+    cache_read_tokens: int = 0  # Tokens lidos do cache de prompt
 
 
 class PageConversionResult(BaseModel):
@@ -79,6 +83,7 @@ class PageConversionResult(BaseModel):
     tokens_used: dict = Field(default_factory=dict)
     duration_seconds: float = 0.0
     cost_usd: float = 0.0
+    cache_hit: bool = False
 
 
 class ProcedureContext(BaseModel):
@@ -86,6 +91,7 @@ class ProcedureContext(BaseModel):
 
     group_name: str
     element_id: str
+    project_id: str | None = None
     source_file: str = ""
     procedures: list[dict] = Field(default_factory=list)
     referenced_procedures: list[dict] = Field(default_factory=list)
@@ -124,6 +130,7 @@ class ProcedureConversionResult(BaseModel):
     tokens_used: dict = Field(default_factory=dict)
     duration_seconds: float = 0.0
     cost_usd: float = 0.0
+    cache_hit: bool = False
 
 
 class ConversionError(Exception):
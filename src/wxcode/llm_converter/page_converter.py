@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
+from uuid import uuid4
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -10,7 +11,9 @@ from .context_builder import ContextBuilder
 from .models import ConversionError, PageConversionResult
 from .output_writer import OutputWriter
 from .providers import LLMProvider, create_provider
-from .response_parser import ResponseParser
+from .response_cache import LLMResponseCache
+from .response_parser import ResponseParser, StreamingJSONBuffer
+from .usage_log import record_llm_usage
 
 
 class PageConverter:
@@ -23,6 +26,8 @@ class PageConverter:
         llm_provider: LLMProvider | None = None,
         theme: str | None = None,
         project_root: Path | None = None,
+        response_cache: LLMResponseCache | None = None,
+        refresh_cache: bool = False,
     ):
         """Inicializa o PageConverter.
 
@@ -32,6 +37,8 @@ class PageConverter:
             llm_provider: Provider LLM (opcional, cria AnthropicProvider se não fornecido)
             theme: Nome do tema para skills (ex: 'dashlite')
             project_root: Raiz do projeto para encontrar skills
+            response_cache: Cache de respostas do LLM (None desativa o cache)
+            refresh_cache: Se True, ignora entradas existentes e regrava o cache
         """
         self.db = db
         self.output_dir = Path(output_dir)
@@ -41,6 +48,10 @@ class PageConverter:
             db, theme=theme, project_root=project_root
         )
         self.llm_provider = llm_provider or create_provider("anthropic")
+        # Agrupa os registros de TokenUsageLog desta instância
+        self.session_id = f"llm-{uuid4().hex}"
+        self.response_cache = response_cache
+        self.refresh_cache = refresh_cache
         self.response_parser = ResponseParser()
         self.output_writer = OutputWriter(output_dir)
 
@@ -69,11 +80,28 @@ class PageConverter:
         # 1. Construir contexto
         context = await self.context_builder.build(element_id)
 
-        # 2. Chamar LLM
-        llm_response = await self.llm_provider.convert(context)
+        # 2. Reaproveitar resposta em cache ou chamar LLM (o JSON é
+        # localizado conforme o streaming chega)
+        buffer = StreamingJSONBuffer()
+        response_cache = self.response_cache
+        cache_key: str | None = None
+        llm_response = None
+        if response_cache is not None:
+            cache_key = response_cache.make_key(
+                self.llm_provider.name, self.llm_provider.model, context
+            )
+            if not self.refresh_cache:
+                llm_response = response_cache.get(cache_key)
+        cache_hit = llm_response is not None
+        if llm_response is None:
+            llm_response = await self.llm_provider.convert(context, buffer=buffer)
 
         # 3. Parsear resposta
-        result = self.response_parser.parse(llm_response.content)
+        result = self.response_parser.parse(llm_response.content, buffer=buffer)
+
+        # Só respostas parseáveis entram no cache
+        if response_cache is not None and cache_key is not None and not cache_hit:
+            response_cache.put(cache_key, llm_response)
 
         # 4. Escrever arquivos (se não for dry_run)
         files_created: list[str] = []
@@ -84,23 +112,49 @@ class PageConverter:
         # 5. Calcular métricas
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
-        cost = self.llm_provider.estimate_cost(
-            llm_response.input_tokens,
-            llm_response.output_tokens
-        )
+        if cache_hit:
+            # Nenhuma chamada ao LLM: sem custo e sem registro de uso
+            cost = 0.0
+            tokens_used = {
+                "input": 0,
+                "output": 0,
+                "total": 0,
+                "cache_creation": 0,
+                "cache_read": 0,
+                "saved": llm_response.input_tokens + llm_response.output_tokens,
+            }
+        else:
+            cost = self.llm_provider.estimate_cost(
+                llm_response.input_tokens,
+                llm_response.output_tokens,
+                llm_response.cache_creation_tokens,
+                llm_response.cache_read_tokens,
+            )
+            await record_llm_usage(
+                llm_response,
+                context.project_id,
+                session_id=self.session_id,
+                model=self.llm_provider.model,
+                cost_usd=cost,
+                change_id=result.page_name,
+            )
+            tokens_used = {
+                "input": llm_response.input_tokens,
+                "output": llm_response.output_tokens,
+                "total": llm_response.input_tokens + llm_response.output_tokens,
+                "cache_creation": llm_response.cache_creation_tokens,
+                "cache_read": llm_response.cache_read_tokens,
+            }
 
         return PageConversionResult(
             element_id=str(element_id),
             page_name=result.page_name,
             files_created=files_created,
             notes=result.notes,
-            tokens_used={
-                "input": llm_response.input_tokens,
-                "output": llm_response.output_tokens,
-                "total": llm_response.input_tokens + llm_response.output_tokens,
-            },
+            tokens_used=tokens_used,
             duration_seconds=duration,
             cost_usd=cost,
+            cache_hit=cache_hit,
         )
 
     async def convert_by_name(
@@ -7,6 +7,8 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from .models import ConversionError, ProcedureContext
+from .token_counter import count_tokens, procedure_tokens
+from .usage_log import element_project_id
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +80,12 @@ class ProcedureContextBuilder:
         # Calcular tokens totais
         estimated_tokens = base_tokens
         for proc in referenced_procedures:
-            estimated_tokens += self._estimate_tokens(proc.get("code", ""))
+            estimated_tokens += procedure_tokens(proc)
 
         return ProcedureContext(
             group_name=source_name.replace(".wdg", ""),
             element_id=str(element_id),
+            project_id=element_project_id(element),
             source_file=source_file,
             procedures=procedures,
             referenced_procedures=referenced_procedures,
@@ -119,6 +122,7 @@ class ProcedureContextBuilder:
                 "name": proc.get("name"),
                 "code": proc.get("code"),
                 "signature": proc.get("signature"),
+                "token_count": proc.get("token_count"),
                 "return_type": proc.get("return_type"),
                 "parameters": proc.get("parameters", []),
             })
@@ -208,6 +212,7 @@ class ProcedureContextBuilder:
                 "name": proc.get("name"),
                 "code": proc.get("code"),
                 "signature": proc.get("signature"),
+                "token_count": proc.get("token_count"),
                 "source": "external_group"
             })
 
@@ -238,27 +243,23 @@ class ProcedureContextBuilder:
             # Nome + signature + código
             total += self._estimate_tokens(proc.get("name", ""))
             total += self._estimate_tokens(proc.get("signature", ""))
-            total += self._estimate_tokens(proc.get("code", ""))
+            total += procedure_tokens(proc)
 
         for proc in referenced_procedures:
-            total += self._estimate_tokens(proc.get("code", ""))
+            total += procedure_tokens(proc)
 
         return total
 
     def _estimate_tokens(self, text: str) -> int:
-        """Estima número de tokens do texto.
-
-        Usa aproximação de ~4 caracteres por token.
+        """Conta tokens do texto com tiktoken (cache por hash do conteúdo).
 
         Args:
-            text: Texto para estimar
+            text: Texto para contar
 
         Returns:
-            Número estimado de tokens
+            Número de tokens
         """
-        if not text:
-            return 0
-        return len(text) // 4
+        return count_tokens(text)
 
     def _prioritize_procedures(
         self,
@@ -282,8 +283,7 @@ class ProcedureContextBuilder:
         # Calcular tokens de cada procedure
         proc_with_tokens = []
         for proc in referenced_procedures:
-            code = proc.get("code", "")
-            tokens = self._estimate_tokens(code)
+            tokens = procedure_tokens(proc)
             proc_with_tokens.append((proc, tokens))
 
         # Ordenar por tamanho (menores primeiro para maximizar quantidade)
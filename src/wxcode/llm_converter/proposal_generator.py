@@ -231,23 +231,7 @@ class ProposalGenerator:
         Returns:
             Resposta do LLM
         """
-        # Implementação simplificada - assume Anthropic provider
-        # Em produção, deveria usar método abstrato no provider
-        import anthropic
-
-        client = anthropic.Anthropic()
-        response = client.messages.create(
-            model=self.provider.model,
-            max_tokens=8192,
-            system=PROPOSAL_GENERATION_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        )
-
-        return LLMResponse(
-            content=response.content[0].text,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-        )
+        return await self.provider.complete(PROPOSAL_GENERATION_PROMPT, user_message)
 
     def _parse_response(self, content: str) -> dict:
         """Parseia resposta JSON do LLM.
@@ -2,8 +2,10 @@
 
 from .anthropic import AnthropicProvider
 from .base import BaseLLMProvider
+from .limiter import ProviderRateLimiter, get_provider_limiter, retry_delay_from_headers
 from .ollama import OllamaProvider
 from .openai import OpenAIProvider
+from .pool import close_http_client, get_http_client
 from .protocol import LLMProvider
 from .prompts import SYSTEM_PROMPT
 
@@ -57,6 +59,11 @@ __all__ = [
     "OpenAIProvider",
     "OllamaProvider",
     "SYSTEM_PROMPT",
+    "ProviderRateLimiter",
+    "get_provider_limiter",
+    "retry_delay_from_headers",
+    "get_http_client",
+    "close_http_client",
     "PROVIDERS",
     "create_provider",
     "list_providers",
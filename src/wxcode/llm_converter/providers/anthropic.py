@@ -1,13 +1,21 @@
 """AnthropicProvider - Provider para Anthropic Claude."""
 
 import os
-from typing import Any
+from typing import Any, Optional
 
 import anthropic
 
-from ..models import ConversionContext, LLMResponse, LLMResponseError, ProcedureContext
-from .base import BaseLLMProvider
-from .prompts import SYSTEM_PROMPT, PROCEDURE_SYSTEM_PROMPT
+from ..models import LLMResponseError
+from .base import BaseLLMProvider, Prompt, TextCallback
+from .limiter import ProviderRateLimiter
+from .pool import get_http_client
+
+# Breakpoint de cache de prompt (TTL padrão de 5 minutos)
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Multiplicadores do preço de entrada para gravação e leitura de cache
+CACHE_WRITE_PRICE_RATIO = 1.25
+CACHE_READ_PRICE_RATIO = 0.1
 
 
 class AnthropicProvider(BaseLLMProvider):
@@ -22,12 +30,19 @@ class AnthropicProvider(BaseLLMProvider):
 
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
+    retry_exceptions = (
+        anthropic.RateLimitError,
+        anthropic.APIConnectionError,  # inclui APITimeoutError
+        anthropic.InternalServerError,
+    )
+
     def __init__(
         self,
         model: str | None = None,
         api_key: str | None = None,
         max_retries: int = 3,
         timeout: int = 120,
+        limiter: Optional[ProviderRateLimiter] = None,
     ):
         """Inicializa o provider Anthropic.
 
@@ -36,11 +51,12 @@ class AnthropicProvider(BaseLLMProvider):
             api_key: Chave da API Anthropic (usa WXCODE_LLM_KEY ou ANTHROPIC_API_KEY)
             max_retries: Número máximo de tentativas
             timeout: Timeout em segundos
+            limiter: Limitador de chamadas (default: compartilhado do provider)
 
         Raises:
             LLMResponseError: Se nenhuma API key estiver configurada
         """
-        super().__init__(model or self.DEFAULT_MODEL, max_retries, timeout)
+        super().__init__(model or self.DEFAULT_MODEL, max_retries, timeout, limiter)
         # Prefer custom variable name (avoids leaking to subprocesses like Claude CLI)
         # Falls back to standard name for backwards compatibility
         self.api_key = (
@@ -52,143 +68,113 @@ class AnthropicProvider(BaseLLMProvider):
             raise LLMResponseError(
                 "API key not found. Set WXCODE_LLM_KEY or ANTHROPIC_API_KEY"
             )
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self._client: anthropic.AsyncAnthropic | None = None
+        self._http_client = None
+
+    @property
+    def client(self) -> anthropic.AsyncAnthropic:
+        """Client async sobre o pool HTTP compartilhado do event loop atual."""
+        http_client = get_http_client()
+        if self._client is None or self._http_client is not http_client:
+            # Retries ficam com _call_with_retry (limitador + headers de rate limit)
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=http_client,
+                max_retries=0,
+                timeout=self.timeout,
+            )
+            self._http_client = http_client
+        return self._client
 
     @property
     def name(self) -> str:
         """Nome do provider."""
         return "anthropic"
 
-    async def convert(self, context: ConversionContext) -> LLMResponse:
-        """Envia contexto para o Claude e retorna resposta.
-
-        Args:
-            context: Contexto da conversão
-
-        Returns:
-            LLMResponse com conteúdo e métricas de uso
-
-        Raises:
-            LLMResponseError: Se a chamada falhar após retries
-        """
-        user_message = self._build_user_message(context)
-
-        try:
-            response = await self._call_with_retry(
-                lambda: self._sync_call(user_message),
-                (anthropic.RateLimitError, anthropic.APITimeoutError),
-            )
-        except anthropic.APIError as e:
-            raise LLMResponseError(f"Anthropic API error: {e}") from e
-        except Exception as e:
-            raise LLMResponseError(f"Failed after retries: {e}") from e
-
-        return LLMResponse(
-            content=response["content"],
-            input_tokens=response["input_tokens"],
-            output_tokens=response["output_tokens"],
-        )
-
-    async def convert_procedure(self, context: ProcedureContext) -> LLMResponse:
-        """Envia contexto de procedure group para o Claude e retorna resposta.
-
-        Args:
-            context: Contexto do procedure group
-
-        Returns:
-            LLMResponse com conteúdo e métricas de uso
-
-        Raises:
-            LLMResponseError: Se a chamada falhar após retries
-        """
-        user_message = self._build_procedure_user_message(context)
-
-        try:
-            response = await self._call_with_retry(
-                lambda: self._sync_call_procedure(user_message),
-                (anthropic.RateLimitError, anthropic.APITimeoutError),
-            )
-        except anthropic.APIError as e:
-            raise LLMResponseError(f"Anthropic API error: {e}") from e
-        except Exception as e:
-            raise LLMResponseError(f"Failed after retries: {e}") from e
-
-        return LLMResponse(
-            content=response["content"],
-            input_tokens=response["input_tokens"],
-            output_tokens=response["output_tokens"],
-        )
+    async def _stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int,
+        on_text: Optional[TextCallback],
+    ) -> dict[str, Any]:
+        """Chamada streaming para a API Anthropic.
 
-    def _sync_call_procedure(self, user_message: str) -> dict[str, Any]:
-        """Chamada síncrona para conversão de procedures.
+        O system e o último bloco estável do prompt recebem cache_control:
+        entre conversões só o sufixo do elemento é processado do zero.
 
         Args:
-            user_message: Mensagem do usuário
+            prompt: Prompt (partes estáveis + parte do elemento)
+            max_tokens: Máximo de tokens de saída
+            on_text: Callback chamado com cada trecho de texto
 
         Returns:
-            Dicionário com content, input_tokens, output_tokens
+            Dicionário com content, tokens de entrada/saída e de cache
         """
-        response = self.client.messages.create(
+        system = [{"type": "text", "text": prompt.system, "cache_control": CACHE_CONTROL}]
+        content: list[dict[str, Any]] = [
+            {"type": "text", "text": block} for block in prompt.prefix
+        ]
+        if content:
+            content[-1]["cache_control"] = CACHE_CONTROL
+        content.append({"type": "text", "text": prompt.suffix})
+
+        async with self.client.messages.stream(
             model=self.model,
-            max_tokens=8192,
-            timeout=self.timeout,
-            system=PROCEDURE_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        )
+            max_tokens=max_tokens,
+            system=system,
+            messages=[{"role": "user", "content": content}],
+        ) as stream:
+            async for text in stream.text_stream:
+                if on_text is not None:
+                    on_text(text)
+            response = await stream.get_final_message()
 
         # Extrair conteúdo de texto
-        content = ""
+        text = ""
         for block in response.content:
             if block.type == "text":
-                content += block.text
+                text += block.text
 
+        usage = response.usage
         return {
-            "content": content,
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
+            "content": text,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_tokens": usage.cache_creation_input_tokens or 0,
+            "cache_read_tokens": usage.cache_read_input_tokens or 0,
         }
 
-    def _sync_call(self, user_message: str) -> dict[str, Any]:
-        """Chamada síncrona para a API Anthropic.
-
-        Args:
-            user_message: Mensagem do usuário
-
-        Returns:
-            Dicionário com content, input_tokens, output_tokens
-        """
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=8192,
-            timeout=self.timeout,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        )
-
-        # Extrair conteúdo de texto
-        content = ""
-        for block in response.content:
-            if block.type == "text":
-                content += block.text
+    def _wrap_error(self, error: Exception) -> LLMResponseError:
+        """Converte um erro da chamada em LLMResponseError."""
+        if isinstance(error, anthropic.APIError):
+            return LLMResponseError(f"Anthropic API error: {error}")
+        return super()._wrap_error(error)
 
-        return {
-            "content": content,
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
-        }
-
-    def estimate_cost(self, tokens_in: int, tokens_out: int) -> float:
+    def estimate_cost(
+        self,
+        tokens_in: int,
+        tokens_out: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+    ) -> float:
         """Estima custo em USD.
 
         Args:
-            tokens_in: Número de tokens de entrada
+            tokens_in: Número de tokens de entrada (fora do cache)
             tokens_out: Número de tokens de saída
+            cache_creation_tokens: Tokens gravados no cache
+            cache_read_tokens: Tokens lidos do cache
 
         Returns:
             Custo estimado em USD
         """
         pricing = self.PRICING.get(self.model, self.PRICING[self.DEFAULT_MODEL])
-        return (tokens_in * pricing["input"] + tokens_out * pricing["output"]) / 1_000_000
+        input_cost = pricing["input"] * (
+            tokens_in
+            + cache_creation_tokens * CACHE_WRITE_PRICE_RATIO
+            + cache_read_tokens * CACHE_READ_PRICE_RATIO
+        )
+        return (input_cost + tokens_out * pricing["output"]) / 1_000_000
 
     @classmethod
     def available_models(cls) -> list[str]:
@@ -2,19 +2,60 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
-from ..models import ConversionContext, LLMResponse, ProcedureContext
+from ..models import ConversionContext, LLMResponse, LLMResponseError, ProcedureContext
+from ..token_counter import count_tokens
+from .limiter import ProviderRateLimiter, backoff_delay, get_provider_limiter
+from .prompts import PROCEDURE_SYSTEM_PROMPT, SYSTEM_PROMPT
+
+if TYPE_CHECKING:
+    from ..response_parser import StreamingJSONBuffer
+
+# Recebe cada trecho de texto gerado durante o streaming
+TextCallback = Callable[[str], Any]
+
+# Máximo de tokens de saída por chamada
+DEFAULT_MAX_TOKENS = 8192
+
+
+@dataclass
+class Prompt:
+    """Prompt dividido em partes estáveis e parte específica do elemento.
+
+    O system e os blocos de `prefix` se repetem entre conversões (prompt de
+    regras, skills do tema) e podem ser cacheados pelo provider; o `suffix`
+    muda a cada elemento e vem sempre por último.
+    """
+
+    system: str
+    suffix: str
+    prefix: list[str] = field(default_factory=list)
+
+    @property
+    def user_message(self) -> str:
+        """Mensagem do usuário completa (prefixo + sufixo)."""
+        return "\n".join([*self.prefix, self.suffix])
 
 
 class BaseLLMProvider(ABC):
-    """Classe base com funcionalidades comuns para todos os providers."""
+    """Classe base com funcionalidades comuns para todos os providers.
+
+    Os providers implementam apenas `_stream` (uma chamada streaming ao
+    modelo); retry com backoff, limite de concorrência/tokens por minuto e
+    a alimentação incremental do parser ficam aqui.
+    """
+
+    # Exceções transitórias que devem causar retry
+    retry_exceptions: tuple[type[Exception], ...] = ()
 
     def __init__(
         self,
         model: str,
         max_retries: int = 3,
         timeout: int = 120,
+        limiter: Optional[ProviderRateLimiter] = None,
     ):
         """Inicializa o provider base.
 
@@ -22,16 +63,25 @@ class BaseLLMProvider(ABC):
             model: Nome do modelo a usar
             max_retries: Número máximo de tentativas
             timeout: Timeout em segundos
+            limiter: Limitador de chamadas (default: compartilhado do provider)
         """
         self._model = model
         self.max_retries = max_retries
         self.timeout = timeout
+        self._limiter = limiter
 
     @property
     def model(self) -> str:
         """Modelo em uso."""
         return self._model
 
+    @property
+    def limiter(self) -> ProviderRateLimiter:
+        """Limitador de chamadas compartilhado por todas as instâncias do provider."""
+        if self._limiter is None:
+            self._limiter = get_provider_limiter(self.name)
+        return self._limiter
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -39,18 +89,34 @@ class BaseLLMProvider(ABC):
         ...
 
     @abstractmethod
-    async def convert(self, context: ConversionContext) -> LLMResponse:
-        """Executa conversão de página usando o LLM."""
-        ...
+    async def _stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int,
+        on_text: Optional[TextCallback],
+    ) -> dict[str, Any]:
+        """Executa uma chamada streaming ao modelo.
 
-    @abstractmethod
-    async def convert_procedure(self, context: ProcedureContext) -> LLMResponse:
-        """Executa conversão de procedure group usando o LLM."""
+        Args:
+            prompt: Prompt (partes estáveis + parte do elemento)
+            max_tokens: Máximo de tokens de saída
+            on_text: Callback chamado com cada trecho de texto recebido
+
+        Returns:
+            Dicionário com content, input_tokens, output_tokens e,
+            se o provider informar, cache_creation_tokens/cache_read_tokens
+        """
         ...
 
     @abstractmethod
-    def estimate_cost(self, tokens_in: int, tokens_out: int) -> float:
-        """Estima custo em USD."""
+    def estimate_cost(
+        self,
+        tokens_in: int,
+        tokens_out: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+    ) -> float:
+        """Estima custo em USD (tokens_in não inclui os tokens de cache)."""
         ...
 
     @classmethod
@@ -59,6 +125,120 @@ class BaseLLMProvider(ABC):
         """Lista modelos disponíveis."""
         ...
 
+    def _wrap_error(self, error: Exception) -> LLMResponseError:
+        """Converte um erro da chamada em LLMResponseError."""
+        return LLMResponseError(f"Failed after retries: {error}")
+
+    async def complete(
+        self,
+        system: str,
+        user_message: str,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        buffer: Optional["StreamingJSONBuffer"] = None,
+    ) -> LLMResponse:
+        """Gera uma resposta para um system prompt e uma mensagem.
+
+        Args:
+            system: Prompt de sistema
+            user_message: Mensagem do usuário
+            max_tokens: Máximo de tokens de saída
+            buffer: Buffer alimentado com o texto conforme chega (opcional)
+
+        Returns:
+            LLMResponse com conteúdo e métricas de uso
+
+        Raises:
+            LLMResponseError: Se a chamada falhar após retries
+        """
+        return await self.complete_prompt(
+            Prompt(system=system, suffix=user_message), max_tokens, buffer
+        )
+
+    async def complete_prompt(
+        self,
+        prompt: Prompt,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        buffer: Optional["StreamingJSONBuffer"] = None,
+    ) -> LLMResponse:
+        """Gera uma resposta em streaming, com retry e limite de chamadas.
+
+        Args:
+            prompt: Prompt (partes estáveis + parte do elemento)
+            max_tokens: Máximo de tokens de saída
+            buffer: Buffer alimentado com o texto conforme chega (opcional)
+
+        Returns:
+            LLMResponse com conteúdo e métricas de uso
+
+        Raises:
+            LLMResponseError: Se a chamada falhar após retries
+        """
+
+        async def attempt() -> dict[str, Any]:
+            # Uma tentativa anterior pode ter deixado texto parcial no buffer
+            if buffer is not None:
+                buffer.reset()
+            return await self._stream(
+                prompt, max_tokens, buffer.feed if buffer else None
+            )
+
+        try:
+            response = await self._call_with_retry(
+                attempt,
+                self.retry_exceptions,
+                estimated_tokens=count_tokens(prompt.system)
+                + sum(count_tokens(block) for block in prompt.prefix)
+                + count_tokens(prompt.suffix),
+            )
+        except LLMResponseError:
+            raise
+        except Exception as e:
+            raise self._wrap_error(e) from e
+
+        return LLMResponse(
+            content=response["content"],
+            input_tokens=response["input_tokens"],
+            output_tokens=response["output_tokens"],
+            cache_creation_tokens=response.get("cache_creation_tokens", 0),
+            cache_read_tokens=response.get("cache_read_tokens", 0),
+        )
+
+    async def convert(
+        self,
+        context: ConversionContext,
+        buffer: Optional["StreamingJSONBuffer"] = None,
+    ) -> LLMResponse:
+        """Executa conversão de página usando o LLM.
+
+        Args:
+            context: Contexto da conversão
+            buffer: Buffer alimentado com o texto conforme chega (opcional)
+
+        Returns:
+            LLMResponse com conteúdo e métricas de uso
+        """
+        return await self.complete_prompt(
+            self._build_page_prompt(context), buffer=buffer
+        )
+
+    async def convert_procedure(
+        self,
+        context: ProcedureContext,
+        buffer: Optional["StreamingJSONBuffer"] = None,
+    ) -> LLMResponse:
+        """Executa conversão de procedure group usando o LLM.
+
+        Args:
+            context: Contexto do procedure group
+            buffer: Buffer alimentado com o texto conforme chega (opcional)
+
+        Returns:
+            LLMResponse com conteúdo e métricas de uso
+        """
+        return await self.complete_prompt(
+            self._build_procedure_prompt(context), buffer=buffer
+        )
+
     def _build_user_message(self, context: ConversionContext) -> str:
         """Formata o contexto como mensagem para o usuário.
 
@@ -68,10 +248,26 @@ class BaseLLMProvider(ABC):
         Returns:
             Mensagem formatada
         """
-        parts = []
+        return self._build_page_prompt(context).user_message
+
+    def _build_page_prompt(self, context: ConversionContext) -> Prompt:
+        """Monta o prompt de conversão de página.
+
+        As skills do tema são iguais para todas as páginas do mesmo tema e
+        ficam no prefixo; controles, procedures e dependências formam o
+        sufixo.
+
+        Args:
+            context: Contexto da conversão
+
+        Returns:
+            Prompt com prefixo estável e sufixo da página
+        """
+        prefix = []
 
         # Incluir theme skills se disponíveis
         if context.theme_skills:
+            parts = []
             parts.append("# Theme Reference")
             parts.append("")
             parts.append(f"Using theme: **{context.theme}**")
@@ -87,13 +283,14 @@ class BaseLLMProvider(ABC):
             parts.append("")
             parts.append("---")
             parts.append("")
+            prefix.append("\n".join(parts))
 
-        parts.extend([
+        parts = [
             f"# Converter Página: {context.page_name}",
             "",
             "## Hierarquia de Controles",
             "",
-        ])
+        ]
 
         # Serializar controles em formato legível
         for control in context.controls:
@@ -130,6 +327,15 @@ class BaseLLMProvider(ABC):
                 parts.append("```")
                 parts.append("")
 
+        # Procedures que não couberam no limite de tokens: apenas assinatura
+        if context.procedure_summaries:
+            parts.append("")
+            parts.append("## Outras Procedures Disponíveis (somente assinatura)")
+            parts.append("")
+            for proc in context.procedure_summaries:
+                parts.append(f"- `{proc.get('signature') or proc.get('name')}`")
+            parts.append("")
+
         # Adicionar dependências
         if context.dependencies:
             parts.append("")
@@ -149,7 +355,7 @@ class BaseLLMProvider(ABC):
             "Retorne APENAS o JSON, sem markdown ou explicações."
         )
 
-        return "\n".join(parts)
+        return Prompt(system=SYSTEM_PROMPT, prefix=prefix, suffix="\n".join(parts))
 
     def _format_control(self, control: dict, indent: int = 0) -> str:
         """Formata um controle para exibição.
@@ -203,14 +409,20 @@ class BaseLLMProvider(ABC):
 
     async def _call_with_retry(
         self,
-        call_fn: Callable[[], dict[str, Any]],
+        call_fn: Callable[[], Awaitable[dict[str, Any]]],
         retry_exceptions: tuple[type[Exception], ...],
+        estimated_tokens: int = 0,
     ) -> dict[str, Any]:
-        """Chama função com retry e backoff exponencial.
+        """Chama função com retry e backoff com jitter.
+
+        Cada tentativa ocupa um slot do limitador do provider. Em erros de
+        rate limit (HTTP 429) o tempo de espera vem dos headers da resposta
+        e pausa todas as chamadas do provider, não só esta.
 
         Args:
-            call_fn: Função síncrona que executa a chamada
+            call_fn: Coroutine factory que executa a chamada
             retry_exceptions: Tupla de exceções que devem causar retry
+            estimated_tokens: Tokens de entrada estimados (orçamento por minuto)
 
         Returns:
             Dicionário com content, input_tokens, output_tokens
@@ -222,14 +434,17 @@ class BaseLLMProvider(ABC):
 
         for attempt in range(self.max_retries):
             try:
-                # Executar chamada síncrona em thread separada
-                response = await asyncio.to_thread(call_fn)
-                return response
+                async with self.limiter.slot(estimated_tokens):
+                    return await call_fn()
 
             except retry_exceptions as e:
                 last_error = e
-                wait_time = 2 ** attempt  # 1, 2, 4 segundos
-                await asyncio.sleep(wait_time)
+                response = getattr(e, "response", None)
+                delay = backoff_delay(attempt, getattr(response, "headers", None))
+                if getattr(response, "status_code", None) == 429:
+                    self.limiter.pause(delay)
+                if attempt + 1 < self.max_retries:
+                    await asyncio.sleep(delay)
 
         raise last_error  # type: ignore
 
@@ -242,6 +457,20 @@ class BaseLLMProvider(ABC):
         Returns:
             Mensagem formatada
         """
+        return self._build_procedure_prompt(context).user_message
+
+    def _build_procedure_prompt(self, context: ProcedureContext) -> Prompt:
+        """Monta o prompt de conversão de procedure group.
+
+        Só o system prompt é comum entre grupos; a mensagem inteira é
+        específica do grupo.
+
+        Args:
+            context: Contexto do procedure group
+
+        Returns:
+            Prompt com o sufixo do grupo
+        """
         parts = [
             f"# Converter Grupo de Procedures: {context.group_name}",
             "",
@@ -302,4 +531,4 @@ class BaseLLMProvider(ABC):
             "Retorne APENAS o JSON, sem markdown ou explicações."
         )
 
-        return "\n".join(parts)
+        return Prompt(system=PROCEDURE_SYSTEM_PROMPT, suffix="\n".join(parts))
@@ -0,0 +1,218 @@
+"""Limitadores de chamadas por provider LLM (concorrência, tokens/min e backoff)."""
+
+import asyncio
+import email.utils
+import random
+import re
+import time
+import weakref
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Mapping, Optional
+
+# Teto do backoff exponencial sem headers (segundos)
+MAX_BACKOFF_SECONDS = 60.0
+
+# Jitter adicionado ao tempo indicado pelos headers de rate limit (fração)
+HEADER_JITTER_RATIO = 0.1
+
+# Headers com timestamp/duração para o reset dos limites
+_RESET_HEADERS = (
+    "anthropic-ratelimit-requests-reset",
+    "anthropic-ratelimit-tokens-reset",
+    "anthropic-ratelimit-input-tokens-reset",
+    "anthropic-ratelimit-output-tokens-reset",
+    "x-ratelimit-reset-requests",
+    "x-ratelimit-reset-tokens",
+)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+# Semáforo de concorrência e lock do token bucket de um event loop
+_LoopPrimitives = tuple[asyncio.Semaphore, asyncio.Lock]
+
+
+def _parse_duration(value: str) -> float | None:
+    """Converte durações do tipo '1s', '6m0s', '250ms' em segundos."""
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value.strip():
+        return None
+    factors = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(n) * factors[u] for n, u in parts)
+
+
+def _parse_reset(value: str, now: datetime) -> float | None:
+    """Interpreta um header de reset: segundos, duração ou timestamp RFC 3339."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    if (duration := _parse_duration(value)) is not None:
+        return duration
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return max(0.0, (reset_at - now).total_seconds())
+    except ValueError:
+        return None
+
+
+def retry_delay_from_headers(
+    headers: Optional[Mapping[str, str]],
+    now: Optional[datetime] = None,
+) -> float | None:
+    """Tempo de espera indicado pelos headers de rate limit da resposta.
+
+    Considera retry-after-ms, retry-after (segundos ou data HTTP) e os
+    headers de reset da Anthropic/OpenAI. Retorna None se nenhum existir.
+    """
+    if not headers:
+        return None
+    headers = {k.lower(): v for k, v in headers.items()}
+    now = now or datetime.now(timezone.utc)
+
+    if value := headers.get("retry-after-ms"):
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    if value := headers.get("retry-after"):
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            parsed = email.utils.parsedate_to_datetime(value)
+            if parsed is not None:
+                return max(0.0, (parsed - now).total_seconds())
+
+    delays = [
+        delay for name in _RESET_HEADERS
+        if (value := headers.get(name)) and (delay := _parse_reset(value, now)) is not None
+    ]
+    return max(delays) if delays else None
+
+
+def backoff_delay(
+    attempt: int,
+    headers: Optional[Mapping[str, str]] = None,
+    base: float = 1.0,
+    cap: float = MAX_BACKOFF_SECONDS,
+) -> float:
+    """Calcula a espera antes da próxima tentativa.
+
+    Com headers de rate limit, espera o tempo indicado mais um jitter
+    pequeno (evita que todas as chamadas voltem juntas). Sem headers, usa
+    backoff exponencial com full jitter.
+    """
+    delay = retry_delay_from_headers(headers)
+    if delay is not None:
+        return min(cap, delay * (1 + random.uniform(0, HEADER_JITTER_RATIO)))
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class ProviderRateLimiter:
+    """
+    Limita chamadas a um provider LLM.
+
+    Combina um semáforo (chamadas simultâneas) com um token bucket de
+    tokens por minuto. Uma chamada maior que a capacidade do bucket espera
+    o bucket encher e então consome tudo, para nunca travar. Quando o
+    provider responde com rate limit, `pause()` segura todas as chamadas
+    até o reset indicado.
+
+    Semáforo e lock ficam presos ao event loop em que são usados, então são
+    criados por loop (a CLI e os testes usam asyncio.run várias vezes no
+    mesmo processo); o bucket e a pausa são compartilhados.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._available = float(tokens_per_minute or 0)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._primitives: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPrimitives] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _loop_primitives(self) -> _LoopPrimitives:
+        """Semáforo e lock do event loop atual."""
+        loop = asyncio.get_running_loop()
+        primitives = self._primitives.get(loop)
+        if primitives is None:
+            primitives = (asyncio.Semaphore(self.max_concurrency), asyncio.Lock())
+            self._primitives[loop] = primitives
+        return primitives
+
+    def _refill(self) -> None:
+        now = self._clock()
+        rate = self.tokens_per_minute / 60.0
+        self._available = min(
+            float(self.tokens_per_minute),
+            self._available + (now - self._updated_at) * rate,
+        )
+        self._updated_at = now
+
+    async def _wait_pause(self) -> None:
+        while (remaining := self._paused_until - self._clock()) > 0:
+            await asyncio.sleep(remaining)
+
+    async def _consume(self, tokens: int) -> None:
+        if not self.tokens_per_minute:
+            return
+        needed = min(tokens, self.tokens_per_minute)
+        # O lock garante ordem FIFO entre quem está esperando o bucket
+        async with self._loop_primitives()[1]:
+            while True:
+                self._refill()
+                if self._available >= needed:
+                    self._available -= needed
+                    return
+                deficit = needed - self._available
+                await asyncio.sleep(deficit * 60.0 / self.tokens_per_minute)
+
+    def pause(self, seconds: float) -> None:
+        """Suspende novas chamadas por `seconds` (ex: após HTTP 429)."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Reserva uma chamada simultânea e `tokens` do orçamento por minuto."""
+        async with self._loop_primitives()[0]:
+            await self._wait_pause()
+            await self._consume(tokens)
+            yield
+
+
+# Limitadores compartilhados por provider neste processo
+_provider_limiters: dict[str, ProviderRateLimiter] = {}
+
+
+def get_provider_limiter(
+    provider: str,
+    max_concurrency: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+) -> ProviderRateLimiter:
+    """
+    Retorna o limitador do provider, criando-o na primeira chamada.
+
+    Sem parâmetros explícitos, usa conversion_provider_concurrency e
+    conversion_tokens_per_minute das settings.
+    """
+    limiter = _provider_limiters.get(provider)
+    if limiter is None:
+        from wxcode.config import get_settings
+
+        settings = get_settings()
+        limiter = ProviderRateLimiter(
+            max_concurrency=max_concurrency or settings.conversion_provider_concurrency,
+            tokens_per_minute=tokens_per_minute or settings.conversion_tokens_per_minute,
+        )
+        _provider_limiters[provider] = limiter
+    return limiter
@@ -1,12 +1,15 @@
 """OllamaProvider - Provider para Ollama (modelos locais)."""
 
+import json
 import os
+from typing import Any, Optional
 
 import httpx
 
-from ..models import ConversionContext, LLMResponse, LLMResponseError
-from .base import BaseLLMProvider
-from .prompts import SYSTEM_PROMPT
+from ..models import LLMResponseError
+from .base import BaseLLMProvider, Prompt, TextCallback
+from .limiter import ProviderRateLimiter
+from .pool import get_http_client
 
 
 class OllamaProvider(BaseLLMProvider):
@@ -24,12 +27,18 @@ class OllamaProvider(BaseLLMProvider):
     DEFAULT_MODEL = "llama3.1"
     DEFAULT_BASE_URL = "http://localhost:11434"
 
+    # Tempo que o modelo (e o KV cache do prefixo) fica carregado entre chamadas
+    DEFAULT_KEEP_ALIVE = "30m"
+
+    retry_exceptions = (httpx.TimeoutException, httpx.RemoteProtocolError)
+
     def __init__(
         self,
         model: str | None = None,
         base_url: str | None = None,
         max_retries: int = 3,
         timeout: int = 120,
+        limiter: Optional[ProviderRateLimiter] = None,
     ):
         """Inicializa o provider Ollama.
 
@@ -38,65 +47,97 @@ class OllamaProvider(BaseLLMProvider):
             base_url: URL do servidor Ollama (default: http://localhost:11434)
             max_retries: Número máximo de tentativas
             timeout: Timeout em segundos
+            limiter: Limitador de chamadas (default: compartilhado do provider)
         """
-        super().__init__(model or self.DEFAULT_MODEL, max_retries, timeout)
+        super().__init__(model or self.DEFAULT_MODEL, max_retries, timeout, limiter)
         self.base_url = base_url or os.environ.get("OLLAMA_BASE_URL", self.DEFAULT_BASE_URL)
+        self.keep_alive = os.environ.get("OLLAMA_KEEP_ALIVE", self.DEFAULT_KEEP_ALIVE)
 
     @property
     def name(self) -> str:
         """Nome do provider."""
         return "ollama"
 
-    async def convert(self, context: ConversionContext) -> LLMResponse:
-        """Envia contexto para o Ollama e retorna resposta.
+    async def _stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int,
+        on_text: Optional[TextCallback],
+    ) -> dict[str, Any]:
+        """Chamada streaming para a API do Ollama (NDJSON).
+
+        Com o modelo mantido carregado (keep_alive), o Ollama reaproveita o
+        KV cache do prefixo comum entre chamadas consecutivas; por isso as
+        partes estáveis do prompt vêm primeiro.
 
         Args:
-            context: Contexto da conversão
+            prompt: Prompt (partes estáveis + parte do elemento)
+            max_tokens: Máximo de tokens de saída
+            on_text: Callback chamado com cada trecho de texto
 
         Returns:
-            LLMResponse com conteúdo e métricas de uso
-
-        Raises:
-            LLMResponseError: Se a chamada falhar
+            Dicionário com content, input_tokens, output_tokens
         """
-        user_message = self._build_user_message(context)
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "system": SYSTEM_PROMPT,
-                        "prompt": user_message,
-                        "stream": False,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            return LLMResponse(
-                content=data.get("response", ""),
-                input_tokens=data.get("prompt_eval_count", 0),
-                output_tokens=data.get("eval_count", 0),
-            )
-
-        except httpx.ConnectError as e:
-            raise LLMResponseError(
+        parts: list[str] = []
+        result: dict[str, Any] = {"input_tokens": 0, "output_tokens": 0}
+
+        async with get_http_client().stream(
+            "POST",
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model,
+                "system": prompt.system,
+                "prompt": prompt.user_message,
+                "stream": True,
+                "keep_alive": self.keep_alive,
+                "options": {"num_predict": max_tokens},
+            },
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if error := data.get("error"):
+                    raise LLMResponseError(f"Ollama error: {error}")
+                if text := data.get("response"):
+                    parts.append(text)
+                    if on_text is not None:
+                        on_text(text)
+                # A última linha (done) traz as métricas de uso
+                if data.get("done"):
+                    result["input_tokens"] = data.get("prompt_eval_count", 0)
+                    result["output_tokens"] = data.get("eval_count", 0)
+
+        result["content"] = "".join(parts)
+        return result
+
+    def _wrap_error(self, error: Exception) -> LLMResponseError:
+        """Converte um erro da chamada em LLMResponseError."""
+        if isinstance(error, httpx.ConnectError):
+            return LLMResponseError(
                 f"Cannot connect to Ollama at {self.base_url}. "
                 "Is Ollama running? (ollama serve)"
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise LLMResponseError(f"Ollama HTTP error: {e}") from e
-        except Exception as e:
-            raise LLMResponseError(f"Ollama error: {e}") from e
+            )
+        if isinstance(error, httpx.HTTPStatusError):
+            return LLMResponseError(f"Ollama HTTP error: {error}")
+        return LLMResponseError(f"Ollama error: {error}")
 
-    def estimate_cost(self, tokens_in: int, tokens_out: int) -> float:
+    def estimate_cost(
+        self,
+        tokens_in: int,
+        tokens_out: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+    ) -> float:
         """Estima custo em USD.
 
         Args:
             tokens_in: Número de tokens de entrada (ignorado)
             tokens_out: Número de tokens de saída (ignorado)
+            cache_creation_tokens: Tokens gravados no cache (ignorado)
+            cache_read_tokens: Tokens lidos do cache (ignorado)
 
         Returns:
             Sempre 0.0 - Ollama é gratuito (local)
@@ -1,11 +1,15 @@
 """OpenAIProvider - Provider para OpenAI GPT."""
 
 import os
-from typing import Any
+from typing import Any, Optional
 
-from ..models import ConversionContext, LLMResponse, LLMResponseError
-from .base import BaseLLMProvider
-from .prompts import SYSTEM_PROMPT
+from ..models import LLMResponseError
+from .base import BaseLLMProvider, Prompt, TextCallback
+from .limiter import ProviderRateLimiter
+from .pool import get_http_client
+
+# Multiplicador do preço de entrada para tokens lidos do cache
+CACHE_READ_PRICE_RATIO = 0.5
 
 try:
     import openai
@@ -33,6 +37,7 @@ class OpenAIProvider(BaseLLMProvider):
         api_key: str | None = None,
         max_retries: int = 3,
         timeout: int = 120,
+        limiter: Optional[ProviderRateLimiter] = None,
     ):
         """Inicializa o provider OpenAI.
 
@@ -41,6 +46,7 @@ class OpenAIProvider(BaseLLMProvider):
             api_key: Chave da API OpenAI (usa OPENAI_API_KEY se não fornecida)
             max_retries: Número máximo de tentativas
             timeout: Timeout em segundos
+            limiter: Limitador de chamadas (default: compartilhado do provider)
 
         Raises:
             LLMResponseError: Se openai não estiver instalado ou API key não configurada
@@ -50,84 +56,122 @@ class OpenAIProvider(BaseLLMProvider):
                 "OpenAI package not installed. Run: pip install openai"
             )
 
-        super().__init__(model or self.DEFAULT_MODEL, max_retries, timeout)
+        super().__init__(model or self.DEFAULT_MODEL, max_retries, timeout, limiter)
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise LLMResponseError("OPENAI_API_KEY not found")
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.retry_exceptions = (
+            openai.RateLimitError,
+            openai.APIConnectionError,  # inclui APITimeoutError
+            openai.InternalServerError,
+        )
+        self._client = None
+        self._http_client = None
+
+    @property
+    def client(self) -> "openai.AsyncOpenAI":
+        """Client async sobre o pool HTTP compartilhado do event loop atual."""
+        http_client = get_http_client()
+        if self._client is None or self._http_client is not http_client:
+            # Retries ficam com _call_with_retry (limitador + headers de rate limit)
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=http_client,
+                max_retries=0,
+                timeout=self.timeout,
+            )
+            self._http_client = http_client
+        return self._client
 
     @property
     def name(self) -> str:
         """Nome do provider."""
         return "openai"
 
-    async def convert(self, context: ConversionContext) -> LLMResponse:
-        """Envia contexto para o GPT e retorna resposta.
-
-        Args:
-            context: Contexto da conversão
-
-        Returns:
-            LLMResponse com conteúdo e métricas de uso
-
-        Raises:
-            LLMResponseError: Se a chamada falhar após retries
-        """
-        user_message = self._build_user_message(context)
-
-        try:
-            response = await self._call_with_retry(
-                lambda: self._sync_call(user_message),
-                (openai.RateLimitError, openai.APITimeoutError),
-            )
-        except openai.APIError as e:
-            raise LLMResponseError(f"OpenAI API error: {e}") from e
-        except Exception as e:
-            raise LLMResponseError(f"Failed after retries: {e}") from e
-
-        return LLMResponse(
-            content=response["content"],
-            input_tokens=response["input_tokens"],
-            output_tokens=response["output_tokens"],
-        )
+    async def _stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int,
+        on_text: Optional[TextCallback],
+    ) -> dict[str, Any]:
+        """Chamada streaming para a API OpenAI.
 
-    def _sync_call(self, user_message: str) -> dict[str, Any]:
-        """Chamada síncrona para a API OpenAI.
+        A OpenAI cacheia prefixos automaticamente; basta manter as partes
+        estáveis do prompt no início (o que a mensagem já faz).
 
         Args:
-            user_message: Mensagem do usuário
+            prompt: Prompt (partes estáveis + parte do elemento)
+            max_tokens: Máximo de tokens de saída
+            on_text: Callback chamado com cada trecho de texto
 
         Returns:
-            Dicionário com content, input_tokens, output_tokens
+            Dicionário com content, tokens de entrada/saída e de cache
         """
-        response = self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             model=self.model,
-            max_tokens=8192,
-            timeout=self.timeout,
+            max_tokens=max_tokens,
             messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_message},
+                {"role": "system", "content": prompt.system},
+                {"role": "user", "content": prompt.user_message},
             ],
+            stream=True,
+            stream_options={"include_usage": True},
         )
 
+        parts: list[str] = []
+        usage = None
+        async for chunk in stream:
+            # O último chunk traz apenas o uso (sem choices)
+            if chunk.usage:
+                usage = chunk.usage
+            for choice in chunk.choices:
+                if text := choice.delta.content:
+                    parts.append(text)
+                    if on_text is not None:
+                        on_text(text)
+
+        if usage is None:
+            return {"content": "".join(parts), "input_tokens": 0, "output_tokens": 0}
+
+        # prompt_tokens inclui os tokens lidos do cache
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", None) or 0) if details else 0
         return {
-            "content": response.choices[0].message.content or "",
-            "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "output_tokens": response.usage.completion_tokens if response.usage else 0,
+            "content": "".join(parts),
+            "input_tokens": usage.prompt_tokens - cached,
+            "output_tokens": usage.completion_tokens,
+            "cache_read_tokens": cached,
         }
 
-    def estimate_cost(self, tokens_in: int, tokens_out: int) -> float:
+    def _wrap_error(self, error: Exception) -> LLMResponseError:
+        """Converte um erro da chamada em LLMResponseError."""
+        if isinstance(error, openai.APIError):
+            return LLMResponseError(f"OpenAI API error: {error}")
+        return super()._wrap_error(error)
+
+    def estimate_cost(
+        self,
+        tokens_in: int,
+        tokens_out: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+    ) -> float:
         """Estima custo em USD.
 
         Args:
-            tokens_in: Número de tokens de entrada
+            tokens_in: Número de tokens de entrada (fora do cache)
             tokens_out: Número de tokens de saída
+            cache_creation_tokens: Tokens gravados no cache (sem custo extra)
+            cache_read_tokens: Tokens lidos do cache
 
         Returns:
             Custo estimado em USD
         """
         pricing = self.PRICING.get(self.model, self.PRICING[self.DEFAULT_MODEL])
-        return (tokens_in * pricing["input"] + tokens_out * pricing["output"]) / 1_000_000
+        input_cost = pricing["input"] * (
+            tokens_in + cache_creation_tokens + cache_read_tokens * CACHE_READ_PRICE_RATIO
+        )
+        return (input_cost + tokens_out * pricing["output"]) / 1_000_000
 
     @classmethod
     def available_models(cls) -> list[str]:
@@ -0,0 +1,51 @@
+"""Pool de conexões HTTP compartilhado pelos providers LLM."""
+
+import asyncio
+import weakref
+
+import httpx
+
+# Conexões simultâneas e keep-alive por event loop
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+KEEPALIVE_EXPIRY = 60.0
+
+# Timeout padrão (leitura longa: gerações podem levar minutos)
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# httpx.AsyncClient fica preso ao loop onde abriu as conexões, então o pool
+# é mantido por loop (a CLI usa asyncio.run várias vezes no mesmo processo)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Retorna o AsyncClient compartilhado do event loop atual.
+
+    Todas as chamadas dos providers no mesmo loop reaproveitam as conexões
+    (TLS e keep-alive) deste client.
+
+    Raises:
+        RuntimeError: Se chamado fora de um event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Fecha o client do event loop atual (ex: no shutdown da API)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
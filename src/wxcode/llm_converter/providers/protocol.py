@@ -1,9 +1,12 @@
 """LLMProvider Protocol - Interface comum para todos os providers."""
 
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from ..models import ConversionContext, LLMResponse
 
+if TYPE_CHECKING:
+    from ..response_parser import StreamingJSONBuffer
+
 
 @runtime_checkable
 class LLMProvider(Protocol):
@@ -22,23 +25,54 @@ class LLMProvider(Protocol):
         """Modelo em uso."""
         ...
 
-    async def convert(self, context: ConversionContext) -> LLMResponse:
+    async def convert(
+        self,
+        context: ConversionContext,
+        buffer: "StreamingJSONBuffer | None" = None,
+    ) -> LLMResponse:
         """Executa conversão usando o LLM.
 
         Args:
             context: Contexto da conversão com controles, procedures, etc.
+            buffer: Buffer alimentado com o texto em streaming (opcional)
+
+        Returns:
+            LLMResponse com conteúdo e métricas de uso
+        """
+        ...
+
+    async def complete(
+        self,
+        system: str,
+        user_message: str,
+        max_tokens: int = 8192,
+    ) -> LLMResponse:
+        """Gera uma resposta livre (prompt de sistema + mensagem).
+
+        Args:
+            system: Prompt de sistema
+            user_message: Mensagem do usuário
+            max_tokens: Máximo de tokens de saída
 
         Returns:
             LLMResponse com conteúdo e métricas de uso
         """
         ...
 
-    def estimate_cost(self, tokens_in: int, tokens_out: int) -> float:
+    def estimate_cost(
+        self,
+        tokens_in: int,
+        tokens_out: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
+    ) -> float:
         """Estima custo em USD (0.0 para providers gratuitos).
 
         Args:
-            tokens_in: Número de tokens de entrada
+            tokens_in: Número de tokens de entrada (fora do cache)
             tokens_out: Número de tokens de saída
+            cache_creation_tokens: Tokens gravados no cache de prompt
+            cache_read_tokens: Tokens lidos do cache de prompt
 
         Returns:
             Custo estimado em USD
@@ -0,0 +1,218 @@
+"""LLMResponseCache - Cache em disco de respostas do LLM endereçado por conteúdo."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from .models import LLMResponse
+from .providers.prompts import PROCEDURE_SYSTEM_PROMPT, SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+# Incrementar quando o formato esperado da resposta mudar sem mudar os prompts
+PROMPT_VERSION = "1"
+
+# Após uma eviction, o cache fica com no máximo esta fração do limite
+EVICTION_TARGET_RATIO = 0.9
+
+
+def _prompt_fingerprint() -> str:
+    """Versão dos prompts: muda sempre que um system prompt é editado."""
+    digest = hashlib.blake2b(digest_size=8)
+    for part in (PROMPT_VERSION, SYSTEM_PROMPT, PROCEDURE_SYSTEM_PROMPT):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+PROMPT_FINGERPRINT = _prompt_fingerprint()
+
+
+class LLMResponseCache:
+    """Cache de respostas do LLM em disco, com eviction por tamanho.
+
+    A chave é o hash de (provider, modelo, versão dos prompts, contexto
+    serializado): reconverter um elemento cujo contexto não mudou devolve a
+    resposta anterior sem chamar o LLM. Cada resposta fica em um arquivo
+    JSON; quando o total passa de `max_bytes`, os arquivos usados há mais
+    tempo (mtime, atualizado em cada hit) são removidos.
+    """
+
+    def __init__(self, directory: Path | str, max_bytes: int):
+        """Inicializa o cache.
+
+        Args:
+            directory: Diretório dos arquivos de cache
+            max_bytes: Tamanho máximo total em bytes
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: int | None = None
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        context: BaseModel,
+        prompt_version: str = PROMPT_FINGERPRINT,
+    ) -> str:
+        """Calcula a chave de cache de uma conversão.
+
+        Args:
+            provider: Nome do provider
+            model: Modelo usado
+            context: Contexto da conversão (ConversionContext/ProcedureContext)
+            prompt_version: Versão dos prompts
+
+        Returns:
+            Hash hexadecimal da entrada
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "prompt_version": prompt_version,
+                "kind": type(context).__name__,
+                "context": context.model_dump(mode="json"),
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Busca uma resposta no cache.
+
+        Args:
+            key: Chave calculada por make_key
+
+        Returns:
+            LLMResponse armazenada ou None
+        """
+        path = self._path(key)
+        try:
+            response = LLMResponse.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Entrada de cache inválida descartada ({path.name}): {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            os.utime(path)  # marca como usada recentemente
+        except OSError:
+            pass
+        return response
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Armazena uma resposta e aplica o limite de tamanho.
+
+        Args:
+            key: Chave calculada por make_key
+            response: Resposta do LLM
+        """
+        path = self._path(key)
+        data = response.model_dump_json().encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        previous = path.stat().st_size if path.exists() else 0
+        size = self.size()
+        # Escrita atômica: um processo interrompido não deixa JSON truncado
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self._size = size - previous + len(data)
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def size(self) -> int:
+        """Tamanho total do cache em bytes."""
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        return self._size
+
+    def _entries(self) -> list[tuple[float, Path, int]]:
+        entries = []
+        if not self.directory.is_dir():
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, Path(entry.path), stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove as entradas usadas há mais tempo até caber no limite."""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        for _, path, size in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+        self._size = total
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        for _, path, _ in self._entries():
+            self._remove(path)
+        self._size = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Estatísticas do cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size_bytes": self.size(),
+            "max_bytes": self.max_bytes,
+            "directory": str(self.directory),
+        }
+
+
+_default_cache: LLMResponseCache | None = None
+
+
+def get_response_cache() -> LLMResponseCache:
+    """Retorna o cache de respostas compartilhado (configurado pelas settings)."""
+    global _default_cache
+    if _default_cache is None:
+        from wxcode.config import get_settings
+
+        settings = get_settings()
+        _default_cache = LLMResponseCache(
+            settings.llm_cache_dir, settings.llm_cache_max_mb * 1024 * 1024
+        )
+    return _default_cache
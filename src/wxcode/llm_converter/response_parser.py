@@ -14,15 +14,127 @@ from .models import (
     TemplateDefinition,
 )
 
+# Caracteres relevantes para localizar o objeto JSON (resto é pulado)
+_JSON_STRUCTURE = re.compile(r'[{}"\\]')
+
+
+class StreamingJSONBuffer:
+    """Acumula a resposta em streaming e localiza o objeto JSON conforme chega.
+
+    Cada trecho é varrido uma única vez acompanhando strings, escapes e a
+    profundidade de chaves; ao fim do streaming o parser já sabe onde o
+    objeto JSON começa e termina, sem as buscas por regex na resposta toda.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Descarta o conteúdo (ex: antes de uma nova tentativa)."""
+        self._parts: list[str] = []
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start: int | None = None
+        self._end: int | None = None
+
+    def feed(self, chunk: str) -> bool:
+        """Adiciona um trecho da resposta.
+
+        Returns:
+            True quando o objeto JSON de nível superior já foi fechado
+        """
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        if self._end is not None:
+            return True
+
+        skip = 0
+        if self._escape:
+            # Barra invertida no fim do trecho anterior escapa este caractere
+            self._escape = False
+            skip = 1
+
+        for match in _JSON_STRUCTURE.finditer(chunk, skip):
+            pos = match.start()
+            if pos < skip:
+                continue
+            char = match.group()
+
+            if self._start is None:
+                if char == "{":
+                    self._start = offset + pos
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if char == "\\":
+                    skip = pos + 2
+                    if skip > len(chunk):
+                        self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = offset + pos + 1
+                    return True
+        return False
+
+    @property
+    def text(self) -> str:
+        """Resposta acumulada."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    @property
+    def complete(self) -> bool:
+        """Se o objeto JSON de nível superior foi fechado."""
+        return self._end is not None
+
+    @property
+    def json_text(self) -> str | None:
+        """Texto do objeto JSON (None se ainda incompleto)."""
+        if self._end is None:
+            return None
+        return self.text[self._start:self._end]
+
+    def loads(self) -> dict[str, Any] | None:
+        """Parseia o objeto JSON localizado (None se incompleto ou inválido)."""
+        json_text = self.json_text
+        if json_text is None:
+            return None
+        try:
+            data = json.loads(json_text)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def matches(self, raw_response: str) -> bool:
+        """Se o buffer corresponde a esta resposta e tem o JSON completo."""
+        return self.complete and self.text == raw_response
+
 
 class ResponseParser:
     """Parseia e valida resposta JSON do LLM."""
 
-    def parse(self, raw_response: str) -> ConversionResult:
+    def parse(
+        self,
+        raw_response: str,
+        buffer: StreamingJSONBuffer | None = None,
+    ) -> ConversionResult:
         """Parseia resposta e valida estrutura.
 
         Args:
             raw_response: Resposta bruta do LLM
+            buffer: Buffer que recebeu o streaming desta resposta (opcional)
 
         Returns:
             ConversionResult validado
@@ -30,8 +142,12 @@ class ResponseParser:
         Raises:
             InvalidOutputError: Se a resposta não for válida
         """
-        # Extrair JSON
-        data = self._extract_json(raw_response)
+        # Extrair JSON (já localizado durante o streaming, se disponível)
+        data = None
+        if buffer is not None and buffer.matches(raw_response):
+            data = buffer.loads()
+        if data is None:
+            data = self._extract_json(raw_response)
 
         # Validar campos obrigatórios
         self._validate_required_fields(data)
@@ -9,16 +9,22 @@ from .models import (
     InvalidOutputError,
     ServiceConversionResult,
 )
+from .response_parser import StreamingJSONBuffer
 
 
 class ServiceResponseParser:
     """Parseia e valida resposta JSON do LLM para services Python."""
 
-    def parse(self, raw_response: str) -> ServiceConversionResult:
+    def parse(
+        self,
+        raw_response: str,
+        buffer: StreamingJSONBuffer | None = None,
+    ) -> ServiceConversionResult:
         """Parseia resposta e valida estrutura.
 
         Args:
             raw_response: Resposta bruta do LLM
+            buffer: Buffer que recebeu o streaming desta resposta (opcional)
 
         Returns:
             ServiceConversionResult validado
@@ -26,8 +32,12 @@ class ServiceResponseParser:
         Raises:
             InvalidOutputError: Se a resposta não for válida
         """
-        # Extrair JSON
-        data = self._extract_json(raw_response)
+        # Extrair JSON (já localizado durante o streaming, se disponível)
+        data = None
+        if buffer is not None and buffer.matches(raw_response):
+            data = buffer.loads()
+        if data is None:
+            data = self._extract_json(raw_response)
 
         # Validar campos obrigatórios
         self._validate_required_fields(data)
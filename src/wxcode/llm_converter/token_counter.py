@@ -0,0 +1,177 @@
+"""TokenCounter - Contagem de tokens com tiktoken e cache por hash de conteúdo."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Encoding usado para contagem. Não é o tokenizer exato do Claude, mas fica
+# muito mais próximo que chars/4 para código WLanguage e identificadores PT-BR.
+TOKEN_ENCODING = "cl100k_base"
+
+# Máximo de textos distintos mantidos no cache
+TOKEN_CACHE_SIZE = 16384
+
+# Textos menores que isso não passam pelo cache (hash custaria mais que contar)
+MIN_CACHED_LENGTH = 64
+
+
+class Encoder(Protocol):
+    """Interface mínima de um encoding tiktoken."""
+
+    def encode_ordinary(self, text: str) -> list[int]: ...
+
+
+def _load_encoding(name: str) -> Encoder | None:
+    """Carrega o encoding tiktoken ou None se indisponível (ex: sem rede)."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning(
+            f"tiktoken encoding '{name}' indisponível ({e}); "
+            "usando estimativa de ~4 caracteres por token"
+        )
+        return None
+
+
+class TokenCounter:
+    """Conta tokens de textos, memorizando o resultado pelo hash do conteúdo.
+
+    O mesmo código de procedure aparece no contexto de várias páginas;
+    com o cache ele é tokenizado uma única vez por processo.
+    """
+
+    def __init__(
+        self,
+        encoder: Encoder | None = None,
+        encoding_name: str = TOKEN_ENCODING,
+        cache_size: int = TOKEN_CACHE_SIZE,
+    ):
+        """Inicializa o contador.
+
+        Args:
+            encoder: Encoding já carregado (opcional; carrega encoding_name sob demanda)
+            encoding_name: Nome do encoding tiktoken
+            cache_size: Máximo de entradas no cache
+        """
+        self.encoding_name = encoding_name
+        self.cache_size = cache_size
+        self._encoder = encoder
+        self._encoder_loaded = encoder is not None
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def encoder(self) -> Encoder | None:
+        """Encoding tiktoken (None quando indisponível)."""
+        if not self._encoder_loaded:
+            self._encoder = _load_encoding(self.encoding_name)
+            self._encoder_loaded = True
+        return self._encoder
+
+    def count(self, text: str | None) -> int:
+        """Conta tokens do texto.
+
+        Args:
+            text: Texto a contar
+
+        Returns:
+            Número de tokens
+        """
+        if not text:
+            return 0
+        if len(text) < MIN_CACHED_LENGTH:
+            return self._count_uncached(text)
+
+        key = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return cached
+
+        self.misses += 1
+        tokens = self._count_uncached(text)
+        self._cache[key] = tokens
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def count_exact(self, text: str | None) -> int | None:
+        """Conta tokens só com o encoding real.
+
+        Returns:
+            Número de tokens, ou None se apenas a estimativa chars/4 estiver
+            disponível (valor que não deve ser gravado como contagem real)
+        """
+        if self.encoder is None:
+            return None
+        return self.count(text)
+
+    def _count_uncached(self, text: str) -> int:
+        encoder = self.encoder
+        if encoder is None:
+            return len(text) // 4
+        return len(encoder.encode_ordinary(text))
+
+    def cache_info(self) -> dict[str, Any]:
+        """Estatísticas do cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+            "encoding": self.encoding_name if self.encoder else None,
+        }
+
+    def clear(self) -> None:
+        """Limpa o cache e os contadores."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_default_counter: TokenCounter | None = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Retorna o TokenCounter compartilhado do processo."""
+    global _default_counter
+    if _default_counter is None:
+        _default_counter = TokenCounter()
+    return _default_counter
+
+
+def count_tokens(text: str | None) -> int:
+    """Conta tokens usando o TokenCounter compartilhado."""
+    return get_token_counter().count(text)
+
+
+def stored_token_count(text: str | None) -> int | None:
+    """Contagem a gravar em Procedure.token_count (None sem tiktoken)."""
+    return get_token_counter().count_exact(text)
+
+
+def procedure_tokens(proc: dict) -> int:
+    """Tokens do código de uma procedure.
+
+    Usa o token_count gravado no parse quando disponível; senão conta
+    (com cache).
+
+    Args:
+        proc: Dict da procedure (precisa de "code"; "token_count" opcional)
+
+    Returns:
+        Número de tokens do código
+    """
+    stored = proc.get("token_count")
+    if stored is not None:
+        return stored
+    return count_tokens(proc.get("code"))
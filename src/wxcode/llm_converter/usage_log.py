@@ -0,0 +1,72 @@
+"""Registro do consumo de tokens das conversões LLM em TokenUsageLog."""
+
+import logging
+from typing import Any
+
+from beanie import PydanticObjectId
+
+from .models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+def element_project_id(element: dict[str, Any]) -> str | None:
+    """ID do projeto de um elemento lido direto do MongoDB.
+
+    O campo project_id é um Link do Beanie e pode estar gravado como
+    DBRef ou como ObjectId.
+    """
+    ref = element.get("project_id")
+    if ref is None:
+        return None
+    return str(getattr(ref, "id", ref))
+
+
+async def record_llm_usage(
+    response: LLMResponse,
+    project_id: str | None,
+    session_id: str,
+    model: str,
+    cost_usd: float,
+    change_id: str | None = None,
+    tenant_id: str = "default",
+) -> bool:
+    """Grava o consumo de uma chamada ao LLM, incluindo tokens de cache.
+
+    Falhas não interrompem a conversão (ex: Beanie não inicializado em
+    scripts que usam apenas o Motor).
+
+    Args:
+        response: Resposta do LLM com as métricas de uso
+        project_id: ID do projeto (sem projeto, nada é gravado)
+        session_id: Sessão de conversão (ex: uma execução da CLI)
+        model: Modelo utilizado
+        cost_usd: Custo estimado da chamada
+        change_id: Elemento convertido
+        tenant_id: ID do tenant
+
+    Returns:
+        True se o log foi gravado
+    """
+    if not project_id:
+        return False
+
+    from wxcode.models.token_usage import TokenUsageLog
+
+    try:
+        await TokenUsageLog(
+            tenant_id=tenant_id,
+            project_id=PydanticObjectId(project_id),
+            session_id=session_id,
+            change_id=change_id,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cache_creation_tokens=response.cache_creation_tokens,
+            cache_read_tokens=response.cache_read_tokens,
+            total_cost_usd=cost_usd,
+            model=model,
+        ).insert()
+    except Exception as e:
+        logger.debug(f"Consumo de tokens não registrado: {e}")
+        return False
+    return True
@@ -19,6 +19,7 @@ from fastapi.templating import Jinja2Templates
 from wxcode import __version__
 from wxcode.config import get_settings, PROJECT_ROOT
 from wxcode.database import init_db, close_db
+from wxcode.llm_converter.providers.pool import close_http_client
 from wxcode.services import seed_stacks
 from wxcode.api import (
     projects,
@@ -52,6 +53,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    await close_http_client()
     await close_db(client)
 
 
@@ -8,6 +8,7 @@ otherwise we get the __main__ vs module identity issue when running
 python -m wxcode.mcp.server.
 """
 
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
@@ -42,17 +43,18 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
     Initialize database connections at startup.
 
     MongoDB is required - failure will prevent server startup.
-    Neo4j is optional - failure will be logged and server continues.
+    Neo4j is optional and connected lazily by get_neo4j_connection() on the
+    first graph tool call, so the driver import and connection timeout are
+    not paid by every stdio spawn.
 
     Yields:
         Context dict with:
         - mongo_client: Motor AsyncIOMotorClient
-        - neo4j_conn: Neo4jConnection or None
-        - neo4j_available: bool indicating Neo4j status
+        - neo4j_conn: Neo4jConnection or None (until first use)
+        - neo4j_available: bool, or None if no connection was attempted yet
     """
     # Import here to avoid circular imports
     from wxcode.database import init_db, close_db
-    from wxcode.graph.neo4j_connection import Neo4jConnection, Neo4jConnectionError
 
     logger.info("Starting wxcode MCP Server...")
 
@@ -60,35 +62,61 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
     mongo_client = await init_db()
     logger.info("MongoDB connected and Beanie initialized")
 
-    # Neo4j (optional)
-    neo4j_conn = None
-    neo4j_available = False
-
-    try:
-        neo4j_conn = Neo4jConnection()
-        await neo4j_conn.connect()
-        neo4j_available = True
-        logger.info("Neo4j connected")
-    except Neo4jConnectionError as e:
-        logger.warning(f"Neo4j unavailable: {e}, using MongoDB only")
-    except Exception as e:
-        logger.warning(f"Neo4j connection failed: {e}, using MongoDB only")
-
+    lifespan_ctx: dict[str, Any] = {
+        "mongo_client": mongo_client,
+        "neo4j_conn": None,
+        "neo4j_available": None,
+        "neo4j_lock": asyncio.Lock(),
+    }
     try:
-        yield {
-            "mongo_client": mongo_client,
-            "neo4j_conn": neo4j_conn,
-            "neo4j_available": neo4j_available,
-        }
+        yield lifespan_ctx
     finally:
         logger.info("Shutting down wxcode MCP Server...")
         await close_db(mongo_client)
-        if neo4j_conn:
-            await neo4j_conn.close()
+        if lifespan_ctx["neo4j_conn"]:
+            await lifespan_ctx["neo4j_conn"].close()
         logger.info("Shutdown complete")
 
 
+async def get_neo4j_connection(lifespan_ctx: dict[str, Any]) -> Any | None:
+    """
+    Return the shared Neo4j connection, connecting on first use.
+
+    A failed attempt is remembered, so later calls return None immediately.
+
+    Args:
+        lifespan_ctx: Context dict yielded by app_lifespan
+
+    Returns:
+        Neo4jConnection, or None if Neo4j is unavailable
+    """
+    if lifespan_ctx.get("neo4j_available") is not None:
+        return lifespan_ctx.get("neo4j_conn")
+
+    async with lifespan_ctx.setdefault("neo4j_lock", asyncio.Lock()):
+        if lifespan_ctx.get("neo4j_available") is not None:
+            return lifespan_ctx.get("neo4j_conn")
+
+        from wxcode.graph.neo4j_connection import Neo4jConnection, Neo4jConnectionError
+
+        conn = Neo4jConnection()
+        try:
+            await conn.connect()
+        except Neo4jConnectionError as e:
+            logger.warning(f"Neo4j unavailable: {e}, using MongoDB only")
+            conn = None
+        except Exception as e:
+            logger.warning(f"Neo4j connection failed: {e}, using MongoDB only")
+            conn = None
+        else:
+            logger.info("Neo4j connected")
+
+        lifespan_ctx["neo4j_conn"] = conn
+        lifespan_ctx["neo4j_available"] = conn is not None
+        return conn
+
+
 # Create the single mcp instance - this is imported by all tool modules
 mcp = FastMCP("wxcode-kb", lifespan=app_lifespan)
 
-__all__ = ["mcp", "app_lifespan"]
+__all__ = ["mcp", "app_lifespan", "get_neo4j_connection"]
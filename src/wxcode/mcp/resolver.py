@@ -0,0 +1,236 @@
+"""Shared element resolver for MCP tools.
+
+Resolves an element name (optionally scoped to a project name) to its
+document. An in-memory index of (project, source_name) -> ObjectId is warmed
+on first use, so a lookup costs a single primary-key fetch that can be
+projected to the fields a tool actually needs.
+
+The index is kept consistent in two ways:
+- explicitly, via invalidate_element_index() after import/purge in this
+  process;
+- implicitly, by comparing each project's fingerprint (updated_at,
+  total_elements, status), refreshed every PROJECTS_TTL_SECONDS, which
+  catches imports done by other processes (API, CLI).
+Index misses and stale ids fall back to a direct query.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar, Union
+
+from beanie import PydanticObjectId
+from bson import ObjectId
+from pydantic import BaseModel, Field
+
+from wxcode.models.element import Element, ElementType
+from wxcode.models.project import Project
+
+__all__ = [
+    "ElementRef",
+    "ElementResolver",
+    "element_resolver",
+    "invalidate_element_index",
+    "resolve_element",
+]
+
+PROJECTS_TTL_SECONDS = 30.0
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ElementRef(BaseModel):
+    """Minimal element projection for tools that only need identity."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    source_name: str
+    source_type: ElementType
+
+
+@dataclass
+class _ProjectEntry:
+    id: ObjectId
+    fingerprint: tuple
+
+
+@dataclass
+class _ProjectIndex:
+    fingerprint: tuple
+    elements: dict[str, ObjectId] = field(default_factory=dict)
+
+
+def _fingerprint(doc: dict[str, Any]) -> tuple:
+    return (doc.get("updated_at"), doc.get("total_elements"), doc.get("status"))
+
+
+class ElementResolver:
+    """Name -> element resolution backed by a per-project index."""
+
+    def __init__(self, projects_ttl: float = PROJECTS_TTL_SECONDS):
+        """Initialize the resolver.
+
+        Args:
+            projects_ttl: Seconds before the project list is re-read
+        """
+        self.projects_ttl = projects_ttl
+        self._projects: dict[str, _ProjectEntry] = {}
+        self._projects_expires_at = 0.0
+        self._indexes: dict[ObjectId, _ProjectIndex] = {}
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, project_id: Optional[Union[str, ObjectId]] = None) -> None:
+        """Drop cached indexes.
+
+        Args:
+            project_id: Project to invalidate (None invalidates everything)
+        """
+        self._projects_expires_at = 0.0
+        if project_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(ObjectId(str(project_id)), None)
+
+    async def _get_projects(self, force: bool = False) -> dict[str, _ProjectEntry]:
+        if force or time.monotonic() >= self._projects_expires_at:
+            docs = await Project.get_pymongo_collection().find(
+                {}, {"name": 1, "updated_at": 1, "total_elements": 1, "status": 1}
+            ).to_list(None)
+            self._projects = {
+                doc["name"]: _ProjectEntry(doc["_id"], _fingerprint(doc)) for doc in docs
+            }
+            self._projects_expires_at = time.monotonic() + self.projects_ttl
+        return self._projects
+
+    async def _get_index(self, entry: _ProjectEntry) -> _ProjectIndex:
+        index = self._indexes.get(entry.id)
+        if index is not None and index.fingerprint == entry.fingerprint:
+            return index
+
+        index = _ProjectIndex(entry.fingerprint)
+        cursor = Element.get_pymongo_collection().find(
+            {"project_id.$id": entry.id}, {"source_name": 1}
+        )
+        async for doc in cursor:
+            index.elements.setdefault(doc["source_name"], doc["_id"])
+        self._indexes[entry.id] = index
+        return index
+
+    async def _fetch(self, element_id: ObjectId, projection: Optional[type[T]]):
+        if projection is None:
+            return await Element.get(element_id)
+        return await Element.find_one({"_id": element_id}, projection_model=projection)
+
+    async def _find_direct(
+        self, query: dict[str, Any], limit: int = 2
+    ) -> list[dict[str, Any]]:
+        return await Element.get_pymongo_collection().find(
+            query, {"_id": 1, "project_id": 1}
+        ).to_list(limit)
+
+    async def resolve(
+        self,
+        element_name: str,
+        project_name: Optional[str] = None,
+        projection: Optional[type[T]] = None,
+    ) -> tuple[Any, Optional[str]]:
+        """Find an element by name, optionally scoped to a project.
+
+        Args:
+            element_name: Element source_name
+            project_name: Optional project name to scope the search
+            projection: Optional projection model (e.g. ElementRef);
+                the full Element is returned when omitted
+
+        Returns:
+            Tuple of (element, error_message) - element is None if not found
+        """
+        if project_name:
+            return await self._resolve_in_project(element_name, project_name, projection)
+        return await self._resolve_anywhere(element_name, projection)
+
+    async def _resolve_in_project(
+        self,
+        element_name: str,
+        project_name: str,
+        projection: Optional[type[T]],
+    ) -> tuple[Any, Optional[str]]:
+        async with self._lock:
+            projects = await self._get_projects()
+            if project_name not in projects:
+                projects = await self._get_projects(force=True)
+            entry = projects.get(project_name)
+            if entry is None:
+                return None, f"Project '{project_name}' not found"
+            index = await self._get_index(entry)
+
+        element_id = index.elements.get(element_name)
+        element = await self._fetch(element_id, projection) if element_id else None
+        if element is None:
+            # Index miss or stale id: the element may have been imported
+            # or removed after the index was built
+            docs = await self._find_direct(
+                {"source_name": element_name, "project_id.$id": entry.id},
+                limit=1,
+            )
+            if not docs:
+                index.elements.pop(element_name, None)
+                return None, f"Element '{element_name}' not found in project '{project_name}'"
+            index.elements[element_name] = docs[0]["_id"]
+            element = await self._fetch(docs[0]["_id"], projection)
+        return element, None
+
+    async def _resolve_anywhere(
+        self,
+        element_name: str,
+        projection: Optional[type[T]],
+    ) -> tuple[Any, Optional[str]]:
+        async with self._lock:
+            projects = await self._get_projects()
+            matches: list[tuple[str, ObjectId]] = []
+            for name, entry in projects.items():
+                index = await self._get_index(entry)
+                element_id = index.elements.get(element_name)
+                if element_id is not None:
+                    matches.append((name, element_id))
+
+        if len(matches) > 1:
+            return None, (
+                f"Element '{element_name}' found in multiple projects: "
+                f"{', '.join(sorted(name for name, _ in matches))}. "
+                "Use project_name to specify."
+            )
+
+        element = await self._fetch(matches[0][1], projection) if matches else None
+        if element is None:
+            docs = await self._find_direct({"source_name": element_name})
+            if not docs:
+                return None, f"Element '{element_name}' not found"
+            if len(docs) > 1:
+                # Index was stale: rebuild on next lookup
+                self.invalidate()
+                return None, (
+                    f"Element '{element_name}' found in multiple projects. "
+                    "Use project_name to specify."
+                )
+            element = await self._fetch(docs[0]["_id"], projection)
+            if element is None:
+                return None, f"Element '{element_name}' not found"
+        return element, None
+
+
+# Shared instance used by all MCP tools
+element_resolver = ElementResolver()
+
+
+async def resolve_element(
+    element_name: str,
+    project_name: Optional[str] = None,
+    projection: Optional[type[T]] = None,
+) -> tuple[Any, Optional[str]]:
+    """Resolve an element with the shared resolver (see ElementResolver.resolve)."""
+    return await element_resolver.resolve(element_name, project_name, projection)
+
+
+def invalidate_element_index(project_id: Optional[Union[str, ObjectId]] = None) -> None:
+    """Invalidate the shared resolver index after import/purge."""
+    element_resolver.invalidate(project_id)
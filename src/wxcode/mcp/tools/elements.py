@@ -7,83 +7,13 @@ classes, queries) from the wxcode knowledge base.
 import re
 from typing import Any
 
-from bson import DBRef
 from fastmcp import Context
 
-from wxcode.config import get_settings
 from wxcode.mcp.instance import mcp
+from wxcode.mcp.resolver import resolve_element
 from wxcode.models import Element, Project
 
 
-async def _find_element(
-    ctx: Context,
-    element_name: str,
-    project_name: str | None,
-) -> tuple[Element | None, str | None]:
-    """
-    Find element by name, optionally scoped to project.
-
-    Uses DBRef pattern for project-scoped queries (workaround for Beanie Link fields).
-
-    Args:
-        ctx: FastMCP context with lifespan context
-        element_name: Name of the element to find
-        project_name: Optional project name to scope the search
-
-    Returns:
-        Tuple of (element, error_message) - element is None if not found
-    """
-    if project_name:
-        project = await Project.find_one(Project.name == project_name)
-        if not project:
-            return None, f"Project '{project_name}' not found"
-
-        # DBRef query via raw Motor - workaround for Beanie Link fields
-        settings = get_settings()
-        mongo_client = ctx.request_context.lifespan_context["mongo_client"]
-        db = mongo_client[settings.mongodb_database]
-        collection = db["elements"]
-
-        project_dbref = DBRef("projects", project.id)
-        elem_dict = await collection.find_one({
-            "source_name": element_name,
-            "project_id": project_dbref,
-        })
-
-        if not elem_dict:
-            return None, f"Element '{element_name}' not found in project '{project_name}'"
-
-        element = await Element.get(elem_dict["_id"])
-        return element, None
-    else:
-        # Search across all projects
-        elements = await Element.find(Element.source_name == element_name).to_list()
-
-        if not elements:
-            return None, f"Element '{element_name}' not found"
-
-        if len(elements) > 1:
-            # Ambiguous - need to look up project names
-            settings = get_settings()
-            mongo_client = ctx.request_context.lifespan_context["mongo_client"]
-            db = mongo_client[settings.mongodb_database]
-            projects_coll = db["projects"]
-
-            project_names = []
-            for elem in elements:
-                if hasattr(elem, "project_id") and elem.project_id:
-                    proj_dict = await projects_coll.find_one({"_id": elem.project_id.ref.id})
-                    if proj_dict:
-                        project_names.append(proj_dict["name"])
-
-            return None, (
-                f"Element '{element_name}' found in multiple projects: "
-                f"{', '.join(project_names)}. Use project_name to specify."
-            )
-
-        return elements[0], None
-
-
 def _serialize_element(element: Element, include_raw: bool = True) -> dict[str, Any]:
     """
     Serialize Element to JSON-safe dict.
@@ -170,7 +100,7 @@ async def get_element(
         Complete element definition including AST and dependencies
     """
     try:
-        element, error = await _find_element(ctx, element_name, project_name)
+        element, error = await resolve_element(element_name, project_name)
 
         if error:
             return {
@@ -4,17 +4,22 @@ Provides tools for dependency analysis, impact assessment, and graph traversal.
 All tools require Neo4j to be running and synced with MongoDB.
 """
 
+from typing import TYPE_CHECKING
+
 from fastmcp import Context
 
-from wxcode.mcp.instance import mcp
-from wxcode.graph.impact_analyzer import ImpactAnalyzer
-from wxcode.graph.neo4j_connection import Neo4jConnection
+from wxcode.mcp.instance import get_neo4j_connection, mcp
+
+if TYPE_CHECKING:
+    from wxcode.graph.neo4j_connection import Neo4jConnection
 
 
-def _check_neo4j(ctx: Context) -> tuple[Neo4jConnection | None, dict | None]:
+async def _check_neo4j(ctx: Context) -> tuple["Neo4jConnection | None", dict | None]:
     """
     Check Neo4j availability and return connection or error dict.
 
+    The neo4j driver is imported and connected on the first graph tool call.
+
     Args:
         ctx: FastMCP context with lifespan context
 
@@ -22,8 +27,8 @@ def _check_neo4j(ctx: Context) -> tuple[Neo4jConnection | None, dict | None]:
         (connection, None) if available
         (None, error_dict) if unavailable
     """
-    neo4j_available = ctx.request_context.lifespan_context.get("neo4j_available", False)
-    if not neo4j_available:
+    conn = await get_neo4j_connection(ctx.request_context.lifespan_context)
+    if conn is None:
         return None, {
             "error": True,
             "code": "NEO4J_UNAVAILABLE",
@@ -33,7 +38,7 @@ def _check_neo4j(ctx: Context) -> tuple[Neo4jConnection | None, dict | None]:
                 "-e NEO4J_AUTH=neo4j/password neo4j:5"
             ),
         }
-    return ctx.request_context.lifespan_context["neo4j_conn"], None
+    return conn, None
 
 
 @mcp.tool
@@ -58,7 +63,7 @@ async def get_dependencies(
         Direct dependencies with relationship types
     """
     try:
-        conn, error = _check_neo4j(ctx)
+        conn, error = await _check_neo4j(ctx)
         if error:
             return error
 
@@ -134,10 +139,12 @@ async def get_impact(
         Affected elements grouped by depth and type
     """
     try:
-        conn, error = _check_neo4j(ctx)
+        conn, error = await _check_neo4j(ctx)
         if error:
             return error
 
+        from wxcode.graph.impact_analyzer import ImpactAnalyzer
+
         analyzer = ImpactAnalyzer(conn)
         result = await analyzer.get_impact(
             node_id=element_name,
@@ -205,10 +212,12 @@ async def get_path(
         Paths connecting the elements, sorted by length
     """
     try:
-        conn, error = _check_neo4j(ctx)
+        conn, error = await _check_neo4j(ctx)
         if error:
             return error
 
+        from wxcode.graph.impact_analyzer import ImpactAnalyzer
+
         analyzer = ImpactAnalyzer(conn)
         result = await analyzer.get_path(
             source=source,
@@ -268,10 +277,12 @@ async def find_hubs(
         Hub nodes sorted by total connections (highest first)
     """
     try:
-        conn, error = _check_neo4j(ctx)
+        conn, error = await _check_neo4j(ctx)
         if error:
             return error
 
+        from wxcode.graph.impact_analyzer import ImpactAnalyzer
+
         analyzer = ImpactAnalyzer(conn)
         result = await analyzer.find_hubs(
             min_connections=min_connections,
@@ -335,10 +346,12 @@ async def find_dead_code(
         Potentially unused procedures and classes
     """
     try:
-        conn, error = _check_neo4j(ctx)
+        conn, error = await _check_neo4j(ctx)
         if error:
             return error
 
+        from wxcode.graph.impact_analyzer import ImpactAnalyzer
+
         analyzer = ImpactAnalyzer(conn)
         result = await analyzer.find_dead_code(
             project=project_name,
@@ -403,10 +416,12 @@ async def find_cycles(
         Cycles found in the dependency graph
     """
     try:
-        conn, error = _check_neo4j(ctx)
+        conn, error = await _check_neo4j(ctx)
         if error:
             return error
 
+        from wxcode.graph.impact_analyzer import ImpactAnalyzer
+
         analyzer = ImpactAnalyzer(conn)
         cycles = await analyzer.find_cycles(
             node_type=node_type,
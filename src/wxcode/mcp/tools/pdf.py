@@ -2,63 +2,58 @@
 
 Provides tools to locate and access PDF documentation and screenshots
 for WinDev elements during conversion.
+
+Enrichment stores each element's PDF path (from the split manifest) and a
+text sidecar next to the PDF, so lookups are a single projected fetch.
+Elements enriched before that fall back to probing common locations.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-from bson import DBRef
+from beanie import PydanticObjectId
 from fastmcp import Context
+from pydantic import BaseModel, Field
 
-from wxcode.config import get_settings
 from wxcode.mcp.instance import mcp
-from wxcode.models.element import Element
+from wxcode.mcp.resolver import resolve_element
+from wxcode.models.element import Element, ElementType
 from wxcode.models.output_project import OutputProject
-from wxcode.models.project import Project
 
+# Default cap for PDF text returned by get_element_pdf_slice
+MAX_TEXT_CHARS = 20000
 
-async def _find_element(
-    ctx: Context, element_name: str, project_name: str | None
-) -> tuple[Element | None, str | None]:
-    """
-    Find element by name, optionally scoped to project.
 
-    Returns:
-        (element, error_message) - element is None if not found
-    """
-    if project_name:
-        project = await Project.find_one(Project.name == project_name)
-        if not project:
-            return None, f"Project '{project_name}' not found"
-
-        settings = get_settings()
-        mongo_client = ctx.request_context.lifespan_context["mongo_client"]
-        db = mongo_client[settings.mongodb_database]
-        collection = db["elements"]
-
-        project_dbref = DBRef("projects", project.id)
-        elem_dict = await collection.find_one(
-            {"source_name": element_name, "project_id": project_dbref}
-        )
-
-        if not elem_dict:
-            return None, f"Element '{element_name}' not found in project '{project_name}'"
-
-        element = await Element.get(elem_dict["_id"])
-        return element, None
-    else:
-        elements = await Element.find(Element.source_name == element_name).to_list()
-
-        if not elements:
-            return None, f"Element '{element_name}' not found"
-
-        if len(elements) > 1:
-            return (
-                None,
-                f"Element '{element_name}' found in multiple projects. Use project_name to specify.",
-            )
+class _PdfRef(BaseModel):
+    """Element projection with the stored documentation locations."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    source_name: str
+    source_type: ElementType
+    screenshot_path: Optional[str] = None
+    pdf_path: Optional[str] = None
+    pdf_text_path: Optional[str] = None
 
-        return elements[0], None
+
+def _existing(path: str | None) -> Path | None:
+    """Return the path if it is set and exists."""
+    if path:
+        candidate = Path(path)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _read_pdf_text(ref: _PdfRef, pdf_path: Path) -> str:
+    """PDF text from the stored sidecar, extracting (and caching) it if missing or stale."""
+    sidecar = _existing(ref.pdf_text_path)
+    if sidecar is not None and sidecar.stat().st_mtime >= pdf_path.stat().st_mtime:
+        return sidecar.read_text(encoding="utf-8")
+
+    # wxcode.parser pulls PyMuPDF; import only when the sidecar is missing
+    from wxcode.parser.pdf_element_parser import load_pdf_text
+
+    return load_pdf_text(pdf_path)
 
 
 def _find_pdf_file(workspace_path: str | None, element_name: str) -> Path | None:
@@ -146,6 +141,8 @@ async def get_element_pdf_slice(
     element_name: str,
     output_project_id: str | None = None,
     project_name: str | None = None,
+    include_text: bool = False,
+    max_text_chars: int = MAX_TEXT_CHARS,
 ) -> dict[str, Any]:
     """
     Get path to PDF documentation and screenshot for a WinDev element.
@@ -160,13 +157,15 @@ async def get_element_pdf_slice(
         element_name: Name of the element (e.g., PAGE_Login)
         output_project_id: Optional Output Project ID to determine workspace path
         project_name: Optional project name to scope the element search
+        include_text: Include the PDF text (served from the cached sidecar)
+        max_text_chars: Maximum characters of text returned (default 20000)
 
     Returns:
         Paths to PDF and screenshot files if they exist
     """
     try:
-        # Find the element
-        element, error = await _find_element(ctx, element_name, project_name)
+        # Find the element (only the stored documentation locations)
+        element, error = await resolve_element(element_name, project_name, _PdfRef)
 
         if error:
             return {
@@ -183,17 +182,24 @@ async def get_element_pdf_slice(
             if output_project and output_project.workspace_path:
                 workspace_path = output_project.workspace_path
 
-        # If no workspace from output project, try to get from project
-        if not workspace_path:
-            project = await element.project_id.fetch()
-            if project and hasattr(project, "workspace_path"):
-                workspace_path = project.workspace_path
-
-        # Look for PDF
-        pdf_path = _find_pdf_file(workspace_path, element_name)
-
-        # Look for screenshot
-        screenshot_path = _find_screenshot(workspace_path, element_name, element.screenshot_path)
+        # Locations recorded at enrich time
+        pdf_path = _existing(element.pdf_path)
+        screenshot_path = _existing(element.screenshot_path)
+
+        if pdf_path is None or screenshot_path is None:
+            # Not enriched with these locations (or the files moved): probe the workspace
+            if not workspace_path:
+                full_element = await Element.get(element.id)
+                project = await full_element.project_id.fetch() if full_element else None
+                if project and hasattr(project, "workspace_path"):
+                    workspace_path = project.workspace_path
+
+            if pdf_path is None:
+                pdf_path = _find_pdf_file(workspace_path, element_name)
+            if screenshot_path is None:
+                screenshot_path = _find_screenshot(
+                    workspace_path, element_name, element.screenshot_path
+                )
 
         # Build response
         response: dict[str, Any] = {
@@ -212,6 +218,10 @@ async def get_element_pdf_slice(
                 "path": str(pdf_path),
                 "size_bytes": pdf_path.stat().st_size,
             }
+            if include_text:
+                text = _read_pdf_text(element, pdf_path)
+                response["pdf"]["text"] = text[:max_text_chars]
+                response["pdf"]["text_truncated"] = len(text) > max_text_chars
         else:
             response["pdf"] = {
                 "exists": False,
@@ -5,61 +5,15 @@ files and local procedures from pages/windows. Essential for understanding
 business logic during conversion.
 """
 
-from bson import DBRef
 from fastmcp import Context
 
 from wxcode.config import get_settings
 from wxcode.mcp.instance import mcp
-from wxcode.models.element import Element
+from wxcode.mcp.resolver import ElementRef, resolve_element
 from wxcode.models.procedure import Procedure
 from wxcode.models.project import Project
 
 
-async def _find_element(
-    ctx: Context,
-    element_name: str,
-    project_name: str | None
-) -> tuple[Element | None, str | None]:
-    """
-    Find element by name, optionally scoped to project.
-
-    Returns:
-        (element, error_message) - element is None if not found
-    """
-    if project_name:
-        project = await Project.find_one(Project.name == project_name)
-        if not project:
-            return None, f"Project '{project_name}' not found"
-
-        # DBRef query via raw Motor
-        settings = get_settings()
-        mongo_client = ctx.request_context.lifespan_context["mongo_client"]
-        db = mongo_client[settings.mongodb_database]
-        collection = db["elements"]
-
-        project_dbref = DBRef("projects", project.id)
-        elem_dict = await collection.find_one({
-            "source_name": element_name,
-            "project_id": project_dbref
-        })
-
-        if not elem_dict:
-            return None, f"Element '{element_name}' not found in project '{project_name}'"
-
-        element = await Element.get(elem_dict["_id"])
-        return element, None
-    else:
-        elements = await Element.find(Element.source_name == element_name).to_list()
-
-        if not elements:
-            return None, f"Element '{element_name}' not found"
-
-        if len(elements) > 1:
-            return None, f"Element '{element_name}' found in multiple projects. Use project_name to specify."
-
-        return elements[0], None
-
-
 @mcp.tool
 async def get_procedures(
     ctx: Context,
@@ -83,7 +37,7 @@ async def get_procedures(
     """
     try:
         # Find element first
-        element, error = await _find_element(ctx, element_name, project_name)
+        element, error = await resolve_element(element_name, project_name, ElementRef)
 
         if error:
             return {
@@ -176,7 +130,7 @@ async def get_procedure(
 
         # If element_name provided, scope to that element
         if element_name:
-            element, error = await _find_element(ctx, element_name, project_name)
+            element, error = await resolve_element(element_name, project_name, ElementRef)
             if error:
                 return {
                     "error": True,
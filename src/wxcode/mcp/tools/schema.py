@@ -10,7 +10,7 @@ from fastmcp import Context
 
 from wxcode.mcp.instance import mcp
 from wxcode.models.project import Project
-from wxcode.models.schema import DatabaseSchema
+from wxcode.models.schema import DatabaseSchema, get_schema_tables
 
 
 @mcp.tool
@@ -132,7 +132,7 @@ async def get_schema(
 
         # Build tables summary (without full column details)
         tables_data = []
-        for table in (schema.tables or []):
+        for table in await get_schema_tables(schema):
             # Get primary key column names
             pk_columns = [col.name for col in (table.columns or []) if col.is_primary_key]
 
@@ -204,15 +204,13 @@ async def get_table(
                 "suggestion": "Run 'wxcode parse-schema' to import the database schema"
             }
 
-        # Find table in schema (case-insensitive)
-        table = next(
-            (t for t in (schema.tables or []) if t.name.upper() == table_name.upper()),
-            None
-        )
+        # Find table in schema (case-insensitive, indexed by project + name)
+        matches = await get_schema_tables(schema, [table_name], limit=1)
+        table = matches[0] if matches else None
 
         if not table:
             # List available tables as suggestion
-            available = [t.name for t in (schema.tables or [])[:15]]
+            available = [t.name for t in await get_schema_tables(schema, limit=15)]
             suggestion = f"Available tables (first 15): {', '.join(available)}" if available else "No tables in schema"
             return {
                 "error": True,
@@ -8,7 +8,7 @@ from typing import Any
 
 from fastmcp import Context
 
-from wxcode.mcp.instance import mcp
+from wxcode.mcp.instance import get_neo4j_connection, mcp
 from wxcode.models import Project, Element
 
 
@@ -58,11 +58,10 @@ async def health_check(ctx: Context) -> dict[str, Any]:
         }
         result["status"] = "unhealthy"
 
-    # Check Neo4j
-    neo4j_available = lifespan_ctx.get("neo4j_available", False)
-    neo4j_conn = lifespan_ctx.get("neo4j_conn")
+    # Check Neo4j (connects on first use)
+    neo4j_conn = await get_neo4j_connection(lifespan_ctx)
 
-    if neo4j_available and neo4j_conn:
+    if neo4j_conn:
         try:
             # Quick connectivity check
             async with neo4j_conn.driver.session() as session:
@@ -170,6 +169,7 @@ async def list_tools(
             "description": "UI plane detection (tabs, wizards, views)",
             "tools": [
                 {"name": "get_element_planes", "description": "Detect multi-plane UI patterns"},
+                {"name": "get_project_planes", "description": "Plane summaries for all pages of a project"},
             ],
         },
         "wlanguage": {
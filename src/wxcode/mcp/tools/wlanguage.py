@@ -4,38 +4,15 @@ Provides tools to query WLanguage H* function documentation and get
 modern stack equivalents during code conversion.
 """
 
-from pathlib import Path
 from typing import Any
 
-import yaml
 from fastmcp import Context
 
 from wxcode.mcp.instance import mcp
+from wxcode.mcp.wlanguage_index import get_reference_index
 from wxcode.models.output_project import OutputProject
 from wxcode.models.stack import Stack
 
-# Cache for loaded reference data
-_reference_cache: dict[str, Any] | None = None
-
-
-def _load_reference() -> dict[str, Any]:
-    """Load WLanguage reference YAML file (cached)."""
-    global _reference_cache
-
-    if _reference_cache is not None:
-        return _reference_cache
-
-    # Find the reference file
-    reference_path = Path(__file__).parent.parent.parent / "data" / "wlanguage_reference.yaml"
-
-    if not reference_path.exists():
-        return {"functions": {}, "patterns": {}}
-
-    with open(reference_path, "r", encoding="utf-8") as f:
-        _reference_cache = yaml.safe_load(f)
-
-    return _reference_cache or {"functions": {}, "patterns": {}}
-
 
 def _get_stack_key(stack: Stack) -> str:
     """
@@ -121,9 +98,8 @@ async def get_wlanguage_reference(
         equivalent code
     """
     try:
-        # Load reference data
-        reference = _load_reference()
-        functions = reference.get("functions", {})
+        reference = get_reference_index()
+        functions = reference.functions
 
         if not functions:
             return {
@@ -142,34 +118,22 @@ async def get_wlanguage_reference(
         ):
             search_name = "H" + search_name
 
-        # Try exact match first
-        func_data = functions.get(search_name)
-
-        # Try case-insensitive match
-        if not func_data:
-            for name, data in functions.items():
-                if name.lower() == search_name.lower():
-                    func_data = data
-                    search_name = name
-                    break
-
-        if not func_data:
-            # Suggest similar functions
-            similar = [
-                name
-                for name in functions.keys()
-                if search_name.lower() in name.lower() or name.lower() in search_name.lower()
-            ]
+        # Exact, then case-insensitive match (indexed)
+        found = reference.get(search_name) or reference.get(function_name.strip())
+
+        if not found:
+            # Suggest similar functions (substring, then trigram similarity)
+            similar = reference.search(search_name, limit=5)
             return {
                 "error": True,
                 "code": "NOT_FOUND",
                 "message": f"Function '{function_name}' not found in reference",
-                "similar_functions": similar[:5] if similar else None,
-                "available_categories": list(
-                    set(f.get("category", "unknown") for f in functions.values())
-                ),
+                "similar_functions": similar or None,
+                "available_categories": list(reference.categories),
             }
 
+        search_name, func_data = found
+
         # Determine target stack
         stack_key = None
         stack_name = None
@@ -236,8 +200,8 @@ async def list_wlanguage_functions(ctx: Context, category: str | None = None) ->
         List of functions grouped by category with brief descriptions
     """
     try:
-        reference = _load_reference()
-        functions = reference.get("functions", {})
+        reference = get_reference_index()
+        functions = reference.functions
 
         if not functions:
             return {
@@ -246,31 +210,25 @@ async def list_wlanguage_functions(ctx: Context, category: str | None = None) ->
                 "message": "WLanguage reference data not found",
             }
 
-        # Group by category
+        # Group by category (category index built at compile time)
         by_category: dict[str, list[dict[str, str]]] = {}
 
-        for func_name, func_data in functions.items():
-            func_category = func_data.get("category", "unknown")
-
+        for func_category, names in reference.categories.items():
             # Apply filter if specified
             if category and func_category.lower() != category.lower():
                 continue
 
-            if func_category not in by_category:
-                by_category[func_category] = []
-
-            by_category[func_category].append(
-                {"name": func_name, "description": func_data.get("description", "")[:100]}
-            )
+            by_category[func_category] = [
+                {"name": name, "description": functions[name].get("description", "")[:100]}
+                for name in names
+            ]
 
         if category and not by_category:
             return {
                 "error": True,
                 "code": "NOT_FOUND",
                 "message": f"No functions found in category '{category}'",
-                "available_categories": list(
-                    set(f.get("category", "unknown") for f in functions.values())
-                ),
+                "available_categories": list(reference.categories),
             }
 
         return {
@@ -304,8 +262,7 @@ async def get_wlanguage_pattern(ctx: Context, pattern_name: str) -> dict[str, An
         Pattern documentation with WLanguage code and modern equivalents
     """
     try:
-        reference = _load_reference()
-        patterns = reference.get("patterns", {})
+        patterns = get_reference_index().patterns
 
         if not patterns:
             return {
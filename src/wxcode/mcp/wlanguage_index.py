@@ -0,0 +1,225 @@
+"""Compiled, indexed WLanguage function reference for MCP tools.
+
+The YAML reference (data/wlanguage_reference.yaml) is compiled once into a
+JSON file keyed by a hash of its contents plus INDEX_FORMAT. Later processes
+load the JSON directly (no YAML parsing) and get:
+- exact and case-insensitive name lookup (dicts);
+- prefix search over the sorted lowercase names (bisect);
+- fuzzy search through a trigram inverted index, ranked by Dice similarity.
+
+The compiled file is rebuilt whenever the YAML changes; if the cache
+directory is not writable the index simply lives in memory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "INDEX_FORMAT",
+    "REFERENCE_PATH",
+    "WLanguageReferenceIndex",
+    "get_reference_index",
+    "load_reference_index",
+]
+
+logger = logging.getLogger(__name__)
+
+# Incrementar quando a estrutura do arquivo compilado mudar
+INDEX_FORMAT = 1
+
+REFERENCE_PATH = Path(__file__).parent.parent / "data" / "wlanguage_reference.yaml"
+
+# Similaridade mínima (Dice) para uma sugestão fuzzy
+MIN_FUZZY_SCORE = 0.3
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class WLanguageReferenceIndex:
+    """In-memory indexes over the WLanguage reference."""
+
+    def __init__(self, data: dict[str, Any]):
+        """Initialize from compiled data (see compile()).
+
+        Args:
+            data: Output of WLanguageReferenceIndex.compile()
+        """
+        self.source_hash: str = data.get("source_hash", "")
+        self.functions: dict[str, dict[str, Any]] = data["functions"]
+        self.patterns: dict[str, dict[str, Any]] = data["patterns"]
+        self.categories: dict[str, list[str]] = data["categories"]
+        self._canonical: dict[str, str] = data["canonical"]
+        self._sorted_keys: list[str] = data["sorted_keys"]
+        self._trigrams: dict[str, list[str]] = data["trigrams"]
+
+    @staticmethod
+    def compile(reference: dict[str, Any] | None, source_hash: str = "") -> dict[str, Any]:
+        """Build the serializable index from the parsed YAML reference.
+
+        Args:
+            reference: Parsed YAML ({"functions": ..., "patterns": ...})
+            source_hash: Hash of the YAML source
+
+        Returns:
+            JSON-serializable dict with the data and its indexes
+        """
+        reference = reference or {}
+        functions = reference.get("functions") or {}
+        patterns = reference.get("patterns") or {}
+
+        categories: dict[str, list[str]] = {}
+        trigrams: dict[str, list[str]] = {}
+        for name, func in functions.items():
+            categories.setdefault(func.get("category", "unknown"), []).append(name)
+            for gram in sorted(_trigrams(name)):
+                trigrams.setdefault(gram, []).append(name)
+
+        return {
+            "format": INDEX_FORMAT,
+            "source_hash": source_hash,
+            "functions": functions,
+            "patterns": patterns,
+            "categories": categories,
+            "canonical": {name.lower(): name for name in functions},
+            "sorted_keys": sorted(name.lower() for name in functions),
+            "trigrams": trigrams,
+        }
+
+    def get(self, name: str) -> tuple[str, dict[str, Any]] | None:
+        """Look up a function by name, exact first, then case-insensitive.
+
+        Returns:
+            (canonical name, function data) or None
+        """
+        func = self.functions.get(name)
+        if func is not None:
+            return name, func
+        canonical = self._canonical.get(name.lower())
+        if canonical is None:
+            return None
+        return canonical, self.functions[canonical]
+
+    def with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Function names starting with `prefix` (case-insensitive), sorted."""
+        prefix = prefix.lower()
+        names = []
+        for i in range(bisect_left(self._sorted_keys, prefix), len(self._sorted_keys)):
+            key = self._sorted_keys[i]
+            if not key.startswith(prefix) or (limit is not None and len(names) >= limit):
+                break
+            names.append(self._canonical[key])
+        return names
+
+    def search(self, query: str, limit: int = 5) -> list[str]:
+        """Fuzzy search: substring matches first, then trigram similarity.
+
+        Args:
+            query: Partial or misspelled function name
+            limit: Maximum number of names
+
+        Returns:
+            Function names, best matches first
+        """
+        query_trigrams = _trigrams(query)
+        shared: Counter[str] = Counter()
+        for gram in query_trigrams:
+            shared.update(self._trigrams.get(gram, ()))
+
+        needle = query.lower()
+        scored = []
+        for name, common in shared.items():
+            key = name.lower()
+            substring = needle in key or key in needle
+            score = 2 * common / (len(query_trigrams) + len(_trigrams(name)))
+            if substring or score >= MIN_FUZZY_SCORE:
+                scored.append((not substring, -score, name))
+
+        scored.sort()
+        return [name for _, _, name in scored[:limit]]
+
+
+def _compiled_path(cache_dir: Path, source_hash: str) -> Path:
+    return cache_dir / f"wlanguage_reference.{source_hash}.json"
+
+
+def _write_atomic(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_reference_index(
+    source: Path = REFERENCE_PATH, cache_dir: Path | None = None
+) -> WLanguageReferenceIndex:
+    """Load the compiled index, compiling the YAML source if needed.
+
+    Args:
+        source: YAML reference file
+        cache_dir: Directory of compiled files (default: settings.wlanguage_index_dir)
+
+    Returns:
+        WLanguageReferenceIndex (empty if the source does not exist)
+    """
+    if not source.exists():
+        return WLanguageReferenceIndex(WLanguageReferenceIndex.compile(None))
+
+    if cache_dir is None:
+        from wxcode.config import get_settings
+
+        cache_dir = Path(get_settings().wlanguage_index_dir)
+
+    raw = source.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=10)
+    digest.update(str(INDEX_FORMAT).encode())
+    source_hash = digest.hexdigest()
+    compiled = _compiled_path(cache_dir, source_hash)
+
+    try:
+        data = json.loads(compiled.read_bytes())
+        if data.get("format") == INDEX_FORMAT and data.get("source_hash") == source_hash:
+            return WLanguageReferenceIndex(data)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Discarding invalid compiled WLanguage reference ({compiled.name}): {e}")
+
+    import yaml
+
+    data = WLanguageReferenceIndex.compile(yaml.safe_load(raw), source_hash)
+    try:
+        _write_atomic(compiled, data)
+        for stale in cache_dir.glob("wlanguage_reference.*.json"):
+            if stale != compiled:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not write compiled WLanguage reference: {e}")
+
+    return WLanguageReferenceIndex(data)
+
+
+_index: WLanguageReferenceIndex | None = None
+
+
+def get_reference_index() -> WLanguageReferenceIndex:
+    """Process-wide reference index, loaded on first use."""
+    global _index
+
+    if _index is None:
+        _index = load_reference_index()
+    return _index
@@ -1,60 +1,131 @@
 """
 Models Pydantic/Beanie para MongoDB.
+
+Os nomes são carregados sob demanda (PEP 562): importar um único model não
+paga o custo de importar todos os documentos Beanie.
 """
 
-from wxcode.models.project import Project, ProjectConfiguration, ProjectStatus
-from wxcode.models.element import (
-    Element,
-    ElementType,
-    ElementLayer,
-    ElementChunk,
-    ElementAST,
-    ElementDependencies,
-    ElementConversion,
-    ConversionStatus,
-)
-from wxcode.models.conversion import Conversion, ConversionError, ConversionPhase
-from wxcode.models.control_type import (
-    ControlTypeDefinition,
-    PREFIX_TO_TYPE_NAME,
-    CONTAINER_PREFIXES,
-    infer_type_name_from_prefix,
-    is_container_by_prefix,
-)
-from wxcode.models.control import (
-    Control,
-    ControlEvent,
-    ControlProperties,
-    DataBindingInfo,
-    DataBindingType,
-    EVENT_TYPE_CODES,
-    get_event_name,
-)
-from wxcode.models.procedure import (
-    Procedure,
-    ProcedureParameter,
-    ProcedureDependencies,
-)
-from wxcode.models.schema import (
-    DatabaseSchema,
-    SchemaConnection,
-    SchemaTable,
-    SchemaColumn,
-    SchemaIndex,
-)
-from wxcode.models.class_definition import (
-    ClassDefinition,
-    ClassMember,
-    ClassMethod,
-    ClassConstant,
-    ClassDependencies,
-)
-from wxcode.models.token_usage import TokenUsageLog
-from wxcode.models.product import Product, ProductType, ProductStatus
-from wxcode.models.conversion_history import ConversionHistoryEntry
-from wxcode.models.stack import Stack, StartDevTemplate
-from wxcode.models.output_project import OutputProject, OutputProjectStatus
-from wxcode.models.milestone import Milestone, MilestoneStatus
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wxcode.models.project import Project, ProjectConfiguration, ProjectStatus
+    from wxcode.models.element import (
+        Element,
+        ElementType,
+        ElementLayer,
+        ElementChunk,
+        ElementAST,
+        ElementDependencies,
+        ElementConversion,
+        ElementPlanes,
+        ElementPlane,
+        PlaneControl,
+        ConversionStatus,
+    )
+    from wxcode.models.conversion import Conversion, ConversionError, ConversionPhase
+    from wxcode.models.control_type import (
+        ControlTypeDefinition,
+        PREFIX_TO_TYPE_NAME,
+        CONTAINER_PREFIXES,
+        infer_type_name_from_prefix,
+        is_container_by_prefix,
+    )
+    from wxcode.models.control import (
+        Control,
+        ControlEvent,
+        ControlProperties,
+        DataBindingInfo,
+        DataBindingType,
+        EVENT_TYPE_CODES,
+        get_event_name,
+    )
+    from wxcode.models.procedure import (
+        Procedure,
+        ProcedureParameter,
+        ProcedureDependencies,
+    )
+    from wxcode.models.schema import (
+        DatabaseSchema,
+        SchemaConnection,
+        SchemaTable,
+        SchemaTableDocument,
+        SchemaSummary,
+        SchemaColumn,
+        SchemaIndex,
+    )
+    from wxcode.models.class_definition import (
+        ClassDefinition,
+        ClassMember,
+        ClassMethod,
+        ClassConstant,
+        ClassDependencies,
+    )
+    from wxcode.models.token_usage import TokenUsageLog
+    from wxcode.models.product import Product, ProductType, ProductStatus
+    from wxcode.models.conversion_history import ConversionHistoryEntry
+    from wxcode.models.stack import Stack, StartDevTemplate
+    from wxcode.models.output_project import OutputProject, OutputProjectStatus
+    from wxcode.models.milestone import Milestone, MilestoneStatus
+
+# Nome exportado -> módulo que o define
+_LAZY_IMPORTS: dict[str, str] = {
+    "Project": "wxcode.models.project",
+    "ProjectConfiguration": "wxcode.models.project",
+    "ProjectStatus": "wxcode.models.project",
+    "Element": "wxcode.models.element",
+    "ElementType": "wxcode.models.element",
+    "ElementLayer": "wxcode.models.element",
+    "ElementChunk": "wxcode.models.element",
+    "ElementAST": "wxcode.models.element",
+    "ElementDependencies": "wxcode.models.element",
+    "ElementConversion": "wxcode.models.element",
+    "ElementPlanes": "wxcode.models.element",
+    "ElementPlane": "wxcode.models.element",
+    "PlaneControl": "wxcode.models.element",
+    "ConversionStatus": "wxcode.models.element",
+    "Conversion": "wxcode.models.conversion",
+    "ConversionError": "wxcode.models.conversion",
+    "ConversionPhase": "wxcode.models.conversion",
+    "ControlTypeDefinition": "wxcode.models.control_type",
+    "PREFIX_TO_TYPE_NAME": "wxcode.models.control_type",
+    "CONTAINER_PREFIXES": "wxcode.models.control_type",
+    "infer_type_name_from_prefix": "wxcode.models.control_type",
+    "is_container_by_prefix": "wxcode.models.control_type",
+    "Control": "wxcode.models.control",
+    "ControlEvent": "wxcode.models.control",
+    "ControlProperties": "wxcode.models.control",
+    "DataBindingInfo": "wxcode.models.control",
+    "DataBindingType": "wxcode.models.control",
+    "EVENT_TYPE_CODES": "wxcode.models.control",
+    "get_event_name": "wxcode.models.control",
+    "Procedure": "wxcode.models.procedure",
+    "ProcedureParameter": "wxcode.models.procedure",
+    "ProcedureDependencies": "wxcode.models.procedure",
+    "DatabaseSchema": "wxcode.models.schema",
+    "SchemaConnection": "wxcode.models.schema",
+    "SchemaTable": "wxcode.models.schema",
+    "SchemaTableDocument": "wxcode.models.schema",
+    "SchemaSummary": "wxcode.models.schema",
+    "SchemaColumn": "wxcode.models.schema",
+    "SchemaIndex": "wxcode.models.schema",
+    "ClassDefinition": "wxcode.models.class_definition",
+    "ClassMember": "wxcode.models.class_definition",
+    "ClassMethod": "wxcode.models.class_definition",
+    "ClassConstant": "wxcode.models.class_definition",
+    "ClassDependencies": "wxcode.models.class_definition",
+    "TokenUsageLog": "wxcode.models.token_usage",
+    "Product": "wxcode.models.product",
+    "ProductType": "wxcode.models.product",
+    "ProductStatus": "wxcode.models.product",
+    "ConversionHistoryEntry": "wxcode.models.conversion_history",
+    "Stack": "wxcode.models.stack",
+    "StartDevTemplate": "wxcode.models.stack",
+    "OutputProject": "wxcode.models.output_project",
+    "OutputProjectStatus": "wxcode.models.output_project",
+    "Milestone": "wxcode.models.milestone",
+    "MilestoneStatus": "wxcode.models.milestone",
+}
 
 __all__ = [
     # Project
@@ -69,6 +140,9 @@ __all__ = [
     "ElementAST",
     "ElementDependencies",
     "ElementConversion",
+    "ElementPlanes",
+    "ElementPlane",
+    "PlaneControl",
     "ConversionStatus",
     # Conversion
     "Conversion",
@@ -96,6 +170,8 @@ __all__ = [
     "DatabaseSchema",
     "SchemaConnection",
     "SchemaTable",
+    "SchemaTableDocument",
+    "SchemaSummary",
     "SchemaColumn",
     "SchemaIndex",
     # ClassDefinition
@@ -119,3 +195,16 @@ __all__ = [
     "Milestone",
     "MilestoneStatus",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -14,6 +14,23 @@ from pydantic import BaseModel, Field
 from wxcode.models.project import Project
 
 
+def conversion_duration(
+    started_at: Optional[datetime], completed_at: Optional[datetime]
+) -> Optional[float]:
+    """Duração em segundos (até agora, se ainda não concluída)."""
+    if started_at is None:
+        return None
+    end = completed_at or datetime.utcnow()
+    return (end - started_at).total_seconds()
+
+
+def conversion_progress(elements_converted: int, total_elements: int) -> float:
+    """Progresso em percentual de elementos convertidos."""
+    if total_elements == 0:
+        return 0.0
+    return (elements_converted / total_elements) * 100
+
+
 class ConversionPhase(str, Enum):
     """Fases do pipeline de conversão."""
     PENDING = "pending"
@@ -117,17 +134,12 @@ class Conversion(Document):
     @property
     def duration_seconds(self) -> Optional[float]:
         """Duração da conversão em segundos."""
-        if self.started_at is None:
-            return None
-        end = self.completed_at or datetime.utcnow()
-        return (end - self.started_at).total_seconds()
+        return conversion_duration(self.started_at, self.completed_at)
 
     @property
     def overall_progress(self) -> float:
         """Progresso geral da conversão em percentual."""
-        if self.total_elements == 0:
-            return 0.0
-        return (self.elements_converted / self.total_elements) * 100
+        return conversion_progress(self.elements_converted, self.total_elements)
 
     @property
     def has_errors(self) -> bool:
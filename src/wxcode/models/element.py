@@ -158,11 +158,62 @@ class ElementDependencies(BaseModel):
             self.bound_tables.append(table_name)
 
 
+class PlaneControl(BaseModel):
+    """Controle pertencente a um plano (dados mínimos para a análise)."""
+    name: str = Field(..., description="Nome do controle")
+    type_code: int = Field(..., description="Código do tipo do controle")
+    full_path: str = Field(default="", description="Caminho completo do controle")
+    depth: int = Field(default=0, description="Profundidade na hierarquia")
+    has_code: bool = Field(default=False, description="Controle possui código")
+
+
+class ElementPlane(BaseModel):
+    """Plano (aba/etapa/camada) com seus controles."""
+    number: int = Field(..., description="Número do plano (0 = camada base)")
+    controls: list[PlaneControl] = Field(default_factory=list)
+
+
+class ElementPlanes(BaseModel):
+    """
+    Análise de planos do elemento, calculada no enrich.
+
+    Guarda o mapa plano -> controles, as operações de plano encontradas no
+    código e o padrão de navegação inferido, para consulta sem reprocessar
+    controles e raw_content.
+    """
+    planes: list[ElementPlane] = Field(
+        default_factory=list,
+        description="Planos ordenados por número"
+    )
+    operations: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Operações de plano no código (Plane(), PlaneEnable(), ..Plane)"
+    )
+    navigation_pattern: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Padrão inferido (none, simple, wizard, tabs, conditional)"
+    )
+    total_controls: int = Field(default=0, description="Controles analisados")
+    computed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class ConvertedFile(BaseModel):
     """Arquivo gerado na conversão."""
     path: str = Field(..., description="Caminho relativo do arquivo gerado")
     file_type: str = Field(..., description="Tipo (model, service, route, template)")
-    content: str = Field(..., description="Conteúdo do arquivo")
+    content_hash: Optional[str] = Field(
+        default=None,
+        description="SHA-256 do conteúdo no ArtifactStore"
+    )
+    size: Optional[int] = Field(default=None, description="Tamanho em bytes")
+    mtime_ns: Optional[int] = Field(
+        default=None,
+        description="mtime (ns) do arquivo em disco quando foi gravado"
+    )
+    content: Optional[str] = Field(
+        default=None,
+        description="Conteúdo embutido (legado, antes do ArtifactStore)"
+    )
 
 
 class ElementConversion(BaseModel):
@@ -256,10 +307,22 @@ class Element(Document):
         default=None,
         description="Caminho do screenshot no filesystem"
     )
+    pdf_path: Optional[str] = Field(
+        default=None,
+        description="Caminho do PDF de documentação do elemento (do manifest)"
+    )
+    pdf_text_path: Optional[str] = Field(
+        default=None,
+        description="Texto extraído do PDF (sidecar .txt ao lado do PDF)"
+    )
     controls_count: int = Field(
         default=0,
         description="Quantidade de controles do elemento"
     )
+    planes: Optional[ElementPlanes] = Field(
+        default=None,
+        description="Análise de planos (preenchida pelo enrich)"
+    )
 
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
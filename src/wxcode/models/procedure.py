@@ -106,6 +106,10 @@ class Procedure(Document):
     # Código
     code: str = Field(default="", description="Código WLanguage completo")
     code_lines: int = Field(default=0, description="Número de linhas de código")
+    token_count: Optional[int] = Field(
+        default=None,
+        description="Tokens do código (tiktoken), calculado no parse; None sem tiktoken"
+    )
 
     # Dependências
     dependencies: ProcedureDependencies = Field(
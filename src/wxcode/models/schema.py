@@ -2,13 +2,19 @@
 Models para schema de banco de dados extraído de arquivos .xdd (Analysis WinDev).
 
 Representa a estrutura completa do banco: conexões, tabelas, colunas, índices.
+
+As tabelas ficam na coleção schema_tables (um documento por tabela,
+indexado por projeto + nome); DatabaseSchema guarda só os metadados e as
+conexões. Schemas gravados no formato antigo (tabelas embutidas em
+DatabaseSchema.tables) continuam legíveis via get_schema_tables().
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
-from beanie import Document, PydanticObjectId
-from pydantic import BaseModel, Field
+from beanie import Document, PydanticObjectId, View
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pymongo import ASCENDING, IndexModel
 
 
 class SchemaConnection(BaseModel):
@@ -96,7 +102,8 @@ class DatabaseSchema(Document):
         default_factory=list, description="Conexões de banco definidas"
     )
     tables: list[SchemaTable] = Field(
-        default_factory=list, description="Tabelas do schema"
+        default_factory=list,
+        description="Tabelas embutidas (formato legado; ver SchemaTableDocument)",
     )
 
     created_at: datetime = Field(default_factory=datetime.now)
@@ -119,3 +126,144 @@ class DatabaseSchema(Document):
     def total_connections(self) -> int:
         """Número total de conexões."""
         return len(self.connections)
+
+
+class SchemaTableDocument(SchemaTable, Document):
+    """
+    Tabela do schema persistida como documento próprio.
+
+    Um documento por tabela permite buscar só as tabelas necessárias
+    (por projeto + nome) em vez de carregar o schema inteiro.
+    """
+
+    project_id: PydanticObjectId = Field(..., description="ID do projeto")
+    schema_id: Optional[PydanticObjectId] = Field(
+        None, description="ID do DatabaseSchema de origem"
+    )
+    name_key: str = Field("", description="Nome em maiúsculas (busca case-insensitive)")
+    physical_name_key: str = Field(
+        "", description="Nome físico em maiúsculas (busca case-insensitive)"
+    )
+
+    class Settings:
+        name = "schema_tables"
+        indexes = [
+            IndexModel(
+                [("project_id", ASCENDING), ("name_key", ASCENDING)],
+                name="project_table_name",
+            ),
+            IndexModel(
+                [("project_id", ASCENDING), ("physical_name_key", ASCENDING)],
+                name="project_table_physical_name",
+            ),
+        ]
+
+    @model_validator(mode="after")
+    def _fill_name_key(self) -> "SchemaTableDocument":
+        if not self.name_key:
+            self.name_key = self.name.upper()
+        if not self.physical_name_key:
+            self.physical_name_key = self.physical_name.upper()
+        return self
+
+    @classmethod
+    def from_table(
+        cls,
+        table: SchemaTable,
+        project_id: PydanticObjectId,
+        schema_id: Optional[PydanticObjectId] = None,
+    ) -> "SchemaTableDocument":
+        """Cria o documento a partir de uma tabela parseada."""
+        return cls(
+            **table.model_dump(),
+            project_id=project_id,
+            schema_id=schema_id,
+        )
+
+
+class SchemaSummary(View):
+    """Contagens agregadas do schema por projeto (view sobre schema_tables)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    project_id: PydanticObjectId = Field(..., alias="_id")
+    total_tables: int = 0
+    total_columns: int = 0
+
+    class Settings:
+        name = "schema_summaries"
+        source = SchemaTableDocument
+        pipeline = [
+            {
+                "$group": {
+                    "_id": "$project_id",
+                    "total_tables": {"$sum": 1},
+                    "total_columns": {"$sum": {"$size": "$columns"}},
+                }
+            },
+        ]
+
+
+async def get_schema_tables(
+    schema: DatabaseSchema,
+    names: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    physical_names: bool = False,
+) -> list[SchemaTable]:
+    """
+    Carrega as tabelas de um schema, opcionalmente só as de `names`.
+
+    Args:
+        schema: DatabaseSchema do projeto
+        names: Nomes das tabelas (case-insensitive); None carrega todas
+        limit: Número máximo de tabelas retornadas
+        physical_names: `names` também casa com o nome físico das tabelas
+
+    Returns:
+        Tabelas na ordem da Analysis
+    """
+    keys = {name.upper() for name in names} if names is not None else None
+
+    if schema.tables:
+        # Formato legado: tabelas embutidas no documento
+        tables = [
+            t for t in schema.tables
+            if keys is None
+            or t.name.upper() in keys
+            or (physical_names and t.physical_name.upper() in keys)
+        ]
+        return tables[:limit] if limit is not None else tables
+
+    if keys is not None and not keys:
+        return []
+
+    query = SchemaTableDocument.find(SchemaTableDocument.project_id == schema.project_id)
+    if keys is not None:
+        in_keys = {"$in": sorted(keys)}
+        if physical_names:
+            query = query.find({"$or": [{"name_key": in_keys}, {"physical_name_key": in_keys}]})
+        else:
+            query = query.find({"name_key": in_keys})
+    query = query.sort("+_id")
+    if limit is not None:
+        query = query.limit(limit)
+    return await query.to_list()
+
+
+async def get_schema_summary(schema: DatabaseSchema) -> SchemaSummary:
+    """
+    Contagens de tabelas e colunas de um schema.
+
+    Usa a view schema_summaries; para schemas no formato legado, conta as
+    tabelas embutidas.
+    """
+    if schema.tables:
+        # Valores vêm de um documento já validado
+        return SchemaSummary.model_construct(
+            project_id=schema.project_id,
+            total_tables=len(schema.tables),
+            total_columns=sum(len(table.columns) for table in schema.tables),
+        )
+
+    summary = await SchemaSummary.find_one(SchemaSummary.project_id == schema.project_id)
+    return summary or SchemaSummary(project_id=schema.project_id)
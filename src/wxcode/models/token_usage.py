@@ -1,5 +1,5 @@
 """
-Model para tracking de consumo de tokens do Claude Code.
+Model para tracking de consumo de tokens do Claude Code e das conversões LLM.
 """
 
 from datetime import datetime
@@ -15,7 +15,9 @@ class TokenUsageLog(Document):
     Registra o consumo de tokens de uma sessão Claude Code.
 
     Cada execução de comando no Claude Code gera um log com métricas
-    de tokens utilizados e custo total da operação.
+    de tokens utilizados e custo total da operação. As conversões via
+    provider LLM (PageConverter/ProcedureConverter) gravam um log por
+    elemento, com session_id "llm-..." por execução.
     """
 
     # Identificação
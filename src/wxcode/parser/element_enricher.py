@@ -7,8 +7,12 @@ Combina dados de:
 - Procedures locais extraídas do código da página
 
 E persiste no MongoDB.
+
+A leitura e o parsing dos arquivos (.wwh e PDF) rodam em thread, para não
+bloquear o event loop da API durante o enriquecimento.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
@@ -34,7 +38,12 @@ from wxcode.models import (
     is_container_by_prefix,
 )
 from wxcode.parser.dependency_extractor import DependencyExtractor
-from wxcode.parser.pdf_element_parser import PDFElementParser, ParsedPDFElement
+from wxcode.parser.pdf_element_parser import (
+    PDFElementParser,
+    ParsedPDFElement,
+    write_pdf_text,
+)
+from wxcode.parser.plane_analyzer import build_element_planes
 from wxcode.parser.wwh_parser import (
     ParsedControl,
     ParsedLocalProcedure,
@@ -169,6 +178,13 @@ class ElementEnricher:
         # Carrega manifest se existir
         self.manifest = self._load_manifest()
 
+        # Índice (categoria, nome) -> item do manifest
+        self._manifest_index: dict[tuple[str, str], dict[str, Any]] = {
+            (category, item['name']): item
+            for category, items in self.manifest.get('elements', {}).items()
+            for item in items
+        }
+
     def _load_manifest(self) -> dict[str, Any]:
         """Carrega e deduplica o manifest."""
         manifest_path = self.pdf_docs_dir / "manifest.json"
@@ -263,30 +279,12 @@ class ElementEnricher:
         """
         result = EnrichmentResult(element_name=element.source_name)
 
-        # 1. Encontra e parseia arquivo fonte (.wwh/.wdw)
-        source_file = self._find_source_file(element)
-        wwh_data: Optional[ParsedPage] = None
-
-        if source_file and source_file.exists():
-            try:
-                # Lê conteúdo bruto para salvar no elemento
-                element.raw_content = source_file.read_text(encoding='utf-8', errors='replace')
-
-                parser = WWHParser(source_file)
-                wwh_data = parser.parse()
-            except Exception as e:
-                result.errors.append(f"Erro ao parsear {source_file.name}: {e}")
-
-        # 2. Encontra e parseia PDF
-        pdf_file = self._find_pdf_for_element(element.source_name, element.source_type)
-        pdf_data: Optional[ParsedPDFElement] = None
-
-        if pdf_file and pdf_file.exists():
-            try:
-                pdf_parser = PDFElementParser(pdf_file)
-                pdf_data = pdf_parser.parse(self.screenshots_dir)
-            except Exception as e:
-                result.errors.append(f"Erro ao parsear PDF: {e}")
+        # 1-2. Lê e parseia o arquivo fonte (.wwh/.wdw) e o PDF fora do event loop
+        raw_content, wwh_data, pdf_file, pdf_data = await asyncio.to_thread(
+            self._parse_sources, element, result.errors
+        )
+        if raw_content is not None:
+            element.raw_content = raw_content
 
         # 3. Processa controles
         if wwh_data:
@@ -326,6 +324,14 @@ class ElementEnricher:
         if pdf_data:
             element.general_properties = pdf_data.general_properties
             element.screenshot_path = pdf_data.screenshot_path
+            # Localização do PDF e do texto já extraído, para consulta sem
+            # procurar arquivos nem reabrir o PDF
+            element.pdf_path = str(pdf_file.resolve())
+            try:
+                text_path = await asyncio.to_thread(write_pdf_text, pdf_file, pdf_data.raw_text)
+                element.pdf_text_path = str(text_path.resolve())
+            except OSError as e:
+                result.errors.append(f"Erro ao gravar texto do PDF: {e}")
 
         element.controls_count = result.controls_created + result.controls_updated
         element.updated_at = datetime.utcnow()
@@ -333,6 +339,49 @@ class ElementEnricher:
 
         return result
 
+    def _parse_sources(
+        self,
+        element: Element,
+        errors: list[str],
+    ) -> tuple[Optional[str], Optional[ParsedPage], Optional[Path], Optional[ParsedPDFElement]]:
+        """
+        Lê e parseia o arquivo fonte e o PDF de um elemento (bloqueante).
+
+        Args:
+            element: Elemento a enriquecer
+            errors: Lista onde os erros de parsing são acumulados
+
+        Returns:
+            Tupla (conteúdo bruto, dados do .wwh, arquivo PDF, dados do PDF)
+        """
+        # 1. Encontra e parseia arquivo fonte (.wwh/.wdw)
+        source_file = self._find_source_file(element)
+        raw_content: Optional[str] = None
+        wwh_data: Optional[ParsedPage] = None
+
+        if source_file and source_file.exists():
+            try:
+                # Lê conteúdo bruto para salvar no elemento
+                raw_content = source_file.read_text(encoding='utf-8', errors='replace')
+
+                parser = WWHParser(source_file)
+                wwh_data = parser.parse()
+            except Exception as e:
+                errors.append(f"Erro ao parsear {source_file.name}: {e}")
+
+        # 2. Encontra e parseia PDF
+        pdf_file = self._find_pdf_for_element(element.source_name, element.source_type)
+        pdf_data: Optional[ParsedPDFElement] = None
+
+        if pdf_file and pdf_file.exists():
+            try:
+                pdf_parser = PDFElementParser(pdf_file)
+                pdf_data = pdf_parser.parse(self.screenshots_dir)
+            except Exception as e:
+                errors.append(f"Erro ao parsear PDF: {e}")
+
+        return raw_content, wwh_data, pdf_file, pdf_data
+
     def _build_matching_context(
         self,
         pdf_data: Optional[ParsedPDFElement]
@@ -621,6 +670,9 @@ class ElementEnricher:
                 control.children_ids = children_ids
                 await control.save()
 
+        # Análise de planos (servida pelo MCP sem reprocessar controles/código)
+        element.planes = build_element_planes(control_map.values(), element.raw_content)
+
         # Copia estatísticas de matching para o resultado
         result['exact_matches'] = match_ctx.exact_matches
         result['leaf_matches'] = match_ctx.leaf_matches
@@ -670,6 +722,8 @@ class ElementEnricher:
         Returns:
             Número de procedures criadas
         """
+        from wxcode.llm_converter.token_counter import stored_token_count
+
         created = 0
 
         # Determina scope baseado no tipo do elemento
@@ -702,6 +756,7 @@ class ElementEnricher:
                 existing.return_type = parsed_proc.return_type
                 existing.code = parsed_proc.code
                 existing.code_lines = parsed_proc.code_lines
+                existing.token_count = stored_token_count(parsed_proc.code)
                 existing.has_documentation = parsed_proc.has_documentation
                 existing.is_internal = parsed_proc.is_internal
                 existing.has_error_handling = parsed_proc.has_error_handling
@@ -739,6 +794,7 @@ class ElementEnricher:
                     return_type=parsed_proc.return_type,
                     code=parsed_proc.code,
                     code_lines=parsed_proc.code_lines,
+                    token_count=stored_token_count(parsed_proc.code),
                     dependencies=ProcedureDependencies(
                         calls_procedures=deps.calls_procedures,
                         uses_files=deps.uses_files,
@@ -793,7 +849,7 @@ class ElementEnricher:
                 all_code_blocks.append(proc.code)
 
         # Extrai e combina dependências
-        deps = self.dep_extractor.extract_and_merge(*all_code_blocks)
+        deps = await asyncio.to_thread(self.dep_extractor.extract_and_merge, *all_code_blocks)
 
         # Atualiza Element.dependencies
         if not element.dependencies:
@@ -924,11 +980,11 @@ class ElementEnricher:
             category = 'windows'
 
         # Busca no manifest
-        for item in self.manifest.get('elements', {}).get(category, []):
-            if item.get('name') == element_name:
-                pdf_path = self.pdf_docs_dir / item['pdf_file']
-                if pdf_path.exists():
-                    return pdf_path
+        item = self._manifest_index.get((category, element_name))
+        if item:
+            pdf_path = self.pdf_docs_dir / item['pdf_file']
+            if pdf_path.exists():
+                return pdf_path
 
         # Fallback: busca direta
         pdf_path = self.pdf_docs_dir / category / f"{element_name}.pdf"
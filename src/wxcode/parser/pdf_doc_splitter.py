@@ -335,6 +335,20 @@ class PDFDocumentSplitter:
 
         return None
 
+    # Diretório (e categoria do manifest) de cada tipo de elemento
+    TYPE_DIRS = {
+        ElementType.PAGE: "pages",
+        ElementType.REPORT: "reports",
+        ElementType.WINDOW: "windows",
+        ElementType.INTERNAL_WINDOW: "windows",
+        ElementType.QUERY: "queries",
+    }
+
+    def _element_pdf_file(self, element: PDFElement) -> str:
+        """Caminho do PDF do elemento relativo a output_dir (igual ao do manifest)."""
+        type_dir = self.TYPE_DIRS.get(element.element_type, "pages")
+        return f"{type_dir}/{element.name}.pdf"
+
     def _extract_element_pdfs(self, doc: fitz.Document):
         """
         Extrai PDFs individuais para cada elemento.
@@ -359,15 +373,7 @@ class PDFDocumentSplitter:
             doc: Documento PDF fonte
             element: Elemento a extrair
         """
-        # Determina diretório de saída baseado no tipo
-        type_dir = {
-            ElementType.PAGE: "pages",
-            ElementType.REPORT: "reports",
-            ElementType.WINDOW: "windows",
-            ElementType.INTERNAL_WINDOW: "windows",
-        }.get(element.element_type, "pages")
-
-        output_path = self.output_dir / type_dir / f"{element.name}.pdf"
+        output_path = self.output_dir / self._element_pdf_file(element)
 
         # Cria novo PDF com as páginas do elemento
         new_doc = fitz.open()
@@ -429,19 +435,11 @@ class PDFDocumentSplitter:
 
         # Agrupa elementos por tipo
         for element in self.elements:
-            type_key = {
-                ElementType.PAGE: "pages",
-                ElementType.REPORT: "reports",
-                ElementType.WINDOW: "windows",
-                ElementType.INTERNAL_WINDOW: "windows",
-                ElementType.QUERY: "queries",
-            }.get(element.element_type, "pages")
-
-            type_dir = type_key  # Mesmo nome do diretório
+            type_key = self.TYPE_DIRS.get(element.element_type, "pages")
 
             manifest["elements"][type_key].append({
                 "name": element.name,
-                "pdf_file": f"{type_dir}/{element.name}.pdf",
+                "pdf_file": self._element_pdf_file(element),
                 "source_page": element.source_page + 1,  # 1-indexed para humanos
                 "has_screenshot": element.screenshot_page is not None
             })
@@ -15,6 +15,58 @@ import fitz  # PyMuPDF
 from wxcode.models.control import DataBindingInfo, DataBindingType
 
 
+# Extensão do arquivo com o texto extraído, gravado ao lado do PDF
+PDF_TEXT_SUFFIX = ".txt"
+
+
+def pdf_text_sidecar(pdf_path: Path) -> Path:
+    """Caminho do sidecar de texto de um PDF."""
+    return Path(pdf_path).with_suffix(PDF_TEXT_SUFFIX)
+
+
+def write_pdf_text(pdf_path: Path, text: str) -> Path:
+    """
+    Grava o texto extraído de um PDF no sidecar.
+
+    Args:
+        pdf_path: Caminho do PDF
+        text: Texto já extraído
+
+    Returns:
+        Caminho do sidecar
+    """
+    sidecar = pdf_text_sidecar(pdf_path)
+    sidecar.write_text(text, encoding="utf-8")
+    return sidecar
+
+
+def load_pdf_text(pdf_path: Path) -> str:
+    """
+    Texto de um PDF, lido do sidecar.
+
+    O PDF só é aberto (e o sidecar regravado) quando o sidecar não existe
+    ou é mais antigo que o PDF.
+
+    Args:
+        pdf_path: Caminho do PDF
+
+    Returns:
+        Texto de todas as páginas
+    """
+    pdf_path = Path(pdf_path)
+    sidecar = pdf_text_sidecar(pdf_path)
+    try:
+        if sidecar.stat().st_mtime >= pdf_path.stat().st_mtime:
+            return sidecar.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+
+    with fitz.open(pdf_path) as doc:
+        text = "".join(page.get_text() + "\n" for page in doc)
+    write_pdf_text(pdf_path, text)
+    return text
+
+
 @dataclass
 class ParsedPDFElement:
     """Resultado do parsing de um PDF de elemento."""
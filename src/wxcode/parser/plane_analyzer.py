@@ -0,0 +1,198 @@
+"""
+Análise de planos (abas, etapas de wizard, camadas condicionais) de páginas.
+
+Agrupa os controles pelo(s) plano(s) a que pertencem, extrai do código
+WLanguage as operações de plano e infere o padrão de navegação. Executada
+uma vez no enrich (ElementEnricher) e armazenada em Element.planes.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from wxcode.models.control import Control
+from wxcode.models.element import ElementPlane, ElementPlanes, PlaneControl
+
+# Padrões de operações de plano, na ordem em que são reportados
+_PLANE_OPERATION_PATTERNS = [
+    # Plane(N) ou Plane(N, controle)
+    (re.compile(r"Plane\s*\(\s*(\d+)(?:\s*,\s*([^)]+))?\)", re.IGNORECASE), "plane_switch"),
+    # PlaneEnable(N, bool)
+    (re.compile(r"PlaneEnable\s*\(\s*(\d+)\s*,\s*(True|False|true|false)", re.IGNORECASE), "plane_enable"),
+    # PlaneVisible(N)
+    (re.compile(r"PlaneVisible\s*\(\s*(\d+)\s*\)", re.IGNORECASE), "plane_visible_check"),
+    # ..Plane = N (atribuição de propriedade)
+    (re.compile(r"\.\.Plane\s*=\s*(\d+)", re.IGNORECASE), "plane_assign"),
+    # ..Plane (leitura de propriedade, captura o controle)
+    (re.compile(r"(\w+)\.\.Plane(?!\s*=)", re.IGNORECASE), "plane_read"),
+]
+
+# Todos os padrões contêm "plane": evita varrer código sem planos
+_PLANE_HINT = re.compile(r"plane", re.IGNORECASE)
+
+
+def parse_plane_value(plane_str: Optional[str]) -> list[int]:
+    """
+    Converte o valor da propriedade Plane em números de plano.
+
+    Formatos: "1", "1,2,3" e (raro) "1-3".
+
+    Returns:
+        Números dos planos (0 = todos os planos / camada base)
+    """
+    if not plane_str:
+        return [0]  # Sem plano = camada base
+
+    planes = []
+    plane_str = str(plane_str).strip()
+
+    for part in plane_str.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            planes.append(int(part))
+        except ValueError:
+            # Formato de intervalo "1-3"
+            if "-" in part:
+                try:
+                    start, end = part.split("-")
+                    planes.extend(range(int(start.strip()), int(end.strip()) + 1))
+                except (ValueError, IndexError):
+                    pass
+
+    return planes if planes else [0]
+
+
+def extract_plane_operations(raw_content: str) -> list[dict[str, Any]]:
+    """
+    Extrai operações de plano do código WLanguage.
+
+    Reconhece Plane(N[, controle]), PlaneEnable(N, bool), PlaneVisible(N)
+    e leitura/atribuição de ..Plane.
+
+    Returns:
+        Operações com tipo, posição e número do plano/controle
+    """
+    if not raw_content or not _PLANE_HINT.search(raw_content):
+        return []
+
+    operations = []
+    for pattern, op_type in _PLANE_OPERATION_PATTERNS:
+        for match in pattern.finditer(raw_content):
+            operation: dict[str, Any] = {
+                "type": op_type,
+                "line_position": match.start(),
+            }
+
+            if op_type == "plane_switch":
+                operation["plane_number"] = int(match.group(1))
+                if match.group(2):
+                    operation["target_control"] = match.group(2).strip()
+            elif op_type == "plane_enable":
+                operation["plane_number"] = int(match.group(1))
+                operation["enabled"] = match.group(2).lower() == "true"
+            elif op_type == "plane_read":
+                operation["control_name"] = match.group(1)
+            else:
+                operation["plane_number"] = int(match.group(1))
+
+            operations.append(operation)
+
+    return operations
+
+
+def infer_navigation_pattern(
+    planes: dict[int, list[str]], operations: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Infere o padrão de navegação a partir dos planos e operações.
+
+    - wizard: trocas de plano sequenciais (1->2->3)
+    - tabs: acesso direto a qualquer plano
+    - conditional: planos exibidos por lógica, sem navegação clara
+    - simple: até 2 planos (mostrar/ocultar)
+    """
+    num_planes = len(planes)
+
+    if num_planes <= 1:
+        return {
+            "pattern": "none",
+            "description": "No planes detected - single view",
+            "confidence": "high",
+        }
+
+    if num_planes == 2:
+        return {
+            "pattern": "simple",
+            "description": "Two planes - likely show/hide or toggle pattern",
+            "confidence": "medium",
+        }
+
+    # Trocas sequenciais (wizard)
+    plane_numbers = [op["plane_number"] for op in operations if op["type"] == "plane_switch"]
+    if len(plane_numbers) > 1 and all(
+        abs(plane_numbers[i] - plane_numbers[i + 1]) == 1
+        for i in range(len(plane_numbers) - 1)
+    ):
+        return {
+            "pattern": "wizard",
+            "description": f"Sequential navigation through {num_planes} steps",
+            "confidence": "high",
+            "step_count": num_planes,
+        }
+
+    # Acesso direto a vários planos (abas)
+    if len(plane_numbers) >= num_planes:
+        return {
+            "pattern": "tabs",
+            "description": f"Tab-like navigation with {num_planes} views",
+            "confidence": "medium",
+            "tab_count": num_planes,
+        }
+
+    return {
+        "pattern": "conditional",
+        "description": f"Conditional visibility with {num_planes} planes",
+        "confidence": "low",
+    }
+
+
+def build_element_planes(controls: Iterable[Control], raw_content: str) -> ElementPlanes:
+    """
+    Calcula a análise de planos de um elemento.
+
+    Args:
+        controls: Controles do elemento (na ordem de definição)
+        raw_content: Código bruto do elemento
+
+    Returns:
+        ElementPlanes pronto para ser salvo em Element.planes
+    """
+    grouped: dict[int, list[PlaneControl]] = defaultdict(list)
+    total_controls = 0
+
+    for ctrl in controls:
+        total_controls += 1
+        plane_value = ctrl.properties.plane if ctrl.properties else None
+        entry = PlaneControl(
+            name=ctrl.name,
+            type_code=ctrl.type_code,
+            full_path=ctrl.full_path or "",
+            depth=ctrl.depth or 0,
+            has_code=ctrl.has_code,
+        )
+        for plane_num in parse_plane_value(plane_value):
+            grouped[plane_num].append(entry)
+
+    operations = extract_plane_operations(raw_content)
+    plane_names = {num: [c.name for c in ctrls] for num, ctrls in grouped.items()}
+
+    return ElementPlanes(
+        planes=[
+            ElementPlane(number=num, controls=grouped[num]) for num in sorted(grouped)
+        ],
+        operations=operations,
+        navigation_pattern=infer_navigation_pattern(plane_names, operations),
+        total_controls=total_controls,
+    )
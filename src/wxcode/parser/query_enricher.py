@@ -4,6 +4,7 @@ Query Enricher para projetos WebDev.
 Enriquece elementos do tipo query com SQL extraído do PDF de documentação.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -90,8 +91,8 @@ class QueryEnricher:
             return
 
         try:
-            # Parseia SQL do PDF
-            query_info = self.parser.parse(pdf_path)
+            # Parseia SQL do PDF (fora do event loop)
+            query_info = await asyncio.to_thread(self.parser.parse, pdf_path)
 
             # Atualiza elemento
             if query_info.has_sql:
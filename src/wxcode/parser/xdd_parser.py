@@ -2,12 +2,16 @@
 Parser para arquivos .xdd (Analysis WinDev).
 
 Extrai schema de banco de dados a partir do formato XML nativo WinDev.
+O arquivo é lido em streaming (iterparse): tabelas são emitidas à medida
+que são lidas e os nós já processados são descartados.
 """
 
+import codecs
+import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from wxcode.models.schema import (
     SchemaConnection,
@@ -52,6 +56,17 @@ CONNECTION_TYPE_MAP: dict[int, tuple[str, str, str]] = {
     7: ("odbc", "ODBC", ""),
 }
 
+# Encoding dos arquivos WinDev quando o prólogo XML não declara nenhum
+DEFAULT_ENCODING = "iso-8859-1"
+
+# Bytes lidos do início do arquivo para encontrar o prólogo
+PROLOG_SIZE = 1024
+
+# Tabelas por lote em iter_table_batches
+TABLE_BATCH_SIZE = 500
+
+_ENCODING_RE = re.compile(rb"""<\?xml[^>]*?encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+
 
 @dataclass
 class XddParseResult:
@@ -104,134 +119,172 @@ class XddParser:
             XddParseResult com conexões, tabelas e estatísticas.
         """
         result = XddParseResult()
+        result.tables.extend(self.iter_tables(result))
+        return result
 
-        # Parse XML (arquivo pode estar em ISO-8859-1)
-        tree = self._parse_xml()
-        root = tree.getroot()
+    def iter_tables(self, result: Optional[XddParseResult] = None) -> Iterator[SchemaTable]:
+        """
+        Emite as tabelas (FICHIER) à medida que são lidas do arquivo.
+
+        Versão, conexões, total de colunas e warnings são acumulados em
+        `result` durante a leitura; `result.tables` não é preenchido.
 
-        # Extrai versão da Analysis
-        gen_num = root.get("GenNum")
-        if gen_num:
-            result.version = int(gen_num)
+        Args:
+            result: Resultado para metadados (opcional)
 
-        # Extrai conexões
-        result.connections = self._parse_connections(root)
+        Yields:
+            SchemaTable de cada FICHIER, na ordem do arquivo
+        """
+        if result is None:
+            result = XddParseResult()
+
+        parser = ET.XMLParser(encoding=self.detect_encoding())
+        events = ET.iterparse(self.xdd_path, events=("start", "end"), parser=parser)
+        root: Optional[ET.Element] = None
+        depth = 0
+
+        for event, elem in events:
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = elem
+                    gen_num = elem.get("GenNum")
+                    if gen_num:
+                        result.version = int(gen_num)
+                continue
 
-        # Extrai tabelas
-        result.tables = self._parse_tables(root, result)
+            depth -= 1
+            if depth != 1:
+                continue
 
-        # Calcula total de colunas
-        result.total_columns = sum(len(t.columns) for t in result.tables)
+            # Filho direto da raiz completo: processar e descartar a subárvore
+            table = None
+            if elem.tag == "CONNEXION":
+                result.connections.append(self._parse_connection(elem))
+            elif elem.tag == "FICHIER":
+                table = self._parse_table(elem, result)
+                result.total_columns += len(table.columns)
+            elem.clear()
+            root.remove(elem)
+
+            if table is not None:
+                yield table
+
+    def iter_table_batches(
+        self,
+        batch_size: int = TABLE_BATCH_SIZE,
+        result: Optional[XddParseResult] = None,
+    ) -> Iterator[list[SchemaTable]]:
+        """
+        Emite as tabelas em lotes, para persistência incremental.
 
-        return result
+        Args:
+            batch_size: Número máximo de tabelas por lote
+            result: Resultado para metadados (opcional)
 
-    def _parse_xml(self) -> ET.ElementTree:
+        Yields:
+            Listas de até batch_size tabelas
         """
-        Parseia o arquivo XML com tratamento de encoding.
+        batch: list[SchemaTable] = []
+        for table in self.iter_tables(result):
+            batch.append(table)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def detect_encoding(self) -> str:
+        """
+        Detecta o encoding pelo prólogo XML (lido uma única vez).
 
         Returns:
-            ElementTree parseado
+            Encoding declarado, "utf-8" com BOM ou DEFAULT_ENCODING
         """
-        # Tenta ler como ISO-8859-1 (encoding comum em arquivos WinDev)
-        try:
-            with open(self.xdd_path, "r", encoding="iso-8859-1") as f:
-                content = f.read()
-            return ET.ElementTree(ET.fromstring(content))
-        except ET.ParseError:
-            # Fallback para UTF-8
-            with open(self.xdd_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            return ET.ElementTree(ET.fromstring(content))
-
-    def _parse_connections(self, root: ET.Element) -> list[SchemaConnection]:
+        with open(self.xdd_path, "rb") as f:
+            head = f.read(PROLOG_SIZE)
+        if head.startswith(codecs.BOM_UTF8):
+            return "utf-8"
+        match = _ENCODING_RE.search(head)
+        if match:
+            return match.group(1).decode("ascii")
+        return DEFAULT_ENCODING
+
+    def _parse_connection(self, conn_elem: ET.Element) -> SchemaConnection:
         """
-        Extrai conexões (CONNEXION) do XML.
+        Extrai uma conexão (CONNEXION).
 
         Args:
-            root: Elemento raiz do XML
+            conn_elem: Elemento CONNEXION
 
         Returns:
-            Lista de SchemaConnection
+            SchemaConnection
         """
-        connections = []
-
-        for conn_elem in root.findall("CONNEXION"):
-            name = conn_elem.get("Nom", "")
-            type_code = int(conn_elem.get("Type", "0"))
-
-            # Mapeia tipo de conexão
-            database_type, driver_name, default_port = self._map_connection_type(type_code)
-
-            source_elem = conn_elem.find("SOURCE")
-            db_elem = conn_elem.find("DB")
-            user_elem = conn_elem.find("USER")
-            extended_info_elem = conn_elem.find("INFOS_ETENDUES")
-
-            # Extrai informações estendidas
-            extended_info = extended_info_elem.text if extended_info_elem is not None else ""
-
-            # Tenta extrair porta de INFOS_ETENDUES ou usa porta padrão
-            port = self._extract_port_from_extended_info(extended_info) or default_port
-
-            connection = SchemaConnection(
-                name=name,
-                type_code=type_code,
-                database_type=database_type,
-                driver_name=driver_name,
-                source=source_elem.text if source_elem is not None else "",
-                port=port,
-                database=db_elem.text if db_elem is not None else "",
-                user=user_elem.text if user_elem is not None else None,
-                extended_info=extended_info,
-            )
-            connections.append(connection)
-
-            # Warning para tipos desconhecidos
-            if database_type == "unknown":
-                warning = f"Tipo de conexão desconhecido: {type_code} para conexão '{name}'"
-                if warning not in connections:  # Avoid duplicate warnings in result
-                    print(f"Warning: {warning}")
-
-        return connections
-
-    def _parse_tables(
-        self, root: ET.Element, result: XddParseResult
-    ) -> list[SchemaTable]:
+        name = conn_elem.get("Nom", "")
+        type_code = int(conn_elem.get("Type", "0"))
+
+        # Mapeia tipo de conexão
+        database_type, driver_name, default_port = self._map_connection_type(type_code)
+
+        source_elem = conn_elem.find("SOURCE")
+        db_elem = conn_elem.find("DB")
+        user_elem = conn_elem.find("USER")
+        extended_info_elem = conn_elem.find("INFOS_ETENDUES")
+
+        # Extrai informações estendidas
+        extended_info = extended_info_elem.text if extended_info_elem is not None else ""
+
+        # Tenta extrair porta de INFOS_ETENDUES ou usa porta padrão
+        port = self._extract_port_from_extended_info(extended_info) or default_port
+
+        # Warning para tipos desconhecidos
+        if database_type == "unknown":
+            print(f"Warning: Tipo de conexão desconhecido: {type_code} para conexão '{name}'")
+
+        return SchemaConnection(
+            name=name,
+            type_code=type_code,
+            database_type=database_type,
+            driver_name=driver_name,
+            source=source_elem.text if source_elem is not None else "",
+            port=port,
+            database=db_elem.text if db_elem is not None else "",
+            user=user_elem.text if user_elem is not None else None,
+            extended_info=extended_info,
+        )
+
+    def _parse_table(
+        self, fichier_elem: ET.Element, result: XddParseResult
+    ) -> SchemaTable:
         """
-        Extrai tabelas (FICHIER) do XML.
+        Extrai uma tabela (FICHIER).
 
         Args:
-            root: Elemento raiz do XML
+            fichier_elem: Elemento FICHIER
             result: Resultado para adicionar warnings
 
         Returns:
-            Lista de SchemaTable
+            SchemaTable
         """
-        tables = []
-
-        for fichier_elem in root.findall("FICHIER"):
-            name = fichier_elem.get("Nom", "")
-            physical_name = fichier_elem.get("NomPhysique", name)
-            connection_name = fichier_elem.get("Connexion", "")
-            supports_null = fichier_elem.get("FicNullSupporte", "0") == "1"
-
-            # Extrai colunas
-            columns = self._parse_columns(fichier_elem, result)
-
-            # Infere índices das colunas
-            indexes = self._infer_indexes(name, columns)
-
-            table = SchemaTable(
-                name=name,
-                physical_name=physical_name,
-                connection_name=connection_name,
-                supports_null=supports_null,
-                columns=columns,
-                indexes=indexes,
-            )
-            tables.append(table)
-
-        return tables
+        name = fichier_elem.get("Nom", "")
+        physical_name = fichier_elem.get("NomPhysique", name)
+        connection_name = fichier_elem.get("Connexion", "")
+        supports_null = fichier_elem.get("FicNullSupporte", "0") == "1"
+
+        # Extrai colunas
+        columns = self._parse_columns(fichier_elem, result)
+
+        # Infere índices das colunas
+        indexes = self._infer_indexes(name, columns)
+
+        return SchemaTable(
+            name=name,
+            physical_name=physical_name,
+            connection_name=connection_name,
+            supports_null=supports_null,
+            columns=columns,
+            indexes=indexes,
+        )
 
     def _parse_columns(
         self, fichier_elem: ET.Element, result: XddParseResult
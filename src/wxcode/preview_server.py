@@ -14,6 +14,8 @@ from fastapi.templating import Jinja2Templates
 from pymongo import MongoClient
 import uvicorn
 
+from wxcode.generator.artifact_store import get_artifact_store
+
 
 # MongoDB connection
 MONGO_URI = "mongodb://localhost:27017"
@@ -44,10 +46,13 @@ def load_templates_from_mongo():
         "conversion.target_files": {"$exists": True}
     })
 
+    store = get_artifact_store()
     for element in cursor:
         for target_file in element.get("conversion", {}).get("target_files", []):
             file_path = target_file.get("path", "")
-            content = target_file.get("content", "")
+            content = target_file.get("content") or ""
+            if not content and target_file.get("content_hash"):
+                content = store.get_text(target_file["content_hash"]) or ""
 
             if "templates/" in file_path and content:
                 rel_path = file_path.split("templates/")[-1]
@@ -6,6 +6,9 @@ from wxcode.services.project_service import (
     purge_project,
     purge_project_by_name,
     check_duplicate_projects,
+    get_purge_job,
+    start_purge_job,
+    PurgeJob,
     PurgeStats,
 )
 from wxcode.services.conversion_executor import (
@@ -30,6 +33,9 @@ __all__ = [
     "purge_project",
     "purge_project_by_name",
     "check_duplicate_projects",
+    "get_purge_job",
+    "start_purge_job",
+    "PurgeJob",
     "PurgeStats",
     # Conversion
     "ConversionExecutor",
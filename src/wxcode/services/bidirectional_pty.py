@@ -7,7 +7,8 @@ with Claude Code CLI. It supports:
 - Bidirectional communication (read output, write user input)
 - Terminal resize (TIOCSWINSZ ioctl + SIGWINCH)
 - Process group management for clean termination
-- Async-safe operations via run_in_executor
+- Event-driven output pump (loop.add_reader) with chunk coalescing
+- Async-safe writes via run_in_executor
 
 The class extracts and enhances patterns from gsd_invoker.py's PTYProcess and PTYStdin
 inline classes.
@@ -36,7 +37,6 @@ import asyncio
 import fcntl
 import os
 import pty
-import select
 import signal
 import struct
 import subprocess
@@ -44,6 +44,18 @@ import termios
 from typing import AsyncIterator, Optional
 
 
+# Bytes requested per os.read() when the master fd becomes readable
+READ_CHUNK_SIZE = 64 * 1024
+
+# Upper bound for a coalesced chunk yielded by stream_output()
+COALESCE_LIMIT = 256 * 1024
+
+# Pending-output watermarks: stop reading the fd above HIGH (the kernel PTY
+# buffer then applies backpressure to the child) and resume below LOW
+PENDING_HIGH_WATER = 1024 * 1024
+PENDING_LOW_WATER = 256 * 1024
+
+
 class BidirectionalPTY:
     """
     Async PTY wrapper with bidirectional communication.
@@ -79,6 +91,8 @@ class BidirectionalPTY:
         self.pid: Optional[int] = None
         self._proc: Optional[subprocess.Popen] = None
         self._closed = False
+        self._reader_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._output_queue: Optional[asyncio.Queue] = None
 
     async def start(self) -> None:
         """
@@ -191,45 +205,86 @@ class BidirectionalPTY:
         """
         Async generator that yields PTY output chunks.
 
-        Uses select() to check for available data before reading,
-        preventing blocking. Continues until process exits or PTY is closed.
+        Registers the non-blocking master fd with loop.add_reader(), so reads
+        happen on the event loop as soon as data is available, without any
+        executor round trip. Chunks that pile up while the consumer is busy
+        (e.g. awaiting a WebSocket send) are coalesced into a single yield of
+        up to COALESCE_LIMIT bytes. Ends when the PTY reports EOF (process and
+        its children exited) or the PTY is closed.
 
         Yields:
             Bytes chunks of output from the PTY
         """
-        if self.master_fd is None:
+        if self.master_fd is None or self._closed:
             return
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        fd = self.master_fd
+        queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        pending = 0
+        paused = False
 
-        while not self._closed and self._proc and self._proc.poll() is None:
+        def on_readable() -> None:
+            nonlocal pending, paused
             try:
-                # Use select to check if data is available (non-blocking)
-                readable, _, _ = await loop.run_in_executor(
-                    None, lambda: select.select([self.master_fd], [], [], 0.1)
-                )
-                if readable:
-                    data = await self.read()
-                    if data:
-                        yield data
+                data = os.read(fd, READ_CHUNK_SIZE)
+            except BlockingIOError:
+                return
             except OSError:
-                break
+                # EIO once the slave side has been closed by every process
+                data = b""
+
+            if not data:
+                self._remove_reader()
+                queue.put_nowait(None)
+                return
+
+            queue.put_nowait(data)
+            pending += len(data)
+            if pending > PENDING_HIGH_WATER and not paused:
+                paused = True
+                loop.remove_reader(fd)
+
+        self._reader_loop = loop
+        self._output_queue = queue
+        loop.add_reader(fd, on_readable)
 
-        # Drain remaining data after process exits
         try:
             while True:
-                # Check if more data available
-                readable, _, _ = await loop.run_in_executor(
-                    None, lambda: select.select([self.master_fd], [], [], 0.1)
-                )
-                if not readable:
+                chunk = await queue.get()
+                if chunk is None:
                     break
-                data = await self.read()
-                if not data:
+
+                parts = [chunk]
+                size = len(chunk)
+                eof = False
+                while size < COALESCE_LIMIT and not queue.empty():
+                    extra = queue.get_nowait()
+                    if extra is None:
+                        eof = True
+                        break
+                    parts.append(extra)
+                    size += len(extra)
+
+                pending -= size
+                if paused and pending < PENDING_LOW_WATER and not eof and not self._closed:
+                    paused = False
+                    loop.add_reader(fd, on_readable)
+
+                yield chunk if len(parts) == 1 else b"".join(parts)
+
+                if eof:
                     break
-                yield data
-        except OSError:
-            pass
+        finally:
+            if self._output_queue is queue:
+                self._remove_reader()
+
+    def _remove_reader(self) -> None:
+        """Unregister the master fd from the event loop, if registered."""
+        if self._reader_loop is not None and self.master_fd is not None:
+            self._reader_loop.remove_reader(self.master_fd)
+        self._reader_loop = None
+        self._output_queue = None
 
     async def send_signal(self, sig: int) -> None:
         """
@@ -271,6 +326,12 @@ class BidirectionalPTY:
                 loop = asyncio.get_event_loop()
                 await loop.run_in_executor(None, self._proc.wait)
 
+        # Wake up any stream_output() consumer before the fd goes away
+        queue = self._output_queue
+        self._remove_reader()
+        if queue is not None:
+            queue.put_nowait(None)
+
         if self.master_fd is not None:
             try:
                 os.close(self.master_fd)
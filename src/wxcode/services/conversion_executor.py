@@ -14,8 +14,15 @@ from wxcode.llm_converter import (
     ProposalGenerator,
     ProposalOutput,
 )
+from wxcode.config import get_settings
+from wxcode.llm_converter.conversion_tracker import PendingItem
 from wxcode.llm_converter.providers import create_provider, LLMProvider
 from wxcode.models import Element
+from wxcode.services.conversion_scheduler import (
+    ConversionScheduler,
+    SchedulerReport,
+    next_supported_item,
+)
 
 
 class ConversionExecutionResult:
@@ -90,8 +97,8 @@ class ConversionExecutor:
         """
         Executa conversão do próximo elemento pendente no projeto.
 
-        Pula automaticamente items não suportados (classes, procedures)
-        marcando-os como 'skipped' e busca o próximo válido.
+        Items não suportados (classes, procedures) que precedem o próximo
+        elemento são marcados como 'skipped' em lote (um update por collection).
 
         Args:
             project_name: Nome do projeto
@@ -101,39 +108,27 @@ class ConversionExecutor:
             Resultado da execução
         """
         try:
-            skipped_count = 0
-
-            # Loop até encontrar um item suportado ou esgotar candidatos
-            while skipped_count < max_skips:
-                # Buscar próximo item pendente
-                item = await self.tracker.get_next_pending_item(project_name)
-
-                if not item:
-                    if skipped_count > 0:
-                        return ConversionExecutionResult(
-                            success=False,
-                            error=f"Nenhum elemento suportado encontrado (pulados: {skipped_count} classes/procedures)",
-                        )
+            item, skipped_count = await next_supported_item(
+                self.tracker, project_name, max_skips
+            )
+
+            if not item:
+                if skipped_count >= max_skips:
                     return ConversionExecutionResult(
                         success=False,
-                        error="Nenhum elemento pendente encontrado",
+                        error=f"Excedido limite de {max_skips} items não suportados para pular",
                     )
+                if skipped_count > 0:
+                    return ConversionExecutionResult(
+                        success=False,
+                        error=f"Nenhum elemento suportado encontrado (pulados: {skipped_count} classes/procedures)",
+                    )
+                return ConversionExecutionResult(
+                    success=False,
+                    error="Nenhum elemento pendente encontrado",
+                )
 
-                # Por enquanto só suporta pages (elements collection)
-                if item.collection != "elements":
-                    # Marcar como skipped e buscar próximo
-                    await self._mark_item_skipped(item)
-                    skipped_count += 1
-                    continue
-
-                # Encontrou elemento suportado, executar conversão
-                return await self.execute_element(str(item.id), item.name)
-
-            # Excedeu limite de skips
-            return ConversionExecutionResult(
-                success=False,
-                error=f"Excedido limite de {max_skips} items não suportados para pular",
-            )
+            return await self.execute_element(str(item.id), item.name)
 
         except Exception as e:
             return ConversionExecutionResult(
@@ -141,6 +136,42 @@ class ConversionExecutor:
                 error=f"Erro ao executar conversão: {str(e)}",
             )
 
+    async def execute_pending(
+        self,
+        project_name: str,
+        max_items: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> SchedulerReport:
+        """
+        Converte em paralelo todos os elementos pendentes do projeto.
+
+        Classes e procedures pendentes são marcadas como 'skipped' em lote.
+        Cada elemento é despachado assim que suas dependências pendentes
+        tiverem proposal gerada, respeitando o limite do provider.
+
+        Args:
+            project_name: Nome do projeto
+            max_items: Máximo de elementos convertidos (None = todos)
+            max_workers: Conversões simultâneas (padrão: settings)
+
+        Returns:
+            SchedulerReport; `results` mapeia nome -> ConversionExecutionResult
+        """
+        settings = get_settings()
+
+        async def worker(item: PendingItem) -> tuple[bool, ConversionExecutionResult]:
+            result = await self.execute_element(str(item.id), item.name)
+            return result.success, result
+
+        # O provider já aplica o limitador em cada chamada ao LLM; limitar
+        # também aqui ocuparia o mesmo semáforo duas vezes por item
+        scheduler = ConversionScheduler(
+            self.tracker,
+            worker,
+            max_workers=max_workers or settings.conversion_max_workers,
+        )
+        return await scheduler.run(project_name, max_items=max_items)
+
     async def execute_element(
         self, element_id: str, element_name: Optional[str] = None
     ) -> ConversionExecutionResult:
@@ -196,39 +227,6 @@ class ConversionExecutor:
                 error=f"Erro ao executar conversão: {str(e)}",
             )
 
-    async def _mark_item_skipped(self, item) -> None:
-        """
-        Marca um item como 'skipped' no MongoDB.
-
-        Args:
-            item: PendingItem a ser marcado
-        """
-        from wxcode.llm_converter.conversion_tracker import PendingItem
-
-        collection_map = {
-            "elements": self.db.elements,
-            "procedures": self.db.procedures,
-            "class_definitions": self.db.class_definitions,
-        }
-
-        collection = collection_map.get(item.collection)
-        if not collection:
-            return
-
-        # Atualizar status para 'skipped'
-        if item.collection == "elements":
-            # Elements usa DBRef para project_id
-            await collection.update_one(
-                {"_id": item.id},
-                {"$set": {"conversion.status": "skipped"}},
-            )
-        else:
-            # Outras collections usam ObjectId direto
-            await collection.update_one(
-                {"_id": item.id},
-                {"$set": {"conversion.status": "skipped"}},
-            )
-
     async def get_stats(self, project_name: str) -> dict:
         """
         Retorna estatísticas de conversão do projeto.
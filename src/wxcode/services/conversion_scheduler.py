@@ -0,0 +1,244 @@
+"""
+Scheduler paralelo de conversões guiado pelo grafo de dependências.
+
+Carrega a fronteira de items pendentes uma única vez, pula em lote os tipos
+não suportados e despacha para um pool limitado de workers todo elemento
+cujas dependências pendentes já foram convertidas. As chamadas ao LLM são
+limitadas por provider (concorrência e tokens por minuto).
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from wxcode.llm_converter.conversion_tracker import ConversionTracker, PendingItem
+from wxcode.llm_converter.providers.limiter import (  # noqa: F401 - reexport
+    ProviderRateLimiter,
+    get_provider_limiter,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tokens fixos por chamada (prompt de sistema + specs de dependências)
+BASE_TOKENS_PER_ITEM = 2000
+
+# Worker de conversão: recebe o item e retorna (sucesso, resultado)
+ConversionWorker = Callable[[PendingItem], Awaitable[tuple[bool, Any]]]
+
+
+def estimate_item_tokens(item: PendingItem) -> int:
+    """Estima tokens de uma conversão a partir do tamanho do conteúdo."""
+    return BASE_TOKENS_PER_ITEM + int(item.doc.get("raw_content_chars") or 0) // 4
+
+
+@dataclass
+class SchedulerReport:
+    """Resultado de uma execução do scheduler."""
+
+    converted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    skipped: int = 0
+    blocked: list[str] = field(default_factory=list)
+    results: dict[str, Any] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def dispatched(self) -> int:
+        return len(self.converted) + len(self.failed)
+
+
+class ConversionScheduler:
+    """
+    Executa conversões em paralelo respeitando dependências.
+
+    Um item fica pronto quando todas as suas dependências que ainda estão
+    na fronteira pendente foram convertidas com sucesso. Dependências fora
+    da fronteira (já convertidas, puladas ou externas) não bloqueiam. Se
+    um ciclo impedir qualquer progresso, o item de menor ordem topológica
+    é liberado para manter a ordem do tracker.
+
+    Items dependentes de uma conversão que falhou são reportados como
+    bloqueados e permanecem pendentes.
+    """
+
+    def __init__(
+        self,
+        tracker: ConversionTracker,
+        worker: ConversionWorker,
+        limiter: Optional[ProviderRateLimiter] = None,
+        max_workers: int = 4,
+        supported_collections: tuple[str, ...] = ("elements",),
+        estimate_tokens: Callable[[PendingItem], int] = estimate_item_tokens,
+    ):
+        """
+        Inicializa o scheduler.
+
+        Args:
+            tracker: ConversionTracker do projeto
+            worker: Coroutine que converte um item e retorna (sucesso, resultado)
+            limiter: Limitador do provider LLM (opcional; dispensável quando o
+                worker chama um BaseLLMProvider, que já aplica o limitador)
+            max_workers: Conversões simultâneas
+            supported_collections: Collections convertidas; as demais são puladas
+            estimate_tokens: Estimativa de tokens por item (para o limitador)
+        """
+        self.tracker = tracker
+        self.worker = worker
+        self.limiter = limiter
+        self.max_workers = max(1, max_workers)
+        self.supported_collections = supported_collections
+        self.estimate_tokens = estimate_tokens
+
+    async def run(
+        self,
+        project_name: str,
+        max_items: Optional[int] = None,
+        on_result: Optional[Callable[[PendingItem, bool, Any], None]] = None,
+    ) -> SchedulerReport:
+        """
+        Converte os items pendentes do projeto.
+
+        Args:
+            project_name: Nome do projeto
+            max_items: Máximo de conversões despachadas (None = todas)
+            on_result: Callback chamado ao término de cada conversão
+
+        Returns:
+            SchedulerReport com convertidos, falhas, pulados e bloqueados
+        """
+        started = time.monotonic()
+        report = SchedulerReport()
+
+        frontier = await self.tracker.get_pending_frontier(project_name)
+        unsupported = [i for i in frontier if i.collection not in self.supported_collections]
+        if unsupported:
+            report.skipped = await self.tracker.mark_items_status(unsupported, "skipped")
+
+        items = [i for i in frontier if i.collection in self.supported_collections]
+        order = {item.name: index for index, item in enumerate(items)}
+        by_name = {item.name: item for item in items}
+
+        # Arestas apenas entre items pendentes
+        waiting_on: dict[str, set[str]] = {}
+        dependents: dict[str, list[str]] = {}
+        for item in items:
+            deps = {d for d in item.uses if d in by_name and d != item.name}
+            waiting_on[item.name] = deps
+            for dep in deps:
+                dependents.setdefault(dep, []).append(item.name)
+
+        ready: list[tuple[int, str]] = [
+            (order[name], name) for name, deps in waiting_on.items() if not deps
+        ]
+        heapq.heapify(ready)
+        queued = {name for _, name in ready}
+        blocked: set[str] = set()
+        running: dict[asyncio.Task, str] = {}
+        budget = max_items if max_items is not None else len(items)
+
+        def release(name: str) -> None:
+            for dependent in dependents.get(name, []):
+                deps = waiting_on[dependent]
+                deps.discard(name)
+                if not deps and dependent not in queued and dependent not in blocked:
+                    queued.add(dependent)
+                    heapq.heappush(ready, (order[dependent], dependent))
+
+        def block_dependents(name: str) -> None:
+            stack = list(dependents.get(name, []))
+            while stack:
+                dependent = stack.pop()
+                if dependent in blocked or dependent in queued:
+                    continue
+                blocked.add(dependent)
+                stack.extend(dependents.get(dependent, []))
+
+        while True:
+            while (
+                ready
+                and len(running) < self.max_workers
+                and report.dispatched + len(running) < budget
+            ):
+                _, name = heapq.heappop(ready)
+                task = asyncio.create_task(self._convert(by_name[name]))
+                running[task] = name
+
+            if not running:
+                if report.dispatched >= budget:
+                    break
+                # Ciclo entre pendentes: libera o de menor ordem ainda não despachado
+                remaining = [n for n in waiting_on if n not in queued and n not in blocked]
+                if not remaining:
+                    break
+                name = min(remaining, key=order.__getitem__)
+                waiting_on[name] = set()
+                queued.add(name)
+                heapq.heappush(ready, (order[name], name))
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                success, result = task.result()
+                report.results[name] = result
+                if success:
+                    report.converted.append(name)
+                    release(name)
+                else:
+                    report.failed[name] = str(getattr(result, "error", result))
+                    block_dependents(name)
+                if on_result:
+                    on_result(by_name[name], success, result)
+
+        report.blocked = sorted(blocked, key=order.__getitem__)
+        report.elapsed_seconds = time.monotonic() - started
+        return report
+
+    async def _convert(self, item: PendingItem) -> tuple[bool, Any]:
+        try:
+            if self.limiter:
+                async with self.limiter.slot(self.estimate_tokens(item)):
+                    return await self.worker(item)
+            return await self.worker(item)
+        except Exception as e:
+            logger.exception(f"Conversão de {item.name} falhou")
+            return False, e
+
+
+async def next_supported_item(
+    tracker: ConversionTracker,
+    project_name: str,
+    max_skips: int = 100,
+    supported_collections: tuple[str, ...] = ("elements",),
+) -> tuple[Optional[PendingItem], int]:
+    """
+    Busca o próximo item suportado, pulando em lote os não suportados.
+
+    Os items não suportados que o precedem na ordem topológica (até
+    `max_skips`) são marcados como 'skipped' com um update por collection.
+    Só os primeiros max_skips + 1 items da fronteira são carregados.
+
+    Returns:
+        Tupla (item ou None, quantidade pulada). Item None com quantidade
+        igual a max_skips indica que o limite foi excedido.
+    """
+    frontier = await tracker.get_pending_frontier(
+        project_name, limit=max_skips + 1, include_content_size=False
+    )
+
+    to_skip: list[PendingItem] = []
+    found: Optional[PendingItem] = None
+    for item in frontier:
+        if item.collection in supported_collections:
+            found = item
+            break
+        if len(to_skip) >= max_skips:
+            break
+        to_skip.append(item)
+
+    if to_skip:
+        await tracker.mark_items_status(to_skip, "skipped")
+    return found, len(to_skip)
@@ -28,7 +28,7 @@ from wxcode.models.control_type import ControlTypeDefinition
 from wxcode.models.element import Element
 from wxcode.models.procedure import Procedure
 from wxcode.models.project import Project
-from wxcode.models.schema import DatabaseSchema
+from wxcode.models.schema import DatabaseSchema, SchemaTable, get_schema_tables
 
 console = Console()
 
@@ -45,7 +45,7 @@ class GSDContextData:
     local_procedures: list[Procedure]
     dependencies: dict[str, Any]
     related_elements: list[Element]
-    bound_tables: list[DatabaseSchema]
+    bound_tables: list[SchemaTable]
     project: Project
     stats: dict[str, Any]
     neo4j_available: bool = True
@@ -140,7 +140,7 @@ class GSDContextCollector:
         related_elements = await self._fetch_related_elements(element)
 
         # 7. Fetch Bound Tables
-        bound_tables = await self._fetch_bound_tables(element)
+        bound_tables = await self._fetch_bound_tables(element, project.id)
 
         # 8. Calculate Stats
         stats = self._calculate_stats(element, controls, local_procedures)
@@ -314,17 +314,19 @@ class GSDContextCollector:
         related = await Element.find({"source_name": {"$in": uses}}).to_list()
         return related
 
-    async def _fetch_bound_tables(self, element: Element) -> list[DatabaseSchema]:
+    async def _fetch_bound_tables(
+        self, element: Element, project_id: PydanticObjectId
+    ) -> list[SchemaTable]:
         """
-        Busca tabelas vinculadas ao elemento.
+        Busca tabelas vinculadas ao elemento (apenas as do projeto).
         """
         if not element.dependencies or not element.dependencies.bound_tables:
             return []
 
-        tables = await DatabaseSchema.find(
-            {"table_name": {"$in": element.dependencies.bound_tables}}
-        ).to_list()
-        return tables
+        schema = await DatabaseSchema.find_one(DatabaseSchema.project_id == project_id)
+        if not schema:
+            return []
+        return await get_schema_tables(schema, element.dependencies.bound_tables)
 
     def _calculate_stats(
         self, element: Element, controls: list[Control], local_procedures: list[Procedure]
@@ -435,10 +437,11 @@ class GSDContextWriter:
         self._write_json(path, data)
         return path
 
-    def _write_schema(self, tables: list[DatabaseSchema]) -> Path:
+    def _write_schema(self, tables: list[SchemaTable]) -> Path:
         """Escreve schema.json"""
         path = self.output_dir / "schema.json"
-        data = [t.model_dump(mode="json") for t in tables]
+        fields = set(SchemaTable.model_fields)
+        data = [t.model_dump(mode="json", include=fields) for t in tables]
         self._write_json(path, data)
         return path
 
@@ -11,6 +11,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from wxcode.models import Element
 from wxcode.llm_converter import ConversionTracker
+from wxcode.services.conversion_scheduler import next_supported_item
 from wxcode.services.gsd_context_collector import (
     GSDContextCollector,
     GSDContextWriter,
@@ -81,8 +82,9 @@ class GSDConversionExecutor:
         """
         Executa conversão do próximo elemento pendente via gsd-context.
 
-        Pula automaticamente items não suportados (classes, procedures)
-        marcando-os como 'skipped' e busca o próximo válido (page).
+        Items não suportados (classes, procedures) que precedem o próximo
+        page são marcados como 'skipped' em lote. A execução é sequencial
+        porque cada elemento cria/usa uma branch git no mesmo repositório.
 
         Args:
             project_name: Nome do projeto
@@ -92,43 +94,32 @@ class GSDConversionExecutor:
             Resultado da execução
         """
         try:
-            skipped_count = 0
-
-            # Loop até encontrar um item suportado ou esgotar candidatos
-            while skipped_count < max_skips:
-                # Buscar próximo item pendente
-                item = await self.tracker.get_next_pending_item(project_name)
-
-                if not item:
-                    if skipped_count > 0:
-                        return GSDConversionResult(
-                            success=False,
-                            error=f"Nenhum elemento suportado encontrado (pulados: {skipped_count} classes/procedures)",
-                            skipped_count=skipped_count,
-                        )
+            item, skipped_count = await next_supported_item(
+                self.tracker, project_name, max_skips
+            )
+
+            if not item:
+                if skipped_count >= max_skips:
                     return GSDConversionResult(
                         success=False,
-                        error="Nenhum elemento pendente encontrado",
-                        skipped_count=0,
+                        error=f"Excedido limite de {max_skips} items não suportados para pular",
+                        skipped_count=skipped_count,
                     )
-
-                # Por enquanto só suporta pages (elements collection)
-                if item.collection != "elements":
-                    # Marcar como skipped e buscar próximo
-                    await self._mark_item_skipped(item)
-                    skipped_count += 1
-                    continue
-
-                # Encontrou elemento suportado, executar via gsd-context
-                return await self.execute_element(
-                    item.name, project_name, skipped_count
+                if skipped_count > 0:
+                    return GSDConversionResult(
+                        success=False,
+                        error=f"Nenhum elemento suportado encontrado (pulados: {skipped_count} classes/procedures)",
+                        skipped_count=skipped_count,
+                    )
+                return GSDConversionResult(
+                    success=False,
+                    error="Nenhum elemento pendente encontrado",
+                    skipped_count=0,
                 )
 
-            # Excedeu limite de skips
-            return GSDConversionResult(
-                success=False,
-                error=f"Excedido limite de {max_skips} items não suportados para pular",
-                skipped_count=skipped_count,
+            # Encontrou elemento suportado, executar via gsd-context
+            return await self.execute_element(
+                item.name, project_name, skipped_count
             )
 
         except Exception as e:
@@ -232,37 +223,6 @@ class GSDConversionExecutor:
                 skipped_count=skipped_count,
             )
 
-    async def _mark_item_skipped(self, item) -> None:
-        """
-        Marca um item como 'skipped' no MongoDB.
-
-        Args:
-            item: PendingItem a ser marcado
-        """
-        collection_map = {
-            "elements": self.db.elements,
-            "procedures": self.db.procedures,
-            "class_definitions": self.db.class_definitions,
-        }
-
-        collection = collection_map.get(item.collection)
-        if not collection:
-            return
-
-        # Atualizar status para 'skipped'
-        if item.collection == "elements":
-            # Elements usa DBRef para project_id
-            await collection.update_one(
-                {"_id": item.id},
-                {"$set": {"conversion.status": "skipped"}},
-            )
-        else:
-            # Outras collections usam ObjectId direto
-            await collection.update_one(
-                {"_id": item.id},
-                {"$set": {"conversion.status": "skipped"}},
-            )
-
     async def get_stats(self, project_name: str) -> dict:
         """
         Retorna estatísticas de conversão do projeto.
@@ -0,0 +1,913 @@
+"""
+Pipeline de importação executado no próprio processo.
+
+Cada etapa do wizard vira um pequeno DAG de tarefas que compartilham a
+conexão Beanie da aplicação: tarefas independentes (parse de schema,
+procedures e classes; split de cada PDF) rodam em paralelo e o progresso
+é emitido como eventos estruturados, sem subprocessos nem parsing de stdout.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from beanie import PydanticObjectId
+
+from wxcode.models.import_session import ImportSession
+
+logger = logging.getLogger(__name__)
+
+# Limite de processos para split de PDFs (PyMuPDF não é thread-safe)
+MAX_PDF_WORKERS = 4
+
+# Diretório padrão de PDFs splitados quando a sessão não tem PDFs (igual ao CLI)
+DEFAULT_PDF_DOCS_DIR = Path("./output/pdf_docs")
+
+# Emissor de eventos (recebe o evento já no formato do WebSocket)
+EventSink = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class PipelineError(Exception):
+    """Falha de uma tarefa do pipeline de importação."""
+
+    pass
+
+
+class PipelineReporter:
+    """
+    Emite eventos de log, progresso e métricas de uma etapa.
+
+    Os métodos são síncronos para poderem ser chamados de callbacks dos
+    parsers; os eventos entram em uma fila e um único consumidor os envia
+    em ordem, serializando o acesso ao WebSocket entre tarefas paralelas.
+    O progresso da etapa é a soma do progresso das tarefas.
+    """
+
+    def __init__(self, step: int, sink: EventSink):
+        self.step = step
+        self.sink = sink
+        self.log_lines = 0
+        self._queue: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
+        self._progress: dict[str, tuple[int, int]] = {}
+        self._sender: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Inicia o consumidor da fila de eventos."""
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._drain())
+
+    async def close(self) -> None:
+        """Envia os eventos pendentes e encerra o consumidor."""
+        if self._sender is None:
+            return
+        self._queue.put_nowait(None)
+        await self._sender
+        self._sender = None
+
+    async def _drain(self) -> None:
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                return
+            try:
+                await self.sink(event)
+            except Exception as e:  # WebSocket fechado não interrompe a etapa
+                logger.debug(f"Falha ao enviar evento do pipeline: {e}")
+
+    def log(self, level: str, message: str, task: Optional[str] = None) -> None:
+        """Emite uma linha de log."""
+        self.log_lines += 1
+        self._queue.put_nowait({
+            "type": "log",
+            "log": {
+                "level": level,
+                "message": message,
+                "timestamp": datetime.utcnow().isoformat(),
+                "task": task,
+            },
+        })
+
+    def progress(self, task: str, current: int, total: int) -> None:
+        """Atualiza o progresso de uma tarefa e emite o agregado da etapa."""
+        self._progress[task] = (current, total)
+        done = sum(c for c, _ in self._progress.values())
+        expected = sum(t for _, t in self._progress.values())
+        percent = round(done / expected * 100, 1) if expected else 0.0
+        self._queue.put_nowait({
+            "type": "progress",
+            "progress": {
+                "step": self.step,
+                "current": done,
+                "total": expected,
+                "percent": percent,
+                "task": task,
+            },
+        })
+
+    def metrics(self, data: dict[str, Any]) -> None:
+        """Emite métricas parciais da etapa."""
+        self._queue.put_nowait({
+            "type": "metrics",
+            "metrics": {"step": self.step, "data": data},
+        })
+
+
+@dataclass
+class PipelineContext:
+    """Estado compartilhado pelas tarefas de uma sessão de importação."""
+
+    project_path: Path
+    project_name: str
+    pdf_dir: Optional[Path] = None
+    workspace_id: Optional[str] = None
+    workspace_path: Optional[str] = None
+    executor: Optional[Executor] = None
+    pdf_manifests: list[dict[str, Any]] = field(default_factory=list)
+    _project: Any = field(default=None, repr=False)
+    _known_elements: Optional[dict[str, str]] = field(default=None, repr=False)
+    _owns_executor: bool = field(default=False, repr=False)
+    _elements_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @classmethod
+    def from_session(cls, session: ImportSession) -> "PipelineContext":
+        """Cria o contexto a partir de uma sessão do wizard."""
+        project_path = Path(session.project_path)
+        if session.workspace_id:
+            project_name = f"{project_path.stem}_{session.workspace_id}"
+        else:
+            project_name = project_path.stem
+        return cls(
+            project_path=project_path,
+            project_name=project_name,
+            pdf_dir=Path(session.pdf_docs_path) if session.pdf_docs_path else None,
+            workspace_id=session.workspace_id,
+            workspace_path=session.workspace_path,
+        )
+
+    @property
+    def project_dir(self) -> Path:
+        """Diretório do projeto (sem o arquivo .wwp)."""
+        return self.project_path.parent
+
+    @property
+    def pdf_files(self) -> list[Path]:
+        """PDFs enviados na sessão."""
+        if self.pdf_dir is None or not self.pdf_dir.exists():
+            return []
+        return sorted(self.pdf_dir.glob("*.pdf"))
+
+    @property
+    def split_dir(self) -> Path:
+        """Diretório com os PDFs splitados usado pelo enrich."""
+        if self.pdf_dir is None or not self.pdf_dir.exists():
+            return DEFAULT_PDF_DOCS_DIR
+        return self.pdf_dir / "split"
+
+    async def get_project(self):
+        """Retorna o Project importado (buscado uma única vez)."""
+        if self._project is None:
+            from wxcode.models import Project
+
+            self._project = await Project.find_one(Project.name == self.project_name)
+            if self._project is None:
+                raise PipelineError(
+                    f"Projeto '{self.project_name}' não encontrado no MongoDB"
+                )
+        return self._project
+
+    async def get_known_elements(self) -> dict[str, str]:
+        """Nomes dos elementos do projeto {nome: source_type} para o splitter."""
+        if self._known_elements is not None:
+            return self._known_elements
+        project = await self.get_project()
+        # Splits paralelos compartilham uma única consulta
+        async with self._elements_lock:
+            if self._known_elements is None:
+                from wxcode.models import Element
+
+                elements = await Element.find({"project_id.$id": project.id}).to_list()
+                self._known_elements = {
+                    elem.source_name: elem.source_type.value
+                    for elem in elements
+                    if elem.source_name
+                }
+        return self._known_elements
+
+    def get_executor(self) -> Executor:
+        """Pool de processos para trabalho CPU-bound (criado sob demanda)."""
+        if self.executor is None:
+            workers = max(1, min(len(self.pdf_files), os.cpu_count() or 1, MAX_PDF_WORKERS))
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            self._owns_executor = True
+        return self.executor
+
+    def close(self) -> None:
+        """Libera o pool de processos criado pelo contexto."""
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            self._owns_executor = False
+
+
+# Tarefa: recebe contexto e reporter, retorna métricas
+TaskFn = Callable[[PipelineContext, PipelineReporter], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class PipelineTask:
+    """Nó do DAG de uma etapa."""
+
+    name: str
+    run: TaskFn
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class PipelineResult:
+    """Resultado da execução de um DAG de tarefas."""
+
+    metrics: dict[str, Any] = field(default_factory=dict)
+    completed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    not_run: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.not_run
+
+    @property
+    def error_message(self) -> Optional[str]:
+        if self.failed:
+            return "; ".join(f"{name}: {error}" for name, error in self.failed.items())
+        if self.not_run:
+            return f"Tarefas não executadas: {', '.join(self.not_run)}"
+        return None
+
+
+async def run_tasks(
+    tasks: list[PipelineTask],
+    context: PipelineContext,
+    reporter: PipelineReporter,
+) -> PipelineResult:
+    """
+    Executa um DAG de tarefas com máximo paralelismo.
+
+    Uma tarefa inicia assim que todas as suas dependências terminam com
+    sucesso. Após a primeira falha nenhuma tarefa nova é iniciada, mas as
+    que já estão rodando terminam (cada uma regrava seus dados de forma
+    idempotente). Métricas numéricas repetidas entre tarefas são somadas.
+
+    Args:
+        tasks: Tarefas da etapa
+        context: Contexto compartilhado
+        reporter: Emissor de eventos
+
+    Returns:
+        PipelineResult com métricas e tarefas concluídas/falhas
+    """
+    by_name = {task.name: task for task in tasks}
+    for task in tasks:
+        missing = [dep for dep in task.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"Tarefa '{task.name}' depende de tarefas inexistentes: {missing}")
+
+    result = PipelineResult()
+    pending = dict(by_name)
+    running: dict[asyncio.Task, str] = {}
+
+    async def _run(task: PipelineTask) -> dict[str, Any]:
+        reporter.log("info", f"Executando: {task.name}", task=task.name)
+        return await task.run(context, reporter)
+
+    try:
+        while pending or running:
+            if not result.failed:
+                done_names = set(result.completed)
+                ready = [
+                    task for task in pending.values()
+                    if all(dep in done_names for dep in task.depends_on)
+                ]
+                for task in ready:
+                    del pending[task.name]
+                    running[asyncio.create_task(_run(task))] = task.name
+
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    metrics = future.result()
+                except Exception as e:
+                    logger.exception(f"Tarefa do pipeline falhou: {name}")
+                    result.failed[name] = str(e) or type(e).__name__
+                    reporter.log("error", f"{name}: {e}", task=name)
+                    continue
+
+                result.completed.append(name)
+                for key, value in (metrics or {}).items():
+                    if isinstance(value, (int, float)) and isinstance(result.metrics.get(key), (int, float)):
+                        result.metrics[key] += value
+                    else:
+                        result.metrics[key] = value
+                if metrics:
+                    reporter.metrics(metrics)
+    except asyncio.CancelledError:
+        for future in running:
+            future.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        raise
+
+    result.not_run = sorted(pending)
+    return result
+
+
+# =============================================================================
+# Persistência compartilhada com o CLI
+# =============================================================================
+
+
+async def save_wdg_procedures(element, project_id: PydanticObjectId, parsed) -> None:
+    """
+    Regrava as procedures de um .wdg e o resumo no AST do elemento.
+
+    Args:
+        element: Element do procedure group
+        project_id: ID do projeto
+        parsed: Resultado de parse_wdg_file
+    """
+    from wxcode.llm_converter.token_counter import stored_token_count
+    from wxcode.models.element import ElementAST
+    from wxcode.models.procedure import Procedure, ProcedureDependencies, ProcedureParameter
+
+    await Procedure.find(Procedure.element_id == element.id).delete()
+
+    procedures = [
+        Procedure(
+            element_id=element.id,
+            project_id=project_id,
+            name=proc.name,
+            procedure_id=proc.procedure_id,
+            type_code=proc.type_code,
+            windev_type=proc.windev_type,
+            internal_properties=proc.internal_properties,
+            parameters=[
+                ProcedureParameter(
+                    name=p.name,
+                    type=p.type,
+                    is_local=p.is_local,
+                    default_value=p.default_value
+                )
+                for p in proc.parameters
+            ],
+            return_type=proc.return_type,
+            code=proc.code,
+            code_lines=proc.code_lines,
+            token_count=stored_token_count(proc.code),
+            dependencies=ProcedureDependencies(
+                calls_procedures=proc.dependencies.calls_procedures,
+                uses_files=proc.dependencies.uses_files,
+                uses_apis=proc.dependencies.uses_apis,
+                uses_queries=proc.dependencies.uses_queries
+            ),
+            has_documentation=proc.has_documentation,
+            is_public=proc.is_public,
+            is_internal=proc.is_internal,
+            has_error_handling=proc.has_error_handling
+        )
+        for proc in parsed.procedures
+    ]
+    if procedures:
+        await Procedure.insert_many(procedures)
+
+    if element.ast is None:
+        element.ast = ElementAST()
+    element.ast.procedures = [
+        {
+            "name": proc.name,
+            "parameters": [{"name": p.name, "type": p.type} for p in proc.parameters],
+            "return_type": proc.return_type,
+            "code_lines": proc.code_lines,
+            "has_error_handling": proc.has_error_handling,
+        }
+        for proc in parsed.procedures
+    ]
+    await element.save()
+
+
+async def save_class_definitions(project_id: PydanticObjectId, parsed_classes: list) -> None:
+    """
+    Regrava as ClassDefinitions do projeto.
+
+    Args:
+        project_id: ID do projeto
+        parsed_classes: Lista de (arquivo .wdc, classe parseada)
+    """
+    from wxcode.models import ClassDefinition, Element, ElementType
+
+    # Remove classes antigas (idempotente)
+    await ClassDefinition.find(ClassDefinition.project_id == project_id).delete()
+
+    for wdc_file, parsed_class in parsed_classes:
+        # Busca Element correspondente
+        element = await Element.find_one(
+            Element.project_id == project_id,
+            Element.source_file == wdc_file.name
+        )
+
+        if not element:
+            # Cria element se não existir
+            element = Element(
+                project_id=project_id,
+                source_type=ElementType.CLASS,
+                source_name=parsed_class.name,
+                source_file=wdc_file.name,
+                windev_type=4,
+            )
+            await element.insert()
+
+        class_def = ClassDefinition(
+            project_id=project_id,
+            element_id=element.id,
+            name=parsed_class.name,
+            identifier=parsed_class.identifier,
+            inherits_from=parsed_class.inherits_from,
+            is_abstract=parsed_class.is_abstract,
+            members=[
+                {
+                    "name": m.name,
+                    "type": m.type,
+                    "visibility": m.visibility,
+                    "default_value": m.default_value,
+                    "serialize": m.serialize,
+                }
+                for m in parsed_class.members
+            ],
+            methods=[
+                {
+                    "name": m.name,
+                    "method_type": m.method_type,
+                    "visibility": m.visibility,
+                    "parameters": m.parameters,
+                    "return_type": m.return_type,
+                    "code": m.code,
+                    "code_lines": m.code_lines,
+                    "is_static": m.is_static,
+                    "procedure_id": m.procedure_id,
+                    "type_code": m.type_code,
+                    "windev_type": m.windev_type,
+                    "internal_properties": m.internal_properties,
+                }
+                for m in parsed_class.methods
+            ],
+            constants=[
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "type": c.type,
+                }
+                for c in parsed_class.constants
+            ],
+            dependencies={
+                "uses_classes": parsed_class.dependencies.uses_classes,
+                "uses_files": parsed_class.dependencies.uses_files,
+                "calls_procedures": parsed_class.dependencies.calls_procedures,
+            },
+        )
+        await class_def.insert()
+
+
+async def _reset_database_schema(project_id: PydanticObjectId, source_file: str):
+    """Remove o schema anterior do projeto e cria o DatabaseSchema vazio."""
+    from wxcode.models import DatabaseSchema, SchemaTableDocument
+
+    # Remove schema anterior (idempotente)
+    await DatabaseSchema.find(DatabaseSchema.project_id == project_id).delete()
+    await SchemaTableDocument.find(SchemaTableDocument.project_id == project_id).delete()
+
+    schema = DatabaseSchema(project_id=project_id, source_file=source_file)
+    await schema.insert()
+    return schema
+
+
+async def _insert_schema_tables(schema, tables: list) -> int:
+    """Grava um lote de tabelas na coleção schema_tables."""
+    from wxcode.models import SchemaTableDocument
+
+    if not tables:
+        return 0
+    await SchemaTableDocument.insert_many([
+        SchemaTableDocument.from_table(table, schema.project_id, schema.id)
+        for table in tables
+    ])
+    return len(tables)
+
+
+async def save_database_schema(project_id: PydanticObjectId, source_file: str, parsed) -> None:
+    """
+    Regrava o DatabaseSchema do projeto.
+
+    Os metadados e conexões vão para o DatabaseSchema; as tabelas, em
+    lotes, para a coleção schema_tables.
+
+    Args:
+        project_id: ID do projeto
+        source_file: Caminho do .xdd relativo ao projeto
+        parsed: Resultado do XddParser
+    """
+    from wxcode.parser.xdd_parser import TABLE_BATCH_SIZE
+
+    schema = await _reset_database_schema(project_id, source_file)
+    for start in range(0, len(parsed.tables), TABLE_BATCH_SIZE):
+        await _insert_schema_tables(schema, parsed.tables[start:start + TABLE_BATCH_SIZE])
+
+    schema.version = parsed.version
+    schema.connections = parsed.connections
+    await schema.save()
+
+
+async def import_database_schema(
+    project_id: PydanticObjectId,
+    source_file: str,
+    parser,
+    batch_size: Optional[int] = None,
+):
+    """
+    Parseia a Analysis em streaming e grava as tabelas lote a lote.
+
+    Cada lote é parseado numa thread e gravado antes do próximo, então só
+    um lote de tabelas fica em memória.
+
+    Args:
+        project_id: ID do projeto
+        source_file: Caminho do .xdd relativo ao projeto
+        parser: XddParser do arquivo
+        batch_size: Tabelas por lote (padrão: TABLE_BATCH_SIZE)
+
+    Returns:
+        Tupla (XddParseResult com metadados, número de tabelas gravadas)
+    """
+    from wxcode.parser.xdd_parser import TABLE_BATCH_SIZE, XddParseResult
+
+    result = XddParseResult()
+    batches = parser.iter_table_batches(batch_size or TABLE_BATCH_SIZE, result=result)
+    schema = await _reset_database_schema(project_id, source_file)
+
+    total_tables = 0
+    while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+        total_tables += await _insert_schema_tables(schema, batch)
+
+    schema.version = result.version
+    schema.connections = result.connections
+    await schema.save()
+    return result, total_tables
+
+
+def merge_pdf_manifests(manifests: list[dict[str, Any]], output_dir: Path) -> dict[str, Any]:
+    """
+    Combina os manifests de vários PDFs splitados no mesmo diretório.
+
+    Cada split grava seu próprio manifest.json; com splits em paralelo o
+    arquivo final precisa indexar os elementos de todos os PDFs.
+
+    Args:
+        manifests: Manifests retornados por split_documentation_pdf
+        output_dir: Diretório onde o manifest.json combinado é gravado
+
+    Returns:
+        Manifest combinado
+    """
+    merged: dict[str, Any] = {
+        "source_pdf": ", ".join(m.get("source_pdf", "") for m in manifests),
+        "source_pdfs": [m.get("source_pdf") for m in manifests],
+        "total_pages": sum(m.get("total_pages", 0) for m in manifests),
+        "processed_at": datetime.now().isoformat(),
+        "elements": {"pages": [], "reports": [], "windows": [], "queries": []},
+        "stats": {
+            "total_elements": 0,
+            "pages": 0,
+            "reports": 0,
+            "windows": 0,
+            "queries": 0,
+            "processing_time_seconds": 0.0,
+            "errors": [],
+        },
+    }
+    for manifest in manifests:
+        for category, items in manifest.get("elements", {}).items():
+            merged["elements"].setdefault(category, []).extend(items)
+        stats = manifest.get("stats", {})
+        for key in ("total_elements", "pages", "reports", "windows", "queries"):
+            merged["stats"][key] += stats.get(key, 0)
+        # Splits rodam em paralelo: o tempo total é o do mais lento
+        merged["stats"]["processing_time_seconds"] = max(
+            merged["stats"]["processing_time_seconds"],
+            stats.get("processing_time_seconds", 0.0),
+        )
+        merged["stats"]["errors"].extend(stats.get("errors", []))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(merged, f, indent=2, ensure_ascii=False)
+    return merged
+
+
+# =============================================================================
+# Tarefas
+# =============================================================================
+
+
+async def import_project_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Importa o projeto (equivalente a `wxcode import --force`)."""
+    from wxcode.models import Project
+    from wxcode.parser.project_mapper import ProjectElementMapper
+    from wxcode.services.project_service import purge_project_by_name
+
+    def on_progress(lines_done: int, total_lines: int, elements: int) -> None:
+        reporter.progress("import", lines_done, total_lines)
+
+    def new_mapper() -> ProjectElementMapper:
+        return ProjectElementMapper(
+            ctx.project_path,
+            on_progress,
+            workspace_id=ctx.workspace_id,
+            workspace_path=ctx.workspace_path,
+        )
+
+    # Nome final do projeto (o mapper acrescenta o workspace_id)
+    mapper = new_mapper()
+    await mapper._extract_project_metadata()
+    project_name = mapper._project_data.get("name", ctx.project_path.stem)
+    if ctx.workspace_id:
+        project_name = f"{project_name}_{ctx.workspace_id}"
+
+    # Equivalente ao --force: reimportar substitui o projeto existente
+    existing = await Project.find_one(Project.name == project_name)
+    if existing:
+        reporter.log("info", f"Projeto '{project_name}' já existe. Removendo...", task="import")
+        purge_stats = await purge_project_by_name(project_name)
+        reporter.log("info", f"Removidos: {purge_stats.total} documentos", task="import")
+
+    project, stats = await new_mapper().map()
+    ctx._project = project
+    ctx._known_elements = None
+
+    reporter.log(
+        "info",
+        f"{stats.elements_saved} elementos importados ({stats.total_lines:,} linhas)",
+        task="import",
+    )
+    return {
+        "elements_count": stats.elements_saved,
+        "lines_count": stats.total_lines,
+        "configurations_count": stats.configurations_found,
+    }
+
+
+def _split_pdf_worker(
+    pdf_path: str,
+    output_dir: str,
+    known_elements: dict[str, str],
+) -> dict[str, Any]:
+    """Executa o split de um PDF em um processo do pool."""
+    from wxcode.parser.pdf_doc_splitter import split_documentation_pdf
+
+    return split_documentation_pdf(
+        pdf_path=Path(pdf_path),
+        output_dir=Path(output_dir),
+        known_elements=known_elements,
+    )
+
+
+def split_pdf_task(pdf_file: Path) -> TaskFn:
+    """Cria a tarefa de split de um PDF (executada no pool de processos)."""
+
+    async def _split(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+        name = f"split-pdf {pdf_file.name}"
+        known_elements = await ctx.get_known_elements()
+        reporter.progress(name, 0, 1)
+        loop = asyncio.get_running_loop()
+        manifest = await loop.run_in_executor(
+            ctx.get_executor(),
+            _split_pdf_worker,
+            str(pdf_file),
+            str(ctx.split_dir),
+            known_elements,
+        )
+        ctx.pdf_manifests.append(manifest)
+        reporter.progress(name, 1, 1)
+        reporter.log(
+            "info",
+            f"{pdf_file.name}: {manifest['stats']['total_elements']} elementos extraídos",
+            task=name,
+        )
+        return {"pdf_elements_count": manifest["stats"]["total_elements"]}
+
+    return _split
+
+
+async def merge_manifests_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Grava o manifest.json combinado dos PDFs splitados."""
+    merged = merge_pdf_manifests(ctx.pdf_manifests, ctx.split_dir)
+    return {"pdf_pages_count": merged["total_pages"]}
+
+
+async def enrich_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Enriquece elementos e queries (equivalente a `wxcode enrich`)."""
+    from wxcode.parser.element_enricher import ElementEnricher
+    from wxcode.parser.query_enricher import QueryEnricher
+
+    project = await ctx.get_project()
+
+    def on_progress(element_name: str, current: int, total: int) -> None:
+        reporter.progress("enrich", current, total)
+
+    # O construtor lê o manifest; o parsing dos .wwh/PDFs roda em thread
+    enricher = await asyncio.to_thread(
+        ElementEnricher,
+        pdf_docs_dir=ctx.split_dir,
+        project_dir=ctx.project_dir,
+        on_progress=on_progress,
+    )
+    stats = await enricher.enrich_project(project.id)
+
+    reporter.log("info", "Iniciando enriquecimento de queries...", task="enrich")
+    query_stats = await QueryEnricher(project.id, ctx.split_dir).enrich_all()
+
+    for error in stats.errors[:10]:
+        reporter.log("warning", str(error), task="enrich")
+
+    return {
+        "elements_processed": stats.elements_processed,
+        "controls_count": stats.total_controls,
+        "dependencies_count": stats.total_dependencies,
+        "queries_enriched": query_stats.get("enriched", 0),
+    }
+
+
+async def parse_schema_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Parseia a Analysis (.xdd) do projeto."""
+    from wxcode.parser.xdd_parser import XddParser, find_analysis_file
+
+    project = await ctx.get_project()
+    xdd_path = find_analysis_file(ctx.project_dir, project.analysis_path)
+    if not xdd_path:
+        raise PipelineError("Arquivo de Analysis (.xdd) não encontrado")
+
+    parsed, tables_count = await import_database_schema(
+        project.id, str(xdd_path.relative_to(ctx.project_dir)), XddParser(xdd_path)
+    )
+
+    for warning in parsed.warnings[:5]:
+        reporter.log("warning", str(warning), task="parse-schema")
+    return {"tables_count": tables_count}
+
+
+async def parse_procedures_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Parseia as procedures dos arquivos .wdg."""
+    from wxcode.models import Element, ElementType
+    from wxcode.parser.wdg_parser import parse_wdg_file
+
+    project = await ctx.get_project()
+    wdg_elements = await Element.find({
+        "project_id.$id": project.id,
+        "source_type": ElementType.PROCEDURE_GROUP.value
+    }).to_list()
+
+    total_procedures = 0
+    errors = 0
+    for i, element in enumerate(wdg_elements, 1):
+        source_file = element.source_file.lstrip('.\\').lstrip('./').replace('\\', '/')
+        wdg_path = ctx.project_dir / source_file
+        reporter.progress("parse-procedures", i, len(wdg_elements))
+
+        if not wdg_path.exists():
+            errors += 1
+            reporter.log("warning", f"{element.source_name}: arquivo não encontrado", task="parse-procedures")
+            continue
+
+        try:
+            parsed = await asyncio.to_thread(parse_wdg_file, wdg_path)
+            await save_wdg_procedures(element, project.id, parsed)
+            total_procedures += parsed.total_procedures
+        except Exception as e:
+            errors += 1
+            reporter.log("warning", f"{element.source_name}: {e}", task="parse-procedures")
+
+    return {"procedures_count": total_procedures, "procedure_errors": errors}
+
+
+async def parse_classes_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Parseia as classes (.wdc) do projeto."""
+    from wxcode.parser.wdc_parser import WdcParser
+
+    project = await ctx.get_project()
+    wdc_files = sorted(ctx.project_dir.glob("*.wdc"))
+
+    def _parse_all() -> tuple[list, list[str]]:
+        parsed, errors = [], []
+        for wdc_file in wdc_files:
+            try:
+                parsed.append((wdc_file, WdcParser(wdc_file).parse()))
+            except Exception as e:
+                errors.append(f"{wdc_file.name}: {e}")
+        return parsed, errors
+
+    parsed_classes, errors = await asyncio.to_thread(_parse_all)
+    for error in errors[:5]:
+        reporter.log("warning", error, task="parse-classes")
+
+    await save_class_definitions(project.id, parsed_classes)
+    return {"classes_count": len(parsed_classes)}
+
+
+async def analyze_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Analisa dependências e persiste a ordem topológica."""
+    from wxcode.analyzer import DependencyAnalyzer
+    from wxcode.models.project import ProjectStatus
+
+    project = await ctx.get_project()
+    result = await DependencyAnalyzer(project.id).analyze(persist=True)
+
+    project.status = ProjectStatus.ANALYZED
+    await project.save()
+
+    if result.cycles:
+        reporter.log("warning", f"{len(result.cycles)} ciclos detectados", task="analyze")
+    return {
+        "dependencies_count": result.total_edges,
+        "nodes_count": result.total_nodes,
+        "cycles_count": len(result.cycles),
+    }
+
+
+async def sync_neo4j_task(ctx: PipelineContext, reporter: PipelineReporter) -> dict[str, Any]:
+    """Sincroniza o grafo de dependências para o Neo4j."""
+    from wxcode.graph.neo4j_connection import Neo4jConnection
+    from wxcode.graph.neo4j_sync import Neo4jSyncService
+
+    project = await ctx.get_project()
+    async with Neo4jConnection() as conn:
+        result = await Neo4jSyncService(conn).sync_project(project.id, clear=True, validate=True)
+
+    for error in result.errors:
+        reporter.log("warning", str(error), task="sync-neo4j")
+    return {
+        "neo4j_nodes": result.nodes_created,
+        "neo4j_relationships": result.relationships_created,
+    }
+
+
+def build_step_tasks(step: int, ctx: PipelineContext) -> list[PipelineTask]:
+    """
+    Monta o DAG de tarefas de uma etapa do wizard.
+
+    Args:
+        step: Número da etapa (2-6)
+        ctx: Contexto da sessão
+
+    Returns:
+        Tarefas da etapa (vazio se a etapa não existir)
+    """
+    if step == 2:
+        return [PipelineTask("import", import_project_task)]
+
+    if step == 3:
+        splits = [
+            PipelineTask(f"split-pdf {pdf.name}", split_pdf_task(pdf))
+            for pdf in ctx.pdf_files
+        ]
+        if not splits:
+            return [PipelineTask("enrich", enrich_task)]
+        split_names = tuple(task.name for task in splits)
+        return splits + [
+            PipelineTask("pdf-manifest", merge_manifests_task, depends_on=split_names),
+            PipelineTask("enrich", enrich_task, depends_on=("pdf-manifest",)),
+        ]
+
+    if step == 4:
+        # Independentes entre si: rodam em paralelo
+        return [
+            PipelineTask("parse-schema", parse_schema_task),
+            PipelineTask("parse-procedures", parse_procedures_task),
+            PipelineTask("parse-classes", parse_classes_task),
+        ]
+
+    if step == 5:
+        return [PipelineTask("analyze", analyze_task)]
+
+    if step == 6:
+        return [PipelineTask("sync-neo4j", sync_neo4j_task)]
+
+    return []
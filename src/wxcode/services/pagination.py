@@ -0,0 +1,174 @@
+"""
+Helpers para paginação por cursor (keyset) em collections MongoDB.
+
+O cursor é opaco para o cliente: codifica os valores da chave de ordenação
+do último item retornado. A próxima página é buscada com um filtro
+``(chave > último)`` em vez de ``skip``, então o custo não cresce com a
+profundidade da página.
+"""
+
+import base64
+import json
+from typing import Any, AsyncIterator, Optional
+
+from beanie import Document
+from bson import ObjectId
+
+
+class InvalidCursorError(ValueError):
+    """Cursor de paginação malformado."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Codifica os valores da chave de ordenação em um cursor opaco.
+
+    ObjectIds são serializados como string e restaurados por decode_cursor.
+
+    Args:
+        values: Valores da chave na mesma ordem do sort (ex: source_name, _id)
+
+    Returns:
+        Cursor base64 url-safe
+    """
+    payload = [
+        {"$oid": str(v)} if isinstance(v, ObjectId) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Decodifica um cursor gerado por encode_cursor.
+
+    Raises:
+        InvalidCursorError: Se o cursor não puder ser decodificado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, list):
+            raise ValueError("cursor payload is not a list")
+        return [
+            ObjectId(v["$oid"]) if isinstance(v, dict) and "$oid" in v else v
+            for v in payload
+        ]
+    except Exception as e:
+        raise InvalidCursorError(f"Cursor inválido: {cursor}") from e
+
+
+def keyset_filter(sort_fields: list[str], last_values: list[Any]) -> dict:
+    """
+    Monta o filtro que seleciona itens posteriores ao cursor.
+
+    Para ordenação ascendente em (a, b, _id) gera:
+    ``a > va OR (a == va AND b > vb) OR (a == va AND b == vb AND _id > vid)``.
+
+    Valores nulos ordenam antes de qualquer outro no MongoDB, então
+    ``campo > None`` vira ``campo != None``.
+
+    Args:
+        sort_fields: Campos da ordenação (todos ascendentes; o último deve ser único)
+        last_values: Valores desses campos no último item da página anterior
+
+    Returns:
+        Filtro MongoDB
+    """
+    if len(sort_fields) != len(last_values):
+        raise InvalidCursorError("Cursor não corresponde à ordenação")
+
+    clauses = []
+    for i, field_name in enumerate(sort_fields):
+        clause = {f: last_values[j] for j, f in enumerate(sort_fields[:i])}
+        last = last_values[i]
+        clause[field_name] = {"$ne": None} if last is None else {"$gt": last}
+        clauses.append(clause)
+
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def _sort_values(doc: dict, sort_fields: list[str]) -> list[Any]:
+    """Extrai os valores da chave de ordenação (suporta campos aninhados)."""
+    values = []
+    for field_name in sort_fields:
+        value: Any = doc
+        for part in field_name.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        values.append(value)
+    return values
+
+
+async def paginate_by_cursor(
+    document: type[Document],
+    match: dict,
+    sort_fields: list[str],
+    projection: dict,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> tuple[list[dict], Optional[str]]:
+    """
+    Busca uma página ordenada por chave (keyset) com projeção.
+
+    Busca ``limit + 1`` documentos para saber se existe próxima página sem
+    precisar de count().
+
+    Args:
+        document: Document Beanie da collection
+        match: Filtro base
+        sort_fields: Campos ascendentes da ordenação (o último deve ser único, ex: _id)
+        projection: Projeção ($project) aplicada aos documentos retornados
+        limit: Tamanho da página
+        cursor: Cursor da página anterior
+
+    Returns:
+        Tupla (documentos, próximo cursor ou None)
+
+    Raises:
+        InvalidCursorError: Se o cursor for inválido
+    """
+    if cursor:
+        match = {"$and": [match, keyset_filter(sort_fields, decode_cursor(cursor))]}
+
+    # Os campos de ordenação precisam sobreviver à projeção para gerar o cursor
+    projection = {**projection, **{f: 1 for f in sort_fields if f not in projection}}
+
+    pipeline = [
+        {"$match": match},
+        {"$sort": {f: 1 for f in sort_fields}},
+        {"$limit": limit + 1},
+        {"$project": projection},
+    ]
+    docs = await document.aggregate(pipeline).to_list()
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(*_sort_values(docs[-1], sort_fields))
+
+    return docs, next_cursor
+
+
+async def iter_projected(
+    document: type[Document],
+    match: dict,
+    sort_fields: list[str],
+    projection: dict,
+    batch_size: int = 500,
+) -> AsyncIterator[dict]:
+    """
+    Itera todos os documentos de um filtro em páginas por cursor.
+
+    Cada página é uma consulta curta e indexada, então exportações longas
+    não mantêm um cursor do servidor aberto nem usam skip.
+    """
+    cursor = None
+    while True:
+        docs, cursor = await paginate_by_cursor(
+            document, match, sort_fields, projection, batch_size, cursor
+        )
+        for doc in docs:
+            yield doc
+        if not cursor:
+            break
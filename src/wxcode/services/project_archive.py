@@ -0,0 +1,218 @@
+"""
+Ingestão de arquivos .zip de projeto enviados pelo wizard de importação.
+
+O diretório central do zip é lido antes de qualquer extração: o arquivo
+.wwp e os membros relevantes são identificados pelos nomes, binários que o
+importador nunca lê (imagens, DLLs, artefatos compilados) são descartados,
+e os demais membros são extraídos em paralelo.
+"""
+
+import shutil
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Callable, Optional
+
+# Escritas em disco em blocos grandes (upload e extração)
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+MAX_EXTRACT_WORKERS = 4
+
+# Extensões que o importador nunca lê
+SKIPPED_EXTENSIONS = frozenset({
+    # Imagens e mídia
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".tif", ".tiff", ".webp",
+    ".psd", ".mp3", ".mp4", ".avi", ".wav",
+    # Binários e bibliotecas
+    ".dll", ".exe", ".ocx", ".so", ".dylib", ".msi", ".cab",
+    # Artefatos compilados do WinDev/WebDev
+    ".wdl", ".wdk", ".obj", ".lib", ".pdb",
+    # Backups e arquivos aninhados
+    ".bak", ".zip", ".7z", ".rar",
+})
+
+# Diretórios gerados pelo WinDev/WebDev (executáveis, backups, cópias de deploy)
+SKIPPED_DIRECTORIES = frozenset({
+    "exe", "backup", "sauvegarde",
+})
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ProjectArchiveError(Exception):
+    """Arquivo .zip inválido ou sem projeto WinDev/WebDev."""
+
+
+@dataclass
+class ExtractionPlan:
+    """Membros a extrair, calculados a partir do diretório central."""
+
+    project_member: str
+    members: list[zipfile.ZipInfo] = field(default_factory=list)
+    skipped: int = 0
+    total_bytes: int = 0
+
+    @property
+    def project_dir(self) -> PurePosixPath:
+        """Diretório do .wwp dentro do zip."""
+        return PurePosixPath(self.project_member).parent
+
+
+def _is_skipped(path: PurePosixPath) -> bool:
+    if path.suffix.lower() in SKIPPED_EXTENSIONS:
+        return True
+    return any(part.lower() in SKIPPED_DIRECTORIES for part in path.parts[:-1])
+
+
+def _is_safe(name: str) -> bool:
+    """Rejeita caminhos absolutos e com '..' (zip slip)."""
+    path = PurePosixPath(name.replace("\\", "/"))
+    return not path.is_absolute() and ".." not in path.parts
+
+
+def plan_extraction(archive: Path | BinaryIO) -> ExtractionPlan:
+    """
+    Lê o diretório central do zip e decide o que extrair.
+
+    O .wwp mais raso é o projeto; apenas membros dentro do diretório dele
+    são extraídos (o importador só lê essa árvore).
+
+    Args:
+        archive: Caminho ou arquivo aberto do .zip
+
+    Returns:
+        ExtractionPlan com os membros relevantes
+
+    Raises:
+        ProjectArchiveError: Zip inválido ou sem arquivo .wwp
+    """
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            infos = zf.infolist()
+    except zipfile.BadZipFile as e:
+        raise ProjectArchiveError(f"Invalid zip file: {e}") from e
+
+    projects = [
+        info.filename for info in infos
+        if not info.is_dir()
+        and info.filename.lower().endswith(".wwp")
+        and _is_safe(info.filename)
+        and not _is_skipped(PurePosixPath(info.filename))
+    ]
+    if not projects:
+        raise ProjectArchiveError("No .wwp file found in zip")
+    project_member = min(projects, key=lambda name: (name.count("/"), name))
+
+    plan = ExtractionPlan(project_member=project_member)
+    root = plan.project_dir
+    for info in infos:
+        if info.is_dir():
+            continue
+        path = PurePosixPath(info.filename)
+        if not _is_safe(info.filename):
+            raise ProjectArchiveError(f"Unsafe path in zip: {info.filename}")
+        if root != PurePosixPath(".") and root not in path.parents:
+            plan.skipped += 1
+            continue
+        if _is_skipped(path):
+            plan.skipped += 1
+            continue
+        plan.members.append(info)
+        plan.total_bytes += info.file_size
+    return plan
+
+
+def _extract_batch(
+    archive: Path,
+    members: list[zipfile.ZipInfo],
+    dest: Path,
+    report: Callable[[int], None],
+) -> None:
+    # Um ZipFile por thread: leitura e descompressão (zlib libera o GIL) em paralelo
+    with zipfile.ZipFile(archive) as zf:
+        for info in members:
+            target = dest / info.filename
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, open(target, "wb") as out:
+                shutil.copyfileobj(src, out, COPY_BUFFER_SIZE)
+            report(info.file_size)
+
+
+def extract_plan(
+    archive: Path,
+    plan: ExtractionPlan,
+    dest: Path,
+    on_progress: Optional[ProgressCallback] = None,
+    max_workers: int = MAX_EXTRACT_WORKERS,
+) -> Path:
+    """
+    Extrai os membros do plano em paralelo.
+
+    Args:
+        archive: Caminho do .zip
+        plan: Plano calculado por plan_extraction
+        dest: Diretório de destino
+        on_progress: Chamado com (bytes extraídos, total) a cada membro,
+            a partir das threads de extração
+        max_workers: Número máximo de threads
+
+    Returns:
+        Caminho do .wwp extraído
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    lock = threading.Lock()
+    done = 0
+
+    def report(size: int) -> None:
+        nonlocal done
+        with lock:
+            done += size
+            if on_progress:
+                on_progress(done, plan.total_bytes)
+
+    # Lotes balanceados por tamanho (maiores primeiro, round-robin)
+    workers = max(1, min(max_workers, len(plan.members)))
+    batches: list[list[zipfile.ZipInfo]] = [[] for _ in range(workers)]
+    ordered = sorted(plan.members, key=lambda info: info.file_size, reverse=True)
+    for index, info in enumerate(ordered):
+        batches[index % workers].append(info)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_extract_batch, archive, batch, dest, report)
+            for batch in batches if batch
+        ]
+        for future in futures:
+            future.result()
+
+    return dest / plan.project_member
+
+
+def save_stream(
+    source: BinaryIO,
+    target: Path,
+    on_progress: Optional[ProgressCallback] = None,
+    expected_size: Optional[int] = None,
+) -> int:
+    """
+    Copia um arquivo enviado para o disco em blocos grandes.
+
+    Args:
+        source: Arquivo de origem (ex.: UploadFile.file)
+        target: Caminho de destino
+        on_progress: Chamado com (bytes gravados, total) a cada bloco
+        expected_size: Tamanho total, se conhecido
+
+    Returns:
+        Total de bytes gravados
+    """
+    total = 0
+    with open(target, "wb", buffering=0) as out:
+        while chunk := source.read(COPY_BUFFER_SIZE):
+            out.write(chunk)
+            total += len(chunk)
+            if on_progress:
+                on_progress(total, max(expected_size or 0, total))
+    return total
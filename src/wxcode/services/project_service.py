@@ -1,16 +1,19 @@
 """
 Serviço de gerenciamento de projetos.
 
-Inclui funções para purge completo de projetos e verificação de duplicatas.
+Inclui funções para purge completo de projetos (síncrono ou como job em
+background com progresso) e verificação de duplicatas.
 """
 
+import asyncio
 import logging
 import os
-import shutil
 import stat
+import uuid
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from wxcode.config import get_settings
 
@@ -23,8 +26,11 @@ from wxcode.models import (
     Procedure,
     ClassDefinition,
     DatabaseSchema,
+    SchemaTableDocument,
     Conversion,
 )
+from wxcode.mcp.resolver import invalidate_element_index
+from wxcode.services.tree_builder import invalidate_tree_cache
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +45,7 @@ class PurgeStats:
     procedures: int = 0
     class_definitions: int = 0
     schemas: int = 0
+    schema_tables: int = 0
     conversions: int = 0
     neo4j_nodes: int = 0
     neo4j_error: Optional[str] = None
@@ -56,6 +63,7 @@ class PurgeStats:
             self.procedures +
             self.class_definitions +
             self.schemas +
+            self.schema_tables +
             self.conversions
         )
 
@@ -79,6 +87,7 @@ class PurgeStats:
             "procedures": self.procedures,
             "class_definitions": self.class_definitions,
             "schemas": self.schemas,
+            "schema_tables": self.schema_tables,
             "conversions": self.conversions,
             "total": self.total,
             "files_deleted": self.files_deleted,
@@ -94,12 +103,23 @@ class PurgeStats:
         return result
 
 
-async def purge_project(project_id: PydanticObjectId) -> PurgeStats:
+# Documentos removidos por delete_many em cada lote
+PURGE_BATCH_SIZE = 1000
+
+# Callback de progresso: (etapa, quantidade removida até agora)
+PurgeProgressCallback = Callable[[str, int], None]
+
+
+async def purge_project(
+    project_id: PydanticObjectId,
+    progress: Optional[PurgeProgressCallback] = None,
+) -> PurgeStats:
     """
     Remove completamente um projeto e todas suas collections dependentes.
 
     Args:
         project_id: ID do projeto a ser removido
+        progress: Callback opcional chamado a cada lote removido
 
     Returns:
         PurgeStats com contagem de documentos removidos por collection
@@ -111,7 +131,7 @@ async def purge_project(project_id: PydanticObjectId) -> PurgeStats:
     if not project:
         raise ValueError(f"Projeto com ID {project_id} não encontrado")
 
-    return await _purge_project_data(project)
+    return await _purge_project_data(project, progress)
 
 
 async def purge_project_by_name(project_name: str) -> PurgeStats:
@@ -166,16 +186,24 @@ def _validate_deletion_path(source_path: str, allowed_base: Path) -> Path:
     return project_dir
 
 
-def _purge_local_files(project_dir: Path, stats: PurgeStats) -> None:
+def _purge_local_files(
+    project_dir: Path,
+    stats: PurgeStats,
+    progress: Optional[PurgeProgressCallback] = None,
+) -> None:
     """
     Remove o diretorio do projeto e todo seu conteudo.
 
+    Percorre a árvore uma única vez (bottom-up), contando arquivos e
+    diretórios à medida que os remove.
+
     Similar a _purge_neo4j_data: nao falha se houver erro,
-    apenas registra no stats.
+    apenas registra no stats (contagens refletem o que foi removido).
 
     Args:
         project_dir: Path do diretorio do projeto
         stats: PurgeStats para atualizar com contagens
+        progress: Callback opcional chamado periodicamente com arquivos removidos
     """
     try:
         if not project_dir.exists():
@@ -187,12 +215,32 @@ def _purge_local_files(project_dir: Path, stats: PurgeStats) -> None:
             logger.warning(stats.files_error)
             return
 
-        # Conta antes de deletar
-        stats.files_deleted = sum(1 for p in project_dir.rglob("*") if p.is_file())
-        stats.directories_deleted = sum(1 for p in project_dir.rglob("*") if p.is_dir()) + 1
+        def on_walk_error(e: OSError) -> None:
+            raise e
+
+        for dirpath, dirnames, filenames in os.walk(
+            project_dir, topdown=False, onerror=on_walk_error
+        ):
+            for name in filenames:
+                _remove_with_readonly_retry(os.unlink, os.path.join(dirpath, name))
+                stats.files_deleted += 1
+                if progress and stats.files_deleted % PURGE_BATCH_SIZE == 0:
+                    progress("files", stats.files_deleted)
+            for name in dirnames:
+                path = os.path.join(dirpath, name)
+                if os.path.islink(path):
+                    # Symlink para diretório: os.walk não desce nele
+                    _remove_with_readonly_retry(os.unlink, path)
+                    stats.files_deleted += 1
+                else:
+                    _remove_with_readonly_retry(os.rmdir, path)
+                    stats.directories_deleted += 1
+
+        _remove_with_readonly_retry(os.rmdir, str(project_dir))
+        stats.directories_deleted += 1
+        if progress:
+            progress("files", stats.files_deleted)
 
-        # Deleta com handler para read-only
-        shutil.rmtree(project_dir, onexc=_remove_readonly)
         logger.info(
             f"Removidos {stats.files_deleted} arquivos e "
             f"{stats.directories_deleted} diretorios de {project_dir}"
@@ -200,17 +248,75 @@ def _purge_local_files(project_dir: Path, stats: PurgeStats) -> None:
 
     except OSError as e:
         stats.files_error = f"Falha ao deletar arquivos: {e}"
-        stats.files_deleted = 0
-        stats.directories_deleted = 0
         logger.warning(stats.files_error)
 
 
-async def _purge_project_data(project: Project) -> PurgeStats:
+def _remove_with_readonly_retry(func: Callable[[str], None], path: str) -> None:
+    """Executa unlink/rmdir, liberando permissão de escrita se necessário (Windows)."""
+    try:
+        func(path)
+    except PermissionError:
+        _remove_readonly(func, path, None)
+
+
+async def _delete_in_batches(
+    model,
+    query: dict,
+    step: str,
+    progress: Optional[PurgeProgressCallback] = None,
+    batch_size: int = PURGE_BATCH_SIZE,
+) -> int:
+    """
+    Remove os documentos de uma collection em lotes por faixa de _id.
+
+    Cada lote busca os próximos ``batch_size`` _ids (ordenados) e remove a
+    faixa [primeiro, último] com delete_many, limitando o tempo de cada
+    operação e a carga no MongoDB.
+
+    Returns:
+        Quantidade de documentos removidos
+    """
+    deleted = 0
+    last_id = None
+
+    while True:
+        match = query if last_id is None else {"$and": [query, {"_id": {"$gt": last_id}}]}
+        batch = await model.aggregate([
+            {"$match": match},
+            {"$sort": {"_id": 1}},
+            {"$limit": batch_size},
+            {"$project": {"_id": 1}},
+        ]).to_list()
+        if not batch:
+            break
+
+        first_id, last_id = batch[0]["_id"], batch[-1]["_id"]
+        result = await model.find(
+            {"$and": [query, {"_id": {"$gte": first_id, "$lte": last_id}}]}
+        ).delete()
+        deleted += result.deleted_count if result else 0
+
+        if progress:
+            progress(step, deleted)
+        if len(batch) < batch_size:
+            break
+
+    return deleted
+
+
+async def _purge_project_data(
+    project: Project,
+    progress: Optional[PurgeProgressCallback] = None,
+) -> PurgeStats:
     """
     Remove todos os dados associados a um projeto.
 
+    As collections são removidas em paralelo (um worker por collection),
+    cada uma em lotes por faixa de _id.
+
     Args:
         project: Objeto Project a ser removido
+        progress: Callback opcional chamado a cada lote removido
 
     Returns:
         PurgeStats com contagem de documentos removidos
@@ -218,29 +324,22 @@ async def _purge_project_data(project: Project) -> PurgeStats:
     stats = PurgeStats(project_name=project.name)
     project_id = project.id
 
-    # Remove Elements (usa Link[Project], então precisa buscar pelo $id)
-    result = await Element.find({"project_id.$id": project_id}).delete()
-    stats.elements = result.deleted_count if result else 0
-
-    # Remove Controls (usa PydanticObjectId diretamente)
-    result = await Control.find(Control.project_id == project_id).delete()
-    stats.controls = result.deleted_count if result else 0
-
-    # Remove Procedures
-    result = await Procedure.find(Procedure.project_id == project_id).delete()
-    stats.procedures = result.deleted_count if result else 0
-
-    # Remove ClassDefinitions
-    result = await ClassDefinition.find(ClassDefinition.project_id == project_id).delete()
-    stats.class_definitions = result.deleted_count if result else 0
-
-    # Remove DatabaseSchemas
-    result = await DatabaseSchema.find(DatabaseSchema.project_id == project_id).delete()
-    stats.schemas = result.deleted_count if result else 0
-
-    # Remove Conversions (usa Link[Project])
-    result = await Conversion.find({"project_id.$id": project_id}).delete()
-    stats.conversions = result.deleted_count if result else 0
+    # (campo de PurgeStats, model, filtro). Link[Project] é DBRef: filtra por $id
+    targets = [
+        ("elements", Element, {"project_id.$id": project_id}),
+        ("controls", Control, {"project_id": project_id}),
+        ("procedures", Procedure, {"project_id": project_id}),
+        ("class_definitions", ClassDefinition, {"project_id": project_id}),
+        ("schemas", DatabaseSchema, {"project_id": project_id}),
+        ("schema_tables", SchemaTableDocument, {"project_id": project_id}),
+        ("conversions", Conversion, {"project_id.$id": project_id}),
+    ]
+    counts = await asyncio.gather(*(
+        _delete_in_batches(model, query, step, progress)
+        for step, model, query in targets
+    ))
+    for (step, _, _), count in zip(targets, counts):
+        setattr(stats, step, count)
 
     # Remove dados do Neo4j (opcional - não falha se Neo4j não estiver disponível)
     await _purge_neo4j_data(project.name, stats)
@@ -251,7 +350,7 @@ async def _purge_project_data(project: Project) -> PurgeStats:
         allowed_base = Path(settings.allowed_deletion_base)
         try:
             project_dir = _validate_deletion_path(project.source_path, allowed_base)
-            _purge_local_files(project_dir, stats)
+            await asyncio.to_thread(_purge_local_files, project_dir, stats, progress)
         except ValueError as e:
             stats.files_error = str(e)
             logger.warning(f"Path validation failed: {e}")
@@ -260,6 +359,9 @@ async def _purge_project_data(project: Project) -> PurgeStats:
     await project.delete()
     stats.projects = 1
 
+    invalidate_tree_cache(project_id)
+    invalidate_element_index(project_id)
+
     return stats
 
 
@@ -296,6 +398,150 @@ async def _purge_neo4j_data(project_name: str, stats: PurgeStats) -> None:
         stats.neo4j_error = error_msg
 
 
+@dataclass
+class PurgeJob:
+    """
+    Purge de projeto executando em background.
+
+    O progresso é publicado para os listeners (filas assinadas pelo
+    WebSocket) e fica disponível para consulta via REST.
+
+    asyncio.Queue não é thread-safe: atualizações vindas de threads (remoção
+    de arquivos via asyncio.to_thread) são aplicadas no event loop do job
+    via call_soon_threadsafe.
+    """
+
+    job_id: str
+    project_id: str
+    project_name: str
+    status: str = "pending"  # pending, running, completed, failed
+    progress: dict[str, int] = field(default_factory=dict)
+    stats: Optional[PurgeStats] = None
+    error: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    _listeners: list[asyncio.Queue] = field(default_factory=list, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def to_dict(self) -> dict:
+        """Converte para dicionário (resposta REST / mensagem WebSocket)."""
+        return {
+            "job_id": self.job_id,
+            "project_id": self.project_id,
+            "project_name": self.project_name,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "stats": self.stats.to_dict() if self.stats else None,
+            "error": self.error,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def subscribe(self) -> asyncio.Queue:
+        """Registra um listener; recebe o estado atual e cada atualização."""
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(self.to_dict())
+        if not self.done:
+            self._listeners.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        if queue in self._listeners:
+            self._listeners.remove(queue)
+
+    def report(self, step: str, count: int) -> None:
+        """Callback de progresso passado para _purge_project_data (qualquer thread)."""
+        if self._loop is not None and not self._in_loop():
+            self._loop.call_soon_threadsafe(self._record_progress, step, count)
+        else:
+            self._record_progress(step, count)
+
+    def _in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _record_progress(self, step: str, count: int) -> None:
+        self.progress[step] = count
+        self._publish()
+
+    def _publish(self) -> None:
+        snapshot = self.to_dict()
+        for queue in self._listeners:
+            queue.put_nowait(snapshot)
+        if self.done:
+            self._listeners.clear()
+
+
+# Jobs de purge em andamento/concluídos neste processo (job_id -> job)
+_purge_jobs: dict[str, PurgeJob] = {}
+
+# Quantidade máxima de jobs concluídos mantidos para consulta
+MAX_FINISHED_PURGE_JOBS = 50
+
+
+async def start_purge_job(project_id: PydanticObjectId) -> PurgeJob:
+    """
+    Inicia o purge de um projeto em background.
+
+    Se já existe um job em andamento para o projeto, retorna o mesmo job.
+
+    Raises:
+        ValueError: Se o projeto não existir
+    """
+    for job in _purge_jobs.values():
+        if job.project_id == str(project_id) and not job.done:
+            return job
+
+    project = await Project.get(project_id)
+    if not project:
+        raise ValueError(f"Projeto com ID {project_id} não encontrado")
+
+    job = PurgeJob(
+        job_id=str(uuid.uuid4()),
+        project_id=str(project_id),
+        project_name=project.name,
+    )
+    _purge_jobs[job.job_id] = job
+    _prune_finished_jobs()
+    job._task = asyncio.create_task(_run_purge_job(job, project))
+    return job
+
+
+def get_purge_job(job_id: str) -> Optional[PurgeJob]:
+    """Busca um job de purge pelo ID."""
+    return _purge_jobs.get(job_id)
+
+
+async def _run_purge_job(job: PurgeJob, project: Project) -> None:
+    job._loop = asyncio.get_running_loop()
+    job.status = "running"
+    job._publish()
+    try:
+        job.stats = await _purge_project_data(project, job.report)
+        job.status = "completed"
+    except Exception as e:
+        logger.exception(f"Purge job {job.job_id} falhou")
+        job.error = str(e)
+        job.status = "failed"
+    finally:
+        job.finished_at = datetime.utcnow()
+        job._publish()
+
+
+def _prune_finished_jobs() -> None:
+    finished = [j for j in _purge_jobs.values() if j.done]
+    finished.sort(key=lambda j: j.finished_at or j.started_at)
+    for job in finished[:-MAX_FINISHED_PURGE_JOBS or None]:
+        _purge_jobs.pop(job.job_id, None)
+
+
 @dataclass
 class DuplicateInfo:
     """Informação sobre projetos duplicados."""
@@ -16,6 +16,7 @@ import uuid
 from wxcode.services.bidirectional_pty import BidirectionalPTY
 
 __all__ = [
+    "ReplayRingBuffer",
     "PTYSession",
     "PTYSessionManager",
     "get_session_manager",
@@ -23,6 +24,113 @@ __all__ = [
 ]
 
 
+# How far into a trimmed replay to look for a safe starting point
+MAX_RESYNC_BYTES = 4096
+
+_ESC = 0x1B
+
+
+def _safe_start(data: bytes) -> int:
+    """Offset of the first safe replay boundary in data trimmed at an arbitrary byte.
+
+    The head of trimmed data may be the middle of an ANSI escape sequence or
+    of a UTF-8 multibyte character. Replay starts right after the first
+    newline or at the first ESC (start of a complete sequence), whichever
+    comes first; otherwise only leading UTF-8 continuation bytes are skipped.
+    """
+    window = data[:MAX_RESYNC_BYTES]
+    candidates = []
+    newline = window.find(b"\n")
+    if newline != -1:
+        candidates.append(newline + 1)
+    esc = window.find(bytes([_ESC]))
+    if esc != -1:
+        candidates.append(esc)
+    if candidates:
+        return min(candidates)
+
+    start = 0
+    while start < min(len(data), 3) and 0x80 <= data[start] <= 0xBF:
+        start += 1
+    return start
+
+
+class ReplayRingBuffer:
+    """Fixed-capacity byte ring buffer for terminal output replay.
+
+    Backed by a preallocated bytearray; appends copy through a memoryview and
+    overwrite the oldest bytes once full, so each append is O(len(data)).
+    Once bytes have been evicted, getvalue() starts at a safe boundary (see
+    _safe_start) so a replay never begins inside an escape sequence or a
+    multibyte character.
+    """
+
+    __slots__ = ("_buf", "_view", "_capacity", "_start", "_size", "_evicted")
+
+    def __init__(self, capacity: int):
+        self._capacity = max(capacity, 0)
+        self._buf = bytearray(self._capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._size = 0
+        self._evicted = False
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of bytes kept."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, data: bytes) -> None:
+        """Append data, evicting the oldest bytes if capacity is exceeded."""
+        n = len(data)
+        cap = self._capacity
+        if n == 0 or cap == 0:
+            return
+
+        src = memoryview(data)
+        if n >= cap:
+            # Only the newest `cap` bytes survive
+            self._view[:] = src[n - cap:]
+            self._start = 0
+            self._evicted = self._evicted or self._size > 0 or n > cap
+            self._size = cap
+            return
+
+        end = (self._start + self._size) % cap
+        first = min(n, cap - end)
+        self._view[end:end + first] = src[:first]
+        if first < n:
+            self._view[:n - first] = src[first:]
+
+        overflow = self._size + n - cap
+        if overflow > 0:
+            self._start = (self._start + overflow) % cap
+            self._size = cap
+            self._evicted = True
+        else:
+            self._size += n
+
+    def getvalue(self) -> bytes:
+        """Return buffered bytes, oldest first (from a safe boundary once trimmed)."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            data = bytes(self._view[self._start:end])
+        else:
+            data = bytes(self._view[self._start:]) + bytes(self._view[:end - self._capacity])
+        if self._evicted:
+            return data[_safe_start(data):]
+        return data
+
+    def clear(self) -> None:
+        """Drop all buffered bytes (capacity is kept)."""
+        self._start = 0
+        self._size = 0
+        self._evicted = False
+
+
 @dataclass
 class PTYSession:
     """PTY session state for reconnection support.
@@ -37,22 +145,20 @@ class PTYSession:
     created_at: datetime
     last_activity: datetime
     claude_session_id: Optional[str] = None
-    output_buffer: list[bytes] = field(default_factory=list)
     max_buffer_size: int = 64 * 1024  # 64KB default
+    output_buffer: ReplayRingBuffer = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.output_buffer = ReplayRingBuffer(self.max_buffer_size)
 
     def add_to_buffer(self, data: bytes) -> None:
-        """Add output to replay buffer with size limit."""
+        """Add output to replay buffer (oldest bytes evicted past max size)."""
         self.output_buffer.append(data)
         self.last_activity = datetime.utcnow()
-        # Trim buffer if exceeds max size (FIFO)
-        total_size = sum(len(d) for d in self.output_buffer)
-        while total_size > self.max_buffer_size and self.output_buffer:
-            removed = self.output_buffer.pop(0)
-            total_size -= len(removed)
 
     def get_replay_buffer(self) -> bytes:
         """Get full replay buffer as single bytes object."""
-        return b"".join(self.output_buffer)
+        return self.output_buffer.getvalue()
 
     def clear_buffer(self) -> None:
         """Clear the output buffer."""
@@ -222,7 +328,7 @@ class PTYSessionManager:
                     "claude_session_id": session.claude_session_id,
                     "created_at": session.created_at.isoformat(),
                     "last_activity": session.last_activity.isoformat(),
-                    "buffer_size": sum(len(d) for d in session.output_buffer),
+                    "buffer_size": len(session.output_buffer),
                 })
         return sessions
 
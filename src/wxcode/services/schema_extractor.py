@@ -9,7 +9,7 @@ from typing import Optional
 from beanie import PydanticObjectId
 
 from wxcode.models.element import Element
-from wxcode.models.schema import DatabaseSchema
+from wxcode.models.schema import DatabaseSchema, get_schema_tables
 from wxcode.parser.global_state_extractor import GlobalStateExtractor
 from wxcode.models.global_state_context import GlobalStateContext
 
@@ -78,7 +78,7 @@ async def extract_schema_for_configuration(
 
     # Se nao houver Configuration, retorna TODAS as tabelas
     if not configuration_id:
-        return [_table_to_dict(table) for table in schema.tables]
+        return [_table_to_dict(table) for table in await get_schema_tables(schema)]
 
     # Busca elementos no escopo da Configuration
     elements = await Element.find(
@@ -99,11 +99,11 @@ async def extract_schema_for_configuration(
 
     # Se nenhuma dependencia encontrada, retorna TODAS as tabelas (fallback)
     if not table_names:
-        return [_table_to_dict(table) for table in schema.tables]
+        return [_table_to_dict(table) for table in await get_schema_tables(schema)]
 
-    # Filtra tabelas do schema para apenas as usadas
+    # Busca apenas as tabelas usadas (referenciadas pelo nome ou pelo nome físico)
     tables = []
-    for table in schema.tables:
+    for table in await get_schema_tables(schema, table_names, physical_names=True):
         if table.name in table_names or table.physical_name in table_names:
             tables.append(_table_to_dict(table))
 
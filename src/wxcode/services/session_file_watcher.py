@@ -10,11 +10,22 @@ import json
 import logging
 import os
 import re
+from collections import deque
 from pathlib import Path
-from typing import Callable, Optional, Awaitable, Any
+from typing import BinaryIO, Callable, Optional, Awaitable, Any
+
+from watchfiles import awatch
 
 logger = logging.getLogger(__name__)
 
+SESSIONS_INDEX_FILE = "sessions-index.json"
+
+# How many recent event UUIDs are remembered for duplicate suppression
+DEDUPE_WINDOW_SIZE = 2048
+
+# Debounce for filesystem notifications - short, chat events should feel live
+WATCH_DEBOUNCE_MS = 50
+
 
 def workspace_to_claude_path(workspace_path: str) -> Path:
     """
@@ -83,7 +94,7 @@ def get_active_session_id(workspace_path: str) -> Optional[str]:
         The active session ID or None if not found
     """
     claude_folder = workspace_to_claude_path(workspace_path)
-    index_file = claude_folder / "sessions-index.json"
+    index_file = claude_folder / SESSIONS_INDEX_FILE
 
     if not index_file.exists():
         logger.warning(f"Sessions index not found: {index_file}")
@@ -138,7 +149,7 @@ def get_most_recent_session_file(workspace_path: str) -> Optional[tuple[Path, st
     # Find all .jsonl files (excluding sessions-index.json)
     jsonl_files = [
         f for f in claude_folder.glob("*.jsonl")
-        if f.name != "sessions-index.json"
+        if f.name != SESSIONS_INDEX_FILE
     ]
 
     if not jsonl_files:
@@ -159,6 +170,26 @@ def parse_claude_event(line: str) -> Optional[dict]:
     """
     Parse a JSONL line and extract relevant events for chat display.
 
+    Convenience wrapper around extract_claude_event() for callers that
+    hold the raw line.
+
+    Args:
+        line: Single line from the session JSONL file
+
+    Returns:
+        Parsed event data or None
+    """
+    try:
+        data = json.loads(line.strip())
+    except json.JSONDecodeError:
+        return None
+    return extract_claude_event(data)
+
+
+def extract_claude_event(data: Any) -> Optional[dict]:
+    """
+    Extract a relevant chat event from an already decoded JSONL record.
+
     Detects:
     - AskUserQuestion: Questions requiring user input
     - TaskCreate: Task creation (shows subject)
@@ -168,13 +199,15 @@ def parse_claude_event(line: str) -> Optional[dict]:
     - summary: Session summary
 
     Args:
-        line: Single line from the session JSONL file
+        data: Decoded JSON object for a single session line
 
     Returns:
         Parsed event data or None
     """
+    if not isinstance(data, dict):
+        return None
+
     try:
-        data = json.loads(line.strip())
         msg_type = data.get("type")
         uuid = data.get("uuid")
         timestamp = data.get("timestamp")
@@ -387,7 +420,7 @@ def parse_claude_event(line: str) -> Optional[dict]:
 
         return None
 
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (KeyError, TypeError, AttributeError):
         return None
 
 
@@ -409,12 +442,110 @@ def parse_ask_user_question(line: str) -> Optional[dict]:
     return None
 
 
+class RecentUUIDWindow:
+    """
+    Bounded set of recently seen event UUIDs.
+
+    Keeps only the last ``maxlen`` UUIDs (FIFO eviction) so long-running
+    sessions don't grow the dedupe state without limit.
+    """
+
+    def __init__(self, maxlen: int = DEDUPE_WINDOW_SIZE):
+        self._maxlen = maxlen
+        self._order: deque[str] = deque()
+        self._members: set[str] = set()
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def add(self, uuid: str) -> bool:
+        """
+        Register a UUID.
+
+        Returns:
+            True if the UUID was not in the window yet
+        """
+        if uuid in self._members:
+            return False
+
+        self._order.append(uuid)
+        self._members.add(uuid)
+        if len(self._order) > self._maxlen:
+            self._members.discard(self._order.popleft())
+        return True
+
+    def clear(self) -> None:
+        self._order.clear()
+        self._members.clear()
+
+
+class JsonlTailReader:
+    """
+    Incremental reader for an append-only JSONL file.
+
+    Keeps the file handle open between reads and carries over any trailing
+    partial line until the writer completes it. Truncation and file
+    replacement (new inode) restart reading from the beginning.
+
+    The read methods are blocking; call them via asyncio.to_thread().
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._handle: Optional[BinaryIO] = None
+        self._inode: Optional[int] = None
+        self._carry = b""
+
+    def read_lines(self) -> list[str]:
+        """
+        Read the complete lines appended since the last call.
+
+        Raises:
+            FileNotFoundError: If the file no longer exists
+        """
+        st = os.stat(self.path)
+
+        if self._handle is None or st.st_ino != self._inode:
+            self._reopen(st.st_ino)
+        elif st.st_size < self._handle.tell():
+            # File was truncated - restart from the beginning
+            self._handle.seek(0)
+            self._carry = b""
+
+        chunk = self._handle.read()
+        if not chunk:
+            return []
+
+        *complete, self._carry = (self._carry + chunk).split(b"\n")
+        return [
+            raw.decode("utf-8", errors="replace")
+            for raw in complete
+            if raw.strip()
+        ]
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._inode = None
+        self._carry = b""
+
+    def _reopen(self, inode: int) -> None:
+        self.close()
+        self._handle = open(self.path, "rb")
+        self._inode = inode
+
+
 class SessionFileWatcher:
     """
     Watches a Claude session JSONL file for new AskUserQuestion events.
 
-    Uses async file tailing to monitor for new lines and emits events
-    via callback when AskUserQuestion tool_use is detected.
+    Uses filesystem notifications (watchfiles/inotify) on the Claude projects
+    folder and tails the session file through a persistent handle, emitting
+    events via callback when relevant entries are detected.
 
     Automatically detects the active session from sessions-index.json
     and can switch to new sessions when they become active.
@@ -427,6 +558,7 @@ class SessionFileWatcher:
         on_event: Callable[[dict], Awaitable[None]] = None,
         poll_interval: float = 0.5,
         auto_detect_session: bool = True,
+        dedupe_window: int = DEDUPE_WINDOW_SIZE,
     ):
         """
         Initialize the watcher.
@@ -435,8 +567,10 @@ class SessionFileWatcher:
             workspace_path: Path to the workspace
             session_id: Claude session ID (optional - will auto-detect if not provided)
             on_event: Async callback for AskUserQuestion events
-            poll_interval: How often to check for new lines (seconds)
+            poll_interval: Poll delay (seconds) used only when watchfiles has to
+                fall back to polling (e.g. network filesystems)
             auto_detect_session: Whether to auto-detect and switch to new sessions
+            dedupe_window: How many recent event UUIDs are kept for dedupe
         """
         self._workspace_path = workspace_path
         self._session_id = session_id
@@ -445,7 +579,8 @@ class SessionFileWatcher:
         self._auto_detect = auto_detect_session
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._seen_uuids: set[str] = set()
+        self._stop_event = asyncio.Event()
+        self._seen_uuids = RecentUUIDWindow(dedupe_window)
         self._current_session_file: Optional[Path] = None
 
     def _detect_active_session(self) -> Optional[tuple[Path, str]]:
@@ -513,6 +648,7 @@ class SessionFileWatcher:
 
         self._current_session_file = session_file
         self._running = True
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._watch_loop())
         logger.info(f"Started watching session file: {session_file}")
         return True
@@ -520,6 +656,7 @@ class SessionFileWatcher:
     async def stop(self):
         """Stop watching the session file."""
         self._running = False
+        self._stop_event.set()
         if self._task:
             self._task.cancel()
             try:
@@ -530,111 +667,161 @@ class SessionFileWatcher:
 
     async def _watch_loop(self):
         """
-        Main watch loop - tail the file for new lines.
+        Main watch loop - tail the file whenever the filesystem reports changes.
 
-        Automatically switches to new sessions when detected.
+        Watches the Claude projects folder (not just the session file) so new
+        sessions and sessions-index.json updates are noticed without re-globbing
+        the folder on a timer. Automatically switches to new sessions when detected.
         """
-        session_file = self._current_session_file
-        session_check_counter = 0
-        SESSION_CHECK_INTERVAL = 10  # Check for new session every N iterations
+        tail = JsonlTailReader(self._current_session_file)
+        claude_folder = self._current_session_file.parent
+        watch = awatch(
+            claude_folder,
+            stop_event=self._stop_event,
+            recursive=False,
+            debounce=WATCH_DEBOUNCE_MS,
+            poll_delay_ms=int(self._poll_interval * 1000),
+        )
+        first_changes: Optional[asyncio.Future] = None
 
         try:
+            # Register the watcher BEFORE the initial drain: the first step of
+            # the awatch generator creates the inotify watch, so lines written
+            # while draining are reported instead of lost. The tail reader's
+            # offset and seen_uuids keep them from being emitted twice.
+            first_changes = asyncio.ensure_future(anext(watch, None))
+            await asyncio.sleep(0)
+
             # Start at BEGINNING of file to catch all events (seen_uuids prevents duplicates)
-            file_pos = 0
             logger.info(f"Starting watcher from beginning of file")
+            tail = await self._drain(tail)
 
-            while self._running:
-                try:
-                    # Periodically check for new active session
-                    session_check_counter += 1
-                    if self._auto_detect and session_check_counter >= SESSION_CHECK_INTERVAL:
-                        session_check_counter = 0
-                        result = self._detect_active_session()
-                        if result:
-                            new_file, new_id = result
-                            if new_id != self._session_id:
-                                logger.info(f"Detected new session: {new_id} (was {self._session_id})")
-                                self._session_id = new_id
-                                session_file = new_file
-                                self._current_session_file = new_file
-                                # Start from BEGINNING of new file to catch all events
-                                file_pos = 0
-                                self._seen_uuids.clear()  # Clear seen UUIDs for fresh session
-
-                    if not session_file or not session_file.exists():
-                        await asyncio.sleep(self._poll_interval)
-                        continue
-
-                    current_size = session_file.stat().st_size
-
-                    if current_size > file_pos:
-                        # New data available
-                        with open(session_file, "r", encoding="utf-8") as f:
-                            f.seek(file_pos)
-                            new_content = f.read()
-                            file_pos = f.tell()
-
-                        # Process new lines
-                        lines = [l for l in new_content.split("\n") if l.strip()]
-                        if lines:
-                            logger.info(f"Processing {len(lines)} new lines from session file")
-
-                        for line in lines:
-                            event = parse_claude_event(line)
-                            if event:
-                                event_uuid = event.get("uuid") or ""
-                                if event_uuid not in self._seen_uuids:
-                                    self._seen_uuids.add(event_uuid)
-                                    event_type = event.get("type", "unknown")
-                                    uuid_preview = event_uuid[:8] if event_uuid else "no-uuid"
-                                    logger.info(f"Detected {event_type}: {uuid_preview}...")
-                                    if self._on_event:
-                                        await self._on_event(event)
-                                else:
-                                    logger.debug(f"Skipping duplicate event: {event_uuid[:8] if event_uuid else 'no-uuid'}")
-                            else:
-                                # Log what type of message was skipped
-                                try:
-                                    data = json.loads(line)
-                                    msg_type = data.get("type", "unknown")
-                                    # Check if it's an assistant message with tool_use
-                                    if msg_type == "assistant":
-                                        message = data.get("message", {})
-                                        content = message.get("content", [])
-                                        tools_used = []
-                                        for block in content:
-                                            if isinstance(block, dict) and block.get("type") == "tool_use":
-                                                tools_used.append(block.get("name", "unknown"))
-                                        if tools_used:
-                                            logger.info(f"Skipped assistant message with tools: {tools_used}")
-                                        else:
-                                            logger.debug(f"Skipped assistant message (no tool_use)")
-                                    else:
-                                        logger.debug(f"Skipped message type: {msg_type}")
-                                except Exception as e:
-                                    logger.debug(f"Failed to parse line: {e}")
-
-                    elif current_size < file_pos:
-                        # File was truncated/rotated - reset position
-                        file_pos = 0
-
-                except FileNotFoundError:
-                    logger.warning(f"Session file disappeared: {session_file}")
-                    # Try to find a new session
-                    result = self._detect_active_session()
-                    if result:
-                        session_file, self._session_id = result
-                        self._current_session_file = session_file
-                        file_pos = 0
-                    await asyncio.sleep(1)
-                    continue
+            changes = await first_changes
+            while changes is not None and self._running:
+                changed_names = {Path(path).name for _, path in changes}
+
+                if self._auto_detect and self._needs_session_check(changed_names, tail.path):
+                    tail = await self._maybe_switch_session(tail)
+
+                if tail.path.name in changed_names:
+                    tail = await self._drain(tail)
 
-                await asyncio.sleep(self._poll_interval)
+                changes = await anext(watch, None)
 
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.error(f"Error in watch loop: {e}")
+        finally:
+            if first_changes is not None and not first_changes.done():
+                first_changes.cancel()
+                await asyncio.gather(first_changes, return_exceptions=True)
+            await watch.aclose()
+            tail.close()
+
+    @staticmethod
+    def _needs_session_check(changed_names: set[str], current_file: Path) -> bool:
+        """Whether a change batch may indicate a different active session."""
+        return any(
+            name == SESSIONS_INDEX_FILE
+            or (name.endswith(".jsonl") and name != current_file.name)
+            for name in changed_names
+        )
+
+    async def _maybe_switch_session(self, tail: JsonlTailReader) -> JsonlTailReader:
+        """Re-detect the active session and switch the tail reader if it changed."""
+        result = await asyncio.to_thread(self._detect_active_session)
+        if not result:
+            return tail
+
+        new_file, new_id = result
+        if new_id == self._session_id:
+            return tail
+
+        logger.info(f"Detected new session: {new_id} (was {self._session_id})")
+        tail.close()
+        self._session_id = new_id
+        self._current_session_file = new_file
+        self._seen_uuids.clear()  # Clear seen UUIDs for fresh session
+        # Start from BEGINNING of new file to catch all events
+        return await self._drain(JsonlTailReader(new_file))
+
+    async def _drain(self, tail: JsonlTailReader) -> JsonlTailReader:
+        """
+        Read and dispatch all complete lines currently available.
+
+        Returns the reader to keep using (a new one if the session file
+        disappeared and another session was detected).
+        """
+        try:
+            lines = await asyncio.to_thread(tail.read_lines)
+        except FileNotFoundError:
+            logger.warning(f"Session file disappeared: {tail.path}")
+            result = await asyncio.to_thread(self._detect_active_session)
+            if not result:
+                return tail
+            tail.close()
+            self._current_session_file, self._session_id = result
+            new_tail = JsonlTailReader(self._current_session_file)
+            if new_tail.path == tail.path:
+                return new_tail
+            return await self._drain(new_tail)
+
+        if lines:
+            logger.info(f"Processing {len(lines)} new lines from session file")
+
+        for line in lines:
+            await self._process_line(line)
+
+        return tail
+
+    async def _process_line(self, line: str) -> None:
+        """Parse a single session line (once) and emit its event, if any."""
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Failed to parse line: {e}")
+            return
+
+        event = extract_claude_event(data)
+        if not event:
+            _log_skipped_record(data)
+            return
+
+        event_uuid = event.get("uuid") or ""
+        uuid_preview = event_uuid[:8] if event_uuid else "no-uuid"
+        if not self._seen_uuids.add(event_uuid):
+            logger.debug(f"Skipping duplicate event: {uuid_preview}")
+            return
+
+        event_type = event.get("type", "unknown")
+        logger.info(f"Detected {event_type}: {uuid_preview}...")
+        if self._on_event:
+            await self._on_event(event)
+
+
+def _log_skipped_record(data: Any) -> None:
+    """Log what type of message was skipped by extract_claude_event()."""
+    if not isinstance(data, dict):
+        logger.debug("Skipped non-object line")
+        return
+
+    msg_type = data.get("type", "unknown")
+    if msg_type != "assistant":
+        logger.debug(f"Skipped message type: {msg_type}")
+        return
+
+    # Check if it's an assistant message with tool_use
+    content = (data.get("message") or {}).get("content") or []
+    tools_used = [
+        block.get("name", "unknown")
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "tool_use"
+    ]
+    if tools_used:
+        logger.info(f"Skipped assistant message with tools: {tools_used}")
+    else:
+        logger.debug(f"Skipped assistant message (no tool_use)")
 
 
 class SessionFileWatcherManager:
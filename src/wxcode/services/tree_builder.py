@@ -24,7 +24,9 @@ Constrói a árvore:
     - ...
 """
 
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Union
 
 from beanie import PydanticObjectId
 
@@ -35,7 +37,10 @@ from wxcode.models import (
     Procedure,
     ClassDefinition,
     DatabaseSchema,
+    SchemaSummary,
 )
+from wxcode.models.schema import get_schema_tables
+from wxcode.services.pagination import decode_cursor, encode_cursor, keyset_filter
 
 
 # Mapeamento de tipo para ícone sugerido
@@ -78,6 +83,29 @@ ELEMENT_TYPE_TO_CATEGORY = {
     ElementType.WEBSERVICE: "apis",
 }
 
+CATEGORY_BY_TYPE_VALUE = {
+    elem_type.value: category
+    for elem_type, category in ELEMENT_TYPE_TO_CATEGORY.items()
+}
+
+# Mapeamento de categoria para ElementTypes (inverso de ELEMENT_TYPE_TO_CATEGORY)
+CATEGORY_TO_TYPES = {
+    "pages": [ElementType.PAGE, ElementType.PAGE_TEMPLATE],
+    "procedure_groups": [ElementType.PROCEDURE_GROUP, ElementType.BROWSER_PROCEDURE],
+    "classes": [ElementType.CLASS],
+    "queries": [ElementType.QUERY],
+    "reports": [ElementType.REPORT],
+    "apis": [ElementType.REST_API, ElementType.WEBSERVICE],
+}
+
+# Ordenação estável para paginação por cursor de categorias
+CATEGORY_SORT_FIELDS = ["source_name", "_id"]
+
+# Tempo máximo (segundos) que o esqueleto da árvore fica em cache. Importações
+# e enrich rodam em subprocessos da CLI, então o TTL limita a defasagem mesmo
+# quando a invalidação explícita não alcança este processo.
+SKELETON_CACHE_TTL = 60.0
+
 # Labels para categorias
 CATEGORY_LABELS = {
     "pages": "Pages",
@@ -91,9 +119,132 @@ CATEGORY_LABELS = {
 }
 
 
+@dataclass
+class TreeSkeleton:
+    """
+    Contagens agregadas da árvore de um projeto.
+
+    element_groups guarda (source_type, excluded_from, count) agrupados pelo
+    Mongo; as contagens por configuração são derivadas em memória.
+    """
+
+    element_groups: list[tuple[str, frozenset[str], int]] = field(default_factory=list)
+    tables_count: int = 0
+    connections_count: int = 0
+
+    def category_counts(self, config_id: str) -> dict[str, int]:
+        """Contagem por categoria dos elementos incluídos na configuração."""
+        counts: dict[str, int] = {}
+        for source_type, excluded_from, count in self.element_groups:
+            if config_id in excluded_from:
+                continue
+            category = CATEGORY_BY_TYPE_VALUE[source_type]
+            counts[category] = counts.get(category, 0) + count
+        return counts
+
+    @property
+    def queries_count(self) -> int:
+        """Total de queries do projeto (independente de configuração)."""
+        return sum(
+            count for source_type, _, count in self.element_groups
+            if source_type == ElementType.QUERY.value
+        )
+
+
+# project_id -> (fingerprint, expires_at, skeleton)
+_skeleton_cache: dict[str, tuple[tuple, float, TreeSkeleton]] = {}
+
+
+def invalidate_tree_cache(project_id: Optional[Union[str, PydanticObjectId]] = None) -> None:
+    """
+    Descarta o esqueleto em cache da árvore.
+
+    Deve ser chamado após import, enrich ou purge de um projeto.
+
+    Args:
+        project_id: Projeto a invalidar (None invalida todos)
+    """
+    if project_id is None:
+        _skeleton_cache.clear()
+    else:
+        _skeleton_cache.pop(str(project_id), None)
+
+
+def _project_fingerprint(project: Project) -> tuple:
+    """Campos do projeto que mudam quando o conteúdo da árvore muda."""
+    return (
+        project.updated_at,
+        project.total_elements,
+        project.status,
+        tuple(c.configuration_id for c in project.configurations),
+    )
+
+
 class TreeBuilder:
     """Construtor da árvore hierárquica do Workspace."""
 
+    async def get_skeleton(self, project: Project) -> TreeSkeleton:
+        """
+        Retorna as contagens agregadas do projeto (com cache).
+
+        Usa duas agregações: uma sobre elements agrupando por
+        (source_type, excluded_from) e outra sobre o schema para os totais
+        de tabelas e conexões.
+        """
+        key = str(project.id)
+        fingerprint = _project_fingerprint(project)
+        cached = _skeleton_cache.get(key)
+        if cached and cached[0] == fingerprint and cached[1] > time.monotonic():
+            return cached[2]
+
+        skeleton = TreeSkeleton()
+
+        pipeline = [
+            {"$match": {
+                "project_id.$id": project.id,
+                "source_type": {"$in": list(CATEGORY_BY_TYPE_VALUE)},
+            }},
+            {"$group": {
+                "_id": {
+                    "source_type": "$source_type",
+                    "excluded_from": {"$ifNull": ["$excluded_from", []]},
+                },
+                "count": {"$sum": 1},
+            }},
+        ]
+        async for doc in Element.aggregate(pipeline):
+            skeleton.element_groups.append((
+                doc["_id"]["source_type"],
+                frozenset(doc["_id"]["excluded_from"]),
+                doc["count"],
+            ))
+
+        schema_pipeline = [
+            {"$match": {"project_id": project.id}},
+            {"$limit": 1},
+            {"$project": {
+                "_id": 0,
+                "tables_count": {"$size": {"$ifNull": ["$tables", []]}},
+                "connections_count": {"$size": {"$ifNull": ["$connections", []]}},
+            }},
+        ]
+        async for doc in DatabaseSchema.aggregate(schema_pipeline):
+            skeleton.tables_count = doc["tables_count"]
+            skeleton.connections_count = doc["connections_count"]
+            if not skeleton.tables_count:
+                # Tabelas na coleção schema_tables (formato atual)
+                summary = await SchemaSummary.find_one(
+                    SchemaSummary.project_id == project.id
+                )
+                skeleton.tables_count = summary.total_tables if summary else 0
+
+        _skeleton_cache[key] = (
+            fingerprint,
+            time.monotonic() + SKELETON_CACHE_TTL,
+            skeleton,
+        )
+        return skeleton
+
     async def build_project_tree(
         self,
         project_id: PydanticObjectId,
@@ -129,16 +280,16 @@ class TreeBuilder:
 
         if depth >= 2:
             children = []
+            skeleton = await self.get_skeleton(project)
 
             # Analysis node
-            schema = await DatabaseSchema.find_one({"project_id": project.id})
-            analysis_node = await self._build_analysis_node(project.id, schema, depth - 1)
+            analysis_node = self._build_analysis_node(project.id, skeleton, depth - 1)
             children.append(analysis_node)
 
             # Configuration nodes
             for config in project.configurations:
-                config_node = await self._build_configuration_node(
-                    project.id, config, depth - 1
+                config_node = self._build_configuration_node(
+                    skeleton, config, depth - 1
                 )
                 children.append(config_node)
 
@@ -146,21 +297,16 @@ class TreeBuilder:
 
         return root
 
-    async def _build_analysis_node(
+    def _build_analysis_node(
         self,
         project_id: PydanticObjectId,
-        schema: Optional[DatabaseSchema],
+        skeleton: TreeSkeleton,
         remaining_depth: int
     ) -> dict:
         """Constrói nó de Analysis com schema do banco."""
-        tables_count = schema.total_tables if schema else 0
-        connections_count = schema.total_connections if schema else 0
-
-        # Contar queries do projeto
-        queries_count = await Element.find({
-            "project_id.$id": project_id,
-            "source_type": ElementType.QUERY.value
-        }).count()
+        tables_count = skeleton.tables_count
+        connections_count = skeleton.connections_count
+        queries_count = skeleton.queries_count
 
         node = {
             "id": f"{project_id}:analysis",
@@ -227,28 +373,17 @@ class TreeBuilder:
 
         return node
 
-    async def _build_configuration_node(
+    def _build_configuration_node(
         self,
-        project_id: PydanticObjectId,
+        skeleton: TreeSkeleton,
         config,
         remaining_depth: int
     ) -> dict:
         """Constrói nó de Configuration."""
         config_id = config.configuration_id
 
-        # Contar elementos por categoria nesta configuração
         # Elemento pertence à config se config_id NOT IN excluded_from
-        category_counts = {}
-
-        for elem_type, category in ELEMENT_TYPE_TO_CATEGORY.items():
-            count = await Element.find({
-                "project_id.$id": project_id,
-                "source_type": elem_type.value,
-                "excluded_from": {"$nin": [config_id]}
-            }).count()
-
-            if count > 0:
-                category_counts[category] = category_counts.get(category, 0) + count
+        category_counts = skeleton.category_counts(config_id)
 
         total_elements = sum(category_counts.values())
 
@@ -305,17 +440,12 @@ class TreeBuilder:
         Returns:
             Lista de nós de categoria.
         """
-        category_counts = {}
-
-        for elem_type, category in ELEMENT_TYPE_TO_CATEGORY.items():
-            count = await Element.find({
-                "project_id.$id": project_id,
-                "source_type": elem_type.value,
-                "excluded_from": {"$nin": [config_id]}
-            }).count()
+        project = await Project.get(project_id)
+        if not project:
+            return []
 
-            if count > 0:
-                category_counts[category] = category_counts.get(category, 0) + count
+        skeleton = await self.get_skeleton(project)
+        category_counts = skeleton.category_counts(config_id)
 
         children = []
         for category, count in sorted(category_counts.items()):
@@ -346,15 +476,14 @@ class TreeBuilder:
         Returns:
             Lista de nós de categoria.
         """
-        schema = await DatabaseSchema.find_one({"project_id": project_id})
-
-        tables_count = schema.total_tables if schema else 0
-        connections_count = schema.total_connections if schema else 0
+        project = await Project.get(project_id)
+        if not project:
+            return []
 
-        queries_count = await Element.find({
-            "project_id.$id": project_id,
-            "source_type": ElementType.QUERY.value
-        }).count()
+        skeleton = await self.get_skeleton(project)
+        tables_count = skeleton.tables_count
+        connections_count = skeleton.connections_count
+        queries_count = skeleton.queries_count
 
         children = []
 
@@ -406,7 +535,9 @@ class TreeBuilder:
         self,
         project_id: PydanticObjectId,
         config_id: Optional[str],
-        category: str
+        category: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
     ) -> list[dict]:
         """
         Expande uma categoria retornando seus elementos/itens.
@@ -415,6 +546,8 @@ class TreeBuilder:
             project_id: ID do projeto
             config_id: ID da configuração (None para Analysis)
             category: Nome da categoria (pages, tables, etc.)
+            limit: Máximo de elementos por página (None = todos)
+            after: Cursor retornado por category_page_cursor() da página anterior
 
         Returns:
             Lista de nós de elemento.
@@ -432,75 +565,122 @@ class TreeBuilder:
         if config_id is None:
             return []
 
-        # Mapear categoria para ElementTypes
-        category_to_types = {
-            "pages": [ElementType.PAGE, ElementType.PAGE_TEMPLATE],
-            "procedure_groups": [ElementType.PROCEDURE_GROUP, ElementType.BROWSER_PROCEDURE],
-            "classes": [ElementType.CLASS],
-            "queries": [ElementType.QUERY],
-            "reports": [ElementType.REPORT],
-            "apis": [ElementType.REST_API, ElementType.WEBSERVICE],
-        }
-
-        elem_types = category_to_types.get(category, [])
+        elem_types = CATEGORY_TO_TYPES.get(category, [])
         if not elem_types:
             return []
 
-        # Buscar elementos
-        elements = await Element.find({
+        # Buscar elementos (apenas campos usados no nó)
+        query_filter: dict = {
             "project_id.$id": project_id,
             "source_type": {"$in": [t.value for t in elem_types]},
             "excluded_from": {"$nin": [config_id]}
-        }).sort([("source_name", 1)]).to_list()
+        }
+        if after:
+            query_filter = {
+                "$and": [query_filter, keyset_filter(CATEGORY_SORT_FIELDS, decode_cursor(after))]
+            }
+
+        pipeline: list[dict] = [
+            {"$match": query_filter},
+            {"$sort": {"source_name": 1, "_id": 1}},
+        ]
+        if limit:
+            pipeline.append({"$limit": limit})
+        pipeline.append({"$project": {
+            "source_name": 1,
+            "source_type": 1,
+            "conversion_status": "$conversion.status",
+        }})
+        elements = await Element.aggregate(pipeline).to_list()
+
+        child_counts = await self._count_element_children(elements)
 
         children = []
         for elem in elements:
-            # Verificar se elemento tem procedures locais ou métodos
-            has_children = False
-            children_count = 0
-
-            if elem.source_type in [ElementType.PAGE, ElementType.PAGE_TEMPLATE]:
-                # Contar procedures locais
-                proc_count = await Procedure.find({
-                    "element_id": elem.id,
-                    "is_local": True
-                }).count()
-                has_children = proc_count > 0
-                children_count = proc_count
-
-            elif elem.source_type == ElementType.PROCEDURE_GROUP:
-                # Contar procedures do grupo
-                proc_count = await Procedure.find({
-                    "element_id": elem.id
-                }).count()
-                has_children = proc_count > 0
-                children_count = proc_count
-
-            elif elem.source_type == ElementType.CLASS:
-                # Contar membros + métodos
-                class_def = await ClassDefinition.find_one({"element_id": elem.id})
-                if class_def:
-                    children_count = len(class_def.members) + len(class_def.methods)
-                    has_children = children_count > 0
-
+            children_count = child_counts.get(elem["_id"], 0)
             children.append({
-                "id": str(elem.id),
-                "name": elem.source_name,
+                "id": str(elem["_id"]),
+                "name": elem["source_name"],
                 "node_type": "element",
-                "element_type": elem.source_type.value,
-                "status": elem.conversion.status.value if elem.conversion else "pending",
-                "icon": TYPE_TO_ICON.get(elem.source_type.value, "file"),
-                "has_children": has_children,
+                "element_type": elem["source_type"],
+                "status": elem.get("conversion_status") or "pending",
+                "icon": TYPE_TO_ICON.get(elem["source_type"], "file"),
+                "has_children": children_count > 0,
                 "children_count": children_count,
                 "children": None,
                 "metadata": {
-                    "element_id": str(elem.id),
+                    "element_id": str(elem["_id"]),
                     "config_id": config_id,
                 },
             })
 
         return children
 
+    @staticmethod
+    def category_page_cursor(children: list[dict], limit: Optional[int]) -> Optional[str]:
+        """
+        Cursor para a próxima página de expand_category.
+
+        Returns:
+            Cursor opaco, ou None se a página não estava cheia (última página)
+        """
+        if not limit or len(children) < limit:
+            return None
+        last = children[-1]
+        return encode_cursor(last["name"], PydanticObjectId(last["id"]))
+
+    async def _count_element_children(self, elements: list[dict]) -> dict:
+        """
+        Conta filhos (procedures locais, procedures do grupo, membros de classe)
+        de uma lista de elementos com uma agregação por collection.
+
+        Returns:
+            Dict element_id -> quantidade de filhos
+        """
+        page_ids = []
+        group_ids = []
+        class_ids = []
+        for elem in elements:
+            source_type = elem["source_type"]
+            if source_type in (ElementType.PAGE.value, ElementType.PAGE_TEMPLATE.value):
+                page_ids.append(elem["_id"])
+            elif source_type == ElementType.PROCEDURE_GROUP.value:
+                group_ids.append(elem["_id"])
+            elif source_type == ElementType.CLASS.value:
+                class_ids.append(elem["_id"])
+
+        counts: dict = {}
+
+        if page_ids or group_ids:
+            page_id_set = set(page_ids)
+            pipeline = [
+                {"$match": {"element_id": {"$in": page_ids + group_ids}}},
+                {"$group": {
+                    "_id": "$element_id",
+                    "total": {"$sum": 1},
+                    "local": {"$sum": {"$cond": ["$is_local", 1, 0]}},
+                }},
+            ]
+            async for doc in Procedure.aggregate(pipeline):
+                # Pages contam apenas procedures locais
+                counts[doc["_id"]] = doc["local"] if doc["_id"] in page_id_set else doc["total"]
+
+        if class_ids:
+            pipeline = [
+                {"$match": {"element_id": {"$in": class_ids}}},
+                {"$project": {
+                    "element_id": 1,
+                    "count": {"$add": [
+                        {"$size": {"$ifNull": ["$members", []]}},
+                        {"$size": {"$ifNull": ["$methods", []]}},
+                    ]},
+                }},
+            ]
+            async for doc in ClassDefinition.aggregate(pipeline):
+                counts.setdefault(doc["element_id"], doc["count"])
+
+        return counts
+
     async def _expand_tables(self, project_id: PydanticObjectId) -> list[dict]:
         """Retorna tabelas do schema."""
         schema = await DatabaseSchema.find_one({"project_id": project_id})
@@ -508,7 +688,8 @@ class TreeBuilder:
             return []
 
         children = []
-        for table in sorted(schema.tables, key=lambda t: t.name):
+        tables = await get_schema_tables(schema)
+        for table in sorted(tables, key=lambda t: t.name):
             children.append({
                 "id": f"table:{table.name}",
                 "name": table.name,
@@ -0,0 +1,94 @@
+"""
+Progresso de uploads do wizard de importação.
+
+O upload acontece antes da sessão existir: o cliente gera um `upload_id`,
+abre o WebSocket de progresso com ele e envia o mesmo id no formulário do
+upload. O endpoint publica eventos aqui e o WebSocket os repassa.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Set
+
+TERMINAL_EVENTS = frozenset({"upload_complete", "upload_error"})
+
+
+class UploadProgressHub:
+    """Distribui eventos de progresso de upload para os WebSockets inscritos."""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._last_event: Dict[str, Dict[str, Any]] = {}
+
+    def subscribe(self, upload_id: str) -> asyncio.Queue:
+        """Inscreve um consumidor; recebe o último evento já publicado."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(upload_id, set()).add(queue)
+        last = self._last_event.get(upload_id)
+        if last is not None:
+            queue.put_nowait(last)
+        return queue
+
+    def unsubscribe(self, upload_id: str, queue: asyncio.Queue) -> None:
+        """Remove um consumidor."""
+        queues = self._subscribers.get(upload_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[upload_id]
+
+    def publish(self, upload_id: Optional[str], event: Dict[str, Any]) -> None:
+        """Publica um evento (deve ser chamado no event loop)."""
+        if not upload_id:
+            return
+        if event.get("type") in TERMINAL_EVENTS:
+            self._last_event.pop(upload_id, None)
+        else:
+            self._last_event[upload_id] = event
+        for queue in self._subscribers.get(upload_id, ()):
+            queue.put_nowait(event)
+
+    def progress_callback(
+        self,
+        upload_id: Optional[str],
+        phase: str,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        """
+        Callback de progresso para uso em threads.
+
+        Publica no máximo um evento por ponto percentual, via
+        call_soon_threadsafe.
+
+        Args:
+            upload_id: Id do upload (None desativa o callback)
+            phase: Fase reportada ("saving" ou "extracting")
+            loop: Event loop onde os eventos são publicados
+
+        Returns:
+            Função (bytes_done, bytes_total) ou None
+        """
+        if not upload_id:
+            return None
+        last_percent = -1
+
+        def report(done: int, total: int) -> None:
+            nonlocal last_percent
+            percent = int(done * 100 / total) if total else 100
+            if percent == last_percent:
+                return
+            last_percent = percent
+            event = {
+                "type": "upload_progress",
+                "phase": phase,
+                "bytes_done": done,
+                "bytes_total": total,
+                "percent": percent,
+            }
+            loop.call_soon_threadsafe(self.publish, upload_id, event)
+
+        return report
+
+
+# Instância global (compartilhada entre o endpoint de upload e o WebSocket)
+upload_progress = UploadProgressHub()
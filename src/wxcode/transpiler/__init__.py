@@ -14,6 +14,13 @@ from wxcode.transpiler.hyperfile_catalog import (
     needs_llm_conversion,
     get_mongodb_equivalent,
 )
+from wxcode.transpiler.hyperfile_analyzer import (
+    HFunctionCall,
+    HyperFileAnalyzer,
+    HyperFileUsage,
+    analyze_hyperfile_usage,
+    get_hyperfile_analyzer,
+)
 
 __all__ = [
     "BufferBehavior",
@@ -24,4 +31,9 @@ __all__ = [
     "is_buffer_modifying",
     "needs_llm_conversion",
     "get_mongodb_equivalent",
+    "HFunctionCall",
+    "HyperFileAnalyzer",
+    "HyperFileUsage",
+    "analyze_hyperfile_usage",
+    "get_hyperfile_analyzer",
 ]
@@ -0,0 +1,213 @@
+"""
+Analisador de uso de funções H* em código WLanguage.
+
+Uma única regex compilada localiza, em uma só passada, os identificadores
+H* seguidos de "(" e o nome é resolvido por um índice em minúsculas do
+catálogo (O(1)), classificando o bloco: chamadas encontradas,
+comportamento de buffer, funções que precisam de LLM e equivalentes
+MongoDB/SQLAlchemy. Strings e comentários (//) são consumidos pela mesma
+regex e ignorados.
+
+Uma alternância com todos os nomes do catálogo na regex é mais lenta no
+`re` do Python do que capturar o identificador e consultar o índice.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Mapping, Optional
+
+from wxcode.transpiler.hyperfile_catalog import (
+    HFUNCTION_CATALOG,
+    BufferBehavior,
+    HFunctionInfo,
+)
+
+
+@dataclass(slots=True)
+class HFunctionCall:
+    """Chamada de função H* encontrada no código."""
+
+    name: str                      # Nome canônico (ou como escrito, se desconhecida)
+    info: Optional[HFunctionInfo]  # None = função H* fora do catálogo
+    args_text: str                 # Argumentos como escritos (até o primeiro parêntese)
+    line: int                      # 1-based
+    start: int                     # Offset no código
+
+    @property
+    def args(self) -> list[str]:
+        """Argumentos separados por vírgula."""
+        return [a.strip() for a in self.args_text.split(",") if a.strip()]
+
+    @property
+    def table(self) -> Optional[str]:
+        """Primeiro argumento (arquivo de dados), se houver."""
+        args = self.args
+        return args[0] if args else None
+
+
+@dataclass
+class HyperFileUsage:
+    """Classificação de um bloco de código quanto ao uso de funções H*."""
+
+    calls: list[HFunctionCall] = field(default_factory=list)
+
+    # Derivados calculados uma vez: `calls` não muda após analyze()
+    @cached_property
+    def known_calls(self) -> list[HFunctionCall]:
+        """Chamadas de funções do catálogo."""
+        return [c for c in self.calls if c.info is not None]
+
+    @cached_property
+    def functions(self) -> dict[str, HFunctionInfo]:
+        """Funções do catálogo usadas (nome -> info), na ordem de uso."""
+        return {c.name: c.info for c in self.known_calls}
+
+    @property
+    def function_names(self) -> list[str]:
+        """Funções do catálogo usadas, sem repetição, na ordem de uso."""
+        return list(self.functions)
+
+    @property
+    def unknown_functions(self) -> list[str]:
+        """Funções H* chamadas que não estão no catálogo."""
+        return list(dict.fromkeys(c.name for c in self.calls if c.info is None))
+
+    @property
+    def by_behavior(self) -> dict[BufferBehavior, list[str]]:
+        """Funções usadas agrupadas por comportamento de buffer."""
+        grouped: dict[BufferBehavior, list[str]] = {}
+        for name, info in self.functions.items():
+            grouped.setdefault(info.behavior, []).append(name)
+        return grouped
+
+    @property
+    def modifies_buffer(self) -> bool:
+        """True se alguma função carrega dados no buffer."""
+        return any(
+            info.behavior == BufferBehavior.MODIFIES_BUFFER for info in self.functions.values()
+        )
+
+    @property
+    def needs_llm(self) -> list[str]:
+        """Funções usadas que precisam de conversão via LLM."""
+        return [name for name, info in self.functions.items() if info.needs_llm]
+
+    @property
+    def tables(self) -> list[str]:
+        """Arquivos de dados referenciados (primeiro argumento), sem repetição."""
+        return list(dict.fromkeys(c.table for c in self.known_calls if c.table))
+
+    @property
+    def mongodb_equivalents(self) -> dict[str, str]:
+        """Equivalente MongoDB de cada função usada."""
+        return {name: info.mongodb_equivalent for name, info in self.functions.items()}
+
+    @property
+    def sqlalchemy_equivalents(self) -> dict[str, str]:
+        """Equivalente SQLAlchemy das funções usadas que têm um."""
+        return {
+            name: info.sqlalchemy_equivalent
+            for name, info in self.functions.items()
+            if info.sqlalchemy_equivalent
+        }
+
+
+class HyperFileAnalyzer:
+    """Matcher compilado sobre o catálogo de funções H*."""
+
+    def __init__(self, catalog: Mapping[str, HFunctionInfo] = HFUNCTION_CATALOG):
+        """
+        Monta o índice de nomes do catálogo.
+
+        Args:
+            catalog: Catálogo de funções (padrão: HFUNCTION_CATALOG)
+        """
+        self.catalog = catalog
+        self._by_key = {name.lower(): info for name, info in catalog.items()}
+
+    # O lookahead inicial deixa o `re` pular direto para os candidatos
+    _PATTERN = re.compile(
+        r'(?=["/Hh])(?:'
+        r'"[^"\n]*"'                            # string literal (ignorada)
+        r'|//[^\n]*'                            # comentário (ignorado)
+        r'|(?<!\w)(?P<name>H\w+)\s*\((?P<args>[^()\n]*)'
+        r')',
+        re.IGNORECASE,
+    )
+
+    def lookup(self, name: str) -> Optional[HFunctionInfo]:
+        """Busca função pelo nome (case-insensitive, O(1))."""
+        return self._by_key.get(name.lower())
+
+    def find_calls(self, code: str) -> list[HFunctionCall]:
+        """
+        Encontra as chamadas de funções H* em uma passada.
+
+        Args:
+            code: Código WLanguage
+
+        Returns:
+            Chamadas na ordem em que aparecem
+        """
+        calls = []
+        line = 1
+        last = 0
+        by_key = self._by_key
+        for match in self._PATTERN.finditer(code):
+            name = match.group("name")
+            if name is None:
+                continue
+
+            info = by_key.get(name.lower())
+            # Fora do catálogo, só conta como H* o padrão HNomeDaFuncao
+            if info is None and not (name[0] == "H" and name[1:2].isupper()):
+                continue
+
+            start = match.start()
+            line += code.count("\n", last, start)
+            last = start
+
+            calls.append(HFunctionCall(
+                info.name if info else name, info, match.group("args"), line, start
+            ))
+        return calls
+
+    def analyze(self, code: str) -> HyperFileUsage:
+        """
+        Classifica o uso de funções H* em um bloco de código.
+
+        Args:
+            code: Código WLanguage (procedure, evento, etc.)
+
+        Returns:
+            HyperFileUsage com chamadas e classificações
+        """
+        if not code:
+            return HyperFileUsage()
+        return HyperFileUsage(calls=self.find_calls(code))
+
+
+_default_analyzer: Optional[HyperFileAnalyzer] = None
+
+
+def get_hyperfile_analyzer() -> HyperFileAnalyzer:
+    """Retorna o analisador compartilhado sobre HFUNCTION_CATALOG."""
+    global _default_analyzer
+
+    if _default_analyzer is None:
+        _default_analyzer = HyperFileAnalyzer()
+    return _default_analyzer
+
+
+def analyze_hyperfile_usage(code: str) -> HyperFileUsage:
+    """
+    Atalho para get_hyperfile_analyzer().analyze(code).
+
+    Args:
+        code: Código WLanguage
+
+    Returns:
+        HyperFileUsage do bloco
+    """
+    return get_hyperfile_analyzer().analyze(code)
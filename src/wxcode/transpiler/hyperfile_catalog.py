@@ -521,6 +521,26 @@ HFUNCTION_CATALOG: dict[str, HFunctionInfo] = {
 }
 
 
+# ===========================================================================
+# Índices pré-calculados (o catálogo é estático)
+# ===========================================================================
+
+# Nome em minúsculas -> função (lookup case-insensitive O(1))
+_CATALOG_BY_KEY: dict[str, HFunctionInfo] = {
+    name.lower(): func for name, func in HFUNCTION_CATALOG.items()
+}
+
+# Comportamento -> funções, na ordem do catálogo
+_CATALOG_BY_BEHAVIOR: dict[BufferBehavior, tuple[HFunctionInfo, ...]] = {
+    behavior: tuple(f for f in HFUNCTION_CATALOG.values() if f.behavior == behavior)
+    for behavior in BufferBehavior
+}
+
+_FUNCTIONS_NEEDING_LLM: tuple[HFunctionInfo, ...] = tuple(
+    f for f in HFUNCTION_CATALOG.values() if f.needs_llm
+)
+
+
 # ===========================================================================
 # Funções Helper de Lookup
 # ===========================================================================
@@ -536,16 +556,12 @@ def get_hfunction(name: str) -> Optional[HFunctionInfo]:
         HFunctionInfo se encontrado, None caso contrário
     """
     # Busca exata
-    if name in HFUNCTION_CATALOG:
-        return HFUNCTION_CATALOG[name]
+    func = HFUNCTION_CATALOG.get(name)
+    if func is not None:
+        return func
 
     # Busca case-insensitive
-    name_lower = name.lower()
-    for func_name, func_info in HFUNCTION_CATALOG.items():
-        if func_name.lower() == name_lower:
-            return func_info
-
-    return None
+    return _CATALOG_BY_KEY.get(name.lower())
 
 
 def get_functions_by_behavior(behavior: BufferBehavior) -> list[HFunctionInfo]:
@@ -558,10 +574,7 @@ def get_functions_by_behavior(behavior: BufferBehavior) -> list[HFunctionInfo]:
     Returns:
         Lista de funções com o comportamento especificado
     """
-    return [
-        func for func in HFUNCTION_CATALOG.values()
-        if func.behavior == behavior
-    ]
+    return list(_CATALOG_BY_BEHAVIOR.get(behavior, ()))
 
 
 def is_buffer_modifying(name: str) -> bool:
@@ -623,4 +636,4 @@ def get_functions_needing_llm() -> list[HFunctionInfo]:
     Returns:
         Lista de funções que precisam de LLM
     """
-    return [func for func in HFUNCTION_CATALOG.values() if func.needs_llm]
+    return list(_FUNCTIONS_NEEDING_LLM)
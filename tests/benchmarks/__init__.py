@@ -0,0 +1,6 @@
+"""
+Benchmarks for wxcode hot paths.
+
+Each benchmark prints its measurements and asserts a conservative
+speedup or latency budget so regressions fail the suite.
+"""
@@ -0,0 +1,150 @@
+"""
+Benchmark: ContextBuilder.build latency with cached token counting.
+
+Builds contexts for many pages that reference the same pool of global
+procedures. With the content-hash cache each procedure is tokenized once,
+so every page after the first only pays for its own controls/code.
+"""
+
+import re
+import time
+
+import pytest
+from bson import ObjectId
+
+from wxcode.llm_converter import token_counter
+from wxcode.llm_converter.context_builder import ContextBuilder
+from wxcode.llm_converter.token_counter import TokenCounter
+
+PAGES = 60
+GLOBAL_PROCEDURES = 200
+PROCS_PER_PAGE = 40
+
+
+class _RegexEncoder:
+    """Stand-in with tiktoken-like cost when the BPE file can't be downloaded."""
+
+    _pattern = re.compile(r"\w+|[^\w\s]")
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        return [hash(t) for t in self._pattern.findall(text)]
+
+
+def _encoder():
+    encoder = token_counter._load_encoding(token_counter.TOKEN_ENCODING)
+    return encoder or _RegexEncoder()
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, *args):
+        return self
+
+    def __aiter__(self):
+        self._iter = iter(self._docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return dict(next(self._iter))
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Collection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def find_one(self, query):
+        return next((d for d in self.docs if d["_id"] == query["_id"]), None)
+
+    def find(self, query):
+        def match(doc):
+            for key, value in query.items():
+                if isinstance(value, dict) and "$in" in value:
+                    if doc.get(key) not in value["$in"]:
+                        return False
+                elif doc.get(key) != value:
+                    return False
+            return True
+
+        return _Cursor([d for d in self.docs if match(d)])
+
+
+class _FakeDB:
+    def __init__(self):
+        procedure_names = [f"GlobalProc{i}" for i in range(GLOBAL_PROCEDURES)]
+        body = "".join(
+            f"    nValor{j} is int = HReadSeekFirst(TabelaCliente, IDCliente, {j})\n"
+            for j in range(40)
+        )
+        procedures = [
+            {
+                "_id": ObjectId(),
+                "name": name,
+                "is_local": False,
+                "signature": f"PROCEDURE {name}()",
+                "code": f"PROCEDURE {name}()\n{body}",
+            }
+            for name in procedure_names
+        ]
+
+        self.page_ids = []
+        elements, controls = [], []
+        for p in range(PAGES):
+            page_id = ObjectId()
+            self.page_ids.append(page_id)
+            elements.append({"_id": page_id, "source_name": f"PAGE_{p}"})
+            calls = "\n".join(
+                f"{procedure_names[(p * 7 + k) % GLOBAL_PROCEDURES]}()"
+                for k in range(PROCS_PER_PAGE)
+            )
+            controls.append({
+                "_id": ObjectId(),
+                "element_id": page_id,
+                "name": "BTN_Salvar",
+                "type_code": 4,
+                "depth": 0,
+                "events": [{"event_name": "OnClick", "code": calls}],
+            })
+
+        self.elements = _Collection(elements)
+        self.controls = _Collection(controls)
+        self.procedures = _Collection(procedures)
+
+
+async def _build_all(builder: ContextBuilder, page_ids) -> float:
+    start = time.perf_counter()
+    for page_id in page_ids:
+        await builder.build(page_id)
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_context_build_latency(monkeypatch):
+    db = _FakeDB()
+    encoder = _encoder()
+
+    # Sem cache: cada build re-tokeniza todas as procedures referenciadas
+    monkeypatch.setattr(
+        token_counter, "_default_counter", TokenCounter(encoder=encoder, cache_size=0)
+    )
+    uncached = await _build_all(ContextBuilder(db), db.page_ids)
+
+    counter = TokenCounter(encoder=encoder)
+    monkeypatch.setattr(token_counter, "_default_counter", counter)
+    cold = await _build_all(ContextBuilder(db), db.page_ids)
+    warm = await _build_all(ContextBuilder(db), db.page_ids)
+
+    per_page = lambda total: total / PAGES * 1000  # noqa: E731
+    print(
+        f"\ncontext build ({type(encoder).__name__}): "
+        f"uncached={per_page(uncached):.2f}ms/page "
+        f"cold={per_page(cold):.2f}ms/page warm={per_page(warm):.2f}ms/page "
+        f"cache={counter.cache_info()}"
+    )
+
+    assert counter.cache_info()["hits"] > 0
+    assert warm < uncached
@@ -0,0 +1,68 @@
+"""
+Benchmark: loading all generator templates in a fresh process.
+
+Compares building a private Environment per generator (the previous
+behavior, every template compiled from source) with the shared registry
+backed by the on-disk bytecode cache, as seen by a second ``wxcode``
+process (new registry, warm cache directory).
+"""
+
+import time
+from pathlib import Path
+
+from jinja2 import Environment, PackageLoader
+
+from wxcode.generator.jinja_environments import JinjaEnvironmentRegistry
+
+SUBDIRS = ["python", "html", "deploy"]
+GENERATORS_PER_SUBDIR = 3
+ROUNDS = 5
+
+
+def _load_all(env: Environment) -> int:
+    names = env.list_templates(extensions=["j2"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+def _private_environments() -> int:
+    loaded = 0
+    for subdir in SUBDIRS:
+        for _ in range(GENERATORS_PER_SUBDIR):
+            loaded += _load_all(
+                Environment(loader=PackageLoader("wxcode.generator", f"templates/{subdir}"))
+            )
+    return loaded
+
+
+def _registry(cache_dir: Path) -> int:
+    registry = JinjaEnvironmentRegistry(cache_dir)
+    loaded = 0
+    for subdir in SUBDIRS:
+        for _ in range(GENERATORS_PER_SUBDIR):
+            loaded += _load_all(registry.get(subdir))
+    return loaded
+
+
+def _best(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_template_load_with_bytecode_cache(tmp_path: Path):
+    assert _registry(tmp_path) == _private_environments()  # warms the cache
+
+    private = _best(_private_environments)
+    cached = _best(_registry, tmp_path)
+
+    print(
+        f"\nprivate environments: {private * 1000:.1f} ms"
+        f" | shared registry + bytecode cache: {cached * 1000:.1f} ms"
+        f" ({private / cached:.1f}x)"
+    )
+    assert cached < private
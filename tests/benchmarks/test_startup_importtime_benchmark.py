@@ -0,0 +1,78 @@
+"""
+Benchmark: startup import cost of the CLI and the MCP stdio server.
+
+Runs `python -X importtime` in a fresh interpreter (bytecode already
+compiled) and reports the cumulative import time of the entry module. The
+timings depend on the machine, so only the set of heavy dependencies that
+must stay deferred until a command or tool actually needs them is asserted.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+RUNS = 3
+
+# Módulo de entrada -> dependências que não podem ser importadas
+DEFERRED = {
+    "wxcode.cli": ("pydantic_settings", "beanie", "motor", "neo4j", "networkx", "fitz"),
+    "wxcode.mcp.server": ("neo4j", "networkx", "fitz"),
+    "wxcode.models.element": ("wxcode.models.milestone", "wxcode.models.product"),
+}
+
+_PROBE = (
+    # `import` explícito: -X importtime não registra importlib.import_module
+    "import {module}; import json, sys; print(json.dumps(sorted(sys.modules)))"
+)
+
+
+def _run(module: str, env: dict) -> tuple[float, set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name == module:
+            cumulative_us = int(cumulative)
+    assert cumulative_us is not None, f"{module} not found in -X importtime output"
+
+    loaded = set(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return cumulative_us / 1000, loaded
+
+
+@pytest.fixture(scope="module")
+def import_env(tmp_path_factory):
+    env = dict(os.environ)
+    # Bytecode em diretório temporário: mede import "quente", não compilação
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = str(tmp_path_factory.mktemp("pycache"))
+    return env
+
+
+@pytest.mark.parametrize("module", sorted(DEFERRED))
+def test_startup_defers_heavy_imports(module, import_env):
+    forbidden = DEFERRED[module]
+
+    _run(module, import_env)  # aquece o cache de bytecode
+    timings = []
+    for _ in range(RUNS):
+        elapsed_ms, loaded = _run(module, import_env)
+        timings.append(elapsed_ms)
+
+    best = min(timings)
+    print(f"\nimport {module}: best={best:.1f}ms runs={[round(t, 1) for t in timings]}")
+
+    eager = sorted(dep for dep in forbidden if dep in loaded)
+    assert not eager, f"{module} imports heavy dependencies at startup: {eager}"
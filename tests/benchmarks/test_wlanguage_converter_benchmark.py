@@ -0,0 +1,104 @@
+"""
+Benchmark: WLanguageConverter throughput (lines/s) on a generated corpus.
+
+Converts the procedures of a large synthetic project with a single
+converter (as ServiceGenerator does) and reports lines per second plus the
+per-rule hit/time counters. Every line must be accounted for by exactly
+one rule.
+
+The baseline is the lookup used before the rule engine: every pattern
+tried in order for every line, through re's pattern cache.
+"""
+
+import random
+import re
+import time
+
+from wxcode.generator.wlanguage_converter import (
+    CONTROL_FLOW_RULES,
+    STATEMENT_RULES,
+    WLanguageConverter,
+)
+
+PROCEDURES = 2000
+LINES_PER_PROCEDURE = 50
+
+_LINES = [
+    "// Comentário {n}",
+    "",
+    "sNome{n} is string = \"Cliente\"",
+    "LOCAL nTotal{n} is int",
+    "HReadSeekFirst(CLIENTE, IDCliente, nId{n})",
+    "IF HFound(CLIENTE) AND nValorTotal > {n} THEN",
+    "CLIENTE.Nome = sNome{n}",
+    "HModify(CLIENTE)",
+    "ELSE",
+    "HAdd(PEDIDO)",
+    "END",
+    "FOR i = 1 TO {n}",
+    "WHILE NOT HOut(PEDIDO)",
+    "HReadNext(PEDIDO)",
+    "Info(\"Processado {n}\")",
+    "nTotal = nTotal + PEDIDO.Valor",
+    "RESULT nTotal",
+    "CASE ERROR:",
+    "FOR EACH stItem OF arrItens",
+    "x = Left(sValor, 3) + Right(sValor, 2)",
+]
+
+
+def _corpus() -> list[str]:
+    rng = random.Random(7)
+    return [
+        "\n".join(
+            rng.choice(_LINES).format(n=rng.randint(1, 999))
+            for _ in range(LINES_PER_PROCEDURE)
+        )
+        for _ in range(PROCEDURES)
+    ]
+
+
+class LinearConverter(WLanguageConverter):
+    """Converter without first-token dispatch nor precompiled patterns."""
+
+    def _apply_rules(self, stripped: str) -> tuple[str, str | None]:
+        if not stripped:
+            return "blank", ""
+        if stripped.startswith("//"):
+            return "comment", f"# {stripped[2:].strip()}"
+        for rule in CONTROL_FLOW_RULES + STATEMENT_RULES:
+            find = re.search if rule.search else re.match
+            match = find(rule.pattern.pattern, stripped, rule.pattern.flags)
+            if match:
+                return rule.name, self._handlers[rule.name](stripped, match, rule)
+        return "fallback", f"# {stripped}"
+
+
+def _convert_all(converter: WLanguageConverter, procedures: list[str]) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    output = [converter.convert(code).python_code for code in procedures]
+    return time.perf_counter() - start, output
+
+
+def test_converter_throughput():
+    procedures = _corpus()
+    converter = WLanguageConverter(db_var="self.db")
+
+    baseline, expected = _convert_all(LinearConverter(db_var="self.db"), procedures)
+    elapsed, output = _convert_all(converter, procedures)
+
+    # convert() strips leading/trailing blank lines of each procedure
+    total_lines = sum(len(code.strip().split("\n")) for code in procedures)
+    stats = sorted(converter.rule_stats.items(), key=lambda item: -item[1].seconds)
+    print(
+        f"\n{PROCEDURES} procedures / {total_lines} lines: "
+        f"{elapsed * 1000:.0f}ms ({total_lines / elapsed:,.0f} lines/s)"
+        f" | linear lookup: {baseline * 1000:.0f}ms ({baseline / elapsed:.1f}x)"
+    )
+    for name, rule in stats:
+        print(f"  {name:<18} hits={rule.hits:>6}  {rule.seconds * 1000:7.1f}ms")
+
+    assert sum(rule.hits for rule in converter.rule_stats.values()) == total_lines
+    assert converter.rule_stats["fallback"].hits > 0
+    assert output == expected
+    assert elapsed < baseline
@@ -0,0 +1,98 @@
+"""
+Benchmark: XddParser streaming (iterparse) on a generated 5k-table Analysis.
+
+Compares the streaming parser with a full-DOM parse of the same file
+(read into a string, ElementTree.fromstring, then walk). Streaming keeps
+at most one FICHIER subtree alive, so peak memory must be a fraction of
+the DOM path; wall time (measured without tracemalloc) stays comparable.
+"""
+
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from wxcode.parser.xdd_parser import XddParser, XddParseResult
+
+TABLES = 5000
+COLUMNS_PER_TABLE = 12
+
+
+def _write_analysis(path):
+    with open(path, "w", encoding="iso-8859-1") as f:
+        f.write('<?xml version="1.0" encoding="ISO-8859-1"?>\n<ANALYSE GenNum="139">\n')
+        f.write('<CONNEXION Nom="CNX_BASE" Type="1"><SOURCE>db</SOURCE><DB>Base</DB></CONNEXION>\n')
+        for t in range(TABLES):
+            f.write(f'<FICHIER Nom="Tabela{t}" NomPhysique="Tabela{t}" Connexion="CNX_BASE" FicNullSupporte="1">\n')
+            for c in range(COLUMNS_PER_TABLE):
+                key = 1 if c == 0 else 0
+                f.write(
+                    f'<RUBRIQUE Nom="Coluna{c}"><TYPE>{24 if c == 0 else 2}</TYPE>'
+                    f'<TAILLE>50</TAILLE><TYPE_CLE>{key}</TYPE_CLE>'
+                    f'<INDICERUBRIQUE Null="1" Valeur="Descrição padrão"/></RUBRIQUE>\n'
+                )
+            f.write("</FICHIER>\n")
+        f.write("</ANALYSE>\n")
+
+
+def _parse_dom(parser: XddParser) -> XddParseResult:
+    """Caminho anterior: arquivo inteiro em string + DOM completo."""
+    result = XddParseResult()
+    with open(parser.xdd_path, "r", encoding="iso-8859-1") as f:
+        root = ET.fromstring(f.read())
+    result.connections = [parser._parse_connection(e) for e in root.findall("CONNEXION")]
+    result.tables = [parser._parse_table(e, result) for e in root.findall("FICHIER")]
+    result.total_columns = sum(len(t.columns) for t in result.tables)
+    return result
+
+
+def _measure(fn):
+    start = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed, peak
+
+
+@pytest.fixture(scope="module")
+def analysis_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("xdd") / "Big.xdd"
+    _write_analysis(path)
+    return path
+
+
+def test_streaming_parse_memory_and_speed(analysis_file):
+    parser = XddParser(analysis_file)
+
+    def stream_only():
+        # Consumo incremental (como na persistência em lotes)
+        result = XddParseResult()
+        tables = 0
+        for batch in parser.iter_table_batches(result=result):
+            tables += len(batch)
+        return tables, result
+
+    dom_result, dom_time, dom_peak = _measure(lambda: _parse_dom(parser))
+    (stream_tables, stream_result), stream_time, stream_peak = _measure(stream_only)
+    start = time.perf_counter()
+    full_result = parser.parse()
+    full_time = time.perf_counter() - start
+
+    print(
+        f"\n{TABLES} tables / {TABLES * COLUMNS_PER_TABLE} columns "
+        f"({analysis_file.stat().st_size / 1e6:.1f}MB)"
+        f"\n  dom:        {dom_time * 1000:.0f}ms peak={dom_peak / 1e6:.1f}MB"
+        f"\n  streaming:  {stream_time * 1000:.0f}ms peak={stream_peak / 1e6:.1f}MB"
+        f"\n  parse():    {full_time * 1000:.0f}ms"
+    )
+
+    assert stream_tables == TABLES
+    assert stream_result.total_columns == dom_result.total_columns
+    assert full_result.tables == dom_result.tables
+    assert stream_peak < dom_peak * 0.25
+    assert stream_time < dom_time * 1.5
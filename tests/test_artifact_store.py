@@ -0,0 +1,157 @@
+"""Tests for ArtifactStore and hash-based file tracking in BaseGenerator."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from wxcode.generator.artifact_store import ArtifactStore
+from wxcode.generator.base import BaseGenerator
+from wxcode.models.element import (
+    ConversionStatus,
+    ConvertedFile,
+    ElementConversion,
+)
+
+
+class DummyGenerator(BaseGenerator):
+    """Minimal concrete generator."""
+
+    async def generate(self) -> list[Path]:
+        return self.generated_files
+
+
+def _element(target_files: list[ConvertedFile] | None = None) -> MagicMock:
+    element = MagicMock()
+    element.id = ObjectId()
+    element.conversion = ElementConversion(target_files=target_files or [])
+    return element
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ArtifactStore:
+    return ArtifactStore(tmp_path / "artifacts")
+
+
+@pytest.fixture
+def generator(tmp_path: Path, store: ArtifactStore) -> DummyGenerator:
+    gen = DummyGenerator("507f1f77bcf86cd799439011", tmp_path / "out")
+    gen.artifact_store = store
+    return gen
+
+
+class TestArtifactStore:
+    """Content-addressed blob storage."""
+
+    def test_put_and_get(self, store: ArtifactStore):
+        digest = store.put(b"hello")
+        assert digest == ArtifactStore.digest(b"hello")
+        assert store.get(digest) == b"hello"
+        assert store.get_text(digest) == "hello"
+        assert store.path_for(digest).parent.name == digest[:2]
+
+    def test_put_is_idempotent(self, store: ArtifactStore):
+        digest = store.put(b"same")
+        mtime = store.path_for(digest).stat().st_mtime_ns
+        assert store.put(b"same") == digest
+        assert store.path_for(digest).stat().st_mtime_ns == mtime
+
+    def test_missing_blob(self, store: ArtifactStore):
+        assert store.get("0" * 64) is None
+        assert not store.exists("0" * 64)
+
+
+class TestGeneratorArtifacts:
+    """BaseGenerator writes, skips and references files by hash."""
+
+    def test_unchanged_file_is_not_rewritten(self, generator: DummyGenerator):
+        path = generator.write_file("app/a.py", "x = 1\n")
+        mtime = path.stat().st_mtime_ns
+
+        generator.write_file("app/a.py", "x = 1\n")
+        assert path.stat().st_mtime_ns == mtime
+        assert generator.skipped_files == [path]
+
+        generator.write_file("app/a.py", "x = 2\n")
+        assert path.read_text() == "x = 2\n"
+        assert len(generator.skipped_files) == 1
+
+    def test_element_file_stored_by_hash(self, generator: DummyGenerator, store: ArtifactStore):
+        element = _element()
+        generator.write_file_for_element(element, "app/routes/page.py", "route", "route")
+        generator._apply_conversion_status(element, ConversionStatus.CONVERTED)
+
+        [converted] = element.conversion.target_files
+        assert converted.content is None
+        assert converted.size == len("route")
+        assert store.get_text(converted.content_hash) == "route"
+
+    async def test_regenerated_files_kept_and_stale_removed(
+        self, generator: DummyGenerator, tmp_path: Path
+    ):
+        out = tmp_path / "out"
+        for name, content in (("keep.py", "same"), ("old.py", "gone")):
+            (out / "app/routes").mkdir(parents=True, exist_ok=True)
+            (out / "app/routes" / name).write_text(content)
+        element = _element([
+            ConvertedFile(
+                path="app/routes/keep.py",
+                file_type="route",
+                content_hash=ArtifactStore.digest(b"same"),
+                size=4,
+            ),
+            ConvertedFile(path="app/routes/old.py", file_type="route", content="gone"),
+        ])
+        keep_mtime = (out / "app/routes/keep.py").stat().st_mtime_ns
+
+        assert await generator.clean_previous_files(element, file_types=["route"]) == 2
+        generator.write_file_for_element(element, "app/routes/keep.py", "same", "route")
+
+        collection = MagicMock()
+        collection.bulk_write = AsyncMock()
+        with patch(
+            "wxcode.generator.base.Element.get_pymongo_collection",
+            return_value=collection,
+        ):
+            assert await generator.update_all_converted_elements() == 1
+
+        assert (out / "app/routes/keep.py").stat().st_mtime_ns == keep_mtime
+        assert not (out / "app/routes/old.py").exists()
+
+        [operations], kwargs = collection.bulk_write.call_args
+        assert kwargs == {"ordered": False}
+        [operation] = operations
+        assert operation._filter == {"_id": element.id}
+        conversion = operation._doc["$set"]["conversion"]
+        assert conversion["status"] == ConversionStatus.CONVERTED
+        assert [f["path"] for f in conversion["target_files"]] == ["app/routes/keep.py"]
+
+    async def test_previous_hash_trusted_only_for_untouched_files(
+        self, generator: DummyGenerator, tmp_path: Path
+    ):
+        element = _element()
+        generator.write_file_for_element(element, "app/routes/page.py", "same", "route")
+        generator._apply_conversion_status(element, ConversionStatus.CONVERTED)
+        recorded = element.conversion.target_files
+        path = tmp_path / "out/app/routes/page.py"
+
+        # Next run, file untouched: skipped without reading it back
+        rerun = DummyGenerator("507f1f77bcf86cd799439011", tmp_path / "out")
+        await rerun.clean_previous_files(_element(list(recorded)), file_types=["route"])
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("read")):
+            rerun.write_file("app/routes/page.py", "same")
+        assert rerun.skipped_files == [path]
+
+        # Edited on disk with the same size: the stored hash is not trusted
+        path.write_text("edit")
+        rerun = DummyGenerator("507f1f77bcf86cd799439011", tmp_path / "out")
+        await rerun.clean_previous_files(_element(list(recorded)), file_types=["route"])
+        rerun.write_file("app/routes/page.py", "same")
+        assert rerun.skipped_files == []
+        assert path.read_text() == "same"
+
+    async def test_no_tracked_elements_skips_bulk_write(self, generator: DummyGenerator):
+        with patch("wxcode.generator.base.Element.get_pymongo_collection") as get_collection:
+            assert await generator.update_all_converted_elements() == 0
+        get_collection.assert_not_called()
@@ -428,3 +428,48 @@ class TestBidirectionalPTY:
         assert b"line5" in output, f"Expected 'line5' in output, got: {output}"
         # Verify resize happened at least once
         assert resize_count >= 1, f"Expected at least 1 resize, got {resize_count}"
+
+    @pytest.mark.asyncio
+    async def test_stream_output_coalesces_backlog(self):
+        """Test that output produced while the consumer is busy is coalesced.
+
+        The pump reads via loop.add_reader, so a slow consumer receives the
+        accumulated backlog as fewer, larger chunks with no data loss.
+        """
+        pty = BidirectionalPTY(
+            cmd=["sh", "-c", "for i in $(seq 1 200); do echo line$i; done; sleep 0.2"],
+            cwd="/tmp",
+        )
+        await pty.start()
+
+        chunks = []
+        async for chunk in pty.stream_output():
+            chunks.append(chunk)
+            await asyncio.sleep(0.05)  # Simulate a slow WebSocket send
+
+        await pty.close()
+
+        output = b"".join(chunks)
+        assert b"line1\r\n" in output
+        assert b"line200" in output
+        assert len(chunks) < 200
+
+    @pytest.mark.asyncio
+    async def test_close_ends_stream_output(self):
+        """Test that close() wakes up a consumer waiting for output."""
+        pty = BidirectionalPTY(
+            cmd=["sleep", "10"],
+            cwd="/tmp",
+        )
+        await pty.start()
+
+        async def consume():
+            return [chunk async for chunk in pty.stream_output()]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        await pty.close()
+
+        chunks = await asyncio.wait_for(consumer, timeout=5.0)
+        assert chunks == []
+        assert pty.master_fd is None
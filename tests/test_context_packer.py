@@ -0,0 +1,175 @@
+"""
+Unit tests for relevance-ranked context packing.
+
+Tests cover:
+- Relevance scoring (frequency, distance, table overlap)
+- Knapsack selection within the budget, with signature-only summaries
+- Signature formatting from stored parameters
+- ContextBuilder transitive call-graph walk up to call_depth
+"""
+
+from bson import ObjectId
+
+from wxcode.llm_converter import token_counter
+from wxcode.llm_converter.context_builder import ContextBuilder
+from wxcode.llm_converter.context_packer import (
+    ContextPacker,
+    ProcedureCandidate,
+    format_signature,
+    score_candidate,
+)
+from wxcode.llm_converter.token_counter import TokenCounter
+
+
+def _candidate(name, tokens, depth=1, calls=1, tables=()):
+    return ProcedureCandidate(
+        proc={"name": name, "code": "x", "token_count": tokens},
+        depth=depth,
+        call_count=calls,
+        tables=set(tables),
+    )
+
+
+class TestScoring:
+    """Test cases for score_candidate."""
+
+    def test_closer_and_more_called_scores_higher(self):
+        direct = _candidate("A", 10, depth=1, calls=4)
+        indirect = _candidate("B", 10, depth=2, calls=1)
+
+        assert score_candidate(direct, set()) > score_candidate(indirect, set())
+
+    def test_table_overlap_raises_score(self):
+        shared = _candidate("A", 10, tables={"CLIENTE"})
+        unrelated = _candidate("B", 10, tables={"LOG"})
+
+        assert score_candidate(shared, {"CLIENTE"}) > score_candidate(unrelated, {"CLIENTE"})
+
+
+class TestContextPacker:
+    """Test cases for ContextPacker.pack."""
+
+    def test_everything_fits(self):
+        packed = ContextPacker().pack([_candidate("A", 10), _candidate("B", 20)], 100)
+
+        assert {p["name"] for p in packed.full} == {"A", "B"}
+        assert packed.summaries == []
+        assert packed.tokens == 30
+
+    def test_prefers_relevant_large_procedure_over_small_ones(self):
+        candidates = [
+            _candidate("Core", 900, depth=1, calls=8, tables={"PEDIDO"}),
+            _candidate("Helper1", 400, depth=2),
+            _candidate("Helper2", 400, depth=2),
+        ]
+
+        packed = ContextPacker().pack(candidates, 1000, page_tables={"PEDIDO"})
+
+        assert [p["name"] for p in packed.full] == ["Core"]
+        assert {p["name"] for p in packed.summaries} == {"Helper1", "Helper2"}
+        assert packed.tokens <= 1000
+
+    def test_never_exceeds_budget(self):
+        candidates = [_candidate(f"P{i}", 37 + i * 13, depth=1 + i % 3) for i in range(40)]
+
+        packed = ContextPacker().pack(candidates, 2000)
+
+        assert 0 < packed.tokens <= 2000
+
+    def test_empty_budget(self):
+        packed = ContextPacker().pack([_candidate("A", 10)], 0)
+        assert packed.full == [] and packed.summaries == []
+
+
+class TestFormatSignature:
+    """Test cases for format_signature."""
+
+    def test_builds_from_parameters(self):
+        proc = {
+            "name": "CalcularTotal",
+            "parameters": [
+                {"name": "nPedido", "type": "int"},
+                {"name": "bDesconto", "type": "boolean", "default_value": "False"},
+            ],
+            "return_type": "currency",
+        }
+
+        assert format_signature(proc) == (
+            "PROCEDURE CalcularTotal(nPedido is int, bDesconto is boolean = False): currency"
+        )
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._iter = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Procedures:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query):
+        self.queries.append(sorted(query["name"]["$in"]))
+        names = set(query["name"]["$in"])
+        return _Cursor([d for d in self.docs if d["name"] in names])
+
+
+class _DB:
+    def __init__(self, procedures):
+        self.procedures = _Procedures(procedures)
+
+
+def _proc(name, calls=(), tables=()):
+    return {
+        "_id": ObjectId(),
+        "name": name,
+        "code": f"PROCEDURE {name}()",
+        "is_local": False,
+        "dependencies": {"calls_procedures": list(calls), "uses_files": list(tables)},
+    }
+
+
+class TestCallGraphWalk:
+    """Test cases for ContextBuilder._load_referenced_procedures."""
+
+    async def test_walks_to_configured_depth(self, monkeypatch):
+        monkeypatch.setattr(token_counter, "_default_counter", TokenCounter())
+        db = _DB([
+            _proc("Salvar", calls=["Validar"]),
+            _proc("Validar", calls=["LogErro"], tables=["CLIENTE"]),
+            _proc("LogErro"),
+        ])
+        controls = [{"events": [{"code": "Salvar()\nSalvar()"}], "children": []}]
+
+        candidates = await ContextBuilder(db, call_depth=2)._load_referenced_procedures(
+            controls, []
+        )
+
+        by_name = {c.name: c for c in candidates}
+        assert set(by_name) == {"Salvar", "Validar"}
+        assert by_name["Salvar"].depth == 1
+        assert by_name["Salvar"].call_count == 2
+        assert by_name["Validar"].depth == 2
+        assert by_name["Validar"].tables == {"CLIENTE"}
+        assert db.procedures.queries == [["Salvar"], ["Validar"]]
+
+    async def test_local_procedures_are_not_loaded_as_globals(self):
+        db = _DB([_proc("Local")])
+        controls = [{"events": [{"code": "Local()"}], "children": []}]
+
+        candidates = await ContextBuilder(db)._load_referenced_procedures(
+            controls, [{"name": "Local", "code": ""}]
+        )
+
+        assert candidates == []
+        assert db.procedures.queries == []
@@ -0,0 +1,367 @@
+"""
+Unit tests for the DAG-parallel conversion scheduler.
+
+Tests cover:
+- Bulk skip of unsupported items
+- Dependency ordering and bounded parallelism
+- Failure blocking of transitive dependents
+- Cycle breaking by topological order
+- ProviderRateLimiter token bucket
+- next_supported_item bulk skip semantics
+- ConversionTracker limited frontier query
+- Drain rate vs. sequential dispatch on a large backlog
+"""
+
+import asyncio
+import time
+
+from bson import ObjectId
+
+from wxcode.llm_converter.conversion_tracker import ConversionTracker, PendingItem
+from wxcode.services.conversion_scheduler import (
+    ConversionScheduler,
+    ProviderRateLimiter,
+    next_supported_item,
+)
+
+
+def _item(name: str, order: int, uses=(), collection: str = "elements") -> PendingItem:
+    return PendingItem(
+        collection=collection,
+        doc={"_id": ObjectId(), "dependencies": {"uses": list(uses)}},
+        topological_order=order,
+        layer=None,
+        name=name,
+        item_type="page" if collection == "elements" else "procedure",
+    )
+
+
+class _FakeTracker:
+    def __init__(self, items: list[PendingItem]):
+        self.items = items
+        self.frontier_loads = 0
+        self.marked: list[tuple[list[str], str]] = []
+
+    async def get_pending_frontier(
+        self, project_name: str, limit=None, include_content_size=True
+    ) -> list[PendingItem]:
+        self.frontier_loads += 1
+        self.last_limit = limit
+        return list(self.items)[:limit]
+
+    async def mark_items_status(self, items: list[PendingItem], status: str) -> int:
+        self.marked.append(([i.name for i in items], status))
+        return len(items)
+
+
+class _RecordingWorker:
+    def __init__(self, delay: float = 0.01, fail: set[str] = frozenset()):
+        self.delay = delay
+        self.fail = fail
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, item: PendingItem):
+        self.started.append(item.name)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.finished.append(item.name)
+        return item.name not in self.fail, item.name
+
+
+class TestConversionScheduler:
+    """Test cases for ConversionScheduler.run."""
+
+    async def test_skips_unsupported_in_bulk(self):
+        tracker = _FakeTracker([
+            _item("PROC_A", 1, collection="procedures"),
+            _item("CLASS_B", 2, collection="class_definitions"),
+            _item("PAGE_C", 3),
+        ])
+        worker = _RecordingWorker()
+
+        report = await ConversionScheduler(tracker, worker).run("P")
+
+        assert tracker.frontier_loads == 1
+        assert tracker.marked == [(["PROC_A", "CLASS_B"], "skipped")]
+        assert report.skipped == 2
+        assert report.converted == ["PAGE_C"]
+
+    async def test_dependents_wait_for_dependencies(self):
+        tracker = _FakeTracker([
+            _item("A", 1),
+            _item("B", 2),
+            _item("C", 3, uses=["A", "B"]),
+            _item("D", 4, uses=["C", "EXTERNAL"]),
+        ])
+        worker = _RecordingWorker()
+
+        report = await ConversionScheduler(tracker, worker, max_workers=4).run("P")
+
+        assert set(report.converted) == {"A", "B", "C", "D"}
+        assert worker.started.index("C") > max(
+            worker.finished.index("A"), worker.finished.index("B")
+        )
+        assert worker.started[-1] == "D"
+        assert worker.max_active == 2
+
+    async def test_respects_max_workers(self):
+        tracker = _FakeTracker([_item(f"P{i}", i) for i in range(10)])
+        worker = _RecordingWorker()
+
+        report = await ConversionScheduler(tracker, worker, max_workers=3).run("P")
+
+        assert len(report.converted) == 10
+        assert worker.max_active == 3
+
+    async def test_failure_blocks_transitive_dependents(self):
+        tracker = _FakeTracker([
+            _item("A", 1),
+            _item("B", 2, uses=["A"]),
+            _item("C", 3, uses=["B"]),
+            _item("D", 4),
+        ])
+        worker = _RecordingWorker(fail={"A"})
+
+        report = await ConversionScheduler(tracker, worker).run("P")
+
+        assert report.failed == {"A": "A"}
+        assert report.converted == ["D"]
+        assert report.blocked == ["B", "C"]
+        assert "B" not in worker.started
+
+    async def test_cycle_is_broken_by_topological_order(self):
+        tracker = _FakeTracker([
+            _item("A", 1, uses=["B"]),
+            _item("B", 2, uses=["A"]),
+        ])
+        worker = _RecordingWorker()
+
+        report = await ConversionScheduler(tracker, worker).run("P")
+
+        assert worker.started == ["A", "B"]
+        assert report.converted == ["A", "B"]
+
+    async def test_max_items_limits_dispatch(self):
+        tracker = _FakeTracker([_item(f"P{i}", i) for i in range(10)])
+        worker = _RecordingWorker()
+
+        report = await ConversionScheduler(tracker, worker, max_workers=4).run(
+            "P", max_items=5
+        )
+
+        assert report.dispatched == 5
+        assert worker.started == [f"P{i}" for i in range(5)]
+
+    async def test_worker_exception_counts_as_failure(self):
+        async def boom(item):
+            raise RuntimeError("llm down")
+
+        tracker = _FakeTracker([_item("A", 1)])
+        report = await ConversionScheduler(tracker, boom).run("P")
+
+        assert report.failed == {"A": "llm down"}
+
+    async def test_large_backlog_drains_faster_than_sequential(self):
+        items = [_item(f"P{i}", i, uses=[f"P{i - 50}"] if i >= 50 else ()) for i in range(2000)]
+        delay = 0.002
+
+        sequential = ConversionScheduler(
+            _FakeTracker(items), _RecordingWorker(delay), max_workers=1
+        )
+        start = time.perf_counter()
+        await sequential.run("P", max_items=200)
+        sequential_rate = 200 / (time.perf_counter() - start)
+
+        parallel = ConversionScheduler(
+            _FakeTracker(items), _RecordingWorker(delay), max_workers=16
+        )
+        report = await parallel.run("P")
+
+        assert len(report.converted) == 2000
+        assert report.dispatched / report.elapsed_seconds > 4 * sequential_rate
+
+
+class TestProviderRateLimiter:
+    """Test cases for ProviderRateLimiter."""
+
+    async def test_limits_concurrency(self):
+        limiter = ProviderRateLimiter(max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+
+    async def test_token_bucket_waits_for_refill(self, monkeypatch):
+        now = [0.0]
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        monkeypatch.setattr(
+            "wxcode.llm_converter.providers.limiter.asyncio.sleep", fake_sleep
+        )
+        limiter = ProviderRateLimiter(
+            max_concurrency=4, tokens_per_minute=600, clock=lambda: now[0]
+        )
+
+        async with limiter.slot(600):
+            pass
+        assert sleeps == []
+
+        async with limiter.slot(300):
+            pass
+        assert sleeps == [30.0]
+
+    async def test_oversized_request_is_capped(self, monkeypatch):
+        now = [0.0]
+
+        async def fake_sleep(seconds):
+            now[0] += seconds
+
+        monkeypatch.setattr(
+            "wxcode.llm_converter.providers.limiter.asyncio.sleep", fake_sleep
+        )
+        limiter = ProviderRateLimiter(tokens_per_minute=100, clock=lambda: now[0])
+
+        async with limiter.slot(10_000):
+            pass
+        assert now[0] == 0.0
+
+
+class TestNextSupportedItem:
+    """Test cases for next_supported_item."""
+
+    async def test_skips_leading_unsupported_in_one_call(self):
+        tracker = _FakeTracker([
+            _item("PROC_A", 1, collection="procedures"),
+            _item("PROC_B", 2, collection="procedures"),
+            _item("PAGE_C", 3),
+            _item("PROC_D", 4, collection="procedures"),
+        ])
+
+        item, skipped = await next_supported_item(tracker, "P")
+
+        assert item.name == "PAGE_C"
+        assert skipped == 2
+        assert tracker.marked == [(["PROC_A", "PROC_B"], "skipped")]
+
+    async def test_respects_max_skips(self):
+        tracker = _FakeTracker([
+            _item(f"PROC_{i}", i, collection="procedures") for i in range(5)
+        ] + [_item("PAGE", 10)])
+
+        item, skipped = await next_supported_item(tracker, "P", max_skips=3)
+
+        assert item is None
+        assert skipped == 3
+
+    async def test_loads_only_max_skips_plus_one_items(self):
+        tracker = _FakeTracker([_item("PAGE", 1)])
+
+        await next_supported_item(tracker, "P", max_skips=7)
+
+        assert tracker.last_limit == 8
+
+
+class _FakeCollection:
+    """Applies the subset of aggregate() used by get_pending_frontier."""
+
+    def __init__(self, docs: list[dict], name_field: str):
+        self.docs = docs
+        self.name_field = name_field
+        self.pipelines: list[list[dict]] = []
+
+    def aggregate(self, pipeline: list[dict]):
+        self.pipelines.append(pipeline)
+        docs = list(self.docs)
+        for stage in pipeline:
+            if "$match" in stage:
+                order = stage["$match"].get("topological_order", "any")
+                if order is None:
+                    docs = [d for d in docs if d.get("topological_order") is None]
+                elif order != "any":
+                    docs = [d for d in docs if d.get("topological_order") is not None]
+            elif "$sort" in stage:
+                docs.sort(key=lambda d: (
+                    d.get("topological_order") is not None,
+                    d.get("topological_order") or 0,
+                    d[self.name_field],
+                ))
+            elif "$limit" in stage:
+                docs = docs[:stage["$limit"]]
+
+        async def iterate():
+            for doc in docs:
+                yield doc
+
+        return iterate()
+
+
+class _FakeDb:
+    def __init__(self, **collections: _FakeCollection):
+        self.collections = collections
+        self.projects = self
+        for name in ("elements", "procedures", "class_definitions", "database_schemas"):
+            collections.setdefault(name, _FakeCollection([], "name"))
+
+    async def find_one(self, query, projection=None):
+        return {"_id": ObjectId()}
+
+    def __getitem__(self, name: str) -> _FakeCollection:
+        return self.collections[name]
+
+    def __getattr__(self, name: str) -> _FakeCollection:
+        return self.collections[name]
+
+
+class TestLimitedFrontier:
+    """Test cases for ConversionTracker.get_pending_frontier(limit=...)."""
+
+    def _db(self) -> _FakeDb:
+        return _FakeDb(
+            elements=_FakeCollection([
+                {"source_name": "PAGE_NULL", "topological_order": None},
+                {"source_name": "PAGE_5", "topological_order": 5},
+                {"source_name": "PAGE_2", "topological_order": 2},
+            ], "source_name"),
+            procedures=_FakeCollection([
+                {"name": f"PROC_{i}", "topological_order": i} for i in (1, 3, 4)
+            ], "name"),
+        )
+
+    async def test_limit_matches_head_of_full_frontier(self):
+        tracker = ConversionTracker(self._db())
+
+        full = [i.name for i in await tracker.get_pending_frontier("P")]
+        for limit in (1, 3, 6, 10):
+            limited = await tracker.get_pending_frontier("P", limit=limit)
+            assert [i.name for i in limited] == full[:limit]
+
+        assert full[-1] == "PAGE_NULL"
+
+    async def test_limited_query_sorts_and_limits_in_database(self):
+        db = self._db()
+        tracker = ConversionTracker(db)
+
+        await tracker.get_pending_frontier("P", limit=2, include_content_size=False)
+
+        for pipeline in db.elements.pipelines + db.procedures.pipelines:
+            stages = [next(iter(stage)) for stage in pipeline]
+            assert stages == ["$match", "$sort", "$limit", "$project"]
+            assert "raw_content_chars" not in pipeline[-1]["$project"]
@@ -20,6 +20,7 @@ from wxcode.models.class_definition import (
     ClassMember,
     ClassMethod,
 )
+from wxcode.models.configuration_context import ConfigurationContext
 from wxcode.models.procedure import ProcedureParameter
 
 
@@ -421,3 +422,51 @@ class TestConvertWLanguageFunction:
         assert "is not None" in result.python_code
         assert "return True" in result.python_code
         assert "return False" in result.python_code
+
+
+class TestConverterRuleEngine:
+    """Tests for the rule dispatch and per-rule counters."""
+
+    def test_rule_stats_count_each_line(self):
+        """Every converted line is charged to exactly one rule."""
+        converter = WLanguageConverter()
+        converter.convert("// c\nIF nA > 1 THEN\nHAdd(CLIENTE)\nEND\nInfo(x)")
+        converter.convert("RESULT True")
+
+        hits = {name: stats.hits for name, stats in converter.rule_stats.items()}
+        assert hits == {
+            "comment": 1, "if": 1, "h_function": 1, "end": 1, "fallback": 1, "result": 1,
+        }
+        assert all(stats.seconds >= 0 for stats in converter.rule_stats.values())
+
+        converter.reset_rule_stats()
+        assert converter.rule_stats == {}
+
+    def test_keywords_dispatch_on_whole_first_token(self):
+        """BREAK/LOOP rules do not fire for identifiers that merely start with them."""
+        converter = WLanguageConverter()
+
+        assert converter.convert("BREAK").python_code == "break"
+        assert converter.convert("LOOP").python_code == "while True:"
+        assert converter.convert("BreakPoint = 1").python_code == "# BreakPoint = 1"
+
+    def test_else_if_before_else(self):
+        """ELSE IF shares the ELSE token but keeps priority."""
+        result = WLanguageConverter().convert("ELSE IF nA > 1 THEN\nELSE")
+
+        assert result.python_code == "elif n_a > 1:\nelse:"
+
+    def test_config_variables_replaced_in_one_pass(self):
+        """Configuration variables become settings.X."""
+        context = ConfigurationContext(common_variables={"URL_API": None, "URL": None})
+        converter = WLanguageConverter(config_context=context)
+
+        result = converter.convert("sA = url_api\nsB = url")
+
+        assert result.python_code == (
+            "from config import settings\n\n# sA = settings.URL_API\n# sB = settings.URL"
+        )
+        # Pattern compiled once and reused
+        pattern = converter._config_pattern
+        converter.convert("sA = url")
+        assert converter._config_pattern is pattern
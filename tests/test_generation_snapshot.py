@@ -0,0 +1,171 @@
+"""Tests for GenerationSnapshot and parallel generation in GeneratorOrchestrator."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from wxcode.generator.orchestrator import GeneratorOrchestrator
+from wxcode.generator.route_generator import RouteGenerator
+from wxcode.generator.snapshot import GenerationSnapshot
+from wxcode.generator.wlanguage_converter import WLanguageConverter
+
+PROJECT_ID = "507f1f77bcf86cd799439011"
+
+
+def _element(name: str, source_type: str) -> SimpleNamespace:
+    return SimpleNamespace(id=name, source_name=name, source_type=source_type)
+
+
+def _control(name: str, depth: int) -> SimpleNamespace:
+    return SimpleNamespace(name=name, depth=depth)
+
+
+@pytest.fixture
+def snapshot() -> GenerationSnapshot:
+    procedures = [
+        SimpleNamespace(code='HReadFirst(CLIENTE)\nRESULT True'),
+        SimpleNamespace(code="   "),
+    ]
+    method = SimpleNamespace(code='HReadFirst(CLIENTE)\nRESULT True')
+    return GenerationSnapshot(
+        elements=[
+            _element("PAGE_B", "page"),
+            _element("Utils", "procedure_group"),
+            _element("PAGE_A", "page"),
+        ],
+        controls_by_element={
+            "PAGE_A": [_control("EDT_Z", 1), _control("BTN_A", 1), _control("CELL", 0)],
+        },
+        procedures_by_element={"Utils": procedures},
+        class_definitions=[SimpleNamespace(methods=[method])],
+    )
+
+
+class TestGenerationSnapshot:
+    """Tests for the shared snapshot."""
+
+    def test_elements_of_type_keeps_query_order(self, snapshot):
+        pages = snapshot.elements_of_type(["page", "window"])
+
+        assert [e.source_name for e in pages] == ["PAGE_B", "PAGE_A"]
+        assert [e.source_name for e in snapshot.elements_of_type("procedure_group")] == ["Utils"]
+
+    def test_controls_for(self, snapshot):
+        ordered = snapshot.controls_for("PAGE_A", ordered=True)
+        ordered.clear()
+
+        assert [c.name for c in snapshot.controls_for("PAGE_A", ordered=True)] == [
+            "CELL", "BTN_A", "EDT_Z",
+        ]
+        assert [c.name for c in snapshot.controls_for("PAGE_A")] == ["EDT_Z", "BTN_A", "CELL"]
+        assert snapshot.controls_for("PAGE_B") == []
+
+    def test_method_bodies_are_distinct_and_non_empty(self, snapshot):
+        assert snapshot.method_bodies() == ['HReadFirst(CLIENTE)\nRESULT True']
+
+    async def test_precompute_conversions(self, snapshot):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            converted = await snapshot.precompute_conversions(executor, 2)
+            again = await snapshot.precompute_conversions(executor, 2)
+
+        code = 'HReadFirst(CLIENTE)\nRESULT True'
+        expected = WLanguageConverter(db_var="self.db").convert(code)
+        assert (converted, again) == (1, 0)
+        assert snapshot.converted_code[code].python_code == expected.python_code
+
+    async def test_generator_reads_elements_from_snapshot(self, snapshot, tmp_path):
+        generator = RouteGenerator(PROJECT_ID, tmp_path)
+        generator.snapshot = snapshot
+
+        with patch("wxcode.generator.base.Element") as element_model:
+            elements = await generator.find_elements(["page", "window"])
+
+        element_model.find.assert_not_called()
+        assert [e.source_name for e in elements] == ["PAGE_B", "PAGE_A"]
+        assert generator.precomputed_conversion("x = 1") is None
+
+
+def _fake_generator(delay: float, files: int, error: str | None = None):
+    class FakeGenerator:
+        instances: list["FakeGenerator"] = []
+
+        def __init__(self, project_id, output_dir, element_filter=None):
+            self.snapshot = None
+            FakeGenerator.instances.append(self)
+
+        def get_element_query(self, source_types):
+            return {"source_type": {"$in": source_types}}
+
+        def _get_class_query(self):
+            return {}
+
+        async def generate(self):
+            await asyncio.sleep(delay)
+            if error:
+                raise RuntimeError(error)
+            return [Path(f"f{i}") for i in range(files)]
+
+    return FakeGenerator
+
+
+class TestParallelOrchestrator:
+    """Tests for GeneratorOrchestrator(parallel=True)."""
+
+    async def test_layers_share_snapshot_and_keep_order(self, tmp_path, snapshot):
+        order = [
+            ("schema", _fake_generator(0.03, 1)),
+            ("domain", _fake_generator(0.0, 2, error="boom")),
+            ("route", _fake_generator(0.01, 3)),
+            ("template", _fake_generator(0.0, 4, error="bad")),
+        ]
+        orchestrator = GeneratorOrchestrator(PROJECT_ID, tmp_path, parallel=True, max_workers=1)
+
+        with patch.object(GeneratorOrchestrator, "GENERATOR_ORDER", order), \
+             patch("wxcode.generator.orchestrator.load_generation_snapshot",
+                   new=AsyncMock(return_value=snapshot)) as load:
+            await orchestrator._run_generators_parallel(None)
+
+        load.assert_awaited_once()
+        result = orchestrator.result
+        assert [p.name for p in result.generators] == ["schema", "domain", "route", "template"]
+        assert [p.status for p in result.generators] == [
+            "completed", "failed", "completed", "failed",
+        ]
+        assert result.total_files == 4
+        assert result.errors == ["domain: boom", "template: bad"]
+        assert all(cls.instances[0].snapshot is snapshot for _, cls in order)
+
+    async def test_snapshot_failure_falls_back_to_queries(self, tmp_path):
+        order = [("route", _fake_generator(0.0, 2)), ("domain", _fake_generator(0.0, 1))]
+        orchestrator = GeneratorOrchestrator(PROJECT_ID, tmp_path, parallel=True)
+
+        with patch.object(GeneratorOrchestrator, "GENERATOR_ORDER", order), \
+             patch("wxcode.generator.orchestrator.load_generation_snapshot",
+                   new=AsyncMock(side_effect=RuntimeError("db down"))):
+            await orchestrator._run_generators_parallel(None)
+
+        result = orchestrator.result
+        assert result.success is True
+        assert result.errors == []
+        assert result.total_files == 3
+        assert all(cls.instances[0].snapshot is None for _, cls in order)
+
+    async def test_pool_failure_only_skips_precomputation(self, tmp_path, snapshot):
+        generators = [
+            (name, _fake_generator(0.0, 0)(PROJECT_ID, tmp_path)) for name in ("route", "domain")
+        ]
+        orchestrator = GeneratorOrchestrator(PROJECT_ID, tmp_path, parallel=True, max_workers=2)
+
+        with patch("wxcode.generator.orchestrator.load_generation_snapshot",
+                   new=AsyncMock(return_value=snapshot)), \
+             patch("wxcode.generator.orchestrator.MIN_CODES_FOR_POOL", 1), \
+             patch("wxcode.generator.orchestrator.ProcessPoolExecutor",
+                   side_effect=OSError("no semaphores")):
+            loaded = await orchestrator._load_snapshot(generators)
+
+        assert loaded is snapshot
+        assert snapshot.converted_code == {}
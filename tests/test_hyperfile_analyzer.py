@@ -0,0 +1,93 @@
+"""
+Testes para o analisador compilado de funções H*.
+"""
+
+from wxcode.transpiler import BufferBehavior, HyperFileAnalyzer, analyze_hyperfile_usage
+from wxcode.transpiler.hyperfile_catalog import HFUNCTION_CATALOG, get_hfunction
+
+CODE = '''// HAdd(CLIENTE) em comentário não conta
+sMsg = "HDelete(CLIENTE) dentro de string"
+HReadSeekFirst(CLIENTE, IDCliente, nId)
+IF HFound(CLIENTE) THEN
+    CLIENTE.Nome = sNome
+    HModify( CLIENTE )
+END
+HReadFirst(PEDIDO)
+WHILE NOT HOut(PEDIDO)
+    hreadnext(PEDIDO)
+END
+HFuncaoNova(X)
+HReadSeekFirstX(Y)
+html(z)
+'''
+
+
+class TestFindCalls:
+    """Localização das chamadas em uma passada."""
+
+    def test_calls_in_order_with_lines_and_args(self):
+        calls = HyperFileAnalyzer().find_calls(CODE)
+
+        assert [(c.name, c.line) for c in calls] == [
+            ("HReadSeekFirst", 3),
+            ("HFound", 4),
+            ("HModify", 6),
+            ("HReadFirst", 8),
+            ("HOut", 9),
+            ("HReadNext", 10),
+            ("HFuncaoNova", 12),
+            ("HReadSeekFirstX", 13),
+        ]
+        assert calls[0].args == ["CLIENTE", "IDCliente", "nId"]
+        assert calls[2].table == "CLIENTE"
+
+    def test_longest_name_wins(self):
+        calls = HyperFileAnalyzer().find_calls("HReadSeekLast(A, k, v)\nHReadSeek(A, k, v)")
+
+        assert [c.name for c in calls] == ["HReadSeekLast", "HReadSeek"]
+
+    def test_every_catalog_function_is_matched(self):
+        analyzer = HyperFileAnalyzer()
+        code = "\n".join(f"{name}(T)" for name in HFUNCTION_CATALOG)
+
+        assert [c.name for c in analyzer.find_calls(code)] == list(HFUNCTION_CATALOG)
+
+    def test_custom_catalog(self):
+        analyzer = HyperFileAnalyzer({"HAdd": HFUNCTION_CATALOG["HAdd"]})
+
+        calls = analyzer.find_calls("HAdd(A)\nHDelete(A)")
+
+        assert [(c.name, c.info is None) for c in calls] == [("HAdd", False), ("HDelete", True)]
+
+
+class TestHyperFileUsage:
+    """Classificação do bloco."""
+
+    def test_classification(self):
+        usage = analyze_hyperfile_usage(CODE)
+
+        assert usage.function_names == ["HReadSeekFirst", "HFound", "HModify", "HReadFirst", "HOut", "HReadNext"]
+        assert usage.unknown_functions == ["HFuncaoNova", "HReadSeekFirstX"]
+        assert usage.modifies_buffer is True
+        assert usage.needs_llm == ["HReadNext"]
+        assert usage.tables == ["CLIENTE", "PEDIDO"]
+        assert usage.by_behavior[BufferBehavior.PERSISTS_BUFFER] == ["HModify"]
+        assert usage.mongodb_equivalents["HModify"] == HFUNCTION_CATALOG["HModify"].mongodb_equivalent
+        assert "HReadNext" in usage.sqlalchemy_equivalents
+
+    def test_code_without_h_functions(self):
+        usage = analyze_hyperfile_usage("x = 1\nInfo(x)")
+
+        assert usage.calls == []
+        assert usage.modifies_buffer is False
+        assert analyze_hyperfile_usage("").needs_llm == []
+
+
+class TestIndexedLookups:
+    """Lookups do catálogo via índices pré-calculados."""
+
+    def test_lookup_matches_catalog(self):
+        analyzer = HyperFileAnalyzer()
+        for name, func in HFUNCTION_CATALOG.items():
+            assert analyzer.lookup(name.upper()) is func
+            assert get_hfunction(name.lower()) is func
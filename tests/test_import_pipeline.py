@@ -0,0 +1,324 @@
+"""
+Unit tests for the in-process import pipeline.
+
+Tests cover:
+- DAG execution with concurrent independent tasks
+- Dependency ordering and stop-on-failure
+- Aggregated step progress and ordered event delivery
+- Merged manifest for PDFs split in parallel
+- Task graph built for each wizard step
+- Step cancellation requested by the user vs. cancellation of the step itself
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from wxcode.services.import_pipeline import (
+    PipelineContext,
+    PipelineReporter,
+    PipelineTask,
+    build_step_tasks,
+    merge_pdf_manifests,
+    run_tasks,
+)
+from wxcode.services.step_executor import StepExecutor
+
+
+class _Sink:
+    def __init__(self):
+        self.events = []
+
+    async def __call__(self, event):
+        self.events.append(event)
+
+
+def _context(tmp_path: Path, pdfs: int = 0) -> PipelineContext:
+    project_dir = tmp_path / "proj"
+    project_dir.mkdir()
+    pdf_dir = tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    for i in range(pdfs):
+        (pdf_dir / f"doc{i}.pdf").write_bytes(b"%PDF")
+    return PipelineContext(
+        project_path=project_dir / "Proj.wwp",
+        project_name="Proj",
+        pdf_dir=pdf_dir,
+    )
+
+
+async def _run(tasks, ctx, step=4):
+    sink = _Sink()
+    reporter = PipelineReporter(step, sink)
+    reporter.start()
+    result = await run_tasks(tasks, ctx, reporter)
+    await reporter.close()
+    return result, sink.events
+
+
+class TestRunTasks:
+    """Test cases for the DAG runner."""
+
+    async def test_independent_tasks_run_concurrently(self, tmp_path):
+        started = []
+        release = asyncio.Event()
+
+        def make(name):
+            async def run(ctx, reporter):
+                started.append(name)
+                if len(started) == 3:
+                    release.set()
+                await asyncio.wait_for(release.wait(), timeout=1)
+                return {"count": 1}
+            return run
+
+        tasks = [PipelineTask(name, make(name)) for name in ("a", "b", "c")]
+        result, _ = await _run(tasks, _context(tmp_path))
+
+        assert result.ok
+        assert sorted(started) == ["a", "b", "c"]
+        assert result.metrics == {"count": 3}
+
+    async def test_dependencies_run_after_prerequisites(self, tmp_path):
+        order = []
+
+        def make(name, delay=0.0):
+            async def run(ctx, reporter):
+                await asyncio.sleep(delay)
+                order.append(name)
+                return {}
+            return run
+
+        tasks = [
+            PipelineTask("merge", make("merge"), depends_on=("split1", "split2")),
+            PipelineTask("split1", make("split1", 0.02)),
+            PipelineTask("split2", make("split2")),
+            PipelineTask("enrich", make("enrich"), depends_on=("merge",)),
+        ]
+        result, _ = await _run(tasks, _context(tmp_path))
+
+        assert result.ok
+        assert order[-2:] == ["merge", "enrich"]
+        assert set(order[:2]) == {"split1", "split2"}
+
+    async def test_failure_stops_dependents(self, tmp_path):
+        ran = []
+
+        async def boom(ctx, reporter):
+            raise RuntimeError("xdd missing")
+
+        async def ok(ctx, reporter):
+            ran.append("ok")
+            return {}
+
+        tasks = [
+            PipelineTask("schema", boom),
+            PipelineTask("after", ok, depends_on=("schema",)),
+        ]
+        result, events = await _run(tasks, _context(tmp_path))
+
+        assert not result.ok
+        assert result.failed == {"schema": "xdd missing"}
+        assert result.not_run == ["after"]
+        assert ran == []
+        assert "schema: xdd missing" in result.error_message
+        assert any(e["type"] == "log" and e["log"]["level"] == "error" for e in events)
+
+    async def test_unknown_dependency_is_rejected(self, tmp_path):
+        async def noop(ctx, reporter):
+            return {}
+
+        with pytest.raises(ValueError):
+            await _run([PipelineTask("a", noop, depends_on=("ghost",))], _context(tmp_path))
+
+
+class TestPipelineReporter:
+    """Test cases for structured progress events."""
+
+    async def test_progress_is_aggregated_across_tasks(self):
+        sink = _Sink()
+        reporter = PipelineReporter(3, sink)
+        reporter.start()
+        reporter.progress("split-pdf a.pdf", 1, 1)
+        reporter.progress("enrich", 1, 3)
+        await reporter.close()
+
+        last = sink.events[-1]["progress"]
+        assert last == {"step": 3, "current": 2, "total": 4, "percent": 50.0, "task": "enrich"}
+
+    async def test_events_keep_order_and_survive_send_errors(self):
+        sent = []
+
+        async def flaky(event):
+            if event["log"]["message"] == "b":
+                raise RuntimeError("socket closed")
+            sent.append(event["log"]["message"])
+
+        reporter = PipelineReporter(2, flaky)
+        reporter.start()
+        for message in ("a", "b", "c"):
+            reporter.log("info", message)
+        await reporter.close()
+
+        assert sent == ["a", "c"]
+        assert reporter.log_lines == 3
+
+
+class TestMergePdfManifests:
+    """Test cases for merging per-PDF manifests."""
+
+    def test_merges_elements_and_stats(self, tmp_path):
+        def manifest(name, pages, elapsed):
+            return {
+                "source_pdf": name,
+                "total_pages": 10,
+                "elements": {"pages": [{"name": p} for p in pages], "reports": [], "windows": [], "queries": []},
+                "stats": {"total_elements": len(pages), "pages": len(pages), "reports": 0,
+                          "windows": 0, "queries": 0, "processing_time_seconds": elapsed,
+                          "errors": []},
+            }
+
+        merged = merge_pdf_manifests(
+            [manifest("a.pdf", ["PAGE_A"], 2.0), manifest("b.pdf", ["PAGE_B", "PAGE_C"], 3.5)],
+            tmp_path,
+        )
+
+        on_disk = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+        assert on_disk == merged
+        assert [e["name"] for e in merged["elements"]["pages"]] == ["PAGE_A", "PAGE_B", "PAGE_C"]
+        assert merged["total_pages"] == 20
+        assert merged["stats"]["total_elements"] == 3
+        assert merged["stats"]["processing_time_seconds"] == 3.5
+        assert merged["source_pdfs"] == ["a.pdf", "b.pdf"]
+
+
+class TestBuildStepTasks:
+    """Test cases for the per-step task graph."""
+
+    def test_parse_step_has_independent_tasks(self, tmp_path):
+        tasks = build_step_tasks(4, _context(tmp_path))
+
+        assert {t.name for t in tasks} == {"parse-schema", "parse-procedures", "parse-classes"}
+        assert all(not t.depends_on for t in tasks)
+
+    def test_enrich_waits_for_every_split(self, tmp_path):
+        tasks = {t.name: t for t in build_step_tasks(3, _context(tmp_path, pdfs=2))}
+
+        assert set(tasks["pdf-manifest"].depends_on) == {"split-pdf doc0.pdf", "split-pdf doc1.pdf"}
+        assert tasks["enrich"].depends_on == ("pdf-manifest",)
+        assert not tasks["split-pdf doc0.pdf"].depends_on
+
+    def test_enrich_without_pdfs(self, tmp_path):
+        tasks = build_step_tasks(3, _context(tmp_path))
+
+        assert [t.name for t in tasks] == ["enrich"]
+
+    def test_unknown_step(self, tmp_path):
+        assert build_step_tasks(9, _context(tmp_path)) == []
+
+
+class TestSplitTasks:
+    """Test cases for PDF splits dispatched to the executor."""
+
+    async def test_splits_feed_merged_manifest(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wxcode.services import import_pipeline
+
+        def fake_worker(pdf_path, output_dir, known_elements):
+            name = Path(pdf_path).stem
+            return {
+                "source_pdf": Path(pdf_path).name,
+                "total_pages": 1,
+                "elements": {"pages": [{"name": f"PAGE_{name}"}]},
+                "stats": {"total_elements": 1, "pages": 1},
+            }
+
+        monkeypatch.setattr(import_pipeline, "_split_pdf_worker", fake_worker)
+        ctx = _context(tmp_path, pdfs=3)
+        ctx._known_elements = {}
+        ctx.executor = ThreadPoolExecutor(max_workers=3)
+        tasks = [t for t in build_step_tasks(3, ctx) if t.name != "enrich"]
+
+        result, _ = await _run(tasks, ctx, step=3)
+        ctx.executor.shutdown()
+
+        assert result.ok
+        assert result.metrics["pdf_elements_count"] == 3
+        manifest = json.loads((ctx.split_dir / "manifest.json").read_text(encoding="utf-8"))
+        assert sorted(e["name"] for e in manifest["elements"]["pages"]) == [
+            "PAGE_doc0", "PAGE_doc1", "PAGE_doc2",
+        ]
+
+
+class _Session:
+    session_id = "s1"
+    project_id = None
+
+    def __init__(self):
+        self.statuses = []
+
+    def update_step_status(self, step, status, **kwargs):
+        self.statuses.append(status)
+
+    async def save(self):
+        pass
+
+    def get_step_result(self, step):
+        return None
+
+
+class _WebSocket:
+    def __init__(self):
+        self.events = []
+
+    async def send_text(self, text):
+        self.events.append(json.loads(text))
+
+
+class TestStepExecutorCancellation:
+    """Test cases for StepExecutor cancellation."""
+
+    async def _start(self, tmp_path, started):
+        async def slow(ctx, reporter):
+            started.set()
+            await asyncio.sleep(10)
+            return {}
+
+        executor = StepExecutor()
+        executor.contexts["s1"] = _context(tmp_path)
+        session = _Session()
+        with patch(
+            "wxcode.services.step_executor.build_step_tasks",
+            return_value=[PipelineTask("slow", slow)],
+        ):
+            step = asyncio.create_task(executor.execute_step(session, 4, _WebSocket()))
+            await asyncio.wait_for(started.wait(), timeout=1)
+        return executor, session, step
+
+    async def test_user_cancel_fails_the_step(self, tmp_path):
+        started = asyncio.Event()
+        executor, session, step = await self._start(tmp_path, started)
+
+        await executor.cancel_session("s1")
+        result = await asyncio.wait_for(step, timeout=1)
+
+        assert result.status == "failed"
+        assert result.error_message == "Etapa cancelada"
+        assert session.statuses == ["running", "failed"]
+
+    async def test_cancelling_the_step_propagates(self, tmp_path):
+        started = asyncio.Event()
+        executor, session, step = await self._start(tmp_path, started)
+        run = executor.active_tasks["s1"]
+
+        step.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await step
+
+        assert run.cancelled()
+        assert executor.active_tasks == {}
+        assert session.statuses == ["running"]
@@ -0,0 +1,94 @@
+"""Tests for the shared Jinja2 environment registry."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from jinja2 import Environment
+
+from wxcode.generator.jinja_environments import (
+    EnvironmentOptions,
+    JinjaEnvironmentRegistry,
+)
+from wxcode.generator.python_config_generator import PythonConfigGenerator
+from wxcode.generator.route_generator import RouteGenerator
+from wxcode.generator.template_generator import TemplateGenerator
+
+PROJECT_ID = "507f1f77bcf86cd799439011"
+
+
+class TestJinjaEnvironmentRegistry:
+    """Tests for JinjaEnvironmentRegistry."""
+
+    def test_environment_shared_per_key(self, tmp_path: Path):
+        registry = JinjaEnvironmentRegistry(tmp_path)
+
+        python_env = registry.get("python")
+
+        assert registry.get("python") is python_env
+        assert registry.get("html") is not python_env
+        assert registry.get("python", stack="other") is not python_env
+        assert registry.get(
+            "python", options=EnvironmentOptions(keep_trailing_newline=False)
+        ) is not python_env
+        assert python_env.filters["snake_case"]("NomeCliente") == "nome_cliente"
+
+    def test_bytecode_reused_by_new_process(self, tmp_path: Path):
+        JinjaEnvironmentRegistry(tmp_path).get("python").get_template("model.py.j2")
+        assert list(tmp_path.glob("*.cache"))
+
+        # A new registry stands for a new process: no compilation from source
+        env = JinjaEnvironmentRegistry(tmp_path).get("python")
+        with patch.object(Environment, "compile", wraps=env.compile) as compile_:
+            env.get_template("model.py.j2")
+
+        compile_.assert_not_called()
+
+    def test_bytecode_namespaced_by_options(self, tmp_path: Path):
+        registry = JinjaEnvironmentRegistry(tmp_path)
+        registry.get("python").get_template("config.py.j2")
+        registry.get(
+            "python", options=EnvironmentOptions(keep_trailing_newline=False)
+        ).get_template("config.py.j2")
+
+        assert len(list(tmp_path.glob("*.cache"))) == 2
+
+    def test_unwritable_cache_dir(self, tmp_path: Path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+
+        env = JinjaEnvironmentRegistry(blocker / "jinja").get("python")
+
+        assert env.bytecode_cache is None
+        assert env.get_template("model.py.j2")
+
+    def test_from_string_is_memoized(self, tmp_path: Path):
+        env = JinjaEnvironmentRegistry(tmp_path, use_bytecode_cache=False).get("python")
+
+        template = env.from_string("{{ name | pascal_case }}")
+
+        assert env.from_string("{{ name | pascal_case }}") is template
+        assert template.render(name="nome_cliente") == "NomeCliente"
+        assert env.from_string("{{ x }}", globals={"x": 1}) is not env.from_string("{{ x }}")
+
+
+class TestGeneratorsShareEnvironments:
+    """Generators get their environment from the process-wide registry."""
+
+    def test_same_subdir_same_environment(self, tmp_path: Path):
+        route = RouteGenerator(PROJECT_ID, tmp_path)
+        other_route = RouteGenerator(PROJECT_ID, tmp_path)
+        template = TemplateGenerator(PROJECT_ID, tmp_path)
+
+        assert route.jinja_env is other_route.jinja_env
+        assert template.jinja_env is not route.jinja_env
+
+    def test_render_template_string(self, tmp_path: Path):
+        route = RouteGenerator(PROJECT_ID, tmp_path)
+
+        assert route.render_template_string("{{ n | snake_case }}", {"n": "PageLogin"}) == "page_login"
+
+    def test_config_generator_keeps_its_whitespace_options(self):
+        env = PythonConfigGenerator().env
+
+        assert env.keep_trailing_newline is False
+        assert env.trim_blocks is True
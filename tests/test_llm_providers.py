@@ -0,0 +1,443 @@
+"""
+Unit tests for async LLM providers, rate limiting and streaming parsing.
+
+Tests cover:
+- Retry delays derived from rate-limit headers
+- Shared provider limiters reused across event loops
+- Jittered retry with limiter pause on HTTP 429
+- Buffer reset between attempts
+- StreamingJSONBuffer across chunk boundaries
+- ResponseParser using the streamed JSON boundaries
+- OllamaProvider NDJSON streaming over the shared HTTP client
+- Prompt split into cacheable prefix and per-element suffix
+- Anthropic cache breakpoints and cache-aware cost
+- TokenUsageLog recording helpers
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from bson import DBRef, ObjectId
+
+from wxcode.llm_converter.models import ConversionContext, LLMResponse, LLMResponseError
+from wxcode.llm_converter.providers import base as provider_base
+from wxcode.llm_converter.providers import limiter as limiter_module
+from wxcode.llm_converter.providers import ollama as ollama_module
+from wxcode.llm_converter.providers.anthropic import AnthropicProvider
+from wxcode.llm_converter.providers.base import BaseLLMProvider, Prompt
+from wxcode.llm_converter.providers.limiter import (
+    ProviderRateLimiter,
+    backoff_delay,
+    get_provider_limiter,
+    retry_delay_from_headers,
+)
+from wxcode.llm_converter.providers.ollama import OllamaProvider
+from wxcode.llm_converter.providers.pool import get_http_client
+from wxcode.llm_converter.providers.prompts import SYSTEM_PROMPT
+from wxcode.llm_converter.response_parser import ResponseParser, StreamingJSONBuffer
+from wxcode.llm_converter.usage_log import element_project_id, record_llm_usage
+
+NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+PAGE_JSON = {
+    "page_name": "PAGE_Login",
+    "route": {
+        "path": "/login",
+        "methods": ["GET"],
+        "filename": "login.py",
+        "code": "x = {'a': \"}\"}\n",
+    },
+    "template": {"filename": "login.html", "content": "<div>{{ form }}</div>"},
+}
+
+
+class TestRetryDelayFromHeaders:
+    """Test cases for retry_delay_from_headers."""
+
+    def test_no_headers(self):
+        assert retry_delay_from_headers(None) is None
+        assert retry_delay_from_headers({"content-type": "application/json"}) is None
+
+    def test_retry_after_seconds(self):
+        assert retry_delay_from_headers({"Retry-After": "7"}) == 7.0
+
+    def test_retry_after_ms_wins(self):
+        headers = {"retry-after-ms": "1500", "retry-after": "2"}
+        assert retry_delay_from_headers(headers) == 1.5
+
+    def test_retry_after_http_date(self):
+        headers = {"retry-after": format_datetime(NOW + timedelta(seconds=30), usegmt=True)}
+        assert retry_delay_from_headers(headers, now=NOW) == 30.0
+
+    def test_anthropic_reset_timestamp(self):
+        headers = {
+            "anthropic-ratelimit-requests-reset": (NOW + timedelta(seconds=5)).isoformat(),
+            "anthropic-ratelimit-tokens-reset": "2026-01-01T12:00:20Z",
+        }
+        assert retry_delay_from_headers(headers, now=NOW) == 20.0
+
+    def test_openai_reset_durations(self):
+        headers = {"x-ratelimit-reset-requests": "1s", "x-ratelimit-reset-tokens": "6m0s"}
+        assert retry_delay_from_headers(headers, now=NOW) == 360.0
+        assert retry_delay_from_headers({"x-ratelimit-reset-tokens": "20ms"}) == 0.02
+
+    def test_backoff_uses_headers_with_small_jitter(self):
+        for attempt in range(5):
+            delay = backoff_delay(attempt, {"retry-after": "10"})
+            assert 10.0 <= delay <= 11.0
+
+    def test_backoff_without_headers_is_full_jitter(self):
+        for attempt in range(6):
+            assert 0.0 <= backoff_delay(attempt) <= min(60.0, 2 ** attempt)
+
+
+class TestProviderLimiterAcrossLoops:
+    """Test cases for reusing a shared limiter in several asyncio.run calls."""
+
+    def test_shared_limiter_works_in_a_new_event_loop(self, monkeypatch):
+        monkeypatch.setattr(limiter_module, "_provider_limiters", {})
+        limiter = get_provider_limiter("test", max_concurrency=1, tokens_per_minute=6000)
+
+        async def contended_calls():
+            async def call():
+                async with limiter.slot(10):
+                    await asyncio.sleep(0)
+
+            # Contention binds the semaphore and the lock to the running loop
+            await asyncio.gather(call(), call(), call())
+
+        asyncio.run(contended_calls())
+        asyncio.run(contended_calls())
+
+        assert get_provider_limiter("test") is limiter
+
+
+class _RateLimited(Exception):
+    def __init__(self, headers):
+        super().__init__("429")
+        self.response = httpx.Response(429, headers=headers)
+
+
+class _FakeProvider(BaseLLMProvider):
+    retry_exceptions = (_RateLimited,)
+
+    def __init__(self, script, **kwargs):
+        super().__init__("fake", **kwargs)
+        self.script = list(script)
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    async def _stream(self, prompt, max_tokens, on_text):
+        self.calls += 1
+        step = self.script.pop(0)
+        for chunk in step["chunks"]:
+            if on_text is not None:
+                on_text(chunk)
+        if "error" in step:
+            raise step["error"]
+        return {"content": "".join(step["chunks"]), "input_tokens": 3, "output_tokens": 4}
+
+    def estimate_cost(self, tokens_in, tokens_out):
+        return 0.0
+
+    @classmethod
+    def available_models(cls):
+        return ["fake"]
+
+
+class TestCallWithRetry:
+    """Test cases for BaseLLMProvider retry and limiting."""
+
+    async def test_rate_limit_pauses_limiter_and_retries(self, monkeypatch):
+        now = [0.0]
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        monkeypatch.setattr(provider_base.asyncio, "sleep", fake_sleep)
+        limiter = ProviderRateLimiter(max_concurrency=2, clock=lambda: now[0])
+        provider = _FakeProvider(
+            [
+                {"chunks": ['{"partial'], "error": _RateLimited({"retry-after": "4"})},
+                {"chunks": ['{"ok": ', "true}"]},
+            ],
+            limiter=limiter,
+        )
+        buffer = StreamingJSONBuffer()
+
+        response = await provider.complete("system", "user", buffer=buffer)
+
+        assert response.content == '{"ok": true}'
+        assert provider.calls == 2
+        # A pausa do limitador já cobre a espera: a retentativa não dorme de novo
+        assert len(sleeps) == 1 and 4.0 <= sleeps[0] <= 4.4
+        assert limiter._paused_until == sleeps[0]
+        # O texto parcial da tentativa com erro foi descartado
+        assert buffer.text == '{"ok": true}'
+        assert buffer.loads() == {"ok": True}
+
+    async def test_gives_up_after_max_retries(self, monkeypatch):
+        async def fake_sleep(seconds):
+            pass
+
+        monkeypatch.setattr(provider_base.asyncio, "sleep", fake_sleep)
+        error = _RateLimited({})
+        provider = _FakeProvider(
+            [{"chunks": [], "error": error}] * 3,
+            max_retries=3,
+            limiter=ProviderRateLimiter(),
+        )
+
+        with pytest.raises(LLMResponseError, match="Failed after retries"):
+            await provider.complete("system", "user")
+        assert provider.calls == 3
+
+    async def test_non_retryable_error_fails_fast(self):
+        provider = _FakeProvider(
+            [{"chunks": [], "error": ValueError("boom")}],
+            limiter=ProviderRateLimiter(),
+        )
+
+        with pytest.raises(LLMResponseError):
+            await provider.complete("system", "user")
+        assert provider.calls == 1
+
+
+class TestStreamingJSONBuffer:
+    """Test cases for StreamingJSONBuffer."""
+
+    def _feed_all(self, text: str, size: int) -> StreamingJSONBuffer:
+        buffer = StreamingJSONBuffer()
+        for i in range(0, len(text), size):
+            buffer.feed(text[i:i + size])
+        return buffer
+
+    def test_locates_object_across_any_chunking(self):
+        body = json.dumps(PAGE_JSON)
+        text = f"Segue o resultado:\n```json\n{body}\n```\nObs: pronto."
+        for size in (1, 2, 3, 7, 64, len(text)):
+            buffer = self._feed_all(text, size)
+            assert buffer.complete, size
+            assert buffer.json_text == body
+            assert buffer.loads() == PAGE_JSON
+
+    def test_escaped_quote_split_between_chunks(self):
+        buffer = StreamingJSONBuffer()
+        assert not buffer.feed('{"a": "x\\')
+        assert not buffer.feed('"}')
+        assert buffer.feed('"}')
+        assert buffer.loads() == {"a": 'x"}'}
+
+    def test_incomplete_object(self):
+        buffer = self._feed_all('{"a": {"b": 1}', 4)
+        assert not buffer.complete
+        assert buffer.loads() is None
+
+    def test_reset_discards_content(self):
+        buffer = self._feed_all('{"a": 1}', 3)
+        buffer.reset()
+        assert buffer.text == ""
+        assert not buffer.complete
+
+
+class TestResponseParserWithBuffer:
+    """Test cases for ResponseParser.parse with a streaming buffer."""
+
+    def test_uses_streamed_boundaries(self, monkeypatch):
+        text = f"```json\n{json.dumps(PAGE_JSON)}\n```"
+        buffer = StreamingJSONBuffer()
+        buffer.feed(text)
+        parser = ResponseParser()
+
+        def fail(response):
+            raise AssertionError("should not scan the response again")
+
+        monkeypatch.setattr(parser, "_extract_json", fail)
+        result = parser.parse(text, buffer=buffer)
+
+        assert result.page_name == "PAGE_Login"
+
+    def test_falls_back_when_buffer_does_not_match(self):
+        buffer = StreamingJSONBuffer()
+        buffer.feed('{"other": 1}')
+
+        result = ResponseParser().parse(json.dumps(PAGE_JSON), buffer=buffer)
+
+        assert result.page_name == "PAGE_Login"
+
+
+class TestOllamaStreaming:
+    """Test cases for OllamaProvider streaming over the shared client."""
+
+    async def test_streams_ndjson_chunks(self, monkeypatch):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            lines = [
+                {"response": '{"page_name": ', "done": False},
+                {"response": '"P"}', "done": False},
+                {"response": "", "done": True, "prompt_eval_count": 11, "eval_count": 5},
+            ]
+            body = "\n".join(json.dumps(line) for line in lines) + "\n"
+            return httpx.Response(200, content=body.encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(ollama_module, "get_http_client", lambda: client)
+        provider = OllamaProvider(limiter=ProviderRateLimiter())
+        buffer = StreamingJSONBuffer()
+
+        response = await provider.complete("system", "user", buffer=buffer)
+        await client.aclose()
+
+        assert requests[0]["stream"] is True
+        assert response.content == '{"page_name": "P"}'
+        assert (response.input_tokens, response.output_tokens) == (11, 5)
+        assert buffer.loads() == {"page_name": "P"}
+
+    async def test_connect_error_message(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(ollama_module, "get_http_client", lambda: client)
+        provider = OllamaProvider(limiter=ProviderRateLimiter())
+
+        with pytest.raises(LLMResponseError, match="Cannot connect to Ollama"):
+            await provider.complete("system", "user")
+        await client.aclose()
+
+
+class _FakeAnthropicStream:
+    def __init__(self, chunks, usage):
+        self.chunks = chunks
+        self.usage = usage
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def get_final_message(self):
+        text = "".join(self.chunks)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)], usage=self.usage
+        )
+
+
+class _FakeAnthropicClient:
+    def __init__(self, usage):
+        self.calls = []
+        self.usage = usage
+        self.messages = self
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return _FakeAnthropicStream(['{"ok": ', "1}"], self.usage)
+
+
+class TestPromptCaching:
+    """Test cases for prompt prefix caching."""
+
+    def _context(self, **kwargs) -> ConversionContext:
+        return ConversionContext(
+            page_name="PAGE_Login",
+            element_id="e1",
+            controls=[{"name": "EDT_User", "type_code": 8}],
+            **kwargs,
+        )
+
+    def test_page_prompt_puts_theme_skills_in_prefix(self):
+        provider = OllamaProvider()
+        context = self._context(theme="dashlite", theme_skills="## Buttons\n.btn")
+
+        prompt = provider._build_page_prompt(context)
+
+        assert prompt.system == SYSTEM_PROMPT
+        assert len(prompt.prefix) == 1 and ".btn" in prompt.prefix[0]
+        assert "PAGE_Login" not in prompt.prefix[0]
+        assert prompt.suffix.startswith("# Converter Página: PAGE_Login")
+        assert provider._build_user_message(context) == prompt.user_message
+        assert prompt.user_message.index("---\n\n# Converter Página") > 0
+
+    def test_page_prompt_without_theme_has_no_prefix(self):
+        prompt = OllamaProvider()._build_page_prompt(self._context())
+
+        assert prompt.prefix == []
+        assert prompt.user_message == prompt.suffix
+
+    async def test_anthropic_marks_cache_breakpoints(self):
+        usage = SimpleNamespace(
+            input_tokens=120,
+            output_tokens=30,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=4000,
+        )
+        provider = AnthropicProvider(api_key="test", limiter=ProviderRateLimiter())
+        fake = _FakeAnthropicClient(usage)
+        provider._http_client = get_http_client()
+        provider._client = fake
+
+        response = await provider.complete_prompt(
+            Prompt(system="RULES", prefix=["THEME"], suffix="PAGE")
+        )
+
+        call = fake.calls[0]
+        assert call["system"] == [
+            {"type": "text", "text": "RULES", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert call["messages"][0]["content"] == [
+            {"type": "text", "text": "THEME", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "PAGE"},
+        ]
+        assert response.content == '{"ok": 1}'
+        assert response.cache_read_tokens == 4000
+        assert response.cache_creation_tokens == 0
+
+    def test_anthropic_cost_discounts_cache_reads(self):
+        provider = AnthropicProvider(api_key="test")
+        uncached = provider.estimate_cost(10_000, 1_000)
+        cached = provider.estimate_cost(1_000, 1_000, cache_read_tokens=9_000)
+
+        assert cached < uncached
+        assert cached == pytest.approx((1_000 * 3.0 + 9_000 * 0.3 + 1_000 * 15.0) / 1e6)
+
+
+class TestUsageLog:
+    """Test cases for TokenUsageLog recording helpers."""
+
+    def test_element_project_id_accepts_dbref_and_objectid(self):
+        project_id = ObjectId()
+
+        assert element_project_id({"project_id": DBRef("projects", project_id)}) == str(project_id)
+        assert element_project_id({"project_id": project_id}) == str(project_id)
+        assert element_project_id({}) is None
+
+    async def test_record_without_project_is_noop(self):
+        response = LLMResponse(content="", input_tokens=1, output_tokens=1)
+
+        assert not await record_llm_usage(response, None, "llm-s", "m", 0.0)
+
+    async def test_record_failure_does_not_raise(self):
+        # Beanie não inicializado neste teste: o insert falha silenciosamente
+        response = LLMResponse(
+            content="", input_tokens=1, output_tokens=1, cache_read_tokens=5
+        )
+
+        assert not await record_llm_usage(response, str(ObjectId()), "llm-s", "m", 0.0)
@@ -0,0 +1,204 @@
+"""
+Unit tests for the content-addressed LLM response cache.
+
+Tests cover:
+- Cache keys stable across runs and sensitive to provider/model/context
+- Roundtrip of LLMResponse through the on-disk store
+- Size-based eviction of least recently used entries
+- PageConverter cache hits, refresh and no-cache behavior
+"""
+
+import json
+import os
+
+import pytest
+from bson import ObjectId
+
+from wxcode.llm_converter.models import ConversionContext, InvalidOutputError, LLMResponse
+from wxcode.llm_converter.page_converter import PageConverter
+from wxcode.llm_converter.response_cache import LLMResponseCache
+
+PAGE_JSON = {
+    "page_name": "PAGE_Login",
+    "route": {
+        "path": "/login",
+        "methods": ["GET"],
+        "filename": "login.py",
+        "code": "x = 1\n",
+    },
+    "template": {"filename": "login.html", "content": "<div></div>"},
+}
+
+
+def _context(**kwargs) -> ConversionContext:
+    data = {
+        "page_name": "PAGE_Login",
+        "element_id": "65a000000000000000000001",
+        "controls": [{"name": "EDT_User", "type_code": 8}],
+        "local_procedures": [{"name": "Local_Check", "code": "RESULT True"}],
+    }
+    data.update(kwargs)
+    return ConversionContext(**data)
+
+
+def _response(content: str = "{}", tokens_in: int = 100, tokens_out: int = 50) -> LLMResponse:
+    return LLMResponse(content=content, input_tokens=tokens_in, output_tokens=tokens_out)
+
+
+class TestCacheKey:
+    """Test cases for LLMResponseCache.make_key."""
+
+    def test_stable_for_equal_contexts(self):
+        key_a = LLMResponseCache.make_key("anthropic", "m", _context())
+        key_b = LLMResponseCache.make_key("anthropic", "m", _context())
+
+        assert key_a == key_b
+
+    @pytest.mark.parametrize(
+        "provider, model, context",
+        [
+            ("openai", "m", _context()),
+            ("anthropic", "other", _context()),
+            ("anthropic", "m", _context(controls=[])),
+        ],
+    )
+    def test_changes_with_inputs(self, provider, model, context):
+        base = LLMResponseCache.make_key("anthropic", "m", _context())
+
+        assert LLMResponseCache.make_key(provider, model, context) != base
+
+    def test_changes_with_prompt_version(self):
+        base = LLMResponseCache.make_key("anthropic", "m", _context())
+        bumped = LLMResponseCache.make_key("anthropic", "m", _context(), prompt_version="x")
+
+        assert bumped != base
+
+
+class TestResponseStore:
+    """Test cases for get/put and eviction."""
+
+    def test_roundtrip(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, max_bytes=1 << 20)
+        key = cache.make_key("anthropic", "m", _context())
+
+        assert cache.get(key) is None
+        cache.put(key, _response("hello"))
+
+        assert cache.get(key) == _response("hello")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, max_bytes=1 << 20)
+        key = "ab" * 20
+        cache.put(key, _response())
+        (tmp_path / key[:2] / f"{key}.json").write_text("{not json")
+
+        assert cache.get(key) is None
+        assert not (tmp_path / key[:2] / f"{key}.json").exists()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        entry_size = len(_response("x" * 200).model_dump_json())
+        cache = LLMResponseCache(tmp_path, max_bytes=entry_size * 3)
+        keys = [f"{i:02d}" + "0" * 38 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, _response("x" * 200))
+            os.utime(tmp_path / key[:2] / f"{key}.json", (1000 + i, 1000 + i))
+
+        # O primeiro é lido e passa a ser o mais recente
+        assert cache.get(keys[0]) is not None
+        cache.put("99" + "0" * 38, _response("x" * 200))
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.size() <= entry_size * 3
+
+
+class _FakeContextBuilder:
+    def __init__(self, context):
+        self.context = context
+
+    async def build(self, element_id):
+        return self.context
+
+
+class _CountingProvider:
+    name = "fake"
+    model = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def convert(self, context, buffer=None):
+        self.calls += 1
+        return _response(json.dumps(PAGE_JSON), tokens_in=1000, tokens_out=200)
+
+    def estimate_cost(self, tokens_in, tokens_out, cache_creation_tokens=0, cache_read_tokens=0):
+        return 0.5
+
+
+def _converter(tmp_path, provider, cache, refresh=False) -> PageConverter:
+    converter = PageConverter(
+        None,
+        tmp_path / "out",
+        llm_provider=provider,
+        response_cache=cache,
+        refresh_cache=refresh,
+    )
+    converter.context_builder = _FakeContextBuilder(_context())
+    return converter
+
+
+class TestPageConverterCache:
+    """Test cases for PageConverter with a response cache."""
+
+    async def test_second_conversion_hits_cache(self, tmp_path):
+        provider = _CountingProvider()
+        cache = LLMResponseCache(tmp_path / "cache", max_bytes=1 << 20)
+        converter = _converter(tmp_path, provider, cache)
+
+        first = await converter.convert(ObjectId(), dry_run=True)
+        second = await converter.convert(ObjectId(), dry_run=True)
+
+        assert provider.calls == 1
+        assert not first.cache_hit and first.cost_usd == 0.5
+        assert second.cache_hit and second.cost_usd == 0.0
+        assert second.tokens_used["total"] == 0
+        assert second.tokens_used["saved"] == 1200
+        assert second.page_name == "PAGE_Login"
+
+    async def test_refresh_bypasses_and_rewrites(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache", max_bytes=1 << 20)
+        await _converter(tmp_path, _CountingProvider(), cache).convert(ObjectId(), dry_run=True)
+
+        provider = _CountingProvider()
+        result = await _converter(tmp_path, provider, cache, refresh=True).convert(
+            ObjectId(), dry_run=True
+        )
+
+        assert provider.calls == 1
+        assert not result.cache_hit
+        assert cache.size() > 0
+
+    async def test_without_cache_always_calls_provider(self, tmp_path):
+        provider = _CountingProvider()
+        converter = _converter(tmp_path, provider, None)
+
+        await converter.convert(ObjectId(), dry_run=True)
+        await converter.convert(ObjectId(), dry_run=True)
+
+        assert provider.calls == 2
+
+    async def test_unparseable_response_is_not_cached(self, tmp_path):
+        class BrokenProvider(_CountingProvider):
+            async def convert(self, context, buffer=None):
+                self.calls += 1
+                return _response("no json here")
+
+        cache = LLMResponseCache(tmp_path / "cache", max_bytes=1 << 20)
+        converter = _converter(tmp_path, BrokenProvider(), cache)
+
+        with pytest.raises(InvalidOutputError):
+            await converter.convert(ObjectId(), dry_run=True)
+
+        assert cache.size() == 0
@@ -0,0 +1,139 @@
+"""Tests for the shared MCP element resolver."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import DBRef, ObjectId
+
+from wxcode.mcp.resolver import ElementRef, ElementResolver
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return self.docs if length is None else self.docs[:length]
+
+    def __aiter__(self):
+        async def gen():
+            for doc in self.docs:
+                yield doc
+        return gen()
+
+
+def _value(doc, key):
+    # "project_id.$id" reads the id of the project_id DBRef
+    if key.endswith(".$id"):
+        ref = doc.get(key[:-len(".$id")])
+        return ref.id if ref is not None else None
+    return doc.get(key)
+
+
+class FakeCollection:
+    """Minimal async collection supporting equality filters."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        return FakeCursor([
+            d for d in self.docs if all(_value(d, k) == v for k, v in query.items())
+        ])
+
+
+P1, P2 = ObjectId(), ObjectId()
+E_LOGIN_1, E_LOGIN_2, E_HOME = ObjectId(), ObjectId(), ObjectId()
+
+
+@pytest.fixture
+def db():
+    projects = FakeCollection([
+        {"_id": P1, "name": "Linkpay", "updated_at": 1, "total_elements": 2, "status": "imported"},
+        {"_id": P2, "name": "Other", "updated_at": 1, "total_elements": 1, "status": "imported"},
+    ])
+    elements = FakeCollection([
+        {"_id": E_LOGIN_1, "source_name": "PAGE_Login", "project_id": DBRef("projects", P1)},
+        {"_id": E_HOME, "source_name": "PAGE_Home", "project_id": DBRef("projects", P1)},
+        {"_id": E_LOGIN_2, "source_name": "PAGE_Login", "project_id": DBRef("projects", P2)},
+    ])
+    fetched = {d["_id"]: d for d in elements.docs}
+    with patch("wxcode.mcp.resolver.Project.get_pymongo_collection", return_value=projects), \
+         patch("wxcode.mcp.resolver.Element.get_pymongo_collection", return_value=elements), \
+         patch("wxcode.mcp.resolver.Element.get", new=AsyncMock(side_effect=fetched.get)) as get, \
+         patch("wxcode.mcp.resolver.Element.find_one", new=AsyncMock()) as find_one:
+        yield {"projects": projects, "elements": elements, "get": get, "find_one": find_one}
+
+
+class TestElementResolver:
+    """Index-backed name resolution."""
+
+    async def test_scoped_lookup_uses_index(self, db):
+        resolver = ElementResolver()
+        element, error = await resolver.resolve("PAGE_Home", "Linkpay")
+        assert error is None
+        assert element["_id"] == E_HOME
+
+        element, _ = await resolver.resolve("PAGE_Login", "Linkpay")
+        assert element["_id"] == E_LOGIN_1
+        # One project scan and one element index build for both lookups
+        assert len(db["projects"].queries) == 1
+        assert db["elements"].queries == [{"project_id.$id": P1}]
+
+    async def test_unknown_project(self, db):
+        element, error = await ElementResolver().resolve("PAGE_Home", "Missing")
+        assert element is None
+        assert error == "Project 'Missing' not found"
+
+    async def test_unknown_element_in_project(self, db):
+        element, error = await ElementResolver().resolve("PAGE_Nope", "Linkpay")
+        assert element is None
+        assert error == "Element 'PAGE_Nope' not found in project 'Linkpay'"
+
+    async def test_unscoped_ambiguous_lists_projects(self, db):
+        element, error = await ElementResolver().resolve("PAGE_Login")
+        assert element is None
+        assert "found in multiple projects: Linkpay, Other" in error
+
+    async def test_unscoped_unique(self, db):
+        element, error = await ElementResolver().resolve("PAGE_Home")
+        assert error is None
+        assert element["_id"] == E_HOME
+
+    async def test_projection_uses_find_one(self, db):
+        await ElementResolver().resolve("PAGE_Home", "Linkpay", ElementRef)
+        db["find_one"].assert_awaited_once_with({"_id": E_HOME}, projection_model=ElementRef)
+        db["get"].assert_not_awaited()
+
+    async def test_new_element_found_after_index_miss(self, db):
+        resolver = ElementResolver()
+        await resolver.resolve("PAGE_Home", "Linkpay")
+        new_id = ObjectId()
+        db["elements"].docs.append(
+            {"_id": new_id, "source_name": "PAGE_New", "project_id": DBRef("projects", P1)}
+        )
+        db["get"].side_effect = {d["_id"]: d for d in db["elements"].docs}.get
+
+        element, error = await resolver.resolve("PAGE_New", "Linkpay")
+        assert error is None
+        assert element["_id"] == new_id
+
+    async def test_fingerprint_change_rebuilds_index(self, db):
+        resolver = ElementResolver(projects_ttl=0)
+        await resolver.resolve("PAGE_Home", "Linkpay")
+        await resolver.resolve("PAGE_Home", "Linkpay")
+        assert len(db["elements"].queries) == 1
+
+        db["projects"].docs[0]["updated_at"] = 2
+        await resolver.resolve("PAGE_Home", "Linkpay")
+        assert len(db["elements"].queries) == 2
+
+    async def test_invalidate_project(self, db):
+        resolver = ElementResolver()
+        await resolver.resolve("PAGE_Home", "Linkpay")
+        resolver.invalidate(str(P1))
+        await resolver.resolve("PAGE_Home", "Linkpay")
+        assert len(db["elements"].queries) == 2
+        assert len(db["projects"].queries) == 2
@@ -0,0 +1,167 @@
+"""
+Unit tests for keyset (cursor) pagination helpers.
+
+Tests cover:
+- Cursor encode/decode round trip (including ObjectIds)
+- Keyset filter generation (single/compound keys, null values)
+- paginate_by_cursor page slicing and next cursor
+- iter_projected walking every page
+- Conversion list responses built from projected documents
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from wxcode.api.conversions import _conversion_response_from_doc
+from wxcode.services.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    iter_projected,
+    keyset_filter,
+    paginate_by_cursor,
+)
+
+
+class _FakeAggregation:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self):
+        return self._docs
+
+
+class _FakeDocument:
+    """Minimal stand-in for a Beanie Document that applies the keyset pipeline."""
+
+    docs: list[dict] = []
+    pipelines: list[list[dict]] = []
+
+    @classmethod
+    def aggregate(cls, pipeline):
+        cls.pipelines.append(pipeline)
+        match = pipeline[0]["$match"]
+        limit = pipeline[2]["$limit"]
+        after = None
+        if "$and" in match:
+            after = match["$and"][1]["_id"]["$gt"]
+        docs = sorted(cls.docs, key=lambda d: d["_id"])
+        if after is not None:
+            docs = [d for d in docs if d["_id"] > after]
+        return _FakeAggregation(docs[:limit])
+
+
+class TestCursorEncoding:
+    """Test cases for encode_cursor/decode_cursor."""
+
+    def test_round_trip(self):
+        oid = ObjectId()
+        cursor = encode_cursor("PAGE_Login", oid)
+
+        assert decode_cursor(cursor) == ["PAGE_Login", oid]
+
+    def test_round_trip_with_none(self):
+        oid = ObjectId()
+        assert decode_cursor(encode_cursor(None, oid)) == [None, oid]
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor!!")
+
+
+class TestKeysetFilter:
+    """Test cases for keyset_filter."""
+
+    def test_single_field(self):
+        oid = ObjectId()
+        assert keyset_filter(["_id"], [oid]) == {"_id": {"$gt": oid}}
+
+    def test_compound_key(self):
+        oid = ObjectId()
+        assert keyset_filter(["topological_order", "_id"], [5, oid]) == {
+            "$or": [
+                {"topological_order": {"$gt": 5}},
+                {"topological_order": 5, "_id": {"$gt": oid}},
+            ]
+        }
+
+    def test_null_value_sorts_first(self):
+        oid = ObjectId()
+        assert keyset_filter(["topological_order", "_id"], [None, oid]) == {
+            "$or": [
+                {"topological_order": {"$ne": None}},
+                {"topological_order": None, "_id": {"$gt": oid}},
+            ]
+        }
+
+    def test_mismatched_cursor_raises(self):
+        with pytest.raises(InvalidCursorError):
+            keyset_filter(["source_name", "_id"], [ObjectId()])
+
+
+class TestPaginateByCursor:
+    """Test cases for paginate_by_cursor and iter_projected."""
+
+    def setup_method(self):
+        _FakeDocument.docs = [{"_id": ObjectId(), "name": f"p{i}"} for i in range(5)]
+        _FakeDocument.pipelines = []
+
+    async def test_pages_until_exhausted(self):
+        first, cursor = await paginate_by_cursor(
+            _FakeDocument, {}, ["_id"], {"name": 1}, limit=2
+        )
+        assert [d["name"] for d in first] == ["p0", "p1"]
+        assert cursor is not None
+
+        second, cursor = await paginate_by_cursor(
+            _FakeDocument, {}, ["_id"], {"name": 1}, limit=2, cursor=cursor
+        )
+        assert [d["name"] for d in second] == ["p2", "p3"]
+
+        last, cursor = await paginate_by_cursor(
+            _FakeDocument, {}, ["_id"], {"name": 1}, limit=2, cursor=cursor
+        )
+        assert [d["name"] for d in last] == ["p4"]
+        assert cursor is None
+
+    async def test_fetches_one_extra_and_keeps_sort_fields(self):
+        await paginate_by_cursor(_FakeDocument, {}, ["_id"], {"name": 1}, limit=3)
+
+        pipeline = _FakeDocument.pipelines[0]
+        assert pipeline[2] == {"$limit": 4}
+        assert pipeline[3] == {"$project": {"name": 1, "_id": 1}}
+
+    async def test_iter_projected_yields_everything(self):
+        names = [
+            doc["name"]
+            async for doc in iter_projected(
+                _FakeDocument, {}, ["_id"], {"name": 1}, batch_size=2
+            )
+        ]
+        assert names == ["p0", "p1", "p2", "p3", "p4"]
+
+
+class TestConversionListResponse:
+    """Responses built from CONVERSION_LIST_PROJECTION documents."""
+
+    def test_progress_and_duration(self):
+        doc = {
+            "_id": ObjectId(),
+            "total_elements": 8,
+            "elements_converted": 2,
+            "started_at": datetime(2024, 1, 1, 10, 0, 0),
+            "completed_at": datetime(2024, 1, 1, 10, 0, 10),
+        }
+
+        response = _conversion_response_from_doc(doc, "Proj")
+
+        assert response.overall_progress == 25.0
+        assert response.duration_seconds == 10.0
+
+    def test_not_started(self):
+        response = _conversion_response_from_doc({"_id": ObjectId()}, "Proj")
+
+        assert response.overall_progress == 0.0
+        assert response.duration_seconds is None
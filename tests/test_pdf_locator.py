@@ -0,0 +1,159 @@
+"""
+Testes para a localização indexada de PDFs e o sidecar de texto.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fitz
+from bson import ObjectId
+
+from wxcode.mcp.tools.pdf import _PdfRef, get_element_pdf_slice
+from wxcode.models.element import ElementType
+from wxcode.parser.element_enricher import ElementEnricher
+from wxcode.parser.pdf_doc_splitter import ElementType as PDFElementType
+from wxcode.parser.pdf_doc_splitter import PDFDocumentSplitter, PDFElement
+from wxcode.parser.pdf_element_parser import load_pdf_text, pdf_text_sidecar
+
+
+def _make_pdf(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestPdfTextSidecar:
+    """Texto do PDF extraído uma vez e servido do sidecar."""
+
+    def test_extracts_once_then_reads_sidecar(self, tmp_path):
+        pdf = _make_pdf(tmp_path / "pages" / "PAGE_Login.pdf", "Login page")
+
+        assert "Login page" in load_pdf_text(pdf)
+        assert pdf_text_sidecar(pdf).exists()
+
+        with patch("wxcode.parser.pdf_element_parser.fitz.open") as fitz_open:
+            assert "Login page" in load_pdf_text(pdf)
+        fitz_open.assert_not_called()
+
+    def test_stale_sidecar_is_regenerated(self, tmp_path):
+        pdf = _make_pdf(tmp_path / "PAGE_A.pdf", "Nova versao")
+        sidecar = pdf_text_sidecar(pdf)
+        sidecar.write_text("antigo", encoding="utf-8")
+        old = pdf.stat().st_mtime - 10
+        os.utime(sidecar, (old, old))
+
+        assert "Nova versao" in load_pdf_text(pdf)
+        assert "Nova versao" in sidecar.read_text(encoding="utf-8")
+
+
+class TestManifestPaths:
+    """O manifest aponta para o arquivo realmente gravado."""
+
+    def test_query_pdf_goes_to_queries_dir(self, tmp_path):
+        splitter = PDFDocumentSplitter.__new__(PDFDocumentSplitter)
+        query = PDFElement("QRY_Clientes", PDFElementType.QUERY, 0, 0)
+        window = PDFElement("IW_Menu", PDFElementType.INTERNAL_WINDOW, 0, 0)
+
+        assert splitter._element_pdf_file(query) == "queries/QRY_Clientes.pdf"
+        assert splitter._element_pdf_file(window) == "windows/IW_Menu.pdf"
+
+    def test_enricher_resolves_pdf_through_manifest_index(self, tmp_path):
+        _make_pdf(tmp_path / "pages" / "PAGE_Login.pdf", "x")
+        manifest = {"elements": {
+            "pages": [{"name": "PAGE_Login", "pdf_file": "pages/PAGE_Login.pdf"}],
+            "reports": [],
+            "windows": [],
+        }}
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+        enricher = ElementEnricher(pdf_docs_dir=tmp_path, project_dir=tmp_path)
+
+        assert enricher._find_pdf_for_element("PAGE_Login", ElementType.PAGE) == (
+            tmp_path / "pages" / "PAGE_Login.pdf"
+        )
+        assert enricher._find_pdf_for_element("PAGE_Nope", ElementType.PAGE) is None
+
+
+class TestGetElementPdfSlice:
+    """O tool usa os caminhos gravados no enrich."""
+
+    async def test_stored_locations_skip_probing(self, tmp_path):
+        pdf = _make_pdf(tmp_path / "pages" / "PAGE_Login.pdf", "Login page")
+        sidecar = pdf_text_sidecar(pdf)
+        sidecar.write_text("texto em cache", encoding="utf-8")
+        screenshot = tmp_path / "pages" / "PAGE_Login.png"
+        screenshot.write_bytes(b"png")
+        ref = _PdfRef(
+            _id=ObjectId(),
+            source_name="PAGE_Login",
+            source_type=ElementType.PAGE,
+            pdf_path=str(pdf),
+            pdf_text_path=str(sidecar),
+            screenshot_path=str(screenshot),
+        )
+
+        with patch("wxcode.mcp.tools.pdf.resolve_element",
+                   new=AsyncMock(return_value=(ref, None))), \
+             patch("wxcode.mcp.tools.pdf.Element") as element_model, \
+             patch("wxcode.mcp.tools.pdf._find_pdf_file") as find_pdf, \
+             patch("wxcode.mcp.tools.pdf._find_screenshot") as find_screenshot:
+            response = await get_element_pdf_slice.fn(
+                MagicMock(), "PAGE_Login", include_text=True, max_text_chars=5
+            )
+
+        element_model.get.assert_not_called()
+        find_pdf.assert_not_called()
+        find_screenshot.assert_not_called()
+        assert response["pdf"]["path"] == str(pdf)
+        assert response["pdf"]["text"] == "texto"
+        assert response["pdf"]["text_truncated"] is True
+        assert response["screenshot"]["path"] == str(screenshot)
+
+    async def test_stored_pdf_without_screenshot_probes_workspace(self, tmp_path):
+        pdf = _make_pdf(tmp_path / "pages" / "PAGE_Login.pdf", "Login page")
+        screenshot = tmp_path / "screenshots" / "PAGE_Login.png"
+        screenshot.parent.mkdir()
+        screenshot.write_bytes(b"png")
+        ref = _PdfRef(
+            _id=ObjectId(),
+            source_name="PAGE_Login",
+            source_type=ElementType.PAGE,
+            pdf_path=str(pdf),
+        )
+        full_element = MagicMock()
+        full_element.project_id.fetch = AsyncMock(
+            return_value=MagicMock(workspace_path=str(tmp_path))
+        )
+
+        with patch("wxcode.mcp.tools.pdf.resolve_element",
+                   new=AsyncMock(return_value=(ref, None))), \
+             patch("wxcode.mcp.tools.pdf.Element") as element_model, \
+             patch("wxcode.mcp.tools.pdf._find_pdf_file") as find_pdf:
+            element_model.get = AsyncMock(return_value=full_element)
+            response = await get_element_pdf_slice.fn(MagicMock(), "PAGE_Login")
+
+        find_pdf.assert_not_called()
+        assert response["pdf"]["path"] == str(pdf)
+        assert response["screenshot"]["path"] == str(screenshot)
+
+    async def test_legacy_element_probes_workspace(self, tmp_path):
+        pdf = _make_pdf(tmp_path / "pdf_docs" / "PAGE_Old.pdf", "x")
+        ref = _PdfRef(_id=ObjectId(), source_name="PAGE_Old", source_type=ElementType.PAGE)
+        full_element = MagicMock()
+        full_element.project_id.fetch = AsyncMock(
+            return_value=MagicMock(workspace_path=str(tmp_path))
+        )
+
+        with patch("wxcode.mcp.tools.pdf.resolve_element",
+                   new=AsyncMock(return_value=(ref, None))), \
+             patch("wxcode.mcp.tools.pdf.Element") as element_model:
+            element_model.get = AsyncMock(return_value=full_element)
+            response = await get_element_pdf_slice.fn(MagicMock(), "PAGE_Old")
+
+        assert response["pdf"]["path"] == str(pdf)
+        assert response["workspace_path"] == str(tmp_path)
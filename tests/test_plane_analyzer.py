@@ -0,0 +1,153 @@
+"""
+Testes para a análise de planos calculada no enrich e servida pelo MCP.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bson import ObjectId
+
+from wxcode.mcp.tools.planes import _PlanesRef, get_element_planes, get_project_planes
+from wxcode.parser.plane_analyzer import (
+    build_element_planes,
+    extract_plane_operations,
+    infer_navigation_pattern,
+    parse_plane_value,
+)
+
+
+def _control(name: str, plane: str | None = None, type_code: int = 8):
+    properties = SimpleNamespace(plane=plane) if plane is not None else None
+    return SimpleNamespace(
+        name=name,
+        type_code=type_code,
+        full_path=name,
+        depth=1,
+        has_code=False,
+        properties=properties,
+    )
+
+
+WIZARD_CODE = """
+PROCEDURE Avancar()
+Plane(1)
+Plane(2)
+Plane(3)
+PlaneEnable(2, True)
+IF PlaneVisible(3) THEN
+    CELL_Passo..Plane = 3
+END
+x = CELL_Passo..Plane
+"""
+
+
+class TestParsePlaneValue:
+    """Valores da propriedade Plane."""
+
+    def test_formats(self):
+        assert parse_plane_value(None) == [0]
+        assert parse_plane_value("2") == [2]
+        assert parse_plane_value("1, 3") == [1, 3]
+        assert parse_plane_value("1-3") == [1, 2, 3]
+        assert parse_plane_value("x") == [0]
+
+
+class TestExtractPlaneOperations:
+    """Operações de plano no código WLanguage."""
+
+    def test_all_operation_types(self):
+        ops = extract_plane_operations(WIZARD_CODE)
+
+        assert [op["type"] for op in ops] == [
+            "plane_switch", "plane_switch", "plane_switch",
+            "plane_enable", "plane_visible_check", "plane_assign", "plane_read",
+        ]
+        assert ops[3]["enabled"] is True
+        assert ops[5]["plane_number"] == 3
+        assert ops[6]["control_name"] == "CELL_Passo"
+
+    def test_code_without_planes(self):
+        assert extract_plane_operations("x = 1\nInfo(x)") == []
+        assert extract_plane_operations("") == []
+
+
+class TestInferNavigationPattern:
+    """Inferência do padrão de navegação."""
+
+    def test_patterns(self):
+        three = {1: ["A"], 2: ["B"], 3: ["C"]}
+        switch = lambda n: {"type": "plane_switch", "plane_number": n}  # noqa: E731
+
+        assert infer_navigation_pattern({0: ["A"]}, [])["pattern"] == "none"
+        assert infer_navigation_pattern({1: ["A"], 2: ["B"]}, [])["pattern"] == "simple"
+        assert infer_navigation_pattern(three, [switch(1), switch(2), switch(3)])["pattern"] == "wizard"
+        assert infer_navigation_pattern(three, [switch(3), switch(1), switch(3)])["pattern"] == "tabs"
+        assert infer_navigation_pattern(three, [switch(2)])["pattern"] == "conditional"
+
+
+class TestBuildElementPlanes:
+    """Estrutura compacta salva em Element.planes."""
+
+    def test_groups_controls_and_infers_pattern(self):
+        controls = [
+            _control("BTN_Sair"),
+            _control("EDT_Nome", "1"),
+            _control("EDT_Email", "2"),
+            _control("EDT_Senha", "3"),
+            _control("STC_Ajuda", "2,3"),
+        ]
+
+        planes = build_element_planes(controls, WIZARD_CODE)
+
+        assert [p.number for p in planes.planes] == [0, 1, 2, 3]
+        assert [c.name for c in planes.planes[2].controls] == ["EDT_Email", "STC_Ajuda"]
+        assert planes.total_controls == 5
+        assert planes.navigation_pattern["pattern"] == "wizard"
+        assert len(planes.operations) == 7
+
+
+class TestPlaneTools:
+    """MCP tools servem a análise armazenada."""
+
+    async def test_element_planes_from_stored_analysis(self):
+        stored = build_element_planes([_control("EDT_A", "1"), _control("EDT_B", "2")], "")
+        ref = _PlanesRef(_id=ObjectId(), source_name="PAGE_X", planes=stored)
+
+        with patch(
+            "wxcode.mcp.tools.planes.resolve_element",
+            new=AsyncMock(return_value=(ref, None)),
+        ), patch("wxcode.mcp.tools.planes.Control") as control_model:
+            response = await get_element_planes.fn(MagicMock(), "PAGE_X")
+
+        control_model.find.assert_not_called()
+        assert response["navigation_pattern"]["pattern"] == "simple"
+        assert response["planes"]["plane_1"]["controls"][0]["name"] == "EDT_A"
+        assert response["total_controls"] == 2
+
+    async def test_project_planes_summaries(self):
+        docs = [
+            {"source_name": "PAGE_A", "source_type": "page", "analyzed": True,
+             "pattern": "tabs", "total_controls": 9, "operation_count": 4,
+             "planes": [{"number": 1, "control_count": 5}, {"number": 2, "control_count": 4}]},
+            {"source_name": "PAGE_B", "source_type": "page", "analyzed": True,
+             "pattern": "none", "total_controls": 2, "operation_count": 0,
+             "planes": [{"number": 0, "control_count": 2}]},
+            {"source_name": "PAGE_C", "source_type": "page", "analyzed": False,
+             "operation_count": 0, "planes": []},
+        ]
+        collection = MagicMock()
+        collection.aggregate.return_value.to_list = AsyncMock(return_value=docs)
+
+        with patch("wxcode.mcp.tools.planes.Project") as project_model, \
+             patch("wxcode.mcp.tools.planes.Element.get_pymongo_collection",
+                   return_value=collection):
+            project_model.find_one = AsyncMock(return_value=MagicMock(id=ObjectId()))
+            response = await get_project_planes.fn(MagicMock(), "Proj")
+
+        assert collection.aggregate.call_count == 1
+        assert response["total_pages"] == 3
+        assert response["pages_with_planes"] == 1
+        assert response["by_pattern"] == {"tabs": 1, "none": 1}
+        assert [p["element"] for p in response["pages"]] == ["PAGE_A"]
+        assert response["pages"][0]["planes"] == {"plane_1": 5, "plane_2": 4}
+        assert response["not_analyzed"] == ["PAGE_C"]
@@ -0,0 +1,142 @@
+"""
+Testes da ingestão de zips de projeto (diretório central + extração paralela).
+"""
+
+import asyncio
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from wxcode.services.project_archive import (
+    ProjectArchiveError,
+    extract_plan,
+    plan_extraction,
+    save_stream,
+)
+from wxcode.services.upload_progress import UploadProgressHub
+
+
+def _make_zip(path: Path, members: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+@pytest.fixture
+def project_zip(tmp_path):
+    return _make_zip(tmp_path / "upload.zip", {
+        "Linkpay/Linkpay.wwp": b"project",
+        "Linkpay/PAGE_Login.wwh": b"page" * 1000,
+        "Linkpay/ServerProcedures.wdg": b"procs",
+        "Linkpay/Analysis/Linkpay.xdd": b"<xdd/>",
+        "Linkpay/Images/logo.png": b"\x89PNG",
+        "Linkpay/Exe/Linkpay.dll": b"MZ",
+        "Linkpay/Backup/Old/Old.wwp": b"old project",
+        "Other/readme.txt": b"outside",
+    })
+
+
+class TestPlanExtraction:
+    """Leitura do diretório central."""
+
+    def test_finds_shallowest_project(self, project_zip):
+        plan = plan_extraction(project_zip)
+        assert plan.project_member == "Linkpay/Linkpay.wwp"
+
+    def test_skips_binaries_and_members_outside_project(self, project_zip):
+        plan = plan_extraction(project_zip)
+        names = sorted(info.filename for info in plan.members)
+        assert names == [
+            "Linkpay/Analysis/Linkpay.xdd",
+            "Linkpay/Linkpay.wwp",
+            "Linkpay/PAGE_Login.wwh",
+            "Linkpay/ServerProcedures.wdg",
+        ]
+        assert plan.skipped == 4
+        assert plan.total_bytes == sum(info.file_size for info in plan.members)
+
+    def test_project_at_zip_root(self, tmp_path):
+        archive = _make_zip(tmp_path / "root.zip", {"App.wwp": b"p", "sub/PAGE.wwh": b"x"})
+        plan = plan_extraction(archive)
+        assert plan.project_member == "App.wwp"
+        assert len(plan.members) == 2
+
+    def test_without_project_raises(self, tmp_path):
+        archive = _make_zip(tmp_path / "empty.zip", {"notes.txt": b"x"})
+        with pytest.raises(ProjectArchiveError, match=".wwp"):
+            plan_extraction(archive)
+
+    def test_invalid_zip_raises(self, tmp_path):
+        archive = tmp_path / "broken.zip"
+        archive.write_bytes(b"not a zip")
+        with pytest.raises(ProjectArchiveError):
+            plan_extraction(archive)
+
+    def test_unsafe_path_raises(self, tmp_path):
+        archive = _make_zip(tmp_path / "slip.zip", {"App.wwp": b"p", "../evil.wdg": b"x"})
+        with pytest.raises(ProjectArchiveError, match="Unsafe"):
+            plan_extraction(archive)
+
+
+class TestExtractPlan:
+    """Extração paralela dos membros relevantes."""
+
+    def test_extracts_only_planned_members(self, project_zip, tmp_path):
+        plan = plan_extraction(project_zip)
+        dest = tmp_path / "project"
+        progress = []
+
+        project_path = extract_plan(
+            project_zip, plan, dest, lambda done, total: progress.append((done, total)), max_workers=3
+        )
+
+        assert project_path == dest / "Linkpay" / "Linkpay.wwp"
+        assert project_path.read_bytes() == b"project"
+        assert (dest / "Linkpay" / "PAGE_Login.wwh").read_bytes() == b"page" * 1000
+        assert not (dest / "Linkpay" / "Images").exists()
+        assert not (dest / "Other").exists()
+
+        assert len(progress) == len(plan.members)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+        assert progress[-1] == (plan.total_bytes, plan.total_bytes)
+
+
+def test_save_stream_reports_progress(tmp_path):
+    data = b"x" * 1024
+    progress = []
+    written = save_stream(io.BytesIO(data), tmp_path / "out.zip", lambda d, t: progress.append((d, t)), len(data))
+    assert written == len(data)
+    assert (tmp_path / "out.zip").read_bytes() == data
+    assert progress[-1] == (len(data), len(data))
+
+
+class TestUploadProgressHub:
+    """Distribuição de eventos de progresso."""
+
+    async def test_late_subscriber_receives_last_event(self):
+        hub = UploadProgressHub()
+        hub.publish("u1", {"type": "upload_progress", "percent": 40})
+        queue = hub.subscribe("u1")
+        assert (await queue.get())["percent"] == 40
+
+    async def test_terminal_event_clears_state(self):
+        hub = UploadProgressHub()
+        queue = hub.subscribe("u1")
+        hub.publish("u1", {"type": "upload_progress", "percent": 10})
+        hub.publish("u1", {"type": "upload_complete"})
+        assert [(await queue.get())["type"] for _ in range(2)] == ["upload_progress", "upload_complete"]
+        hub.unsubscribe("u1", queue)
+        assert hub.subscribe("u1").empty()
+
+    async def test_progress_callback_throttles_by_percent(self):
+        hub = UploadProgressHub()
+        queue = hub.subscribe("u1")
+        report = hub.progress_callback("u1", "extracting", asyncio.get_running_loop())
+        for done in range(0, 1001):
+            report(done, 1000)
+        await asyncio.sleep(0)
+        assert queue.qsize() == 101
+        assert hub.progress_callback(None, "saving", asyncio.get_running_loop()) is None
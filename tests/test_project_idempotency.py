@@ -9,6 +9,9 @@ Testa:
 - API delete com cascade
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
@@ -32,7 +35,11 @@ from wxcode.services.project_service import (
     check_duplicate_projects,
     PurgeStats,
     DuplicateInfo,
+    PurgeJob,
+    _delete_in_batches,
+    _purge_local_files,
     _purge_project_data,
+    _run_purge_job,
 )
 
 
@@ -150,12 +157,16 @@ class TestPurgeProjectData:
              patch('wxcode.services.project_service.Procedure') as mock_proc, \
              patch('wxcode.services.project_service.ClassDefinition') as mock_class, \
              patch('wxcode.services.project_service.DatabaseSchema') as mock_schema, \
+             patch('wxcode.services.project_service.SchemaTableDocument') as mock_tables, \
              patch('wxcode.services.project_service.Conversion') as mock_conv, \
              patch('wxcode.services.project_service._purge_neo4j_data', new_callable=AsyncMock) as mock_neo4j:
 
-            # Configure all mocks to return delete result
+            # Configure all mocks: um lote de 5 _ids e o delete correspondente
             for mock_model in [mock_element, mock_control, mock_proc,
-                               mock_class, mock_schema, mock_conv]:
+                               mock_class, mock_schema, mock_tables, mock_conv]:
+                mock_model.aggregate.return_value.to_list = AsyncMock(
+                    return_value=[{"_id": i} for i in range(5)]
+                )
                 mock_model.find.return_value.delete = AsyncMock(return_value=mock_result)
 
             stats = await _purge_project_data(mock_project)
@@ -167,12 +178,167 @@ class TestPurgeProjectData:
             assert stats.procedures == 5
             assert stats.class_definitions == 5
             assert stats.schemas == 5
+            assert stats.schema_tables == 5
             assert stats.conversions == 5
 
             mock_project.delete.assert_called_once()
             mock_neo4j.assert_called_once()
 
 
+class TestDeleteInBatches:
+    """Testes para _delete_in_batches."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_by_id_ranges_until_exhausted(self):
+        """Testa que cada lote remove a faixa de _id e avança o cursor."""
+        batches = [[{"_id": 1}, {"_id": 2}], [{"_id": 3}, {"_id": 4}], [{"_id": 5}]]
+        model = MagicMock()
+        model.aggregate.return_value.to_list = AsyncMock(side_effect=batches)
+        model.find.return_value.delete = AsyncMock(
+            side_effect=[MagicMock(deleted_count=len(b)) for b in batches]
+        )
+        progress = []
+
+        deleted = await _delete_in_batches(
+            model, {"project_id": 1}, "controls",
+            lambda step, count: progress.append((step, count)),
+            batch_size=2,
+        )
+
+        assert deleted == 5
+        assert progress == [("controls", 2), ("controls", 4), ("controls", 5)]
+
+        second_match = model.aggregate.call_args_list[1].args[0][0]["$match"]
+        assert second_match == {"$and": [{"project_id": 1}, {"_id": {"$gt": 2}}]}
+        last_delete = model.find.call_args_list[-1].args[0]
+        assert last_delete == {"$and": [{"project_id": 1}, {"_id": {"$gte": 5, "$lte": 5}}]}
+
+    @pytest.mark.asyncio
+    async def test_empty_collection(self):
+        """Testa que collection vazia não executa delete."""
+        model = MagicMock()
+        model.aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+        assert await _delete_in_batches(model, {}, "elements") == 0
+        model.find.assert_not_called()
+
+
+class TestPurgeLocalFiles:
+    """Testes para _purge_local_files."""
+
+    def test_counts_while_deleting(self, tmp_path):
+        """Testa remoção em passada única com contagem de arquivos e diretórios."""
+        project_dir = tmp_path / "project"
+        (project_dir / "a" / "b").mkdir(parents=True)
+        (project_dir / "root.txt").write_text("x")
+        (project_dir / "a" / "one.txt").write_text("x")
+        (project_dir / "a" / "b" / "two.txt").write_text("x")
+
+        stats = PurgeStats(project_name="P")
+        _purge_local_files(project_dir, stats)
+
+        assert not project_dir.exists()
+        assert stats.files_deleted == 3
+        assert stats.directories_deleted == 3
+        assert stats.files_error is None
+
+    def test_missing_directory_is_noop(self, tmp_path):
+        """Testa que diretório inexistente não gera erro."""
+        stats = PurgeStats(project_name="P")
+        _purge_local_files(tmp_path / "missing", stats)
+
+        assert stats.files_deleted == 0
+        assert stats.files_error is None
+
+
+class TestPurgeJob:
+    """Testes para PurgeJob e execução em background."""
+
+    @pytest.mark.asyncio
+    async def test_job_publishes_progress_and_completion(self):
+        """Testa que listeners recebem progresso e o estado final."""
+        job = PurgeJob(job_id="j1", project_id="p1", project_name="P")
+        queue = job.subscribe()
+
+        async def fake_purge(project, progress):
+            progress("elements", 1000)
+            return PurgeStats(project_name="P", elements=1000)
+
+        with patch(
+            'wxcode.services.project_service._purge_project_data',
+            side_effect=fake_purge,
+        ):
+            await _run_purge_job(job, MagicMock())
+
+        snapshots = []
+        while not queue.empty():
+            snapshots.append(queue.get_nowait())
+
+        assert [s["status"] for s in snapshots] == [
+            "pending", "running", "running", "completed",
+        ]
+        assert snapshots[2]["progress"] == {"elements": 1000}
+        assert snapshots[-1]["stats"]["elements"] == 1000
+        assert job.done
+        assert job._listeners == []
+
+    @pytest.mark.asyncio
+    async def test_progress_from_file_purge_thread(self, tmp_path):
+        """Testa que o progresso da thread de arquivos chega às filas pelo event loop."""
+        project_dir = tmp_path / "proj"
+        project_dir.mkdir()
+        for i in range(5):
+            (project_dir / f"f{i}.txt").write_text("x")
+
+        job = PurgeJob(job_id="j3", project_id="p1", project_name="P")
+        queue = job.subscribe()
+        loop_thread = threading.get_ident()
+        put_threads = []
+        put_nowait = queue.put_nowait
+
+        def recording_put(item):
+            put_threads.append(threading.get_ident())
+            put_nowait(item)
+
+        queue.put_nowait = recording_put
+
+        async def purge_files(project, progress):
+            stats = PurgeStats(project_name="P")
+            await asyncio.to_thread(_purge_local_files, project_dir, stats, progress)
+            return stats
+
+        with patch('wxcode.services.project_service.PURGE_BATCH_SIZE', 2), patch(
+            'wxcode.services.project_service._purge_project_data',
+            side_effect=purge_files,
+        ):
+            await _run_purge_job(job, MagicMock())
+
+        snapshots = []
+        while not queue.empty():
+            snapshots.append(queue.get_nowait())
+
+        assert set(put_threads) == {loop_thread}
+        assert [s["progress"].get("files") for s in snapshots[2:-1]] == [2, 4, 5]
+        assert snapshots[-1]["status"] == "completed"
+        assert snapshots[-1]["stats"]["files_deleted"] == 5
+
+    @pytest.mark.asyncio
+    async def test_job_records_failure(self):
+        """Testa que erros do purge marcam o job como failed."""
+        job = PurgeJob(job_id="j2", project_id="p1", project_name="P")
+
+        with patch(
+            'wxcode.services.project_service._purge_project_data',
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("mongo down"),
+        ):
+            await _run_purge_job(job, MagicMock())
+
+        assert job.status == "failed"
+        assert job.error == "mongo down"
+        assert job.finished_at is not None
+
+
 class TestPurgeProject:
     """Testes para purge_project."""
 
@@ -17,12 +17,77 @@ import pytest
 
 from wxcode.services.pty_session_manager import (
     PTYSession,
+    ReplayRingBuffer,
     PTYSessionManager,
     get_session_manager,
     reset_session_manager,
 )
 
 
+class TestReplayRingBuffer:
+    """Test cases for ReplayRingBuffer."""
+
+    def test_append_and_getvalue(self):
+        ring = ReplayRingBuffer(16)
+        ring.append(b"abc")
+        ring.append(b"def")
+        assert ring.getvalue() == b"abcdef"
+        assert len(ring) == 6
+
+    def test_wraps_around_keeping_newest_bytes(self):
+        ring = ReplayRingBuffer(8)
+        ring.append(b"12345")
+        ring.append(b"6789A")
+        assert ring.getvalue() == b"3456789A"
+        ring.append(b"BC")
+        assert ring.getvalue() == b"56789ABC"
+        assert len(ring) == 8
+
+    def test_oversized_append_keeps_tail(self):
+        ring = ReplayRingBuffer(4)
+        ring.append(b"xy")
+        ring.append(b"abcdefgh")
+        assert ring.getvalue() == b"efgh"
+
+    def test_clear(self):
+        ring = ReplayRingBuffer(4)
+        ring.append(b"abc")
+        ring.clear()
+        assert ring.getvalue() == b""
+        ring.append(b"z")
+        assert ring.getvalue() == b"z"
+
+    def test_zero_capacity_ignores_data(self):
+        ring = ReplayRingBuffer(0)
+        ring.append(b"abc")
+        assert ring.getvalue() == b""
+
+    def test_trimmed_replay_skips_partial_escape_sequence(self):
+        ring = ReplayRingBuffer(13)
+        ring.append(b"\x1b[31mERR\x1b[0m\n")
+        ring.append(b"ok\x1b[32m+\n")
+        # Head now starts inside "\x1b[0m" ("[0m"); replay resumes after the newline
+        assert ring.getvalue() == b"ok\x1b[32m+\n"
+
+    def test_trimmed_replay_starts_at_escape_sequence(self):
+        ring = ReplayRingBuffer(12)
+        ring.append(b"\x1b[1;31mab")
+        ring.append(b"\x1b[0mcd")
+        assert ring.getvalue() == b"\x1b[0mcd"
+
+    def test_trimmed_replay_skips_partial_utf8_character(self):
+        ring = ReplayRingBuffer(6)
+        ring.append("aé".encode())
+        ring.append("çãx".encode())
+        # "é" lost its lead byte to eviction
+        assert ring.getvalue() == "çãx".encode()
+
+    def test_untrimmed_replay_is_verbatim(self):
+        ring = ReplayRingBuffer(16)
+        ring.append(b"0m tail\n")
+        assert ring.getvalue() == b"0m tail\n"
+
+
 class TestPTYSession:
     """Test cases for PTYSession dataclass."""
 
@@ -40,9 +105,8 @@ class TestPTYSession:
         session.add_to_buffer(b"first")
         session.add_to_buffer(b"second")
 
-        assert len(session.output_buffer) == 2
-        assert session.output_buffer[0] == b"first"
-        assert session.output_buffer[1] == b"second"
+        assert len(session.output_buffer) == len(b"firstsecond")
+        assert session.get_replay_buffer() == b"firstsecond"
 
     def test_get_replay_buffer_returns_all_data(self):
         """Test that get_replay_buffer joins all buffer data."""
@@ -79,11 +143,10 @@ class TestPTYSession:
         session.add_to_buffer(b"c" * 50)  # This should trigger eviction
 
         # Total should not exceed max_buffer_size
-        total_size = sum(len(d) for d in session.output_buffer)
-        assert total_size <= session.max_buffer_size
+        assert len(session.output_buffer) <= session.max_buffer_size
 
-        # First chunk should have been evicted
-        assert b"a" * 50 not in session.output_buffer
+        # First chunk should have been evicted, newest bytes kept in order
+        assert session.get_replay_buffer() == b"b" * 50 + b"c" * 50
 
     def test_clear_buffer_empties_the_buffer(self):
         """Test that clear_buffer removes all data."""
@@ -0,0 +1,206 @@
+"""
+Testes para o armazenamento de tabelas do schema na coleção schema_tables.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from wxcode.models.schema import (
+    DatabaseSchema,
+    SchemaColumn,
+    SchemaTable,
+    get_schema_summary,
+    get_schema_tables,
+)
+from wxcode.parser.xdd_parser import XddParser
+from wxcode.services.import_pipeline import import_database_schema
+from wxcode.services.schema_extractor import extract_schema_for_configuration
+
+
+def _column(name: str) -> SchemaColumn:
+    return SchemaColumn(name=name, hyperfile_type=2, python_type="str")
+
+
+def _legacy_schema(*tables: SchemaTable) -> DatabaseSchema:
+    """DatabaseSchema no formato antigo (tabelas embutidas), sem Beanie."""
+    return DatabaseSchema.model_construct(
+        project_id=ObjectId(), source_file="x.xdd", tables=list(tables), connections=[]
+    )
+
+
+@pytest.fixture
+def table_collection():
+    """SchemaTableDocument com a query encadeada mockada."""
+    with patch("wxcode.models.schema.SchemaTableDocument") as model:
+        query = model.find.return_value
+        query.find.return_value = query
+        query.sort.return_value = query
+        query.limit.return_value = query
+        query.to_list = AsyncMock(return_value=["tabela"])
+        yield model, query
+
+
+class TestGetSchemaTables:
+    """Leitura de tabelas: coleção schema_tables e formato legado."""
+
+    async def test_legacy_filters_by_name_case_insensitive(self):
+        schema = _legacy_schema(
+            SchemaTable(name="Cliente"), SchemaTable(name="Pedido"), SchemaTable(name="Item")
+        )
+
+        tables = await get_schema_tables(schema, ["CLIENTE", "item"])
+
+        assert [t.name for t in tables] == ["Cliente", "Item"]
+
+    async def test_legacy_keeps_order_and_limit(self):
+        schema = _legacy_schema(SchemaTable(name="B"), SchemaTable(name="A"), SchemaTable(name="C"))
+
+        assert [t.name for t in await get_schema_tables(schema, limit=2)] == ["B", "A"]
+
+    async def test_queries_collection_by_name_key(self, table_collection):
+        model, query = table_collection
+        schema = _legacy_schema()
+
+        assert await get_schema_tables(schema, ["Cliente", "pedido"], limit=1) == ["tabela"]
+
+        model.find.assert_called_once()
+        query.find.assert_called_once_with({"name_key": {"$in": ["CLIENTE", "PEDIDO"]}})
+        query.sort.assert_called_once_with("+_id")
+        query.limit.assert_called_once_with(1)
+
+    async def test_legacy_matches_physical_names_on_request(self):
+        schema = _legacy_schema(
+            SchemaTable(name="Cliente", physical_name="T_CLIENTE"),
+            SchemaTable(name="Pedido", physical_name="T_PEDIDO"),
+        )
+
+        assert await get_schema_tables(schema, ["t_cliente"]) == []
+        tables = await get_schema_tables(schema, ["t_cliente"], physical_names=True)
+        assert [t.name for t in tables] == ["Cliente"]
+
+    async def test_queries_collection_by_name_or_physical_name(self, table_collection):
+        _, query = table_collection
+
+        await get_schema_tables(_legacy_schema(), ["Cliente"], physical_names=True)
+
+        query.find.assert_called_once_with({"$or": [
+            {"name_key": {"$in": ["CLIENTE"]}},
+            {"physical_name_key": {"$in": ["CLIENTE"]}},
+        ]})
+
+    async def test_all_tables_skips_name_filter(self, table_collection):
+        _, query = table_collection
+
+        await get_schema_tables(_legacy_schema())
+
+        query.find.assert_not_called()
+        query.limit.assert_not_called()
+
+    async def test_empty_names_skip_query(self, table_collection):
+        model, _ = table_collection
+
+        assert await get_schema_tables(_legacy_schema(), []) == []
+        model.find.assert_not_called()
+
+
+class TestExtractSchemaForConfiguration:
+    """Tabelas usadas pelos elementos de uma Configuration."""
+
+    async def test_dependency_named_by_physical_name(self):
+        schema = _legacy_schema(
+            SchemaTable(name="Cliente", physical_name="T_CLIENTE"),
+            SchemaTable(name="Pedido", physical_name="T_PEDIDO"),
+        )
+        element = SimpleNamespace(
+            dependencies=SimpleNamespace(data_files=["T_CLIENTE"], bound_tables=["Pedido"])
+        )
+        with patch("wxcode.services.schema_extractor.DatabaseSchema") as schema_model, \
+             patch("wxcode.services.schema_extractor.Element") as element_model:
+            schema_model.find_one = AsyncMock(return_value=schema)
+            element_model.find.return_value.to_list = AsyncMock(return_value=[element])
+
+            tables = await extract_schema_for_configuration(ObjectId(), "cfg")
+
+        assert [t["name"] for t in tables] == ["Cliente", "Pedido"]
+
+
+class TestGetSchemaSummary:
+    """Contagens agregadas."""
+
+    async def test_legacy_counts_embedded_tables(self):
+        schema = _legacy_schema(
+            SchemaTable(name="A", columns=[_column("x"), _column("y")]),
+            SchemaTable(name="B", columns=[_column("z")]),
+        )
+
+        summary = await get_schema_summary(schema)
+
+        assert (summary.total_tables, summary.total_columns) == (2, 3)
+
+    async def test_missing_view_row_returns_zero(self):
+        schema = _legacy_schema()
+        with patch("wxcode.models.schema.SchemaSummary") as view:
+            view.find_one = AsyncMock(return_value=None)
+            view.return_value = MagicMock(total_tables=0, total_columns=0)
+
+            summary = await get_schema_summary(schema)
+
+        view.find_one.assert_awaited_once()
+        view.assert_called_once_with(project_id=schema.project_id)
+        assert summary.total_tables == 0
+
+
+SAMPLE_XDD = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<ANALYSE GenNum="42">
+    <CONNEXION Nom="CNX_BASE" Type="1"><SOURCE>db</SOURCE><DB>Base</DB></CONNEXION>
+    {tables}
+</ANALYSE>
+"""
+
+
+class TestImportDatabaseSchema:
+    """Persistência em streaming da Analysis."""
+
+    async def test_tables_written_in_batches(self, tmp_path):
+        tables = "".join(
+            f'<FICHIER Nom="T{i}" NomPhysique="T{i}" Connexion="CNX_BASE">'
+            f'<RUBRIQUE Nom="ID"><TYPE>24</TYPE><TYPE_CLE>1</TYPE_CLE></RUBRIQUE></FICHIER>'
+            for i in range(5)
+        )
+        xdd_path = tmp_path / "Analysis.xdd"
+        xdd_path.write_text(SAMPLE_XDD.format(tables=tables), encoding="iso-8859-1")
+        project_id = ObjectId()
+
+        schema = MagicMock(project_id=project_id, id=ObjectId())
+        schema.insert = AsyncMock()
+        schema.save = AsyncMock()
+        with patch("wxcode.models.DatabaseSchema") as schema_model, \
+             patch("wxcode.models.SchemaTableDocument") as table_model:
+            schema_model.return_value = schema
+            schema_model.find.return_value.delete = AsyncMock()
+            table_model.find.return_value.delete = AsyncMock()
+            table_model.insert_many = AsyncMock()
+            table_model.from_table.side_effect = lambda table, pid, sid: (table.name, pid, sid)
+
+            result, count = await import_database_schema(
+                project_id, "Analysis.xdd", XddParser(xdd_path), batch_size=2
+            )
+
+        assert count == 5
+        batches = [call.args[0] for call in table_model.insert_many.await_args_list]
+        assert [[name for name, _, _ in batch] for batch in batches] == [
+            ["T0", "T1"], ["T2", "T3"], ["T4"],
+        ]
+        assert all(pid == project_id and sid == schema.id for batch in batches for _, pid, sid in batch)
+
+        # Schema anterior removido antes da gravação; metadados salvos no fim
+        schema_model.find.return_value.delete.assert_awaited_once()
+        table_model.find.return_value.delete.assert_awaited_once()
+        schema.insert.assert_awaited_once()
+        schema.save.assert_awaited_once()
+        assert schema.version == 42
+        assert [c.name for c in schema.connections] == ["CNX_BASE"]
+        assert result.total_columns == 5
@@ -0,0 +1,224 @@
+"""
+Unit tests for the session file watcher.
+
+Tests cover:
+- JsonlTailReader partial-line carry-over, truncation and replacement
+- RecentUUIDWindow bounded dedupe
+- extract_claude_event / parse_claude_event equivalence
+- SessionFileWatcher event delivery via filesystem notifications
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from wxcode.services.session_file_watcher import (
+    JsonlTailReader,
+    RecentUUIDWindow,
+    SessionFileWatcher,
+    extract_claude_event,
+    parse_claude_event,
+)
+
+
+def _ask_line(uuid: str) -> str:
+    return json.dumps({
+        "type": "assistant",
+        "uuid": uuid,
+        "message": {
+            "content": [{
+                "type": "tool_use",
+                "id": f"tool-{uuid}",
+                "name": "AskUserQuestion",
+                "input": {"questions": [{"question": "Continue?"}]},
+            }],
+        },
+    })
+
+
+class TestJsonlTailReader:
+    """Test cases for JsonlTailReader."""
+
+    def test_reads_only_appended_lines(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        path.write_text('{"a": 1}\n')
+        tail = JsonlTailReader(path)
+
+        assert tail.read_lines() == ['{"a": 1}']
+        assert tail.read_lines() == []
+
+        with open(path, "a") as f:
+            f.write('{"b": 2}\n')
+        assert tail.read_lines() == ['{"b": 2}']
+        tail.close()
+
+    def test_partial_line_is_carried_over(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        path.write_text('{"a": 1}\n{"b":')
+        tail = JsonlTailReader(path)
+
+        assert tail.read_lines() == ['{"a": 1}']
+
+        with open(path, "a") as f:
+            f.write(' 2}\n')
+        assert tail.read_lines() == ['{"b": 2}']
+        tail.close()
+
+    def test_truncation_restarts_from_beginning(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        path.write_text('{"a": 1}\n{"b": 2}\n')
+        tail = JsonlTailReader(path)
+        tail.read_lines()
+
+        with open(path, "w") as f:
+            f.write('{"c": 3}\n')
+        assert tail.read_lines() == ['{"c": 3}']
+        tail.close()
+
+    def test_replaced_file_is_reopened(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        path.write_text('{"a": 1}\n')
+        tail = JsonlTailReader(path)
+        tail.read_lines()
+
+        replacement = tmp_path / "replacement.jsonl"
+        replacement.write_text('{"a": 1}\n{"z": 9}\n')
+        os.replace(replacement, path)
+
+        assert tail.read_lines() == ['{"a": 1}', '{"z": 9}']
+        tail.close()
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        tail = JsonlTailReader(tmp_path / "missing.jsonl")
+        with pytest.raises(FileNotFoundError):
+            tail.read_lines()
+
+
+class TestRecentUUIDWindow:
+    """Test cases for RecentUUIDWindow."""
+
+    def test_add_reports_new_uuids(self):
+        window = RecentUUIDWindow(maxlen=10)
+        assert window.add("a") is True
+        assert window.add("a") is False
+        assert "a" in window
+
+    def test_window_is_bounded(self):
+        window = RecentUUIDWindow(maxlen=3)
+        for uuid in ["a", "b", "c", "d"]:
+            window.add(uuid)
+
+        assert len(window) == 3
+        assert "a" not in window
+        assert "d" in window
+
+    def test_clear(self):
+        window = RecentUUIDWindow(maxlen=3)
+        window.add("a")
+        window.clear()
+        assert len(window) == 0
+        assert window.add("a") is True
+
+
+class TestExtractClaudeEvent:
+    """Test cases for extract_claude_event."""
+
+    def test_matches_parse_claude_event(self):
+        line = _ask_line("u-1")
+        assert extract_claude_event(json.loads(line)) == parse_claude_event(line)
+
+    def test_non_object_returns_none(self):
+        assert extract_claude_event([1, 2, 3]) is None
+        assert parse_claude_event("42") is None
+
+    def test_invalid_json_returns_none(self):
+        assert parse_claude_event("{not json") is None
+
+
+class TestSessionFileWatcher:
+    """Test cases for SessionFileWatcher event delivery."""
+
+    async def test_emits_existing_and_appended_events(self, tmp_path: Path, monkeypatch):
+        claude_folder = tmp_path / "claude"
+        claude_folder.mkdir()
+        session_file = claude_folder / "sess-1.jsonl"
+        session_file.write_text(_ask_line("u-1") + "\n")
+
+        monkeypatch.setattr(
+            "wxcode.services.session_file_watcher.workspace_to_claude_path",
+            lambda _: claude_folder,
+        )
+
+        received: list[dict] = []
+        got_second = asyncio.Event()
+
+        async def on_event(event: dict):
+            received.append(event)
+            if len(received) == 2:
+                got_second.set()
+
+        watcher = SessionFileWatcher(
+            workspace_path=str(tmp_path),
+            session_id="sess-1",
+            on_event=on_event,
+            auto_detect_session=False,
+        )
+        assert await watcher.start(wait_for_session=False)
+
+        try:
+            await asyncio.sleep(0.3)
+            with open(session_file, "a") as f:
+                # Duplicate UUID must be suppressed
+                f.write(_ask_line("u-1") + "\n")
+                f.write(_ask_line("u-2") + "\n")
+
+            await asyncio.wait_for(got_second.wait(), timeout=5)
+        finally:
+            await watcher.stop()
+
+        assert [e["uuid"] for e in received] == ["u-1", "u-2"]
+
+    async def test_lines_written_during_initial_drain_are_not_lost(
+        self, tmp_path: Path, monkeypatch
+    ):
+        claude_folder = tmp_path / "claude"
+        claude_folder.mkdir()
+        session_file = claude_folder / "sess-1.jsonl"
+        session_file.write_text(_ask_line("u-1") + "\n")
+
+        monkeypatch.setattr(
+            "wxcode.services.session_file_watcher.workspace_to_claude_path",
+            lambda _: claude_folder,
+        )
+
+        received: list[dict] = []
+        got_second = asyncio.Event()
+
+        async def on_event(event: dict):
+            received.append(event)
+            if event["uuid"] == "u-1":
+                # Written while the initial drain is still dispatching
+                with open(session_file, "a") as f:
+                    f.write(_ask_line("u-1") + "\n")
+                    f.write(_ask_line("u-2") + "\n")
+            else:
+                got_second.set()
+
+        watcher = SessionFileWatcher(
+            workspace_path=str(tmp_path),
+            session_id="sess-1",
+            on_event=on_event,
+            auto_detect_session=False,
+        )
+        assert await watcher.start(wait_for_session=False)
+
+        try:
+            await asyncio.wait_for(got_second.wait(), timeout=5)
+            await asyncio.sleep(0.2)
+        finally:
+            await watcher.stop()
+
+        assert [e["uuid"] for e in received] == ["u-1", "u-2"]
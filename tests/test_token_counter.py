@@ -0,0 +1,113 @@
+"""
+Unit tests for TokenCounter.
+
+Tests cover:
+- Counting through the encoder and content-hash cache hits
+- Bounded cache eviction
+- Fallback estimate when no encoding is available (never stored)
+- procedure_tokens preferring the stored token_count
+- ContextBuilder packing using stored counts
+"""
+
+from wxcode.llm_converter import token_counter
+from wxcode.llm_converter.context_builder import ContextBuilder
+from wxcode.llm_converter.context_packer import ProcedureCandidate
+from wxcode.llm_converter.token_counter import (
+    TokenCounter,
+    procedure_tokens,
+    stored_token_count,
+)
+
+
+class _WordEncoder:
+    """Fake encoding: one token per whitespace-separated word."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        self.calls += 1
+        return [0] * len(text.split())
+
+
+LONG_CODE = "PROCEDURE ValidarCPF(sCPF is string)\n" + "nSoma is int = 0\n" * 20
+
+
+class TestTokenCounter:
+    """Test cases for TokenCounter."""
+
+    def test_counts_with_encoder_and_caches_by_content(self):
+        encoder = _WordEncoder()
+        counter = TokenCounter(encoder=encoder)
+
+        first = counter.count(LONG_CODE)
+        second = counter.count(str(LONG_CODE))
+
+        assert first == second == len(LONG_CODE.split())
+        assert encoder.calls == 1
+        assert counter.cache_info()["hits"] == 1
+
+    def test_short_texts_bypass_cache(self):
+        counter = TokenCounter(encoder=_WordEncoder())
+
+        assert counter.count("a b c") == 3
+        assert counter.cache_info()["size"] == 0
+
+    def test_empty_text(self):
+        counter = TokenCounter(encoder=_WordEncoder())
+        assert counter.count("") == 0
+        assert counter.count(None) == 0
+
+    def test_cache_is_bounded(self):
+        counter = TokenCounter(encoder=_WordEncoder(), cache_size=2)
+        for i in range(3):
+            counter.count(f"{i} " + LONG_CODE)
+
+        assert counter.cache_info()["size"] == 2
+
+    def test_fallback_without_encoding(self, monkeypatch):
+        monkeypatch.setattr(token_counter, "_load_encoding", lambda name: None)
+        counter = TokenCounter()
+
+        assert counter.count("x" * 400) == 100
+        assert counter.cache_info()["encoding"] is None
+
+    def test_fallback_estimate_is_not_stored(self, monkeypatch):
+        monkeypatch.setattr(token_counter, "_load_encoding", lambda name: None)
+        monkeypatch.setattr(token_counter, "_default_counter", TokenCounter())
+
+        assert stored_token_count(LONG_CODE) is None
+
+    def test_exact_count_is_stored(self, monkeypatch):
+        monkeypatch.setattr(
+            token_counter, "_default_counter", TokenCounter(encoder=_WordEncoder())
+        )
+
+        assert stored_token_count(LONG_CODE) == len(LONG_CODE.split())
+
+
+class TestProcedureTokens:
+    """Test cases for procedure_tokens and context prioritization."""
+
+    def test_prefers_stored_token_count(self, monkeypatch):
+        monkeypatch.setattr(
+            token_counter, "_default_counter", TokenCounter(encoder=_WordEncoder())
+        )
+
+        assert procedure_tokens({"code": LONG_CODE, "token_count": 7}) == 7
+        assert procedure_tokens({"code": "a b", "token_count": None}) == 2
+
+    def test_packing_uses_stored_counts(self, monkeypatch):
+        monkeypatch.setattr(
+            token_counter, "_default_counter", TokenCounter(encoder=_WordEncoder())
+        )
+        candidates = [
+            ProcedureCandidate(proc={"name": "Big", "code": "x", "token_count": 500}, depth=1),
+            ProcedureCandidate(
+                proc={"name": "Small", "code": "x " * 1000, "token_count": 10}, depth=1
+            ),
+        ]
+
+        packed = ContextBuilder(db=None)._pack_procedures(candidates, 100)
+
+        assert [p["name"] for p in packed.full] == ["Small"]
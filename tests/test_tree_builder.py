@@ -0,0 +1,102 @@
+"""
+Unit tests for TreeBuilder.
+
+Tests cover:
+- TreeSkeleton per-configuration category counts
+- Skeleton cache invalidation
+- Category page cursor generation and keyset round trip
+"""
+
+from beanie import PydanticObjectId
+
+from wxcode.models import ElementType
+from wxcode.services import tree_builder
+from wxcode.services.pagination import decode_cursor, keyset_filter
+from wxcode.services.tree_builder import (
+    TreeBuilder,
+    TreeSkeleton,
+    invalidate_tree_cache,
+)
+
+
+def _skeleton() -> TreeSkeleton:
+    return TreeSkeleton(
+        element_groups=[
+            (ElementType.PAGE.value, frozenset(), 10),
+            (ElementType.PAGE.value, frozenset({"cfg-b"}), 3),
+            (ElementType.PAGE_TEMPLATE.value, frozenset(), 2),
+            (ElementType.QUERY.value, frozenset({"cfg-a"}), 4),
+            (ElementType.CLASS.value, frozenset({"cfg-a", "cfg-b"}), 1),
+        ],
+        tables_count=7,
+        connections_count=1,
+    )
+
+
+class TestTreeSkeleton:
+    """Test cases for TreeSkeleton."""
+
+    def test_category_counts_respect_exclusions(self):
+        skeleton = _skeleton()
+
+        assert skeleton.category_counts("cfg-a") == {"pages": 15}
+        assert skeleton.category_counts("cfg-b") == {"pages": 12, "queries": 4}
+        assert skeleton.category_counts("cfg-c") == {
+            "pages": 15,
+            "queries": 4,
+            "classes": 1,
+        }
+
+    def test_queries_count_ignores_configuration(self):
+        assert _skeleton().queries_count == 4
+
+    def test_analysis_node_uses_skeleton_counts(self):
+        node = TreeBuilder()._build_analysis_node(
+            PydanticObjectId(), _skeleton(), remaining_depth=1
+        )
+
+        assert node["children_count"] == 7 + 4 + 1
+        assert [c["id"] for c in node["children"]] == ["tables", "queries", "connections"]
+
+
+class TestSkeletonCache:
+    """Test cases for the skeleton cache."""
+
+    def test_invalidate_single_project(self):
+        tree_builder._skeleton_cache["p1"] = ((), 0.0, TreeSkeleton())
+        tree_builder._skeleton_cache["p2"] = ((), 0.0, TreeSkeleton())
+
+        invalidate_tree_cache("p1")
+
+        assert "p1" not in tree_builder._skeleton_cache
+        assert "p2" in tree_builder._skeleton_cache
+        invalidate_tree_cache()
+        assert tree_builder._skeleton_cache == {}
+
+
+class TestCategoryPageCursor:
+    """Test cases for category pagination cursors."""
+
+    def test_no_cursor_without_limit_or_partial_page(self):
+        children = [{"id": str(PydanticObjectId()), "name": "PAGE_A"}]
+
+        assert TreeBuilder.category_page_cursor(children, None) is None
+        assert TreeBuilder.category_page_cursor(children, 5) is None
+
+    def test_cursor_round_trips_to_keyset_filter(self):
+        last_id = PydanticObjectId()
+        children = [
+            {"id": str(PydanticObjectId()), "name": "PAGE_A"},
+            {"id": str(last_id), "name": "PAGE_B"},
+        ]
+
+        cursor = TreeBuilder.category_page_cursor(children, 2)
+        values = decode_cursor(cursor)
+
+        assert values == ["PAGE_B", last_id]
+        assert keyset_filter(tree_builder.CATEGORY_SORT_FIELDS, values) == {
+            "$or": [
+                {"source_name": {"$gt": "PAGE_B"}},
+                {"source_name": "PAGE_B", "_id": {"$gt": last_id}},
+            ]
+        }
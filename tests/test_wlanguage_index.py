@@ -0,0 +1,138 @@
+"""
+Testes para a referência WLanguage compilada e indexada.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wxcode.mcp.tools.wlanguage import get_wlanguage_reference, list_wlanguage_functions
+from wxcode.mcp.wlanguage_index import (
+    REFERENCE_PATH,
+    WLanguageReferenceIndex,
+    load_reference_index,
+)
+
+SAMPLE_YAML = """
+functions:
+  HReadFirst:
+    category: navigation
+    description: First record
+  HReadSeek:
+    category: search
+    description: Seek by key
+  HReadSeekFirst:
+    category: search
+    description: Seek first
+  HAdd:
+    category: crud
+    description: Add record
+patterns:
+  cursor_iteration:
+    description: Loop
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "reference.yaml"
+    path.write_text(SAMPLE_YAML, encoding="utf-8")
+    return path
+
+
+class TestCompiledReference:
+    """Compilação única e reuso do arquivo JSON."""
+
+    def test_second_load_skips_yaml(self, source, tmp_path):
+        cache_dir = tmp_path / "cache"
+        first = load_reference_index(source, cache_dir)
+
+        with patch("yaml.safe_load") as safe_load:
+            second = load_reference_index(source, cache_dir)
+
+        safe_load.assert_not_called()
+        assert second.functions == first.functions
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_changed_source_recompiles(self, source, tmp_path):
+        cache_dir = tmp_path / "cache"
+        load_reference_index(source, cache_dir)
+        source.write_text(SAMPLE_YAML.replace("HAdd:", "HDelete:"), encoding="utf-8")
+
+        index = load_reference_index(source, cache_dir)
+
+        assert index.get("HDelete") is not None
+        assert index.get("HAdd") is None
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_unwritable_cache_still_loads(self, source, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+
+        index = load_reference_index(source, blocker / "cache")
+
+        assert "HAdd" in index.functions
+
+    def test_bundled_reference_compiles(self, tmp_path):
+        index = load_reference_index(REFERENCE_PATH, tmp_path)
+
+        assert index.get("hreadseekfirst")[0] == "HReadSeekFirst"
+        assert index.patterns
+
+
+class TestIndexLookups:
+    """Consultas por nome, prefixo e aproximação."""
+
+    @pytest.fixture
+    def index(self, source, tmp_path):
+        return load_reference_index(source, tmp_path / "cache")
+
+    def test_get_exact_and_case_insensitive(self, index):
+        assert index.get("HAdd")[0] == "HAdd"
+        assert index.get("hreadseek")[0] == "HReadSeek"
+        assert index.get("HNope") is None
+
+    def test_prefix(self, index):
+        assert index.with_prefix("hreadseek") == ["HReadSeek", "HReadSeekFirst"]
+        assert index.with_prefix("HRead", limit=1) == ["HReadFirst"]
+        assert index.with_prefix("X") == []
+
+    def test_fuzzy_search(self, index):
+        assert index.search("Seek")[:2] == ["HReadSeek", "HReadSeekFirst"]
+        assert index.search("HReadFrist")[0] == "HReadFirst"
+        assert index.search("zzzz") == []
+
+    def test_categories(self, index):
+        assert index.categories["search"] == ["HReadSeek", "HReadSeekFirst"]
+
+
+class TestWLanguageTools:
+    """Tools servem a referência a partir do índice."""
+
+    @pytest.fixture(autouse=True)
+    def index(self, source, tmp_path):
+        index = load_reference_index(source, tmp_path / "cache")
+        with patch("wxcode.mcp.tools.wlanguage.get_reference_index", return_value=index):
+            yield index
+
+    async def test_lookup_without_h_prefix(self):
+        response = await get_wlanguage_reference.fn(MagicMock(), "readseek")
+
+        assert response["function"]["function"] == "HReadSeek"
+
+    async def test_not_found_suggests_similar(self):
+        response = await get_wlanguage_reference.fn(MagicMock(), "HReadFrist")
+
+        assert response["code"] == "NOT_FOUND"
+        assert response["similar_functions"][0] == "HReadFirst"
+
+    async def test_list_by_category(self):
+        response = await list_wlanguage_functions.fn(MagicMock(), "CRUD")
+
+        assert response["categories"] == {"crud": [{"name": "HAdd", "description": "Add record"}]}
+
+
+def test_empty_reference():
+    index = WLanguageReferenceIndex(WLanguageReferenceIndex.compile(None))
+
+    assert index.functions == {} and index.search("HAdd") == []
@@ -515,6 +515,73 @@ class TestEncodingHandling:
 
         assert len(result.tables) == 1
 
+    def test_utf8_accented_names(self, tmp_path: Path):
+        """Prólogo UTF-8 é respeitado (acentos não viram mojibake)."""
+        xdd_file = tmp_path / "utf8.xdd"
+        xdd_file.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<ANALYSE GenNum="1"><FICHIER Nom="Endereço"/></ANALYSE>',
+            encoding="utf-8",
+        )
+
+        parser = XddParser(xdd_file)
+        assert parser.detect_encoding() == "UTF-8"
+        assert parser.parse().tables[0].name == "Endereço"
+
+    def test_without_prolog_defaults_to_iso_8859_1(self, tmp_path: Path):
+        """Sem prólogo, o arquivo é lido como ISO-8859-1."""
+        xdd_file = tmp_path / "noprolog.xdd"
+        xdd_file.write_bytes('<ANALYSE GenNum="1"><FICHIER Nom="Situação"/></ANALYSE>'.encode("iso-8859-1"))
+
+        parser = XddParser(xdd_file)
+        assert parser.detect_encoding() == "iso-8859-1"
+        assert parser.parse().tables[0].name == "Situação"
+
+
+class TestStreaming:
+    """Testes da leitura incremental (iterparse)."""
+
+    @pytest.fixture
+    def many_tables_xdd_file(self, tmp_path: Path) -> Path:
+        tables = "".join(
+            f'<FICHIER Nom="T{i}" NomPhysique="T{i}">'
+            f'<RUBRIQUE Nom="ID"><TYPE>24</TYPE><TYPE_CLE>1</TYPE_CLE></RUBRIQUE>'
+            f'<RUBRIQUE Nom="Nome"><TYPE>2</TYPE></RUBRIQUE>'
+            f'</FICHIER>'
+            for i in range(7)
+        )
+        xdd_file = tmp_path / "many.xdd"
+        xdd_file.write_text(
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            f'<ANALYSE GenNum="42"><CONNEXION Nom="CNX" Type="3"/>{tables}'
+            '<LIAISON Nom="L1"/></ANALYSE>',
+            encoding="iso-8859-1",
+        )
+        return xdd_file
+
+    def test_iter_tables_fills_metadata(self, many_tables_xdd_file: Path):
+        """iter_tables emite tabelas e acumula metadados no result."""
+        result = XddParseResult()
+        names = [t.name for t in XddParser(many_tables_xdd_file).iter_tables(result)]
+
+        assert names == [f"T{i}" for i in range(7)]
+        assert result.version == 42
+        assert [c.name for c in result.connections] == ["CNX"]
+        assert result.total_columns == 14
+        assert result.tables == []
+
+    def test_iter_table_batches(self, many_tables_xdd_file: Path):
+        """Lotes respeitam batch_size e cobrem todas as tabelas."""
+        batches = list(XddParser(many_tables_xdd_file).iter_table_batches(batch_size=3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_parse_matches_streaming(self, many_tables_xdd_file: Path):
+        """parse() devolve as mesmas tabelas que iter_tables()."""
+        parser = XddParser(many_tables_xdd_file)
+        result = parser.parse()
+        assert result.tables == list(parser.iter_tables())
+        assert result.total_columns == 14
+
 
 class TestConnectionTypeMapping:
     """Testes do mapeamento de tipos de conexão."""